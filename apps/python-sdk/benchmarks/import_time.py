@@ -0,0 +1,67 @@
+"""
+Benchmark: cold import time of the SDK entry points.
+
+Each statement runs in a fresh interpreter with ``-X importtime`` and the
+cumulative time of the top-level module is reported (best of N runs):
+
+    python benchmarks/import_time.py --runs 5
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+STATEMENTS = (
+    "import firecrawl",
+    "from firecrawl import Firecrawl",
+    "from firecrawl import AsyncFirecrawl",
+    "from firecrawl import V1FirecrawlApp",
+)
+
+# Modules that must stay out of ``import firecrawl``
+HEAVY_MODULES = ("aiohttp", "httpx", "websockets", "firecrawl.v1.client", "firecrawl.v2.client_async")
+
+_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_time_ms(statement: str) -> float:
+    """Cumulative import time in ms of the top-level module(s) imported by ``statement``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        # Top-level entries only; the first line of a fresh interpreter is ``site``
+        if match and not match.group(2) and match.group(3) != "site":
+            total_us += int(match.group(1))
+    return total_us / 1000
+
+
+def loaded_heavy_modules(statement: str) -> list:
+    check = f"{statement}; import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        best = min(import_time_ms(statement) for _ in range(args.runs))
+        heavy = ", ".join(loaded_heavy_modules(statement)) or "-"
+        print(f"{statement:<40} {best:8.1f} ms   heavy: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: peak memory of large-job result paths against their budgets.
+
+Runs firecrawl.testing.memory over synthetic jobs served by the in-process
+fake API, prints a table, writes a diffable JSON report and exits non-zero
+when a path is over budget:
+
+    python benchmarks/memory_regression.py --documents 100000 --json memory.json
+    python benchmarks/memory_regression.py --baseline memory.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from firecrawl.testing.memory import MEMORY_PATHS, run_memory_suite  # noqa: E402
+
+COMPARED = ("peak_kib", "peak_documents", "retained_kib")
+
+
+def diff_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Per-path changes of the compared metrics, e.g. ``crawl_status.peak_kib: 31210 -> 40110 (+28.5%)``."""
+    lines = []
+    for path, row in current["paths"].items():
+        before = baseline["paths"].get(path)
+        if before is None:
+            lines.append(f"{path}: new path")
+            continue
+        for metric in COMPARED:
+            old, new = before.get(metric), row.get(metric)
+            if old == new or old is None or new is None:
+                continue
+            change = f" ({(new - old) / old:+.1%})" if old else ""
+            lines.append(f"{path}.{metric}: {old} -> {new}{change}")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=100_000, help="documents per synthetic job")
+    parser.add_argument("--page-size", type=int, default=100, help="documents per status page")
+    parser.add_argument("--payload-bytes", type=int, default=512, help="markdown bytes per document")
+    parser.add_argument("--paths", nargs="*", choices=sorted(MEMORY_PATHS), help="subset of paths to run")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="report of a previous run to compare against")
+    args = parser.parse_args(argv)
+
+    report = run_memory_suite(
+        documents=args.documents, page_size=args.page_size, payload_bytes=args.payload_bytes, paths=args.paths
+    )
+    print(f"{args.documents} documents, {args.page_size} per page, {args.payload_bytes} payload bytes")
+    print(report.format())
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            changes = diff_reports(json.load(fh), report.to_dict())
+        print("\nChanges from baseline:" if changes else "\nNo changes from baseline")
+        for line in changes:
+            print(f"  {line}")
+    if args.json:
+        with open(args.json, "w") as fh:
+            fh.write(report.to_json() + "\n")
+
+    violations = report.violations()
+    for line in violations:
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
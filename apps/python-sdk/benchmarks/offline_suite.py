@@ -0,0 +1,290 @@
+"""
+Benchmark: client throughput, latency and memory against a local fake v2 API.
+
+Runs scrape, crawl (paginated), batch scrape, map, search and extract through
+the sync and async clients, and crawl watches through both watchers, against
+the in-process ``firecrawl.testing`` fake server (no network, no API key):
+
+    python benchmarks/offline_suite.py --ops 200 --concurrency 16 --latency 0.01
+    python benchmarks/offline_suite.py --only async --error-rate 0.05 --json results.json
+
+Each scenario runs twice: once timed (throughput, p50/p99 per operation) and
+once under tracemalloc (peak traced memory), so tracing overhead does not
+skew the timings.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from firecrawl.testing import FakeFirecrawlServer, FakeServerConfig  # noqa: E402
+from firecrawl.v2.client import FirecrawlClient  # noqa: E402
+from firecrawl.v2.client_async import AsyncFirecrawlClient  # noqa: E402
+
+API_KEY = "fc-offline-bench"
+TERMINAL = ("completed", "failed", "cancelled")
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))]
+
+
+class Scenario:
+    """One operation run ``ops`` times; each call returns the number of documents it produced."""
+
+    def __init__(self, client: str, name: str, ops: int, run: Callable[[int], Any]):
+        self.client = client
+        self.name = name
+        self.ops = ops
+        self.run = run
+
+
+def _summary(scenario: Scenario, latencies: List[float], documents: int, errors: int, seconds: float) -> Dict[str, Any]:
+    return {
+        "client": scenario.client,
+        "operation": scenario.name,
+        "ops": scenario.ops,
+        "errors": errors,
+        "seconds": seconds,
+        "ops_per_s": scenario.ops / seconds if seconds else 0.0,
+        "docs_per_s": documents / seconds if seconds else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_sync(scenario: Scenario, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    counts = {"documents": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def call(index: int) -> None:
+        start = time.perf_counter()
+        try:
+            documents = scenario.run(index)
+        except Exception:
+            with lock:
+                counts["errors"] += 1
+            return
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            counts["documents"] += documents
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(call, range(scenario.ops)))
+    return _summary(scenario, latencies, counts["documents"], counts["errors"], time.perf_counter() - start)
+
+
+async def run_async(scenario: Scenario, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    counts = {"documents": 0, "errors": 0}
+    gate = asyncio.Semaphore(concurrency)
+
+    async def call(index: int) -> None:
+        async with gate:
+            start = time.perf_counter()
+            try:
+                documents = await scenario.run(index)
+            except Exception:
+                counts["errors"] += 1
+                return
+            latencies.append(time.perf_counter() - start)
+            counts["documents"] += documents
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(i) for i in range(scenario.ops)))
+    return _summary(scenario, latencies, counts["documents"], counts["errors"], time.perf_counter() - start)
+
+
+def sync_scenarios(client: FirecrawlClient, args: argparse.Namespace) -> List[Scenario]:
+    poll = args.poll_interval
+    batch_urls = [f"https://bench.firecrawl.test/batch/{i}" for i in range(args.batch_size)]
+
+    def watch(index: int) -> int:
+        job = client.start_crawl(f"https://bench.firecrawl.test/watch/{index}")
+        watcher = client.watcher(job.id, kind="crawl", poll_interval=max(1, int(poll)))
+        done = threading.Event()
+        watcher.add_listener(lambda snapshot: snapshot.status in TERMINAL and done.set())
+        watcher.start()
+        try:
+            if not done.wait(args.job_timeout):
+                raise TimeoutError(f"watcher for {job.id} did not finish")
+        finally:
+            watcher.stop()
+        return len(watcher.data)
+
+    return [
+        Scenario("sync", "scrape", args.ops, lambda i: 1 if client.scrape(f"https://bench.firecrawl.test/{i}") else 0),
+        Scenario("sync", "map", args.ops, lambda i: len(client.map(f"https://bench.firecrawl.test/{i}").links)),
+        Scenario("sync", "search", args.ops, lambda i: len(client.search(f"query {i}").web or [])),
+        Scenario("sync", "extract", args.job_ops, lambda i: 1 if client.extract(urls=[f"https://bench.firecrawl.test/{i}"], prompt="x", poll_interval=poll) else 0),
+        Scenario("sync", "crawl", args.job_ops, lambda i: len(client.crawl(f"https://bench.firecrawl.test/{i}", poll_interval=poll).data)),
+        Scenario("sync", "batch_scrape", args.job_ops, lambda i: len(client.batch_scrape(batch_urls, poll_interval=poll).data)),
+        Scenario("watcher", "crawl_watch", args.job_ops, watch),
+    ]
+
+
+def async_scenarios(client: AsyncFirecrawlClient, args: argparse.Namespace) -> List[Scenario]:
+    poll = args.poll_interval
+    batch_urls = [f"https://bench.firecrawl.test/batch/{i}" for i in range(args.batch_size)]
+
+    def wrap(fn: Callable[[int], Awaitable[Any]], count: Callable[[Any], int]):
+        async def run(index: int) -> int:
+            return count(await fn(index))
+
+        return run
+
+    async def watch(index: int) -> int:
+        job = await client.start_crawl(url=f"https://bench.firecrawl.test/watch/{index}")
+        documents = 0
+        async for snapshot in client.watcher(job.id, kind="crawl", poll_interval=poll, timeout=args.job_timeout):
+            documents = len(snapshot.data)
+            if snapshot.status in TERMINAL:
+                break
+        return documents
+
+    return [
+        Scenario("async", "scrape", args.ops, wrap(lambda i: client.scrape(f"https://bench.firecrawl.test/{i}"), lambda d: 1)),
+        Scenario("async", "map", args.ops, wrap(lambda i: client.map(f"https://bench.firecrawl.test/{i}"), lambda m: len(m.links))),
+        Scenario("async", "search", args.ops, wrap(lambda i: client.search(f"query {i}"), lambda s: len(s.web or []))),
+        Scenario("async", "extract", args.job_ops, wrap(
+            lambda i: client.extract(urls=[f"https://bench.firecrawl.test/{i}"], prompt="x", poll_interval=poll), lambda r: 1
+        )),
+        Scenario("async", "crawl", args.job_ops, wrap(
+            lambda i: client.crawl(url=f"https://bench.firecrawl.test/{i}", poll_interval=poll), lambda j: len(j.data)
+        )),
+        Scenario("async", "batch_scrape", args.job_ops, wrap(
+            lambda i: client.batch_scrape(batch_urls, poll_interval=poll), lambda j: len(j.data)
+        )),
+        Scenario("async_watcher", "crawl_watch", args.job_ops, watch),
+    ]
+
+
+def _measure_memory(run: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+
+def bench_sync(url: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    client = FirecrawlClient(api_key=API_KEY, api_url=url, backoff_factor=args.backoff)
+    results = []
+    for scenario in sync_scenarios(client, args):
+        if not _selected(scenario, args):
+            continue
+        result = run_sync(scenario, args.concurrency)
+        if args.memory:
+            result["peak_mib"] = _measure_memory(lambda: run_sync(scenario, args.concurrency))
+        results.append(result)
+    return results
+
+
+def bench_async(url: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    async def main() -> List[Dict[str, Any]]:
+        client = AsyncFirecrawlClient(api_key=API_KEY, api_url=url)
+        results = []
+        try:
+            for scenario in async_scenarios(client, args):
+                if not _selected(scenario, args):
+                    continue
+                result = await run_async(scenario, args.concurrency)
+                if args.memory:
+                    tracemalloc.start()
+                    try:
+                        await run_async(scenario, args.concurrency)
+                        result["peak_mib"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+                    finally:
+                        tracemalloc.stop()
+                results.append(result)
+        finally:
+            await client.async_http_client.close()
+        return results
+
+    return asyncio.run(main())
+
+
+def _selected(scenario: Scenario, args: argparse.Namespace) -> bool:
+    return not args.operations or scenario.name in args.operations
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'client':<14}{'operation':<14}{'ops':>6}{'err':>5}{'ops/s':>10}{'docs/s':>11}{'p50 ms':>9}{'p99 ms':>9}{'peak MiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        peak = f"{r['peak_mib']:10.1f}" if "peak_mib" in r else f"{'-':>10}"
+        print(
+            f"{r['client']:<14}{r['operation']:<14}{r['ops']:>6}{r['errors']:>5}{r['ops_per_s']:>10.1f}"
+            f"{r['docs_per_s']:>11.1f}{r['p50_ms']:>9.1f}{r['p99_ms']:>9.1f}{peak}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", choices=("sync", "async"), help="run only one client family (watchers included)")
+    parser.add_argument("--operations", nargs="*", help="subset of: scrape map search extract crawl batch_scrape crawl_watch")
+    parser.add_argument("--ops", type=int, default=200, help="calls per request/response operation")
+    parser.add_argument("--job-ops", type=int, default=10, help="calls per job operation (crawl, batch, extract, watch)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency per HTTP response (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform extra latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of HTTP responses that fail")
+    parser.add_argument("--error-status", type=int, default=502)
+    parser.add_argument("--payload-bytes", type=int, default=2048, help="markdown bytes per document")
+    parser.add_argument("--documents", type=int, default=500, help="documents per crawl")
+    parser.add_argument("--page-size", type=int, default=100, help="documents per status page")
+    parser.add_argument("--batch-size", type=int, default=100, help="URLs per batch scrape")
+    parser.add_argument("--job-seconds", type=float, default=0.2, help="time jobs stay scraping")
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--job-timeout", type=float, default=60.0)
+    parser.add_argument("--backoff", type=float, default=0.01, help="sync client retry backoff factor")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc pass")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    config = FakeServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        payload_bytes=args.payload_bytes,
+        page_size=args.page_size,
+        crawl_documents=args.documents,
+        job_seconds=args.job_seconds,
+        seed=args.seed,
+    )
+    results: List[Dict[str, Any]] = []
+    with FakeFirecrawlServer(config) as url:
+        if args.only in (None, "sync"):
+            results.extend(bench_sync(url, args))
+        if args.only in (None, "async"):
+            results.extend(bench_async(url, args))
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump({"config": vars(args), "results": results}, fh, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
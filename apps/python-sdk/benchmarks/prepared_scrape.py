@@ -0,0 +1,63 @@
+"""
+Benchmark: per-URL request building for scrape loops, with and without PreparedScrape.
+
+Measures only client-side work (options model, validation, payload
+conversion and JSON encoding), so it runs offline:
+
+    python benchmarks/prepared_scrape.py --urls 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from firecrawl.v2.methods.scrape import _prepare_scrape_request  # noqa: E402
+from firecrawl.v2.types import ScrapeOptions  # noqa: E402
+from firecrawl.v2.utils.prepared import PreparedScrape  # noqa: E402
+
+OPTIONS = dict(
+    formats=["markdown", "links", {"type": "screenshot", "full_page": True}],
+    only_main_content=True,
+    wait_for=500,
+    parsers=["pdf"],
+    actions=[{"type": "wait", "milliseconds": 200}, {"type": "scroll", "direction": "down"}],
+    max_age=3_600_000,
+)
+
+
+def per_call(urls):
+    # What FirecrawlClient.scrape does for every URL: build the model, validate, convert, encode
+    for url in urls:
+        payload = _prepare_scrape_request(url, ScrapeOptions(**OPTIONS))
+        payload["origin"] = "python-sdk"
+        json.dumps(payload).encode("utf-8")
+
+
+def prepared(urls):
+    template = PreparedScrape(ScrapeOptions(**OPTIONS))
+    for url in urls:
+        template.body(url)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, default=100_000)
+    args = parser.parse_args()
+    urls = [f"https://example.com/docs/page-{i}?ref=bench" for i in range(args.urls)]
+
+    results = {}
+    for name, fn in (("per_call", per_call), ("prepared", prepared)):
+        start = time.perf_counter()
+        fn(urls)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"{name:>9}: {elapsed:8.3f}s  {elapsed / len(urls) * 1e6:8.2f} us/url")
+    print(f"  speedup: {results['per_call'] / results['prepared']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
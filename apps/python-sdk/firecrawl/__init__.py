@@ -3,21 +3,53 @@ Firecrawl Python SDK
 
 """
 
+__version__ = "4.3.6"
+
+import importlib
 import logging
 import os
-
-from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
-from .v2.watcher import Watcher
-from .v2.watcher_async import AsyncWatcher
-from .v1 import (
-    V1FirecrawlApp,
-    AsyncV1FirecrawlApp,
-    V1JsonConfig,
-    V1ScrapeOptions,
-    V1ChangeTrackingOptions,
-)
-
-__version__ = "4.3.6"
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
+    from .v2.watcher import Watcher
+    from .v2.watcher_async import AsyncWatcher
+    from .v1 import (
+        V1FirecrawlApp,
+        AsyncV1FirecrawlApp,
+        V1JsonConfig,
+        V1ScrapeOptions,
+        V1ChangeTrackingOptions,
+    )
+
+# Public names resolved on first attribute access (PEP 562), so ``import firecrawl``
+# stays cheap and the v1 client, async client and websockets load only when used
+_LAZY_EXPORTS = {
+    "Firecrawl": ".client",
+    "AsyncFirecrawl": ".client",
+    "FirecrawlApp": ".client",
+    "AsyncFirecrawlApp": ".client",
+    "Watcher": ".v2.watcher",
+    "AsyncWatcher": ".v2.watcher_async",
+    "V1FirecrawlApp": ".v1",
+    "AsyncV1FirecrawlApp": ".v1",
+    "V1JsonConfig": ".v1",
+    "V1ScrapeOptions": ".v1",
+    "V1ChangeTrackingOptions": ".v1",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Define the logger for the Firecrawl project
 logger: logging.Logger = logging.getLogger("firecrawl")
@@ -0,0 +1,93 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from firecrawl.bench import BenchConfig, load_urls, main, parse_mix, run_bench
+from firecrawl.testing import FakeFirecrawlServer, FakeServerConfig
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+
+
+@pytest.fixture
+def server():
+    servers = []
+
+    def start(**config):
+        fake = FakeFirecrawlServer(FakeServerConfig(**config))
+        fake.start()
+        servers.append(fake)
+        return fake
+
+    yield start
+    for fake in servers:
+        fake.stop()
+
+
+def _bench(url, config):
+    async def go():
+        client = AsyncFirecrawlClient(api_key="fc-bench", api_url=url, tracing=False)
+        try:
+            return await run_bench(client, config)
+        finally:
+            await client.async_http_client.close()
+
+    return asyncio.run(go())
+
+
+def test_mix_and_corpus_parsing(tmp_path):
+    assert parse_mix("scrape=3, map=1,crawl=0") == {"scrape": 3.0, "map": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("scrape=1,search=1")
+    with pytest.raises(ValueError):
+        parse_mix("crawl=0")
+
+    corpus = tmp_path / "urls.txt"
+    corpus.write_text("# seeds\nhttps://a.com\n\n  https://b.com  \n")
+    assert load_urls([str(corpus), "-"], stdin=io.StringIO("https://c.com\n")) == [
+        "https://a.com", "https://b.com", "https://c.com",
+    ]
+
+
+def test_closed_loop_mix_runs_every_operation(server):
+    fake = server(job_seconds=0.1, crawl_documents=5)
+    config = BenchConfig(
+        urls=["https://a.com", "https://b.com"], requests=40, duration=None, concurrency=4,
+        batch_size=3, crawl_limit=5, poll_interval=0.05, queue_interval=0.05, seed=1,
+    )
+    report = _bench(fake.url, config).to_dict()
+
+    assert sum(row["ok"] for row in report["operations"].values()) == 40
+    assert set(report["operations"]) == {"scrape", "crawl", "batch", "map"}
+    assert report["operations"]["batch"]["docs_per_s"] > 0
+    assert report["errors"] == {}
+    assert report["queue"] and {"jobs_in_queue", "in_flight", "t"} <= set(report["queue"][0])
+    assert fake.requests["POST /v2/batch/scrape"] == report["operations"]["batch"]["ok"]
+
+
+def test_errors_are_broken_down_by_error_class(server):
+    fake = server(rate_limit=1, rate_limit_burst=2)
+    config = BenchConfig(urls=["https://a.com"], mix={"scrape": 1}, requests=6, duration=None, concurrency=1, queue_interval=None)
+    report = _bench(fake.url, config).to_dict()
+
+    assert report["operations"]["scrape"]["ok"] == 2
+    assert report["errors"] == {"scrape": {"RateLimitError": 4}}
+
+
+def test_open_loop_holds_target_rate_and_writes_json(server, tmp_path, capsys):
+    fake = server()
+    out = tmp_path / "run.json"
+    code = main([
+        "--api-url", fake.url, "--url", "https://a.com", "--mix", "scrape=1,map=1",
+        "--rps", "40", "--duration", "0.5", "--queue-interval", "0", "--json", str(out),
+    ])
+
+    report = json.loads(out.read_text())
+    assert code == 0 and "open loop at 40 rps" in capsys.readouterr().out
+    assert 12 <= report["total"]["ok"] <= 22
+    assert report["dropped"] == 0 and report["queue"] == []
+
+
+def test_cli_rejects_an_empty_corpus(capsys):
+    assert main(["--mix", "scrape=1"]) == 2
+    assert "no URLs" in capsys.readouterr().err
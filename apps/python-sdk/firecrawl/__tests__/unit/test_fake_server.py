@@ -0,0 +1,93 @@
+import asyncio
+import json
+import time
+
+import pytest
+import requests
+
+from firecrawl.testing import FakeFirecrawlServer, FakeServerConfig, fixture_documents
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.error_handler import RateLimitError
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(**config):
+        server = FakeFirecrawlServer(FakeServerConfig(**config))
+        server.start()
+        servers.append(server)
+        return server, FirecrawlClient(api_key="fc-test", api_url=server.url, tracing=False)
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_crawl_lifecycle_and_pagination(serve):
+    server, client = serve(crawl_documents=25, page_size=10, job_seconds=0.2)
+    started = client.start_crawl("https://example.com")
+
+    first = client.get_crawl_status(started.id)
+    job = client.crawl("https://example.com", poll_interval=0.05)
+
+    assert first.status == "scraping" and first.completed < 25
+    assert job.status == "completed" and len(job.data) == 25
+    assert [d.metadata.title for d in job.data[9:11]] == ["Page 9", "Page 10"]
+    # Completed crawl: one status page plus two ``next`` cursors
+    assert server.requests["GET /v2/crawl/{id}"] >= 3
+
+
+def test_cancel_freezes_progress(serve):
+    server, client = serve(crawl_documents=1000, job_seconds=60)
+    started = client.start_crawl("https://example.com")
+
+    assert client.cancel_crawl(started.id)
+    job = client.get_crawl_status(started.id)
+    assert job.status == "cancelled" and job.completed < 1000
+
+
+def test_rate_limit_returns_429_with_retry_after(serve):
+    server, client = serve(rate_limit=0.5, rate_limit_burst=1)
+
+    client.scrape("https://a.com")
+    with pytest.raises(RateLimitError):
+        client.scrape("https://b.com")
+    raw = requests.post(f"{server.url}/v2/scrape", json={"url": "https://c.com"}, headers={"Authorization": "Bearer fc-test"})
+
+    assert raw.status_code == 429 and int(raw.headers["Retry-After"]) >= 1
+    assert server.rate_limited == 2
+    # Buckets are per API key
+    other = requests.post(f"{server.url}/v2/scrape", json={"url": "https://c.com"}, headers={"Authorization": "Bearer other"})
+    assert other.status_code == 200
+
+
+def test_custom_document_generator(serve):
+    recorded = [{"markdown": "recorded", "metadata": {"title": "Fixture", "statusCode": 200}}]
+    server, client = serve(documents=fixture_documents(recorded))
+
+    job = client.batch_scrape(["https://a.com", "https://b.com"], poll_interval=0.05)
+
+    assert [d.markdown for d in job.data] == ["recorded", "recorded"]
+    assert [d.metadata.source_url for d in job.data] == ["https://a.com", "https://b.com"]
+
+
+def test_websocket_sends_catchup_documents_and_done(serve):
+    websockets = pytest.importorskip("websockets")
+    server, client = serve(crawl_documents=5, job_seconds=0.2)
+    started = client.start_crawl("https://example.com")
+    time.sleep(0.05)
+
+    async def watch():
+        url = server.url.replace("http://", "ws://") + f"/v2/crawl/{started.id}"
+        async with websockets.connect(url) as ws:
+            return [json.loads(message) async for message in ws]
+
+    messages = asyncio.run(watch())
+    types = [m["type"] for m in messages]
+    streamed = len(messages[0]["data"]["data"]) + types.count("document")
+
+    assert types[0] == "catchup" and types[-1] == "done"
+    assert streamed == 5
+    assert messages[-1]["data"]["status"] == "completed"
@@ -0,0 +1,46 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# ``import firecrawl`` measures ~10 ms locally; the budget leaves room for slow CI machines
+IMPORT_BUDGET_MS = float(os.getenv("FIRECRAWL_IMPORT_BUDGET_MS", "150"))
+
+HEAVY_MODULES = ("aiohttp", "httpx", "websockets", "firecrawl.v1.client", "firecrawl.v2.client_async")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _loaded(statement: str) -> set:
+    out = _run(f"{statement}; import sys; print(' '.join(sorted(sys.modules)))").stdout.split()
+    return {m for m in HEAVY_MODULES if m in out}
+
+
+@pytest.mark.parametrize("statement", ["import firecrawl", "from firecrawl import Firecrawl, AsyncFirecrawl, Watcher"])
+def test_heavy_modules_are_not_imported_eagerly(statement):
+    assert _loaded(statement) == set()
+
+
+def test_heavy_modules_load_on_first_use():
+    assert _loaded("import firecrawl; firecrawl.AsyncWatcher") == set()
+    assert "firecrawl.v2.client_async" in _loaded("import firecrawl; firecrawl.AsyncFirecrawl(api_key='k')")
+    assert "firecrawl.v1.client" in _loaded("import firecrawl; firecrawl.Firecrawl(api_key='k').v1")
+    assert "firecrawl.v1.client" in _loaded("from firecrawl import V1ScrapeOptions")
+
+
+def test_import_time_budget():
+    best_ms = float("inf")
+    for _ in range(3):
+        stderr = _run("import firecrawl", "-X", "importtime").stderr
+        match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| firecrawl$", stderr, re.M)
+        assert match, stderr
+        best_ms = min(best_ms, int(match.group(1)) / 1000)
+    assert best_ms < IMPORT_BUDGET_MS, f"import firecrawl took {best_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
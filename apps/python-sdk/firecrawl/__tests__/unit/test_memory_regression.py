@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from firecrawl.testing.memory import MemoryBudget, MemoryProfile, run_memory_suite
+
+# Budgets are per document, so a CI-sized job catches the same regressions as 100k documents
+DOCUMENTS = int(os.getenv("FIRECRAWL_MEMORY_DOCUMENTS", "2000"))
+
+
+@pytest.fixture(scope="module")
+def report():
+    return run_memory_suite(documents=DOCUMENTS, page_size=100, payload_bytes=512)
+
+
+def test_result_paths_stay_within_budget(report):
+    assert report.violations() == [], report.format()
+
+
+def test_streaming_paths_do_not_scale_with_the_job(report):
+    profiles = {p.path: p for p in report.profiles}
+    for name in ("crawl_iter", "batch_iter"):
+        assert profiles[name].peak_documents < profiles["crawl_status"].peak_documents / 4
+
+
+def test_report_is_stable_json(report):
+    data = json.loads(report.to_json())
+    assert data["documents"] == DOCUMENTS
+    assert {"crawl_status", "batch_status", "crawl_iter", "batch_iter", "crawl_watcher"} <= set(data["paths"])
+    assert set(data["paths"]["crawl_status"]) == {
+        "peak_kib", "peak_documents", "budget_documents", "result_kib", "retained_kib", "rss_delta_kib",
+    }
+
+
+def test_budget_flags_accumulation_and_leaks():
+    profile = MemoryProfile(
+        path="crawl_iter", documents=1000, page_size=100, document_bytes=1000,
+        peak_bytes=900 * 1000, result_bytes=0, retained_bytes=2 * 1024 * 1024, rss_delta_bytes=None, seconds=0.0,
+    )
+    problems = profile.violations(MemoryBudget())
+    assert len(problems) == 2
+    assert "peak of 900 documents exceeds budget of 600" in problems[0]
+    assert profile.violations(MemoryBudget(per_document=1.0, retained_bytes=4 * 1024 * 1024)) == []
@@ -115,3 +115,29 @@ async def test_async_transport_used_no_threads(monkeypatch):
 
     assert max_active >= 2
 
+
+
+@pytest.mark.asyncio
+async def test_wait_loops_and_watcher_fallback_stay_on_the_loop(monkeypatch):
+    monkeypatch.setattr(asyncio, "to_thread", lambda *a, **k: (_ for _ in ()).throw(RuntimeError("to_thread not allowed")))
+    statuses = {"crawl": ["scraping", "completed"], "batch": ["scraping", "completed"]}
+
+    async def fake_get(self, endpoint, headers=None, timeout=None):
+        kind = "crawl" if "/crawl/" in endpoint else "batch"
+        state = statuses[kind].pop(0)
+        return httpx.Response(200, json={"success": True, "status": state, "completed": 1, "total": 1, "data": []})
+
+    monkeypatch.setattr(AsyncHttpClient, "get", fake_get)
+
+    client = AsyncFirecrawlClient(api_key="test", api_url="http://localhost")
+    assert not hasattr(client, "http_client")
+
+    crawl = await client.wait_crawl("c-1", poll_interval=0.01, timeout=2)
+    assert crawl.status == "completed"
+
+    # Merged batch handles always use the HTTP fallback
+    watcher = client.watcher("merged:b-1,b-2", kind="batch", poll_interval=0.01, timeout=2)
+    statuses["batch"] = ["scraping", "completed", "completed", "completed"]
+    snapshots = [snapshot.status async for snapshot in watcher]
+    assert snapshots == ["scraping", "completed"]
+    assert watcher._api_url == "http://localhost"
@@ -0,0 +1,227 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.methods.aio import batch as aio_batch
+from firecrawl.v2.types import BatchScrapeJob, Document
+from firecrawl.v2.utils.batch_split import (
+    MAX_BATCH_URLS,
+    merge_batch_jobs,
+    merge_job_ids,
+    run_bounded,
+    split_job_id,
+    split_oversized,
+)
+from firecrawl.v2.utils.url_dedup import UrlDeduplicator
+
+
+def _urls(n):
+    return [f"https://example.com/{i}" for i in range(n)]
+
+
+def _ok(body):
+    resp = Mock(ok=True, status_code=200)
+    resp.json.return_value = body
+    return resp
+
+
+def _sync_client():
+    client = Mock()
+    client._prepare_headers.return_value = {}
+    counter = {"n": 0}
+    lock = threading.Lock()
+
+    def post(endpoint, data, headers=None):
+        with lock:
+            counter["n"] += 1
+            n = counter["n"]
+        return _ok({"success": True, "id": f"job-{n}", "url": f"https://api/job-{n}", "size": len(data["urls"])})
+
+    client.post.side_effect = post
+    return client
+
+
+class TestSplitHelpers:
+    def test_small_lists_are_not_split(self):
+        assert split_oversized(_urls(MAX_BATCH_URLS)) is None
+
+    def test_iterators_are_chunked_lazily(self):
+        chunks = list(split_oversized(iter(_urls(2 * MAX_BATCH_URLS + 5))))
+        assert [len(c) for c in chunks] == [MAX_BATCH_URLS, MAX_BATCH_URLS, 5]
+
+    def test_merged_ids_round_trip(self):
+        assert split_job_id(merge_job_ids(["a", "b"])) == ["a", "b"]
+        assert split_job_id("plain-id") is None
+
+    def test_run_bounded_limits_in_flight_calls_and_keeps_order(self):
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def work(i):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return i * 2
+
+        assert run_bounded(work, range(10), max_workers=3) == [i * 2 for i in range(10)]
+        assert active["max"] <= 3
+
+    def test_merge_batch_jobs_aggregates(self):
+        jobs = [
+            BatchScrapeJob(status="completed", completed=2, total=2, credits_used=2, data=[Document(markdown="a")]),
+            BatchScrapeJob(status="scraping", completed=1, total=3, credits_used=1, data=[Document(markdown="b")]),
+        ]
+        merged = merge_batch_jobs(jobs)
+        assert merged.status == "scraping"
+        assert (merged.completed, merged.total, merged.credits_used) == (3, 5, 3)
+        assert [d.markdown for d in merged.data] == ["a", "b"]
+
+
+def _payment_required():
+    resp = Mock(ok=False, status_code=402)
+    resp.json.return_value = {"success": False, "error": "Insufficient credits"}
+    return resp
+
+
+def _failing_client(fail_on=2):
+    """Starts job-N for each POST except the ``fail_on``-th; jobs scrape until cancelled."""
+    client = Mock()
+    client._prepare_headers.return_value = {}
+    counter = {"n": 0}
+    cancelled = set()
+    lock = threading.Lock()
+
+    def post(endpoint, data, headers=None):
+        with lock:
+            counter["n"] += 1
+            n = counter["n"]
+        if n == fail_on:
+            return _payment_required()
+        return _ok({"success": True, "id": f"job-{n}", "url": f"https://api/job-{n}"})
+
+    def get(endpoint):
+        status = "cancelled" if endpoint.rsplit("/", 1)[-1] in cancelled else "scraping"
+        return _ok({"success": True, "status": status, "completed": 0, "total": 1, "data": []})
+
+    def delete(endpoint):
+        cancelled.add(endpoint.rsplit("/", 1)[-1])
+        return _ok({"status": "cancelled"})
+
+    client.post.side_effect = post
+    client.get.side_effect = get
+    client.delete.side_effect = delete
+    return client, cancelled
+
+
+class TestSyncSplit:
+    def test_start_splits_and_returns_merged_handle(self):
+        client = _sync_client()
+        resp = batch_module.start_batch_scrape(client, _urls(2500), max_parallel_jobs=2)
+        assert client.post.call_count == 3
+        assert sorted(len(c.args[1]["urls"]) for c in client.post.call_args_list) == [500, 1000, 1000]
+        assert split_job_id(resp.id) == resp.sub_job_ids
+        assert len(resp.sub_job_ids) == 3
+
+    def test_dedup_applies_across_chunks(self):
+        client = _sync_client()
+        dedup = UrlDeduplicator(capacity=10_000)
+        urls = _urls(1500) + _urls(10)
+        resp = batch_module.start_batch_scrape(client, urls, deduplicator=dedup)
+        assert resp.dedup_hits == 10
+        assert sum(len(c.args[1]["urls"]) for c in client.post.call_args_list) == 1500
+
+    def test_status_and_cancel_aggregate_over_sub_jobs(self):
+        client = Mock()
+        client.get.side_effect = lambda url: _ok({
+            "success": True, "status": "completed", "completed": 1, "total": 1, "creditsUsed": 1,
+            "data": [{"markdown": url}],
+        })
+        client.delete.return_value = _ok({"status": "cancelled"})
+
+        job_id = merge_job_ids(["a", "b"])
+        job = batch_module.get_batch_scrape_status(client, job_id)
+        assert job.status == "completed"
+        assert job.total == 2
+        assert sorted(d.markdown for d in job.data) == ["/v2/batch/scrape/a", "/v2/batch/scrape/b"]
+        assert batch_module.cancel_batch_scrape(client, job_id) is True
+        assert client.delete.call_count == 2
+
+
+    def test_failed_chunk_cancels_started_sub_jobs(self):
+        client, cancelled = _failing_client(fail_on=2)
+        with pytest.raises(Exception, match="Insufficient credits"):
+            batch_module.start_batch_scrape(client, _urls(2500), max_parallel_jobs=1)
+        assert client.post.call_count == 2
+        assert cancelled == {"job-1"}
+
+    def test_failed_chunk_cancels_running_siblings_while_waiting(self):
+        client, cancelled = _failing_client(fail_on=2)
+        with pytest.raises(Exception, match="Insufficient credits"):
+            # job-1 never finishes on its own; the failure of chunk 2 must end its wait
+            batch_module.batch_scrape(client, _urls(2500), poll_interval=0, timeout=5, max_parallel_jobs=2)
+        assert "job-1" in cancelled
+
+
+class _FakeAsyncClient:
+    def __init__(self):
+        self.posted = []
+        self.auto_idempotency = False
+        self.idempotency_journal = None
+
+    async def post(self, endpoint, data, headers=None):
+        self.posted.append(list(data["urls"]))
+        n = len(self.posted)
+        return _ok({"success": True, "id": f"job-{n}", "url": f"https://api/job-{n}"})
+
+    async def get(self, endpoint):
+        return _ok({"success": True, "status": "completed", "completed": 1, "total": 1, "data": []})
+
+
+class _FailingAsyncClient(_FakeAsyncClient):
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+        self.cancelled = set()
+
+    async def post(self, endpoint, data, headers=None):
+        self.posted.append(list(data["urls"]))
+        n = len(self.posted)
+        if n == self.fail_on:
+            return _payment_required()
+        return _ok({"success": True, "id": f"job-{n}", "url": f"https://api/job-{n}"})
+
+    async def get(self, endpoint):
+        status = "cancelled" if endpoint.rsplit("/", 1)[-1] in self.cancelled else "scraping"
+        return _ok({"success": True, "status": status, "completed": 0, "total": 1, "data": []})
+
+    async def delete(self, endpoint):
+        self.cancelled.add(endpoint.rsplit("/", 1)[-1])
+        return _ok({"status": "cancelled"})
+
+
+@pytest.mark.asyncio
+async def test_async_failed_chunk_cancels_started_sub_jobs():
+    client = _FailingAsyncClient(fail_on=2)
+    with pytest.raises(Exception, match="Insufficient credits"):
+        await aio_batch.start_batch_scrape(client, _urls(2500), max_parallel_jobs=1)
+    assert client.cancelled == {"job-1"}
+
+    client = _FailingAsyncClient(fail_on=2)
+    with pytest.raises(Exception, match="Insufficient credits"):
+        await aio_batch.batch_scrape(client, _urls(2500), poll_interval=0, timeout=5, max_parallel_jobs=2)
+    assert "job-1" in client.cancelled
+
+
+@pytest.mark.asyncio
+async def test_async_batch_scrape_splits_and_merges():
+    client = _FakeAsyncClient()
+    job = await aio_batch.batch_scrape(client, iter(_urls(2001)), poll_interval=0, max_parallel_jobs=2)
+    assert [len(u) for u in client.posted] == [1000, 1000, 1]
+    assert job.status == "completed"
+    assert job.total == 3
@@ -0,0 +1,166 @@
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.types import (
+    Document,
+    DocumentMetadata,
+    LinkResult,
+    MapData,
+    SearchData,
+    SearchResultNews,
+    SearchResultWeb,
+)
+from firecrawl.v2.utils.cache import (
+    MapSearchCache,
+    ScrapeCache,
+    TieredCache,
+    _decode_search,
+    _encode_map,
+    _encode_search,
+)
+
+
+def _payload(url="https://docs.example.com/a", **extra):
+    return {"url": url, "formats": ["markdown"], **extra}
+
+
+def _doc(text="# hi"):
+    return Document(markdown=text, metadata=DocumentMetadata(url="https://docs.example.com/a", status_code=200))
+
+
+class TestTieredCache:
+    def test_lru_evicts_oldest_and_counts(self):
+        cache = TieredCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key.upper(), str.encode)
+        assert cache.get("a", None, bytes.decode) is None
+        assert cache.get("c", None, bytes.decode) == "C"
+        stats = cache.stats()
+        assert (stats.evictions, stats.memory_hits, stats.misses) == (1, 1, 1)
+        assert stats.memory_entries == 2
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        first = TieredCache(path=path)
+        first.set("k", "value", str.encode, tag="example.com/")
+        first.close()
+
+        second = TieredCache(path=path)
+        assert second.get("k", None, bytes.decode) == "value"
+        assert second.stats().disk_hits == 1
+        assert second.get("k", None, bytes.decode) == "value"
+        assert second.stats().memory_hits == 1
+
+    def test_invalidate_by_tag_prefix(self, tmp_path):
+        cache = TieredCache(path=str(tmp_path / "c.sqlite"))
+        cache.set("1", "x", str.encode, tag="a.com/")
+        cache.set("2", "y", str.encode, tag="a.com.au/")
+        assert cache.invalidate("a.com/") == 1
+        assert cache.get("1", None, bytes.decode) is None
+        assert cache.get("2", None, bytes.decode) == "y"
+
+
+class TestScrapeCache:
+    def test_max_age_bounds_freshness(self, monkeypatch):
+        cache = ScrapeCache()
+        cache.store(_payload(maxAge=60_000), _doc())
+        assert cache.lookup(_payload(maxAge=60_000)).markdown == "# hi"
+
+        later = time.time() + 120
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert cache.lookup(_payload(maxAge=60_000)) is None
+        assert cache.lookup(_payload(maxAge=600_000)) is not None
+        assert cache.stats().stale == 1
+
+    def test_bypass_rules(self):
+        cache = ScrapeCache()
+        cache.store(_payload(storeInCache=False), _doc())
+        assert cache.lookup(_payload()) is None
+        cache.store(_payload(), _doc())
+        assert cache.lookup(_payload(maxAge=0)) is None
+        assert cache.lookup(_payload(formats=["html"])) is None
+        cache.store(_payload(actions=[{"type": "click"}]), _doc())
+        assert cache.stats().writes == 1
+
+    def test_disk_round_trip_and_domain_invalidation(self, tmp_path):
+        path = str(tmp_path / "scrape.sqlite")
+        ScrapeCache(path=path).store(_payload(), _doc())
+        reopened = ScrapeCache(path=path)
+        doc = reopened.lookup(_payload())
+        assert doc.metadata.status_code == 200
+        assert reopened.invalidate_domain("example.com") == 1
+        assert reopened.lookup(_payload()) is None
+
+
+def test_client_serves_repeated_scrapes_from_cache(monkeypatch):
+    cache = ScrapeCache()
+    client = FirecrawlClient(api_key="test", api_url="http://localhost", scrape_cache=cache)
+    from firecrawl.v2.methods import scrape as scrape_module
+    fetch = Mock(return_value=_doc())
+    monkeypatch.setattr(scrape_module, "scrape", fetch)
+
+    first = client.scrape("https://docs.example.com/a", formats=["markdown"], max_age=60_000)
+    second = client.scrape("https://docs.example.com/a", formats=["markdown"], max_age=60_000)
+    assert first is second
+    assert fetch.call_count == 1
+    assert cache.stats().hits == 1 and cache.stats().misses == 1
+
+
+class TestMapSearchCache:
+    def test_map_round_trips_compactly_through_disk(self, tmp_path):
+        path = str(tmp_path / "ms.sqlite")
+        links = [LinkResult(url=f"https://example.com/{i}", title="t" if i % 2 else None) for i in range(500)]
+        payload = {"url": "https://example.com", "limit": 500}
+        MapSearchCache(path=path).put_map(payload, MapData(links=links))
+
+        reopened = MapSearchCache(path=path)
+        restored = reopened.get_map(payload)
+        assert [l.model_dump() for l in restored.links] == [l.model_dump() for l in links]
+        assert reopened.get_map({**payload, "limit": 10}) is None
+        assert len(_encode_map(MapData(links=links))) < len(MapData(links=links).model_dump_json()) // 4
+
+    def test_search_preserves_document_and_result_types(self):
+        cache = MapSearchCache()
+        data = SearchData(
+            web=[SearchResultWeb(url="https://a.com", title="A"), Document(markdown="# doc")],
+            news=[SearchResultNews(title="n", url="https://n.com")],
+        )
+        cache.put_search({"query": "firecrawl python"}, data)
+        restored = _decode_search(_encode_search(data))
+        assert isinstance(restored.web[0], SearchResultWeb)
+        assert isinstance(restored.web[1], Document)
+        assert restored.news[0].title == "n"
+        assert restored.images is None
+        assert cache.get_search({"query": "firecrawl python"}) is data
+
+    def test_ttl_and_invalidation(self, monkeypatch):
+        cache = MapSearchCache(ttl=60)
+        cache.put_map({"url": "https://docs.example.com"}, MapData(links=[]))
+        cache.put_map({"url": "https://other.org"}, MapData(links=[]))
+        cache.put_search({"query": "Firecrawl  SDK"}, SearchData())
+        cache.put_search({"query": "other"}, SearchData())
+
+        assert cache.invalidate_domain("example.com") == 1
+        assert cache.get_map({"url": "https://docs.example.com"}) is None
+        assert cache.invalidate_query_prefix("firecrawl s") == 1
+        assert cache.get_search({"query": "other"}) is not None
+
+        later = time.time() + 61
+        monkeypatch.setattr(time, "time", lambda: later)
+        assert cache.get_map({"url": "https://other.org"}) is None
+
+
+def test_client_map_uses_map_search_cache(monkeypatch):
+    cache = MapSearchCache()
+    client = FirecrawlClient(api_key="test", api_url="http://localhost", map_search_cache=cache)
+    from firecrawl.v2.methods import map as map_module
+    fetch = Mock(return_value=MapData(links=[LinkResult(url="https://example.com/a")]))
+    monkeypatch.setattr(map_module, "map", fetch)
+
+    assert client.map("https://example.com", limit=5).links[0].url == "https://example.com/a"
+    client.map("https://example.com", limit=5)
+    client.map("https://example.com", limit=6)
+    assert fetch.call_count == 2
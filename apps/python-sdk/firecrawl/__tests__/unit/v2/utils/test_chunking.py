@@ -0,0 +1,107 @@
+import pytest
+
+from firecrawl.v2.types import Document, DocumentMetadata
+from firecrawl.v2.utils.chunking import MarkdownChunker, chunk_documents, tiktoken_tokenizer
+
+
+def words(text):
+    return len(text.split())
+
+
+GUIDE = """# Guide
+
+Firecrawl turns websites into markdown.
+
+## Install
+
+Run pip install firecrawl-py.
+
+```python
+from firecrawl import Firecrawl
+
+client = Firecrawl()
+```
+
+## Usage
+
+### Scrape
+
+One two three four five six seven eight nine ten.
+"""
+
+
+def test_splits_on_headings_and_keeps_code_blocks_whole():
+    chunks = list(MarkdownChunker(12, min_tokens=0, tokenizer=words).split(GUIDE))
+
+    assert [headings for _, headings, _ in chunks] == [
+        ["Guide"], ["Guide", "Install"], ["Guide", "Install"], ["Guide", "Usage"], ["Guide", "Usage", "Scrape"],
+    ]
+    assert chunks[2][0].startswith("```python") and "client = Firecrawl()\n```" in chunks[2][0]
+    assert all(tokens <= 12 for _, _, tokens in chunks)
+
+
+def test_small_sections_are_merged_up_to_min_tokens():
+    chunks = list(MarkdownChunker(40, tokenizer=words).split(GUIDE))
+    assert chunks[0][0].startswith("# Guide") and "## Install" in chunks[0][0]
+
+
+def test_oversized_paragraphs_are_split_by_sentence_then_word():
+    sentence = "alpha beta gamma delta. "
+    text = "# Long\n\n" + sentence * 20 + " ".join(["x"] * 30)
+    chunks = list(MarkdownChunker(10, min_tokens=0, tokenizer=words).split(text))
+
+    assert all(tokens <= 10 for _, _, tokens in chunks)
+    # The heading tops up with the first sentences instead of standing alone
+    assert chunks[0][0].startswith("# Long\n\nalpha")
+    assert " ".join(c[0] for c in chunks).split().count("x") == 30
+
+
+def test_overlap_repeats_trailing_blocks():
+    text = "\n\n".join(f"p{i} a b c" for i in range(6))
+    chunks = [c[0] for c in MarkdownChunker(8, overlap_tokens=4, tokenizer=words).split(text)]
+    assert chunks[0].endswith("p1 a b c") and chunks[1].startswith("p1 a b c")
+
+
+def test_documents_stream_with_source_and_metadata():
+    pulled = []
+
+    def documents():
+        for i in range(3):
+            pulled.append(i)
+            yield Document(markdown=f"# Page {i}\n\nBody {i}.", metadata=DocumentMetadata(source_url=f"https://a.com/{i}", title=f"T{i}"))
+        yield {"markdown": "Raw event body.", "metadata": {"sourceURL": "https://a.com/raw", "statusCode": 200}}
+
+    chunks = chunk_documents(documents(), max_tokens=50)
+    first = next(chunks)
+    assert pulled == [0]
+    assert (first.source_url, first.headings, first.metadata["title"], first.chunk_index) == ("https://a.com/0", ["Page 0"], "T0", 0)
+
+    rest = list(chunks)
+    assert [c.document_index for c in rest] == [1, 2, 3]
+    assert rest[-1].source_url == "https://a.com/raw" and rest[-1].metadata["status_code"] == 200
+
+
+def test_tokenizer_calls_scale_linearly():
+    calls = 0
+
+    def counting(text):
+        nonlocal calls
+        calls += 1
+        return words(text)
+
+    paragraphs = 5000
+    markdown = "\n\n".join(f"## S{i}\n\nsome words in paragraph {i}" for i in range(paragraphs))
+    chunks = list(MarkdownChunker(64, tokenizer=counting).split(markdown))
+
+    assert calls <= 2 * paragraphs + 1
+    assert sum(text.count("## S") for text, _, _ in chunks) == paragraphs
+
+
+def test_validation_and_optional_tiktoken():
+    with pytest.raises(ValueError):
+        MarkdownChunker(10, overlap_tokens=10)
+    try:
+        import tiktoken  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="pip install tiktoken"):
+            tiktoken_tokenizer()
@@ -0,0 +1,147 @@
+import json
+
+import httpx
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods.aio import crawl as async_crawl
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils.credits import CreditBudgetExceeded, CreditLedger
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _response(status_code, payload):
+    response = Mock(ok=status_code < 400, status_code=status_code, content=json.dumps(payload).encode())
+    response.json.return_value = payload
+    return response
+
+
+def _status(status, credits):
+    return _response(200, {"success": True, "status": status, "completed": 1, "total": 4, "creditsUsed": credits, "data": []})
+
+
+class TestCreditLedger:
+    def test_snapshots_are_cumulative_and_attributed_to_tags(self):
+        ledger = CreditLedger()
+        with ledger.tagged("tenant-a"):
+            ledger.record_job("crawl", "j1", 5)
+        ledger.record_job("crawl", "j1", 8)
+        ledger.record_job("crawl", "j1", None)  # watcher messages without a credit count
+        ledger.record_credits(2)
+
+        assert ledger.spent(job_id="j1") == 8
+        assert ledger.spent(tag="tenant-a") == 8
+        assert ledger.spent() == 10
+        stats = ledger.stats()
+        assert stats.by_tag == {"tenant-a": 8, "default": 2}
+        assert stats.by_job == {"j1": 8}
+
+    def test_job_budget_breaches_once(self):
+        ledger = CreditLedger(job_budget=10)
+        assert ledger.record_job("crawl", "j1", 10) is None
+        breach = ledger.record_job("crawl", "j1", 11)
+        assert (breach.scope, breach.key, breach.spent, breach.budget) == ("job", "j1", 11, 10)
+        assert ledger.record_job("crawl", "j1", 20) is None
+        assert ledger.stats().breaches == 1
+
+    def test_client_and_tag_budgets_stop_new_work(self):
+        ledger = CreditLedger(budget=100, tag_budgets={"cheap": 3})
+        with ledger.tagged("cheap"):
+            ledger.check()
+            ledger.record_credits(3)
+            with pytest.raises(CreditBudgetExceeded) as exc:
+                ledger.check()
+        assert exc.value.scope == "tag"
+        ledger.check()
+        assert ledger.remaining() == 97 and ledger.remaining(tag="cheap") == 0
+
+    def test_merged_batch_shares_one_budget(self):
+        ledger = CreditLedger()
+        ledger.track("merged:a,b", "batch_scrape", budget=10)
+        assert ledger.record_job("batch_scrape", "a", 6) is None
+        breach = ledger.record_job("batch_scrape", "b", 6)
+        assert breach.key == "merged:a,b" and breach.spent == 12
+        assert ledger.spent(job_id="merged:a,b") == 12
+
+
+class TestClientBudgets:
+    def test_runaway_crawl_is_cancelled_while_waiting(self):
+        exceeded = []
+        ledger = CreditLedger(job_budget=10, on_exceeded=exceeded.append)
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=False, credit_ledger=ledger)
+        started = _response(200, {"success": True, "id": "job-1", "url": "http://localhost/v2/crawl/job-1"})
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=started), \
+                patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=[_status("scraping", 4), _status("scraping", 12)]), \
+                patch("firecrawl.v2.utils.http_client.requests.Session.delete", return_value=_response(200, {"status": "cancelled"})) as delete, \
+                pytest.raises(CreditBudgetExceeded) as exc:
+            client.crawl("https://example.com", poll_interval=0)
+
+        assert delete.call_args.args[0] == "http://localhost/v2/crawl/job-1"
+        assert exc.value.cancelled and exc.value.job.credits_used == 12
+        assert exceeded == [exc.value]
+        assert ledger.stats().cancelled_jobs == ["job-1"]
+
+        # Later polls see the cancelled job without another breach
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_status("cancelled", 12)):
+            assert client.get_crawl_status("job-1").status == "cancelled"
+
+    def test_tag_breach_on_merged_batch_cancels_every_sub_job(self):
+        ledger = CreditLedger(tag_budgets={"nightly": 10})
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=False, credit_ledger=ledger)
+        ledger.track("merged:a,b,c", "batch_scrape", tag="nightly")
+        snapshots = {"a": _status("scraping", 4), "b": _status("scraping", 8), "c": _status("scraping", 0)}
+
+        def get(url, **kwargs):
+            return snapshots[url.rsplit("/", 1)[-1]]
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=get), \
+                patch("firecrawl.v2.utils.http_client.requests.Session.delete", return_value=_response(200, {"status": "cancelled"})) as delete, \
+                pytest.raises(CreditBudgetExceeded) as exc:
+            client.get_batch_scrape_status("merged:a,b,c")
+
+        assert exc.value.scope == "tag" and exc.value.cancelled
+        cancelled = sorted(call.args[0].rsplit("/", 1)[-1] for call in delete.call_args_list)
+        assert cancelled == ["a", "b", "c"]
+        assert sorted(ledger.stats().cancelled_jobs) == ["a", "b", "c"]
+        assert ledger.stats().breaches == 1
+
+    def test_exhausted_budget_stops_scrapes_and_batch_feeders(self):
+        ledger = CreditLedger(budget=1)
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=False, credit_ledger=ledger)
+        scraped = _response(200, {"success": True, "data": {"markdown": "a", "metadata": {"creditsUsed": 1}}})
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=scraped) as post:
+            client.scrape("https://a.com")
+            with pytest.raises(CreditBudgetExceeded):
+                client.scrape("https://b.com")
+            with pytest.raises(CreditBudgetExceeded):
+                client.start_batch_scrape(["https://c.com"])
+
+        assert post.call_count == 1
+        assert ledger.spent() == 1
+
+
+@pytest.mark.asyncio
+async def test_async_status_cancels_over_budget_job():
+    ledger = CreditLedger(budget=5)
+    client = AsyncHttpClient("k", "http://localhost", credit_ledger=ledger)
+    requests = []
+
+    def handler(request):
+        requests.append(request.method)
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"status": "cancelled"})
+        return httpx.Response(200, json={"success": True, "status": "scraping", "creditsUsed": 9, "data": []})
+
+    client._client = httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(handler))
+    with pytest.raises(CreditBudgetExceeded) as exc:
+        await async_crawl.get_crawl_status(client, "job-1")
+    # Reported once; later polls return the snapshot
+    job = await async_crawl.get_crawl_status(client, "job-1")
+    await client.close()
+
+    assert exc.value.scope == "client" and exc.value.cancelled
+    assert isinstance(job, CrawlJob)
+    assert requests == ["GET", "DELETE", "GET"]
@@ -0,0 +1,208 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods import batch as batch_module
+from firecrawl.v2.utils.domain_dispatch import (
+    DomainDispatcher,
+    interleave_by_domain,
+    registrable_domain,
+)
+from firecrawl.v2.utils.error_handler import InternalServerError, PaymentRequiredError, RateLimitError
+from firecrawl.v2.utils.scheduler import RequestScheduler
+
+
+class TestRegistrableDomain:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://docs.example.com/a", "example.com"),
+        ("https://a.b.example.co.uk/", "example.co.uk"),
+        ("http://EXAMPLE.com.", "example.com"),
+        ("http://127.0.0.1:8080/x", "127.0.0.1"),
+        ("http://localhost/", "localhost"),
+        ("not a url", ""),
+    ])
+    def test_grouping_key(self, url, expected):
+        assert registrable_domain(url) == expected
+
+    def test_interleave_round_robins_and_keeps_domain_order(self):
+        urls = [f"https://big.com/{i}" for i in range(4)] + ["https://a.org/1", "https://www.a.org/2", "https://c.net/"]
+        assert interleave_by_domain(urls) == [
+            "https://big.com/0", "https://a.org/1", "https://c.net/",
+            "https://big.com/1", "https://www.a.org/2",
+            "https://big.com/2",
+            "https://big.com/3",
+        ]
+
+
+class TestDomainDispatcher:
+    def test_per_domain_cap_and_round_robin_grants(self):
+        dispatcher = DomainDispatcher(max_concurrency=1, initial_cap=1, max_cap=1)
+        dispatcher.acquire("https://hold.com/")
+
+        order = []
+        threads = []
+        for url in ["https://big.com/1", "https://big.com/2", "https://big.com/3", "https://small.com/1"]:
+            def run(u=url):
+                with dispatcher.slot(u):
+                    order.append(registrable_domain(u))
+            t = threading.Thread(target=run)
+            t.start()
+            threads.append(t)
+            # Enqueue deterministically
+            deadline = time.monotonic() + 2
+            while sum(s.queued for s in dispatcher.stats().values()) < len(threads) and time.monotonic() < deadline:
+                time.sleep(0.002)
+
+        dispatcher.release("https://hold.com/")
+        for t in threads:
+            t.join(2)
+        # small.com is served second, not after the whole big.com backlog
+        assert order == ["big.com", "small.com", "big.com", "big.com"]
+
+    def test_errors_halve_cap_and_healthy_completions_grow_it(self):
+        dispatcher = DomainDispatcher(initial_cap=4, max_cap=8)
+        for _ in range(2):
+            with pytest.raises(InternalServerError):
+                with dispatcher.slot("https://flaky.com/"):
+                    raise InternalServerError("origin failed", 502)
+        stats = dispatcher.stats()["flaky.com"]
+        assert stats.cap == 1
+        assert stats.errors == 2
+        assert stats.error_rate > 0
+
+        for _ in range(10):
+            dispatcher.acquire("https://ok.com/")
+            dispatcher.release("https://ok.com/", latency=0.1)
+        assert dispatcher.stats()["ok.com"].cap > 4
+
+    @pytest.mark.parametrize("exc", [
+        RateLimitError("slow down", 429),
+        PaymentRequiredError("no credits", 402),
+        TimeoutError("scheduler slot"),
+        asyncio.CancelledError(),
+    ])
+    def test_non_origin_failures_release_without_an_outcome(self, exc):
+        dispatcher = DomainDispatcher(initial_cap=4)
+        with pytest.raises(type(exc)):
+            with dispatcher.slot("https://fine.com/"):
+                raise exc
+        stats = dispatcher.stats()["fine.com"]
+        assert (stats.cap, stats.in_flight, stats.completed, stats.errors) == (4, 0, 0, 0)
+
+    def test_slow_domain_cap_shrinks_relative_to_others(self):
+        dispatcher = DomainDispatcher(initial_cap=8, max_cap=8, min_samples=3)
+        for _ in range(20):
+            for url, latency in (("https://fast.com/", 0.05), ("https://slow.com/", 2.0)):
+                dispatcher.acquire(url)
+                dispatcher.release(url, latency=latency)
+        stats = dispatcher.stats()
+        assert stats["slow.com"].cap < stats["fast.com"].cap
+        assert stats["slow.com"].latency_seconds > stats["fast.com"].latency_seconds
+
+    def test_acquire_timeout_withdraws_waiter(self):
+        dispatcher = DomainDispatcher(initial_cap=1)
+        dispatcher.acquire("https://x.com/")
+        with pytest.raises(TimeoutError):
+            dispatcher.acquire("https://x.com/other", timeout=0.01)
+        assert dispatcher.stats()["x.com"].queued == 0
+
+    def test_withdrawn_waiter_does_not_block_other_domains(self):
+        dispatcher = DomainDispatcher(max_concurrency=1)
+        dispatcher.acquire("https://a.com/")
+        with pytest.raises(TimeoutError):
+            dispatcher.acquire("https://b.com/", timeout=0.01)
+
+        granted = threading.Event()
+        waiter = threading.Thread(target=lambda: (dispatcher.acquire("https://c.com/", timeout=2), granted.set()))
+        waiter.start()
+        deadline = time.monotonic() + 2
+        while dispatcher.stats().get("c.com") is None or dispatcher.stats()["c.com"].queued == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.002)
+
+        dispatcher.release("https://a.com/")
+        waiter.join(2)
+        assert granted.is_set()
+        assert dispatcher.stats()["c.com"].in_flight == 1
+
+    def test_map_async_preserves_order_and_caps_domains(self):
+        dispatcher = DomainDispatcher(initial_cap=2, max_cap=2)
+        active = {}
+        peak = {}
+
+        async def fetch(url):
+            key = registrable_domain(url)
+            active[key] = active.get(key, 0) + 1
+            peak[key] = max(peak.get(key, 0), active[key])
+            await asyncio.sleep(0.005)
+            active[key] -= 1
+            return url
+
+        urls = [f"https://a.com/{i}" for i in range(6)] + [f"https://b.com/{i}" for i in range(3)]
+        result = asyncio.run(dispatcher.map_async(fetch, urls))
+        assert result == urls
+        assert peak == {"a.com": 2, "b.com": 2}
+
+
+def test_batch_scrape_interleaves_domains():
+    client = Mock()
+    client._prepare_headers.return_value = {}
+    resp = Mock(ok=True, status_code=200)
+    resp.json.return_value = {"success": True, "id": "job", "url": "https://api/job"}
+    client.post.return_value = resp
+
+    urls = ["https://a.com/1", "https://a.com/2", "https://b.com/1"]
+    batch_module.start_batch_scrape(client, urls, interleave_domains=True)
+    assert client.post.call_args.args[1]["urls"] == ["https://a.com/1", "https://b.com/1", "https://a.com/2"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_scrape_goes_through_dispatcher(monkeypatch):
+    dispatcher = DomainDispatcher(initial_cap=1, max_cap=1)
+    client = AsyncFirecrawlClient(api_key="test", api_url="http://localhost", domain_dispatcher=dispatcher)
+    peak = {"now": 0, "max": 0}
+
+    async def fake_scrape(http_client, url, options):
+        peak["now"] += 1
+        peak["max"] = max(peak["max"], peak["now"])
+        await asyncio.sleep(0.005)
+        peak["now"] -= 1
+        return url
+
+    from firecrawl.v2.methods.aio import scrape as async_scrape
+    monkeypatch.setattr(async_scrape, "scrape", fake_scrape)
+
+    urls = [f"https://one.com/{i}" for i in range(4)]
+    assert await asyncio.gather(*(client.scrape(u) for u in urls)) == urls
+    assert peak["max"] == 1
+    assert dispatcher.stats()["one.com"].completed == 4
+
+
+def test_scrape_latency_excludes_the_scheduler_wait(monkeypatch):
+    scheduler = RequestScheduler(max_concurrency=1)
+    dispatcher = DomainDispatcher()
+    client = FirecrawlClient(
+        api_key="test", api_url="http://localhost", scheduler=scheduler, domain_dispatcher=dispatcher
+    )
+
+    from firecrawl.v2.methods import scrape as scrape_module
+    monkeypatch.setattr(scrape_module, "scrape", Mock(return_value="doc"))
+
+    scheduler.acquire("bulk")  # the scrape queues behind this slot
+    t = threading.Thread(target=client.scrape, args=("https://one.com/",))
+    t.start()
+    deadline = time.monotonic() + 2
+    while scheduler.queue_depth() == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    time.sleep(0.2)
+    scheduler.release("bulk")
+    t.join(2)
+
+    stats = dispatcher.stats()["one.com"]
+    assert stats.completed == 1
+    assert stats.latency_seconds < 0.1
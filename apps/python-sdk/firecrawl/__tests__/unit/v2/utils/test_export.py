@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.types import Document, DocumentMetadata, PaginationConfig
+from firecrawl.v2.methods.crawl import iter_crawl_documents
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from firecrawl.v2.utils.export import (  # noqa: E402
+    ParquetDocumentWriter,
+    document_schema,
+    iter_record_batches,
+    write_parquet,
+)
+
+
+def _raw_doc(i):
+    return {
+        "markdown": f"# page {i}",
+        "rawHtml": f"<html>{i}</html>",
+        "links": [f"https://a.com/{i}"],
+        "json": {"n": i},
+        "metadata": {"sourceURL": f"https://a.com/{i}", "statusCode": "200", "ogLocaleAlternate": ["en", "fr"]},
+    }
+
+
+class TestRecordBatches:
+    def test_flattens_metadata_and_normalizes_raw_dicts(self):
+        batches = list(iter_record_batches([_raw_doc(i) for i in range(5)], batch_size=2))
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+
+        table = pa.Table.from_batches(batches)
+        assert table.schema == document_schema()
+        row = table.slice(1, 1).to_pylist()[0]
+        assert row["markdown"] == "# page 1"
+        assert row["raw_html"] == "<html>1</html>"
+        assert row["json"] == '{"n": 1}'
+        assert row["metadata_source_url"] == "https://a.com/1"
+        assert row["metadata_status_code"] == 200
+        assert row["metadata_og_locale_alternate"] == ["en", "fr"]
+
+    def test_accepts_documents(self):
+        doc = Document(markdown="x", metadata=DocumentMetadata(title="T", keywords=["a", "b"]))
+        row = pa.Table.from_batches(list(iter_record_batches([doc]))).to_pylist()[0]
+        assert row["metadata_title"] == "T"
+        assert row["metadata_keywords"] == "a, b"
+        assert row["html"] is None
+
+
+class TestParquet:
+    def test_write_parquet_uses_row_groups(self, tmp_path):
+        path = str(tmp_path / "docs.parquet")
+        rows = write_parquet((_raw_doc(i) for i in range(7)), path, row_group_size=3)
+        assert rows == 7
+        meta = pq.ParquetFile(path).metadata
+        assert meta.num_rows == 7
+        assert meta.num_row_groups == 3
+
+    def test_incremental_writer(self, tmp_path):
+        path = str(tmp_path / "docs.parquet")
+        with ParquetDocumentWriter(path, row_group_size=10) as writer:
+            writer.write(_raw_doc(0))
+            writer.write(_raw_doc(1))
+        assert writer.rows_written == 2
+        assert pq.read_table(path).column("markdown").to_pylist() == ["# page 0", "# page 1"]
+
+
+class TestStreamingPages:
+    def test_iter_crawl_documents_follows_next_lazily(self):
+        pages = [
+            {"success": True, "data": [_raw_doc(0), _raw_doc(1)], "next": "https://api/v2/crawl/j?skip=2"},
+            {"success": True, "data": [_raw_doc(2)], "next": None},
+        ]
+        client = Mock()
+        client.get.side_effect = [Mock(ok=True, json=Mock(return_value=p)) for p in pages]
+
+        it = iter_crawl_documents(client, "j")
+        first = next(it)
+        assert first.markdown == "# page 0"
+        assert client.get.call_count == 1
+        assert [d.markdown for d in it] == ["# page 1", "# page 2"]
+        assert client.get.call_count == 2
+
+    def test_iter_respects_max_results(self):
+        page = {"success": True, "data": [_raw_doc(0), _raw_doc(1)], "next": "https://api/next"}
+        client = Mock()
+        client.get.return_value = Mock(ok=True, json=Mock(return_value=page))
+        docs = list(iter_crawl_documents(client, "j", PaginationConfig(max_results=1)))
+        assert len(docs) == 1
+        assert client.get.call_count == 1
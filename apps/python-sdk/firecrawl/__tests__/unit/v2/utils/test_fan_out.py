@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl import AsyncFirecrawl, Firecrawl
+from firecrawl.testing import FakeFirecrawlServer, FakeServerConfig
+from firecrawl.v2.utils.error_handler import RateLimitError
+from firecrawl.v2.utils.fan_out import aiter_bounded, iter_bounded, rate_limit_delay
+
+
+def _tracked(delay=0.02, fail=()):
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fn(item):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            time.sleep(delay)
+            if item in fail:
+                raise ValueError(item)
+            return item * 10
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    return fn, state
+
+
+class TestIterBounded:
+    def test_bounded_with_indices_and_isolated_errors(self):
+        fn, state = _tracked(fail={3})
+        results = list(iter_bounded(fn, range(12), concurrency=4))
+
+        assert sorted(r.index for r in results) == list(range(12))
+        assert state["peak"] == 4
+        failed = [r for r in results if not r.ok]
+        assert [(r.index, r.item, type(r.error)) for r in failed] == [(3, 3, ValueError)]
+        with pytest.raises(ValueError):
+            failed[0].result()
+        assert {r.index: r.result() for r in results if r.ok}[11] == 110
+
+    def test_inputs_are_consumed_lazily(self):
+        consumed = []
+
+        def items():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        iterator = iter_bounded(lambda i: i, items(), concurrency=3)
+        next(iterator)
+        iterator.close()
+        assert len(consumed) <= 6
+
+    def test_rate_limits_are_retried_after_retry_after(self):
+        calls = []
+
+        def fn(item):
+            calls.append(item)
+            if len(calls) == 1:
+                raise RateLimitError("slow down", 429, Mock(headers={"Retry-After": "3"}))
+            return item
+
+        with patch("firecrawl.v2.utils.fan_out.time.sleep") as sleep:
+            results = list(iter_bounded(fn, ["a"], concurrency=1))
+        assert results[0].value == "a" and calls == ["a", "a"]
+        sleep.assert_called_once_with(3.0)
+
+        always = Mock(side_effect=RateLimitError("slow down", 429, None))
+        with patch("firecrawl.v2.utils.fan_out.time.sleep"):
+            (result,) = iter_bounded(always, ["a"], rate_limit_retries=1)
+        assert isinstance(result.error, RateLimitError) and always.call_count == 2
+        assert rate_limit_delay(RateLimitError("x", 429, None), 2, 0.5) == 2.0
+
+
+def test_aiter_bounded_bounds_tasks_and_isolates_errors():
+    active = peak = 0
+
+    async def fn(item):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if item == 2:
+            raise ValueError(item)
+        return item
+
+    async def run():
+        return [r async for r in aiter_bounded(fn, range(10), concurrency=3)]
+
+    results = asyncio.run(run())
+    assert sorted(r.index for r in results) == list(range(10))
+    assert peak == 3
+    assert [r.index for r in results if not r.ok] == [2]
+
+
+class TestClients:
+    @pytest.fixture
+    def server(self):
+        fake = FakeFirecrawlServer(FakeServerConfig(latency=0.05, rate_limit=50, rate_limit_burst=3))
+        fake.start()
+        yield fake
+        fake.stop()
+
+    def test_sync_scrape_many_rides_out_rate_limits(self, server):
+        client = Firecrawl(api_key="fc-many", api_url=server.url, tracing=False)
+        urls = [f"https://a.com/{i}" for i in range(8)]
+
+        results = sorted(client.scrape_many(urls, concurrency=4, formats=["markdown"]), key=lambda r: r.index)
+
+        assert [r.item for r in results] == urls
+        assert all(r.ok and r.value.markdown for r in results)
+        assert server.rate_limited > 0
+        assert server.requests["POST /v2/scrape"] == 8 + server.rate_limited
+
+    def test_sync_scrape_many_reuses_pooled_connections(self):
+        from urllib3.connectionpool import HTTPConnectionPool
+
+        opened = []
+        new_conn = HTTPConnectionPool._new_conn
+
+        def counting_new_conn(pool):
+            opened.append(pool.host)
+            return new_conn(pool)
+
+        with FakeFirecrawlServer(FakeServerConfig(latency=0.01)) as url, \
+                patch.object(HTTPConnectionPool, "_new_conn", counting_new_conn):
+            client = Firecrawl(api_key="fc-many", api_url=url, tracing=False)
+            urls = [f"https://a.com/{i}" for i in range(16)]
+            results = list(client.scrape_many(urls, concurrency=4, formats=["markdown"]))
+
+        assert all(r.ok for r in results)
+        # One keep-alive connection per worker, not one per URL
+        assert 1 <= len(opened) <= 4
+
+    def test_async_map_and_search_many(self, server):
+        async def run():
+            client = AsyncFirecrawl(api_key="fc-many", api_url=server.url, tracing=False)
+            maps = [r async for r in client.map_many(["https://a.com", "https://b.com"], concurrency=2, limit=5)]
+            searches = [r async for r in client.search_many(["q1", "q2", "q3"], concurrency=2, limit=2)]
+            return maps, searches
+
+        maps, searches = asyncio.run(run())
+        assert all(r.ok for r in maps + searches)
+        assert sorted(r.index for r in searches) == [0, 1, 2]
+        assert server.requests["POST /v2/map"] == 2 and server.requests["POST /v2/search"] == 3
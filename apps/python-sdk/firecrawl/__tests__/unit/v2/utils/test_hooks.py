@@ -0,0 +1,120 @@
+import json
+
+import httpx
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods import crawl as crawl_module
+from firecrawl.v2.methods.aio import scrape as async_scrape
+from firecrawl.v2.utils.hooks import NULL_TIMER, PHASES, Hooks, PhaseTimer, phase_timer
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _response(status_code, payload):
+    content = json.dumps(payload).encode()
+    response = Mock(ok=status_code < 400, status_code=status_code, content=content)
+    response.json.return_value = payload
+    response.request.body = b'{"url":"https://a.com"}'
+    return response
+
+
+def _recording_hooks():
+    hooks = Hooks()
+    events = {name: [] for name in ("request", "response", "retry", "page", "parse")}
+    for name, callbacks in events.items():
+        getattr(hooks, f"on_{name}")(callbacks.append)
+    return hooks, events
+
+
+class TestSyncTransport:
+    def test_retry_emits_request_response_and_retry_events(self):
+        hooks, events = _recording_hooks()
+        client = HttpClient("k", "http://localhost", hooks=hooks)
+        responses = [_response(502, {}), _response(200, {"ok": True})]
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=responses), \
+                patch("firecrawl.v2.utils.http_client.time.sleep"):
+            client.get("/v2/crawl/job")
+
+        assert [e.attempt for e in events["request"]] == [0, 1]
+        assert [e.status_code for e in events["response"]] == [502, 200]
+        assert events["response"][1].bytes_in == len(b'{"ok": true}')
+        assert events["response"][1].bytes_out == len(b'{"url":"https://a.com"}')
+        assert [(e.attempt, e.status_code, e.delay) for e in events["retry"]] == [(0, 502, 0.5)]
+
+    def test_request_hook_can_add_headers_and_failing_hooks_are_isolated(self):
+        hooks = Hooks()
+        hooks.on_request(lambda e: e.headers.update({"x-trace": "1"}))
+        hooks.on_response(Mock(side_effect=RuntimeError("broken hook")))
+        client = HttpClient("k", "http://localhost", hooks=hooks)
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=_response(200, {})) as post:
+            client.post_encoded("/v2/scrape", b"{}")
+
+        assert post.call_args.kwargs["headers"]["x-trace"] == "1"
+
+
+class TestParseEvents:
+    def test_scrape_reports_phase_timings(self):
+        hooks, events = _recording_hooks()
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", hooks=hooks)
+        payload = {"success": True, "data": {"markdown": "# hi", "metadata": {"sourceURL": "https://a.com"}}}
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=_response(200, payload)):
+            doc = client.scrape("https://a.com", formats=["markdown"])
+
+        assert doc.markdown == "# hi"
+        (event,) = events["parse"]
+        assert (event.operation, event.endpoint, event.status_code, event.documents) == ("scrape", "/v2/scrape", 200, 1)
+        assert set(event.timings) == set(PHASES)
+        assert all(v >= 0 for v in event.timings.values())
+        assert event.total_seconds >= sum(event.timings.values()) * 0.99
+        assert event.bytes_in == len(json.dumps(payload))
+
+    def test_crawl_status_emits_one_page_event_per_page(self):
+        hooks, events = _recording_hooks()
+        client = Mock(hooks=hooks)
+        client.get.side_effect = [
+            _response(200, {"success": True, "status": "completed", "data": [{"markdown": "a"}], "next": "/v2/crawl/j?skip=1"}),
+            _response(200, {"success": True, "data": [{"markdown": "b"}, {"markdown": "c"}]}),
+        ]
+
+        job = crawl_module.get_crawl_status(client, "j")
+
+        assert len(job.data) == 3
+        assert [(e.page, e.endpoint, e.documents) for e in events["page"]] == [
+            (1, "/v2/crawl/j", 1),
+            (2, "/v2/crawl/j?skip=1", 2),
+        ]
+        (parse,) = events["parse"]
+        assert (parse.operation, parse.pages, parse.documents) == ("crawl_status", 2, 3)
+        assert parse.bytes_in == sum(e.bytes_in for e in events["page"])
+
+    def test_no_hooks_uses_shared_null_timer(self):
+        assert phase_timer(Mock(), "scrape") is NULL_TIMER
+        assert phase_timer(Mock(hooks=Hooks()), "scrape") is NULL_TIMER
+        hooks = Hooks()
+        hooks.on_parse(print)
+        assert isinstance(phase_timer(Mock(hooks=hooks), "scrape"), PhaseTimer)
+
+
+@pytest.mark.asyncio
+async def test_async_transport_and_scrape_events():
+    hooks, events = _recording_hooks()
+    client = AsyncHttpClient("k", "http://localhost", hooks=hooks)
+    payload = {"success": True, "data": {"markdown": "# hi"}}
+
+    def handler(request):
+        return httpx.Response(200, json=payload)
+
+    client._client = httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(handler))
+    doc = await async_scrape.scrape(client, "https://a.com")
+    await client.close()
+
+    assert doc.markdown == "# hi"
+    assert [(e.method, e.url) for e in events["request"]] == [("POST", "http://localhost/v2/scrape")]
+    (response,) = events["response"]
+    assert response.status_code == 200 and response.bytes_out > 0 and response.bytes_in > 0
+    assert events["parse"][0].operation == "scrape"
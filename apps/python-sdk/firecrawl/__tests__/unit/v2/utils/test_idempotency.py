@@ -0,0 +1,192 @@
+import uuid
+
+import httpx
+import pytest
+import requests
+from unittest.mock import Mock
+
+from firecrawl.v2.types import CrawlRequest
+from firecrawl.v2.methods.crawl import start_crawl
+from firecrawl.v2.utils import idempotency
+from firecrawl.v2.utils.error_handler import ConflictError, IdempotencyConflictError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.idempotency import IdempotencyJournal, derive_idempotency_key
+
+
+class TestDeriveIdempotencyKey:
+    def test_key_is_stable_uuid_and_ignores_origin(self):
+        a = derive_idempotency_key("/v2/crawl", {"url": "https://a.com", "limit": 5})
+        b = derive_idempotency_key("/v2/crawl", {"limit": 5, "url": "https://a.com", "origin": "python-sdk@1"})
+        assert a == b
+        assert str(uuid.UUID(a)) == a
+
+    def test_key_depends_on_endpoint_and_payload(self):
+        payload = {"url": "https://a.com"}
+        assert derive_idempotency_key("/v2/crawl", payload) != derive_idempotency_key("/v2/extract", payload)
+        assert derive_idempotency_key("/v2/crawl", payload) != derive_idempotency_key("/v2/crawl", {"url": "https://b.com"})
+
+
+class TestIdempotencyJournal:
+    def test_journal_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "jobs.jsonl")
+        journal = IdempotencyJournal(path)
+        journal.record("k1", {"id": "job-1"})
+
+        reopened = IdempotencyJournal(path)
+        assert "k1" in reopened
+        assert reopened.get("k1") == {"id": "job-1"}
+        assert len(reopened) == 1
+
+    def test_entries_expire_and_keys_rotate(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(idempotency.time, "time", lambda: now[0])
+        path = str(tmp_path / "jobs.jsonl")
+        journal = IdempotencyJournal(path, ttl=60)
+        key = journal.key_for("derived")
+        assert journal.key_for("derived") == key
+        journal.record(key, {"id": "job-1"})
+        assert IdempotencyJournal(path, ttl=60).key_for("derived") == key
+
+        now[0] += 61
+        assert journal.get(key) is None
+        assert len(IdempotencyJournal(path, ttl=60)) == 0
+        assert journal.key_for("derived") != key
+
+    def test_discarded_key_is_replaced(self):
+        journal = IdempotencyJournal()
+        key = journal.key_for("derived")
+        journal.discard(key)
+        assert journal.key_for("derived") != key
+
+
+def _mock_client(auto_idempotency=True, journal=None):
+    client = Mock()
+    client.auto_idempotency = auto_idempotency
+    client.idempotency_journal = journal
+    client._prepare_headers.side_effect = lambda key=None: {"x-idempotency-key": key} if key else {}
+    ok = Mock(ok=True)
+    ok.json.return_value = {"success": True, "id": "job-1", "url": "https://api/crawl/job-1"}
+    client.post.return_value = ok
+    return client
+
+
+class TestStartCrawlIdempotency:
+    def test_auto_key_is_sent_and_job_is_replayed(self):
+        journal = IdempotencyJournal()
+        client = _mock_client(journal=journal)
+        request = CrawlRequest(url="https://example.com", limit=10)
+
+        first = start_crawl(client, request)
+        headers = client.post.call_args.kwargs["headers"]
+        assert "x-idempotency-key" in headers
+        assert headers["x-idempotency-key"] in journal
+
+        second = start_crawl(client, request)
+        assert second.id == first.id == "job-1"
+        assert client.post.call_count == 1
+
+    def test_no_key_without_opt_in(self):
+        client = _mock_client(auto_idempotency=False)
+        start_crawl(client, CrawlRequest(url="https://example.com"))
+        assert "headers" not in client.post.call_args.kwargs
+
+    def test_conflict_recovers_recorded_job(self):
+        journal = IdempotencyJournal()
+        client = _mock_client(journal=journal)
+        key = str(uuid.uuid4())
+
+        def concurrent_start(*args, **kwargs):
+            # Another caller with the same key started the crawl first
+            journal.record(key, {"id": "job-7", "url": "https://api/crawl/job-7"})
+            return Mock(ok=False, status_code=409)
+
+        client.post.side_effect = concurrent_start
+        assert start_crawl(client, CrawlRequest(url="https://example.com"), idempotency_key=key).id == "job-7"
+
+    def test_rejected_request_releases_auto_key(self):
+        journal = IdempotencyJournal()
+        client = _mock_client(journal=journal)
+        rejected = Mock(ok=False, status_code=402)
+        rejected.json.return_value = {"error": "Insufficient credits"}
+        client.post.return_value = rejected
+        request = CrawlRequest(url="https://example.com")
+        with pytest.raises(Exception):
+            start_crawl(client, request)
+        first = client.post.call_args.kwargs["headers"]["x-idempotency-key"]
+        with pytest.raises(Exception):
+            start_crawl(client, request)
+        assert client.post.call_args.kwargs["headers"]["x-idempotency-key"] != first
+
+    def test_conflict_raises(self):
+        client = _mock_client()
+        conflict = Mock(ok=False, status_code=409)
+        conflict.json.return_value = {"error": "Idempotency key already used"}
+        client.post.return_value = conflict
+        key = str(uuid.uuid4())
+        with pytest.raises(ConflictError) as info:
+            start_crawl(client, CrawlRequest(url="https://example.com"), idempotency_key=key)
+        assert isinstance(info.value, IdempotencyConflictError)
+        assert info.value.idempotency_key == key
+
+
+@pytest.mark.asyncio
+async def test_async_post_retries_transport_errors_only_with_key():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, json={"success": True, "id": "job-1"})
+
+    client = AsyncHttpClient("key", "http://localhost")
+    client._client = httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(handler))
+
+    resp = await client.post("/v2/crawl", {"url": "https://a.com"}, headers={"x-idempotency-key": "k"}, backoff_factor=0)
+    assert resp.status_code == 200
+    assert len(calls) == 2
+
+    calls.clear()
+    with pytest.raises(httpx.ConnectError):
+        await client.post("/v2/crawl", {"url": "https://a.com"}, backoff_factor=0)
+    assert len(calls) == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_post_sends_undeduplicated_endpoints_once():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        raise httpx.ConnectError("boom", request=request)
+
+    client = AsyncHttpClient("key", "http://localhost")
+    client._client = httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(handler))
+    for endpoint in ("/v2/batch/scrape", "/v2/extract"):
+        calls.clear()
+        with pytest.raises(httpx.ConnectError):
+            await client.post(endpoint, {"urls": ["https://a.com"]}, headers={"x-idempotency-key": "k"}, backoff_factor=0)
+        assert len(calls) == 1
+    await client.close()
+
+
+def test_sync_post_retries_only_deduplicated_job_starts(monkeypatch):
+    calls = []
+
+    def fake_post(url, **kwargs):
+        calls.append(url)
+        raise requests.ConnectionError("boom")
+
+    client = HttpClient("key", "http://localhost")
+    monkeypatch.setattr(client.session, "post", fake_post)
+
+    with pytest.raises(requests.ConnectionError):
+        client.post("/v2/batch/scrape", {"urls": []}, headers=client._prepare_headers("k"), backoff_factor=0)
+    assert len(calls) == 1
+
+    calls.clear()
+    with pytest.raises(requests.ConnectionError):
+        client.post("/v2/crawl", {"url": "https://a.com"}, headers=client._prepare_headers("k"), backoff_factor=0)
+    assert len(calls) == 3
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.hooks import Hooks
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.metrics import MetricsRegistry, RateMeter, endpoint_template
+
+
+def _response(status_code, payload):
+    response = Mock(ok=status_code < 400, status_code=status_code, content=json.dumps(payload).encode())
+    response.json.return_value = payload
+    response.request.body = b"{}"
+    return response
+
+
+def _sample(snapshot, name, **labels):
+    for sample in snapshot[name]["samples"]:
+        if all(sample["labels"].get(k) == v for k, v in labels.items()):
+            return sample
+    raise AssertionError(f"no {name} sample with {labels}")
+
+
+class TestMetricsRegistry:
+    def test_client_calls_feed_latency_retry_429_bytes_and_documents(self):
+        metrics = MetricsRegistry()
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", metrics=metrics, tracing=False)
+        status = {"success": True, "status": "completed", "data": [{"markdown": "a"}, {"markdown": "b"}]}
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=[_response(502, {}), _response(200, status)]), \
+                patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=_response(429, {"error": "slow down"})), \
+                patch("firecrawl.v2.utils.http_client.time.sleep"):
+            client.get_crawl_status("0f8c2a4e-1b2d-4c3e-9f00-123456789abc")
+            with pytest.raises(Exception):
+                client.scrape("https://a.com")
+
+        snap = metrics.snapshot()
+        ok = _sample(snap, "firecrawl_request_duration_seconds", endpoint="/v2/crawl/{id}", status="200")
+        assert ok["count"] == 1 and ok["buckets"]["+Inf"] == 1
+        assert _sample(snap, "firecrawl_retries_total", method="GET")["value"] == 1
+        assert _sample(snap, "firecrawl_rate_limited_total", endpoint="/v2/scrape")["value"] == 1
+        assert _sample(snap, "firecrawl_bytes_received_total", endpoint="/v2/crawl/{id}")["value"] == len(json.dumps(status)) + 2
+        assert _sample(snap, "firecrawl_documents_parsed_total", operation="crawl_status")["value"] == 2
+        assert all(s["value"] == 0 for s in snap["firecrawl_requests_in_flight"]["samples"])
+        assert snap["rates"]["documents_per_second"] > 0
+
+    def test_prometheus_exposition(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.request_duration.observe(0.05, method="GET", endpoint="/v2/crawl/{id}", status="200")
+        metrics.request_duration.observe(5.0, method="GET", endpoint="/v2/crawl/{id}", status="200")
+        metrics.watcher_message("crawl", "document")
+        text = metrics.prometheus()
+
+        assert "# TYPE firecrawl_request_duration_seconds histogram" in text
+        labels = 'method="GET",endpoint="/v2/crawl/{id}",status="200"'
+        assert f'firecrawl_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'firecrawl_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"firecrawl_request_duration_seconds_count{{{labels}}} 2" in text
+        assert 'firecrawl_watcher_messages_total{kind="crawl",type="document"} 1' in text
+        assert text.endswith("\n")
+
+    def test_custom_metrics_and_conflicting_registration(self):
+        metrics = MetricsRegistry()
+        jobs = metrics.counter("app_jobs_total", "Jobs.", ("queue",))
+        assert metrics.counter("app_jobs_total", "Jobs.", ("queue",)) is jobs
+        jobs.inc(queue="a")
+        assert jobs.value(queue="a") == 1
+        with pytest.raises(ValueError):
+            metrics.gauge("app_jobs_total", "Jobs.", ("queue",))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_async_request_leaves_nothing_in_flight():
+    metrics = MetricsRegistry()
+    events = []
+    hooks = metrics.install(Hooks())
+    hooks.on_response(events.append)
+    started = asyncio.Event()
+
+    async def hang(request):
+        started.set()
+        await asyncio.sleep(60)
+
+    client = AsyncHttpClient("key", "http://localhost", hooks=hooks)
+    client._client = httpx.AsyncClient(base_url="http://localhost", transport=httpx.MockTransport(hang))
+    task = asyncio.create_task(client.get("/v2/crawl/job-1"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await client.close()
+
+    assert metrics.in_flight.value(method="GET") == 0
+    assert isinstance(events[0].error, asyncio.CancelledError)
+
+
+def test_endpoint_template_bounds_cardinality():
+    assert endpoint_template("https://api.firecrawl.dev/v2/crawl/0f8c2a4e-1b2d-4c3e-9f00-123456789abc?skip=10") == "/v2/crawl/{id}"
+    assert endpoint_template("/v2/batch/scrape/merged:a,b") == "/v2/batch/scrape/{id}"
+    assert endpoint_template("/v2/scrape") == "/v2/scrape"
+
+
+def test_rate_meter_window(monkeypatch):
+    clock = {"t": 1000.0}
+    monkeypatch.setattr("firecrawl.v2.utils.metrics.time.monotonic", lambda: clock["t"])
+    meter = RateMeter(window=10)
+    clock["t"] += 10
+    meter.mark(50)
+    assert meter.per_second() == 5.0
+    clock["t"] += 11
+    assert meter.per_second() == 0.0
@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from firecrawl.v2.types import Document, DocumentMetadata
+from firecrawl.v2.utils.postprocess import PostProcessor, document_payload
+
+
+def digest(doc):
+    return doc["metadata"]["source_url"], hashlib.sha256(doc["markdown"].encode()).hexdigest()[:8], os.getpid()
+
+
+def title(doc):
+    return doc.metadata.title
+
+
+def slow_reverse(doc):
+    # Later documents finish first
+    time.sleep(0.02 * (5 - int(doc["markdown"])))
+    return int(doc["markdown"])
+
+
+def fail_on_three(doc):
+    if doc["markdown"] == "3":
+        raise ValueError("bad document")
+    return doc["markdown"]
+
+
+def _docs(n):
+    return [
+        Document(markdown=str(i), metadata=DocumentMetadata(source_url=f"https://a.com/{i}", title=f"t{i}"))
+        for i in range(n)
+    ]
+
+
+def test_payloads_are_compact_snake_case_dicts():
+    assert document_payload(Document(markdown="a")) == {"markdown": "a"}
+    raw = {"markdown": "a", "rawHtml": "<p>", "metadata": {"sourceURL": "https://a.com", "ogTitle": "x"}}
+    payload = document_payload(raw)
+    assert payload["raw_html"] == "<p>"
+    assert payload["metadata"]["og_title"] == "x"
+
+
+def test_process_pool_map_preserves_order():
+    with PostProcessor(digest, max_workers=2, chunk_size=3) as post:
+        results = list(post.map(_docs(10)))
+    assert [url for url, _, _ in results] == [f"https://a.com/{i}" for i in range(10)]
+    assert all(pid != os.getpid() for _, _, pid in results)
+
+    with PostProcessor(title, max_workers=1, as_document=True) as post:
+        assert list(post.map(_docs(2))) == ["t0", "t1"]
+
+
+def test_input_is_pulled_only_while_workers_have_room():
+    pulled = []
+    gate = threading.Event()
+
+    def documents():
+        for doc in _docs(40):
+            pulled.append(doc)
+            yield doc
+
+    def blocked(doc):
+        gate.wait(5)
+        return doc["markdown"]
+
+    with ThreadPoolExecutor(2) as pool:
+        post = PostProcessor(blocked, executor=pool, chunk_size=4, max_pending=2)
+        results = post.map(documents())
+        consumer = threading.Thread(target=lambda: next(results))
+        consumer.start()
+        time.sleep(0.1)
+        # Two chunks in flight; the generator waits on the first before pulling more
+        assert len(pulled) == 8
+        gate.set()
+        consumer.join()
+        assert list(results) == [str(i) for i in range(1, 40)]
+
+
+def test_unordered_results_and_worker_errors():
+    with ThreadPoolExecutor(5) as pool:
+        post = PostProcessor(slow_reverse, executor=pool, chunk_size=1, max_pending=5, ordered=False)
+        assert list(post.map(_docs(5)))[0] == 4
+
+        post = PostProcessor(fail_on_three, executor=pool, chunk_size=2)
+        with pytest.raises(ValueError, match="bad document"):
+            list(post.map(_docs(6)))
+
+
+def test_amap_accepts_async_iterables():
+    async def documents():
+        for doc in _docs(7):
+            await asyncio.sleep(0)
+            yield doc
+
+    async def run():
+        with ThreadPoolExecutor(3) as pool:
+            post = PostProcessor(lambda d: d["markdown"], executor=pool, chunk_size=2, max_pending=2)
+            return [r async for r in post.amap(documents())], [r async for r in post.amap(_docs(3))]
+
+    assert asyncio.run(run()) == ([str(i) for i in range(7)], ["0", "1", "2"])
+
+
+def test_submit_delivers_in_order_and_flushes_on_close():
+    received = []
+    with ThreadPoolExecutor(4) as pool:
+        with PostProcessor(slow_reverse, executor=pool, chunk_size=1, max_pending=3, on_result=received.append) as post:
+            for doc in _docs(5):
+                post.submit(doc.model_dump())
+    assert received == [0, 1, 2, 3, 4]
+
+    with ThreadPoolExecutor(2) as pool:
+        post = PostProcessor(fail_on_three, executor=pool, chunk_size=2)
+        for doc in _docs(4):
+            post.submit(doc)
+        with pytest.raises(ValueError):
+            post.close()
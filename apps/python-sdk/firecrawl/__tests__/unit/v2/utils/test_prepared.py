@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods.scrape import _prepare_scrape_request
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.prepared import PreparedScrape
+
+
+OPTIONS = ScrapeOptions(formats=["markdown", {"type": "screenshot", "full_page": True}], wait_for=500, max_age=1000)
+
+
+class TestPreparedScrape:
+    def test_body_matches_regular_payload(self):
+        prepared = PreparedScrape(OPTIONS)
+        url = " https://example.com/a?q=\"quoted\"&x=é "
+        body = json.loads(prepared.body(url))
+        expected = _prepare_scrape_request(url, OPTIONS)
+        assert body.pop("origin").startswith("python-sdk@")
+        assert body == expected
+        assert prepared.payload(url) == expected
+
+    def test_without_options_and_empty_url(self):
+        prepared = PreparedScrape()
+        assert json.loads(prepared.body("https://a.com"))["url"] == "https://a.com"
+        with pytest.raises(ValueError):
+            prepared.body("  ")
+
+    def test_invalid_options_fail_at_prepare_time(self):
+        with pytest.raises(ValueError):
+            PreparedScrape(ScrapeOptions(timeout=0))
+
+
+def test_client_scrape_prepared_posts_encoded_body():
+    client = FirecrawlClient(api_key="test", api_url="http://localhost")
+    prepared = client.prepare_scrape(formats=["markdown"])
+    response = Mock(ok=True, status_code=200)
+    response.json.return_value = {"success": True, "data": {"markdown": "# hi"}}
+
+    with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=response) as post:
+        doc = client.scrape_prepared(prepared, "https://example.com")
+
+    assert doc.markdown == "# hi"
+    sent = post.call_args.kwargs["data"]
+    assert isinstance(sent, bytes)
+    assert json.loads(sent)["url"] == "https://example.com"
+    assert post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
@@ -0,0 +1,122 @@
+import asyncio
+import itertools
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl import Firecrawl
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.types import CrawlJob, Document
+from firecrawl.v2.utils import profiling
+from firecrawl.v2.utils.hooks import NULL_TIMER, Hooks, phase_timer
+from firecrawl.v2.utils.profiling import Profiler, resolve_profiling
+from firecrawl.v2.watcher import Watcher
+
+
+def _response(status_code, payload):
+    response = Mock(ok=status_code < 400, status_code=status_code, content=json.dumps(payload).encode())
+    response.json.return_value = payload
+    return response
+
+
+def _docs(n, offset=0):
+    return [{"markdown": f"doc {offset + i}", "metadata": {"sourceURL": f"https://a.com/{offset + i}"}} for i in range(n)]
+
+
+def _phases(profiler):
+    return {(p.operation, p.phase): p for p in profiler.stats().phases}
+
+
+class TestProfiler:
+    def test_timer_accumulates_cpu_and_calls_per_phase(self):
+        ticks = itertools.count()
+        profiler = Profiler(clock=lambda: float(next(ticks)))
+        timer = phase_timer(Mock(hooks=None, profiler=profiler), "crawl_status")
+
+        timer.mark("network")
+        for _ in range(3):
+            timer.mark("normalize")
+            timer.mark("model")
+        timer.skip()
+        timer.page("/v2/crawl/j", None, 3)
+        timer.finish(None, 3)
+
+        phases = _phases(profiler)
+        assert (phases["crawl_status", "normalize"].calls, phases["crawl_status", "normalize"].cpu_seconds) == (3, 3.0)
+        assert profiler.stats().operations == {"crawl_status": 1}
+        assert profiler.stats().cpu_seconds == 7.0
+        assert "crawl_status" in profiler.format() and "total 7.000 CPU s" in profiler.format()
+
+    def test_unsampled_calls_get_the_null_timer(self):
+        profiler = Profiler(sample_rate=0.25)
+        client = Mock(hooks=None, profiler=profiler)
+        with patch("firecrawl.v2.utils.profiling.random.random", side_effect=[0.9, 0.1]):
+            assert phase_timer(client, "scrape") is NULL_TIMER
+            assert phase_timer(client, "scrape") is not NULL_TIMER
+
+    def test_sampled_totals_are_extrapolated(self):
+        profiler = Profiler(sample_rate=0.5)
+        profiler.record("scrape", {"model": 0.25}, {"model": 2}, finished=True)
+        row = profiler.format().splitlines()[2].split()
+        assert row[:4] == ["scrape", "model", "4", "0.500"]
+        assert profiler.format().endswith("sampled at 0.5")
+
+    def test_resolution_and_environment(self, monkeypatch):
+        monkeypatch.setattr(profiling.atexit, "register", Mock())
+        monkeypatch.delenv("FIRECRAWL_PROFILE", raising=False)
+        assert resolve_profiling(None) is None
+        assert resolve_profiling(0.1).sample_rate == 0.1
+        monkeypatch.setenv("FIRECRAWL_PROFILE", "0.05")
+        assert resolve_profiling(None).sample_rate == 0.05
+        assert resolve_profiling(False) is None
+        monkeypatch.setenv("FIRECRAWL_PROFILE", "sometimes")
+        with pytest.raises(ValueError):
+            resolve_profiling(None)
+        with pytest.raises(ValueError):
+            Profiler(sample_rate=0)
+
+
+class TestClientProfiling:
+    def test_scrape_and_paginated_status_are_profiled_per_client(self):
+        client = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=False, profiling=True)
+        other = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=False, profiling=True)
+        scraped = _response(200, {"success": True, "data": _docs(1)[0]})
+        first = _response(200, {"success": True, "status": "completed", "data": _docs(2), "next": "http://localhost/v2/crawl/j?skip=2"})
+        second = _response(200, {"success": True, "status": "completed", "data": _docs(3, 2)})
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=scraped), \
+                patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=[first, second]):
+            client.scrape("https://a.com")
+            job = client.get_crawl_status("j")
+
+        phases = _phases(client.profiler)
+        assert {phase for op, phase in phases if op == "scrape"} == {"payload", "network", "decode", "normalize", "model"}
+        assert phases["crawl_status", "normalize"].calls == len(job.data) == 5
+        assert phases["crawl_status", "model"].calls == 6  # documents plus the CrawlJob
+        assert phases["crawl_status", "decode"].calls == 2
+        assert client.profiler.stats().operations == {"scrape": 1, "crawl_status": 1}
+        assert other.profiler.stats().phases == []
+
+    def test_profiling_coexists_with_parse_hooks(self):
+        hooks = Hooks()
+        parsed = []
+        hooks.on_parse(parsed.append)
+        client = Firecrawl(api_key="k", api_url="http://localhost", tracing=False, hooks=hooks, profiling=True)
+
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=_response(200, {"success": True, "data": _docs(1)[0]})):
+            client.scrape("https://a.com")
+
+        assert parsed[0].operation == "scrape"
+        assert ("scrape", "model") in _phases(client.profiler)
+
+    def test_watcher_profiles_event_model_dumps(self):
+        profiler = Profiler()
+        job = CrawlJob(status="completed", completed=1, total=1, data=[Document(markdown="a")])
+        watcher = Watcher(Mock(profiler=profiler, get_crawl_status=Mock(return_value=job)), "j")
+        done = []
+        watcher.add_event_listener("done", done.append)
+
+        assert asyncio.run(watcher._poll_status_once())
+        assert done[0]["data"][0]["markdown"] == "a"
+        assert _phases(profiler)["crawl_watcher", "model_dump"].calls == 1
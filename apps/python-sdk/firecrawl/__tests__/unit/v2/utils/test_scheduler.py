@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.types import ConcurrencyCheck
+from firecrawl.v2.utils.scheduler import RequestScheduler
+
+
+def _fill(scheduler, priority, count, order):
+    threads = []
+    for _ in range(count):
+        def run():
+            with scheduler.slot(priority):
+                order.append(priority)
+        t = threading.Thread(target=run)
+        t.start()
+        threads.append(t)
+    return threads
+
+
+class TestRequestScheduler:
+    def test_weighted_fair_order_when_backlogged(self):
+        scheduler = RequestScheduler(max_concurrency=1, weights={"interactive": 4, "bulk": 1})
+        scheduler.acquire("bulk")  # occupy the only slot so everything queues
+
+        order = []
+        threads = _fill(scheduler, "bulk", 5, order)
+        threads += _fill(scheduler, "interactive", 5, order)
+        deadline = time.monotonic() + 2
+        while scheduler.queue_depth() < 10 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        scheduler.release("bulk")
+        for t in threads:
+            t.join(2)
+
+        # Interactive gets ~4 slots per bulk slot while both are queued
+        assert order[:5].count("interactive") >= 4
+        assert sorted(order) == ["bulk"] * 5 + ["interactive"] * 5
+
+    def test_stats_report_queue_depth_and_waits(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        scheduler.acquire("default")
+        t = threading.Thread(target=lambda: (scheduler.acquire("interactive"), scheduler.release("interactive")))
+        t.start()
+        deadline = time.monotonic() + 2
+        while scheduler.queue_depth("interactive") == 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        stats = scheduler.stats()
+        assert stats.in_flight == 1
+        assert stats.queued == 1
+        assert stats.classes["interactive"].queued == 1
+
+        time.sleep(0.02)
+        scheduler.release("default")
+        t.join(2)
+        stats = scheduler.stats()
+        assert stats.classes["interactive"].completed == 1
+        assert stats.classes["interactive"].max_wait_seconds >= 0.02
+
+    def test_budget_derived_from_concurrency_source(self):
+        source = Mock(return_value=ConcurrencyCheck(concurrency=0, max_concurrency=10))
+        scheduler = RequestScheduler(budget_fraction=0.5, concurrency_source=source)
+        with scheduler.slot():
+            assert scheduler.stats().max_concurrency == 5
+        with scheduler.slot():
+            pass
+        assert source.call_count == 1
+
+    def test_acquire_timeout_and_unknown_class(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        scheduler.acquire()
+        with pytest.raises(TimeoutError):
+            scheduler.acquire("bulk", timeout=0.01)
+        assert scheduler.queue_depth() == 0
+        scheduler.release()
+        with pytest.raises(ValueError):
+            scheduler.acquire("urgent")
+
+    def test_async_slots_respect_budget(self):
+        scheduler = RequestScheduler(max_concurrency=2)
+        active = {"now": 0, "max": 0}
+
+        async def job(priority):
+            async with scheduler.slot_async(priority):
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+                await asyncio.sleep(0.01)
+                active["now"] -= 1
+
+        async def main():
+            await asyncio.gather(*(job("bulk" if i % 2 else "interactive") for i in range(8)))
+
+        asyncio.run(main())
+        assert active["max"] == 2
+        assert scheduler.stats().in_flight == 0
+
+
+def test_client_uses_get_concurrency_for_budget(monkeypatch):
+    scheduler = RequestScheduler()
+    client = FirecrawlClient(api_key="test", api_url="http://localhost", scheduler=scheduler)
+    assert scheduler.concurrency_source == client.get_concurrency
+    monkeypatch.setattr(client, "get_concurrency", Mock(return_value=ConcurrencyCheck(concurrency=1, max_concurrency=3)))
+    scheduler.concurrency_source = client.get_concurrency
+
+    from firecrawl.v2.methods import scrape as scrape_module
+    monkeypatch.setattr(scrape_module, "scrape", Mock(return_value="doc"))
+
+    assert client.scrape("https://example.com", priority="interactive") == "doc"
+    stats = scheduler.stats()
+    assert stats.max_concurrency == 3
+    assert stats.classes["interactive"].completed == 1
+
+
+def test_running_bulk_crawls_do_not_starve_interactive_scrapes(monkeypatch):
+    scheduler = RequestScheduler(max_concurrency=2)
+    client = FirecrawlClient(api_key="test", api_url="http://localhost", scheduler=scheduler)
+    release = threading.Event()
+    polling = []
+
+    from firecrawl.v2.methods import crawl as crawl_module
+    from firecrawl.v2.methods import scrape as scrape_module
+
+    def fake_wait(http_client, job_id, poll_interval, timeout):
+        # Stands in for an hours-long crawl
+        polling.append(job_id)
+        release.wait(5)
+        return "job"
+
+    monkeypatch.setattr(crawl_module, "start_crawl", Mock(return_value=Mock(id="crawl-1")))
+    monkeypatch.setattr(crawl_module, "wait_for_crawl_completion", fake_wait)
+    monkeypatch.setattr(scrape_module, "scrape", Mock(return_value="doc"))
+
+    crawls = [threading.Thread(target=client.crawl, args=("https://example.com",), kwargs={"priority": "bulk"}) for _ in range(2)]
+    for t in crawls:
+        t.start()
+    deadline = time.monotonic() + 2
+    while len(polling) < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    try:
+        assert len(polling) == 2
+        # Both crawls are running, yet neither holds a slot
+        assert scheduler.stats().in_flight == 0
+        started = time.monotonic()
+        assert client.scrape("https://example.com", priority="interactive") == "doc"
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        for t in crawls:
+            t.join(2)
+    assert scheduler.stats().classes["bulk"].completed == 2
+
+
+@pytest.mark.asyncio
+async def test_async_crawl_releases_the_slot_before_polling(monkeypatch):
+    from firecrawl.v2.client_async import AsyncFirecrawlClient
+    from firecrawl.v2.methods.aio import crawl as async_crawl
+
+    scheduler = RequestScheduler(max_concurrency=1)
+    client = AsyncFirecrawlClient(api_key="test", api_url="http://localhost", scheduler=scheduler)
+    seen = []
+
+    async def fake_start(http_client, request, idempotency_key=None):
+        seen.append(("start", scheduler.stats().in_flight))
+        return Mock(id="job-1")
+
+    async def fake_wait(job_id, poll_interval=2, timeout=None):
+        seen.append((job_id, scheduler.stats().in_flight))
+        return "done"
+
+    monkeypatch.setattr(async_crawl, "start_crawl", fake_start)
+    monkeypatch.setattr(client, "wait_crawl", fake_wait)
+
+    assert await client.crawl(url="https://example.com", poll_interval=0, priority="bulk") == "done"
+    assert seen == [("start", 1), ("job-1", 0)]
+    assert scheduler.stats().in_flight == 0
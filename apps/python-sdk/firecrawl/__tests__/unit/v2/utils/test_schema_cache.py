@@ -0,0 +1,60 @@
+import gc
+from typing import List
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from firecrawl.v2.methods.extract import _prepare_extract_request
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.schema_cache import SchemaCache, schema_cache
+from firecrawl.v2.utils.validation import _normalize_schema, prepare_scrape_options
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+class Catalog(BaseModel):
+    items: List[Item]
+
+
+class TestSchemaCache:
+    def test_generates_once_per_class(self):
+        cache = SchemaCache()
+        first = cache.get(Catalog)
+        assert cache.get(Catalog) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert first == Catalog.model_json_schema()
+
+    def test_bounded_lru(self):
+        cache = SchemaCache(maxsize=1)
+        cache.get(Item)
+        cache.get(Catalog)
+        assert len(cache) == 1
+        cache.get(Item)
+        assert cache.misses == 3
+
+    def test_dynamic_models_are_released(self):
+        cache = SchemaCache()
+        model = create_model("Dynamic", field=(int, ...))
+        cache.get(model)
+        assert len(cache) == 1
+        del model
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            SchemaCache(maxsize=0)
+
+
+def test_payload_builders_share_cached_schema():
+    schema_cache.clear()
+    scrape = prepare_scrape_options(ScrapeOptions(formats=[{"type": "json", "schema": Catalog}]))
+    instance_schema = _normalize_schema(Catalog(items=[]))
+    extract = _prepare_extract_request(["https://a.com"], schema=Catalog)
+
+    assert scrape["formats"][0]["schema"] is instance_schema is extract["schema"]
+    assert schema_cache.misses == 1
+    assert _normalize_schema({"type": "object"}) == {"type": "object"}
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import CrawlJob, Document
+from firecrawl.v2.utils.single_flight import SingleFlight, request_key
+
+
+class TestSingleFlight:
+    def test_threads_share_one_execution(self):
+        flights = SingleFlight()
+        calls = {"n": 0}
+        gate = threading.Event()
+
+        def work():
+            calls["n"] += 1
+            gate.wait(2)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flights.do("k", work))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 2
+        while flights.stats().deduplicated < 4 and time.monotonic() < deadline:
+            time.sleep(0.002)
+        gate.set()
+        for t in threads:
+            t.join(2)
+
+        assert calls["n"] == 1
+        assert len({id(r) for r in results}) == 1
+        stats = flights.stats()
+        assert (stats.calls, stats.executions, stats.deduplicated, stats.in_flight) == (5, 1, 4, 0)
+
+    def test_errors_propagate_and_key_is_released(self):
+        flights = SingleFlight()
+        with pytest.raises(RuntimeError):
+            flights.do("k", Mock(side_effect=RuntimeError("boom")))
+        assert flights.do("k", lambda: 42) == 42
+        assert flights.stats().executions == 2
+
+    def test_async_callers_share_task_and_survive_cancellation(self):
+        flights = SingleFlight()
+        calls = {"n": 0}
+
+        async def work():
+            calls["n"] += 1
+            await asyncio.sleep(0.01)
+            return "doc"
+
+        async def main():
+            first = asyncio.ensure_future(flights.do_async("k", work))
+            others = [asyncio.ensure_future(flights.do_async("k", work)) for _ in range(3)]
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(*others)
+
+        assert asyncio.run(main()) == ["doc"] * 3
+        assert calls["n"] == 1
+        assert flights.stats().deduplicated == 3
+
+    def test_keys_depend_on_method_and_payload(self):
+        assert request_key("scrape", {"url": "a", "formats": ["markdown"]}) == request_key(
+            "scrape", {"formats": ["markdown"], "url": "a"}
+        )
+        assert request_key("scrape", {"url": "a"}) != request_key("scrape", {"url": "b"})
+        assert request_key("scrape", {"url": "a"}) != request_key("map", {"url": "a"})
+
+
+def test_sync_client_coalesces_crawl_status(monkeypatch):
+    flights = SingleFlight()
+    client = FirecrawlClient(api_key="test", api_url="http://localhost", single_flight=flights)
+    gate = threading.Event()
+
+    def slow_status(http_client, job_id, pagination_config=None):
+        gate.wait(2)
+        return CrawlJob(status="scraping", completed=0, total=1, data=[])
+
+    from firecrawl.v2.methods import crawl as crawl_module
+    fetch = Mock(side_effect=slow_status)
+    monkeypatch.setattr(crawl_module, "get_crawl_status", fetch)
+
+    threads = [threading.Thread(target=client.get_crawl_status, args=("job-1",)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 2
+    while flights.stats().deduplicated < 2 and time.monotonic() < deadline:
+        time.sleep(0.002)
+    gate.set()
+    for t in threads:
+        t.join(2)
+    assert fetch.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_identical_scrapes(monkeypatch):
+    flights = SingleFlight()
+    client = AsyncFirecrawlClient(api_key="test", api_url="http://localhost", single_flight=flights)
+    calls = []
+
+    async def fake_scrape(http_client, url, options):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return Document(markdown=url)
+
+    from firecrawl.v2.methods.aio import scrape as async_scrape
+    monkeypatch.setattr(async_scrape, "scrape", fake_scrape)
+
+    docs = await asyncio.gather(
+        *(client.scrape("https://a.com") for _ in range(4)),
+        client.scrape("https://a.com", formats=["html"]),
+    )
+    assert calls == ["https://a.com", "https://a.com"]
+    assert docs[0] is docs[3]
+    assert flights.stats().deduplicated == 3
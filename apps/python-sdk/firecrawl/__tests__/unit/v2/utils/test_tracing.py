@@ -0,0 +1,78 @@
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils import tracing as tracing_module
+from firecrawl.v2.utils.tracing import Tracing, resolve_tracing
+
+
+def _response(status_code, payload):
+    response = Mock(ok=status_code < 400, status_code=status_code, content=json.dumps(payload).encode())
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def traced():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client = FirecrawlClient(api_key="k", api_url="http://localhost", tracing=Tracing(tracer_provider=provider))
+    return client, exporter
+
+
+def test_crawl_has_parent_span_with_submit_poll_and_page_children(traced):
+    client, exporter = traced
+    posts = [_response(200, {"success": True, "id": "job-1", "url": "http://localhost/v2/crawl/job-1"})]
+    gets = [
+        _response(200, {"success": True, "status": "completed", "completed": 2, "total": 2,
+                        "data": [{"markdown": "a"}], "next": "http://localhost/v2/crawl/job-1?skip=1"}),
+        _response(200, {"success": True, "data": [{"markdown": "b"}]}),
+    ]
+
+    with patch("firecrawl.v2.utils.http_client.requests.Session.post", side_effect=posts) as post, \
+            patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=gets):
+        job = client.crawl("https://example.com", poll_interval=0)
+
+    assert len(job.data) == 2
+    spans = {s.name: s for s in exporter.get_finished_spans()}
+    assert set(spans) == {"firecrawl.crawl", "firecrawl.submit", "firecrawl.poll", "firecrawl.page"}
+    parent = spans["firecrawl.crawl"]
+    assert parent.attributes["firecrawl.url"] == "https://example.com"
+    for name in ("firecrawl.submit", "firecrawl.poll", "firecrawl.page"):
+        assert spans[name].parent.span_id == parent.context.span_id
+        assert spans[name].context.trace_id == parent.context.trace_id
+    assert spans["firecrawl.poll"].attributes["http.response.status_code"] == 200
+
+    traceparent = post.call_args.kwargs["headers"]["traceparent"]
+    assert traceparent.split("-")[2] == format(spans["firecrawl.submit"].context.span_id, "016x")
+
+
+def test_each_retry_gets_a_span_and_an_event(traced):
+    client, exporter = traced
+    responses = [_response(502, {}), _response(200, {"success": True, "status": "completed", "data": []})]
+
+    with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=responses), \
+            patch("firecrawl.v2.utils.http_client.time.sleep"), \
+            client.tracing.span("caller") as caller:
+        client.get_crawl_status("job-1")
+
+    polls = [s for s in exporter.get_finished_spans() if s.name == "firecrawl.poll"]
+    assert [s.attributes["firecrawl.attempt"] for s in polls] == [0, 1]
+    assert not polls[0].status.is_ok
+    (event,) = [e for e in caller.events if e.name == "firecrawl.retry"]
+    assert event.attributes["http.response.status_code"] == 502
+
+
+def test_tracing_is_off_without_opentelemetry(monkeypatch):
+    assert resolve_tracing(False) is None
+    monkeypatch.setattr(tracing_module, "otel_available", lambda: False)
+    assert resolve_tracing(True) is None
+    client = FirecrawlClient(api_key="k", api_url="http://localhost")
+    assert client.tracing is None and client.http_client.hooks is None
@@ -0,0 +1,108 @@
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.utils.url_dedup import BloomFilter, UrlDeduplicator, canonicalize_url
+from firecrawl.v2.methods.batch import prepare_batch_scrape_request, start_batch_scrape
+
+
+class TestCanonicalizeUrl:
+    def test_strips_tracking_params_fragment_and_trailing_slash(self):
+        url = "HTTPS://Example.COM:443/docs/?utm_source=x&b=2&a=1&fbclid=abc#section"
+        assert canonicalize_url(url) == "https://example.com/docs?a=1&b=2"
+
+    def test_keeps_root_path_and_non_default_port(self):
+        assert canonicalize_url("http://example.com") == "http://example.com/"
+        assert canonicalize_url("http://example.com:8080/") == "http://example.com:8080/"
+
+    def test_variants_collapse_to_same_key(self):
+        variants = [
+            "https://example.com/page",
+            "https://example.com/page/",
+            "https://example.com/page#top",
+            "https://example.com/page?utm_campaign=spring",
+        ]
+        assert len({canonicalize_url(u) for u in variants}) == 1
+
+
+class TestBloomFilter:
+    def test_add_and_contains(self):
+        bf = BloomFilter(capacity=1000, error_rate=0.01)
+        assert "a" not in bf
+        assert bf.add("a") is False
+        assert "a" in bf
+        assert bf.add("a") is True
+
+    def test_on_disk_bitmap_persists(self, tmp_path):
+        path = str(tmp_path / "seen.bloom")
+        bf = BloomFilter(capacity=1000, error_rate=0.01, path=path)
+        bf.add("https://example.com/")
+        bf.close()
+
+        reopened = BloomFilter(capacity=1000, error_rate=0.01, path=path)
+        assert "https://example.com/" in reopened
+        reopened.close()
+
+    def test_on_disk_bitmap_rejects_different_settings(self, tmp_path):
+        path = str(tmp_path / "seen.bloom")
+        BloomFilter(capacity=1000, error_rate=0.01, path=path).close()
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=5000, error_rate=0.01, path=path)
+
+
+class TestUrlDeduplicator:
+    def test_filter_counts_hits_without_recording(self):
+        dedup = UrlDeduplicator(capacity=1000)
+        urls = ["https://a.com/x", "https://a.com/x/", "https://a.com/y"]
+        assert dedup.filter(urls) == ["https://a.com/x", "https://a.com/y"]
+        assert dedup.filter(["https://a.com/y/"]) == ["https://a.com/y/"]
+        assert dedup.hits == 1
+        # Not recorded until mark_seen
+        assert dedup.filter(["https://a.com/x"]) == ["https://a.com/x"]
+
+        dedup.mark_seen(["https://a.com/x"])
+        assert dedup.filter(["https://a.com/x#frag", "https://a.com/z"]) == ["https://a.com/z"]
+        assert dedup.hits == 2
+
+
+class TestBatchDeduplication:
+    def test_prepare_filters_duplicates(self):
+        dedup = UrlDeduplicator(capacity=1000)
+        dedup.mark_seen(["https://example.com/seen"])
+        data = prepare_batch_scrape_request(
+            ["https://example.com/seen/", "https://example.com/new?utm_source=x"],
+            deduplicator=dedup,
+        )
+        assert data["urls"] == ["https://example.com/new?utm_source=x"]
+
+    def test_prepare_raises_when_everything_was_seen(self):
+        dedup = UrlDeduplicator(capacity=1000)
+        dedup.mark_seen(["https://example.com/"])
+        with pytest.raises(ValueError):
+            prepare_batch_scrape_request(["https://example.com"], deduplicator=dedup)
+
+    def test_start_marks_seen_only_after_success_and_reports_hits(self):
+        dedup = UrlDeduplicator(capacity=1000)
+        client = Mock()
+        client._prepare_headers.return_value = {}
+        ok = Mock(ok=True)
+        ok.json.return_value = {"success": True, "id": "job-1", "url": "https://api/job-1"}
+        client.post.return_value = ok
+
+        resp = start_batch_scrape(client, ["https://a.com/1", "https://a.com/1/"], deduplicator=dedup)
+        assert resp.dedup_hits == 1
+        assert "https://a.com/1" in dedup
+        assert client.post.call_args[0][1]["urls"] == ["https://a.com/1"]
+
+    def test_non_canonical_url_reaches_the_api_unchanged(self):
+        dedup = UrlDeduplicator(capacity=1000)
+        client = Mock()
+        client._prepare_headers.return_value = {}
+        ok = Mock(ok=True)
+        ok.json.return_value = {"success": True, "id": "job-1", "url": "https://api/job-1"}
+        client.post.return_value = ok
+
+        signed = "https://Example.com/file/?b=2&a=%7Euser&sig=abc"
+        start_batch_scrape(client, [signed, "https://example.com/file?a=~user&b=2&sig=abc"], deduplicator=dedup)
+        assert client.post.call_args[0][1]["urls"] == [signed]
+        # The seen-set still matches any spelling of the submitted URL
+        assert "https://example.com/file?sig=abc&a=~user&b=2" in dedup
@@ -0,0 +1,419 @@
+"""
+Load generator for Firecrawl deployments (the ``firecrawl-bench`` command).
+
+Drives a weighted mix of scrape, crawl, batch scrape and map calls through the
+async client, either open-loop at a target rate (``--rps``, with
+``--concurrency`` capping calls in flight) or closed-loop with a fixed number
+of workers (``--concurrency`` alone). It reports throughput, latency
+percentiles per operation, errors by ``FirecrawlError`` subclass and the team
+queue status sampled over the run:
+
+    firecrawl-bench --api-url http://localhost:3002 --urls corpus.txt \\
+        --mix scrape=70,crawl=10,batch=10,map=10 --rps 20 --duration 300 --json run.json
+
+URL corpora are text files with one URL per line (blank lines and ``#``
+comments are skipped; ``-`` reads stdin). Crawl and batch operations wait for
+their job to finish, so their latency is the end-to-end job time;
+``--no-wait`` measures job submission only.
+
+Try it offline against the fake server from ``firecrawl.testing``:
+
+    python -m firecrawl.testing --port 3002 --job-seconds 2 &
+    firecrawl-bench --api-url http://localhost:3002 --url https://example.com --duration 30
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+from .v2.client_async import AsyncFirecrawlClient
+
+OPERATIONS = ("scrape", "crawl", "batch", "map")
+DEFAULT_MIX = {"scrape": 70.0, "crawl": 10.0, "batch": 10.0, "map": 10.0}
+
+
+class JobFailed(Exception):
+    """A crawl or batch job ended ``failed``/``cancelled`` or timed out while waiting."""
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """``"scrape=70,crawl=10"`` → ``{"scrape": 70.0, "crawl": 10.0}``."""
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r} in mix (expected one of {', '.join(OPERATIONS)})")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight {weight!r} for {name}") from None
+        if mix[name] < 0:
+            raise ValueError(f"Weight of {name} must not be negative")
+    if not any(mix.values()):
+        raise ValueError("Mix needs at least one operation with a positive weight")
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def read_urls(lines: Iterable[str]) -> List[str]:
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def load_urls(paths: Iterable[str], stdin: Optional[TextIO] = None) -> List[str]:
+    """URLs of the corpus files ``paths`` (``-`` is stdin), in order."""
+    urls: List[str] = []
+    for path in paths:
+        if path == "-":
+            urls.extend(read_urls(stdin or sys.stdin))
+        else:
+            with open(path, encoding="utf-8") as fh:
+                urls.extend(read_urls(fh))
+    return urls
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered) + 0.5)) - 1))]
+
+
+@dataclass
+class BenchConfig:
+    """What to send, how fast and for how long."""
+
+    urls: List[str]
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    crawl_urls: Optional[List[str]] = None  # crawl seeds; the corpus by default
+    rps: Optional[float] = None  # open loop when set, otherwise closed loop
+    concurrency: int = 16  # closed-loop workers, or the in-flight cap at a target rate
+    duration: Optional[float] = 60.0  # seconds; None runs until ``requests`` calls were made
+    requests: Optional[int] = None
+    batch_size: int = 10
+    crawl_limit: int = 10
+    map_limit: int = 100
+    formats: List[str] = field(default_factory=lambda: ["markdown"])
+    wait: bool = True
+    poll_interval: float = 1.0
+    job_timeout: float = 300.0
+    queue_interval: Optional[float] = 5.0  # seconds between queue-status samples; None disables them
+    seed: Optional[int] = None
+
+
+@dataclass
+class OperationResult:
+    latencies: List[float] = field(default_factory=list)
+    documents: int = 0
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def ok(self) -> int:
+        return len(self.latencies)
+
+
+@dataclass
+class BenchReport:
+    """Results of one run; ``to_dict`` is the ``--json`` output."""
+
+    api_url: str
+    mode: str
+    seconds: float = 0.0
+    operations: Dict[str, OperationResult] = field(default_factory=dict)
+    queue: List[Dict[str, Any]] = field(default_factory=list)
+    dropped: int = 0  # arrivals skipped because ``concurrency`` calls were already in flight
+
+    def _row(self, result: OperationResult) -> Dict[str, Any]:
+        seconds = self.seconds or 1.0
+        return {
+            "ok": result.ok,
+            "errors": sum(result.errors.values()),
+            "ops_per_s": result.ok / seconds,
+            "docs_per_s": result.documents / seconds,
+            "p50_ms": percentile(result.latencies, 50) * 1000,
+            "p90_ms": percentile(result.latencies, 90) * 1000,
+            "p99_ms": percentile(result.latencies, 99) * 1000,
+            "max_ms": max(result.latencies, default=0.0) * 1000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        total = OperationResult()
+        for result in self.operations.values():
+            total.latencies.extend(result.latencies)
+            total.documents += result.documents
+            total.errors.update(result.errors)
+        return {
+            "api_url": self.api_url,
+            "mode": self.mode,
+            "seconds": self.seconds,
+            "dropped": self.dropped,
+            "operations": {name: self._row(result) for name, result in self.operations.items()},
+            "total": self._row(total),
+            "errors": {name: dict(result.errors) for name, result in self.operations.items() if result.errors},
+            "queue": self.queue,
+        }
+
+    def format(self) -> str:
+        data = self.to_dict()
+        header = f"{'operation':<10} {'ok':>7} {'errors':>7} {'ops/s':>8} {'docs/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+        lines = [f"{self.api_url}: {self.seconds:.1f} s, {self.mode}", header, "-" * len(header)]
+        rows = list(data["operations"].items()) + [("total", data["total"])]
+        for name, row in rows:
+            lines.append(
+                f"{name:<10} {row['ok']:>7} {row['errors']:>7} {row['ops_per_s']:>8.2f} {row['docs_per_s']:>9.1f} "
+                f"{row['p50_ms']:>9.1f} {row['p90_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+            )
+        if self.dropped:
+            lines.append(f"{self.dropped} arrivals dropped at the in-flight cap (target rate not sustained)")
+        if data["errors"]:
+            lines += ["", "Errors:"]
+            for name, errors in data["errors"].items():
+                for error, count in sorted(errors.items(), key=lambda item: -item[1]):
+                    lines.append(f"  {name:<10} {error:<28} {count:>7}")
+        if self.queue:
+            lines += ["", f"{'t s':>7} {'in queue':>9} {'active':>7} {'waiting':>8} {'max conc':>9} {'in flight':>10}"]
+            for sample in self.queue:
+                lines.append(
+                    f"{sample['t']:>7.1f} {sample['jobs_in_queue']:>9} {sample['active_jobs_in_queue']:>7} "
+                    f"{sample['waiting_jobs_in_queue']:>8} {sample['max_concurrency']:>9} {sample['in_flight']:>10}"
+                )
+        return "\n".join(lines)
+
+
+class _Bench:
+    def __init__(self, client: AsyncFirecrawlClient, config: BenchConfig):
+        if not config.urls:
+            raise ValueError("The URL corpus is empty")
+        self.client = client
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.names = list(config.mix)
+        self.weights = [config.mix[name] for name in self.names]
+        self.urls = itertools.cycle(config.urls)
+        self.crawl_urls = itertools.cycle(config.crawl_urls or config.urls)
+        mode = f"closed loop, {config.concurrency} workers"
+        if config.rps:
+            mode = f"open loop at {config.rps:g} rps, max {config.concurrency} in flight"
+        self.report = BenchReport(api_url=client.async_http_client.api_url, mode=mode)
+        self.report.operations = {name: OperationResult() for name in self.names}
+        self.issued = 0
+        self.in_flight = 0
+        self.started = 0.0
+        self.deadline: Optional[float] = None
+
+    def _more(self) -> bool:
+        if self.config.requests is not None and self.issued >= self.config.requests:
+            return False
+        return self.deadline is None or time.perf_counter() < self.deadline
+
+    async def _job(self, job_id: str, wait) -> int:
+        job = await wait(job_id, poll_interval=self.config.poll_interval, timeout=self.config.job_timeout)
+        if job.status != "completed":
+            raise JobFailed(f"job {job_id} ended {job.status}")
+        return len(job.data or [])
+
+    async def _run(self, name: str) -> int:
+        client, config = self.client, self.config
+        if name == "scrape":
+            await client.scrape(next(self.urls), formats=config.formats)
+            return 1
+        if name == "map":
+            return len((await client.map(next(self.urls), limit=config.map_limit)).links or [])
+        if name == "crawl":
+            started = await client.start_crawl(next(self.crawl_urls), limit=config.crawl_limit)
+            return await self._job(started.id, client.wait_crawl) if config.wait else 0
+        urls = [next(self.urls) for _ in range(config.batch_size)]
+        started = await client.start_batch_scrape(urls, formats=config.formats)
+        return await self._job(started.id, client.wait_batch_scrape) if config.wait else 0
+
+    async def _call(self) -> None:
+        name = self.random.choices(self.names, self.weights)[0]
+        result = self.report.operations[name]
+        self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            documents = await self._run(name)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            result.errors["TimeoutError"] += 1
+        except Exception as exc:
+            # FirecrawlError subclasses (RateLimitError, InternalServerError, ...) keep their own names
+            result.errors[type(exc).__name__] += 1
+        else:
+            result.latencies.append(time.perf_counter() - start)
+            result.documents += documents
+        finally:
+            self.in_flight -= 1
+
+    async def _worker(self) -> None:
+        while self._more():
+            self.issued += 1
+            await self._call()
+
+    async def _open_loop(self) -> None:
+        interval = 1.0 / self.config.rps
+        tasks = set()
+        next_at = time.perf_counter()
+        while self._more():
+            if self.in_flight >= self.config.concurrency:
+                self.report.dropped += 1
+            else:
+                self.issued += 1
+                task = asyncio.ensure_future(self._call())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _sample_queue(self) -> None:
+        while True:
+            try:
+                status = await self.client.get_queue_status()
+            except Exception:
+                pass  # not every deployment exposes queue status
+            else:
+                self.report.queue.append({
+                    "t": round(time.perf_counter() - self.started, 3),
+                    "jobs_in_queue": status.jobs_in_queue,
+                    "active_jobs_in_queue": status.active_jobs_in_queue,
+                    "waiting_jobs_in_queue": status.waiting_jobs_in_queue,
+                    "max_concurrency": status.max_concurrency,
+                    "in_flight": self.in_flight,
+                })
+            await asyncio.sleep(self.config.queue_interval)
+
+    async def run(self) -> BenchReport:
+        config = self.config
+        if config.duration is None and config.requests is None:
+            raise ValueError("Set a duration or a number of requests")
+        self.started = time.perf_counter()
+        if config.duration is not None:
+            self.deadline = self.started + config.duration
+        sampler = asyncio.ensure_future(self._sample_queue()) if config.queue_interval else None
+        try:
+            if config.rps:
+                await self._open_loop()
+            else:
+                await asyncio.gather(*(self._worker() for _ in range(config.concurrency)))
+        finally:
+            if sampler is not None:
+                sampler.cancel()
+                await asyncio.gather(sampler, return_exceptions=True)
+        self.report.seconds = time.perf_counter() - self.started
+        return self.report
+
+
+async def run_bench(client: AsyncFirecrawlClient, config: BenchConfig) -> BenchReport:
+    """Run the load described by ``config`` through ``client``."""
+    return await _Bench(client, config).run()
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="firecrawl-bench",
+        description="Load generator for Firecrawl deployments (scrape, crawl, batch and map mixes).",
+    )
+    parser.add_argument("--api-url", default=os.getenv("FIRECRAWL_API_URL", "http://localhost:3002"))
+    parser.add_argument(
+        "--api-key",
+        default=os.getenv("FIRECRAWL_API_KEY", "fc-bench"),
+        help="defaults to FIRECRAWL_API_KEY (self-hosted deployments without auth accept any key)",
+    )
+    parser.add_argument("--urls", nargs="*", default=[], metavar="FILE", help="URL corpus files (- for stdin)")
+    parser.add_argument("--url", action="append", default=[], help="URL to add to the corpus (repeatable)")
+    parser.add_argument("--crawl-urls", nargs="*", metavar="FILE", help="crawl seed files (default: the corpus)")
+    parser.add_argument("--mix", default="scrape=70,crawl=10,batch=10,map=10", help="operation weights")
+    parser.add_argument("--rps", type=float, help="target arrival rate (open loop); closed loop when omitted")
+    parser.add_argument("--concurrency", type=int, default=16, help="workers, or max calls in flight with --rps")
+    parser.add_argument("--duration", type=float, help="seconds to run (default 60 unless --requests is set)")
+    parser.add_argument("--requests", type=int, help="stop after this many calls")
+    parser.add_argument("--batch-size", type=int, default=10, help="URLs per batch scrape")
+    parser.add_argument("--crawl-limit", type=int, default=10, help="page limit per crawl")
+    parser.add_argument("--map-limit", type=int, default=100)
+    parser.add_argument("--formats", nargs="*", default=["markdown"], help="scrape formats")
+    parser.add_argument("--no-wait", dest="wait", action="store_false", help="measure crawl/batch submission only")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="job status poll interval (s)")
+    parser.add_argument("--job-timeout", type=float, default=300.0, help="max seconds to wait for a job")
+    parser.add_argument("--queue-interval", type=float, default=5.0, help="queue-status sample interval (s); 0 disables")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", help="also write the report to this file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+        urls = load_urls(args.urls) + args.url
+        crawl_urls = load_urls(args.crawl_urls) if args.crawl_urls else None
+    except (OSError, ValueError) as exc:
+        print(f"firecrawl-bench: {exc}", file=sys.stderr)
+        return 2
+    if not urls:
+        print("firecrawl-bench: no URLs (use --urls FILE or --url URL)", file=sys.stderr)
+        return 2
+    duration = args.duration if args.duration is not None else (None if args.requests else 60.0)
+    config = BenchConfig(
+        urls=urls,
+        mix=mix,
+        crawl_urls=crawl_urls,
+        rps=args.rps,
+        concurrency=args.concurrency,
+        duration=duration,
+        requests=args.requests,
+        batch_size=args.batch_size,
+        crawl_limit=args.crawl_limit,
+        map_limit=args.map_limit,
+        formats=args.formats,
+        wait=args.wait,
+        poll_interval=args.poll_interval,
+        job_timeout=args.job_timeout,
+        queue_interval=args.queue_interval or None,
+        seed=args.seed,
+    )
+
+    running: List[_Bench] = []
+
+    async def bench() -> BenchReport:
+        client = AsyncFirecrawlClient(api_key=args.api_key, api_url=args.api_url, tracing=False)
+        running.append(_Bench(client, config))
+        try:
+            return await running[0].run()
+        finally:
+            await client.async_http_client.close()
+
+    try:
+        report = asyncio.run(bench())
+    except KeyboardInterrupt:
+        if not running:
+            return 130
+        # Report what completed before the interrupt
+        report = running[0].report
+        report.seconds = time.perf_counter() - running[0].started
+    print(report.format())
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(report.to_dict(), fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,22 +18,25 @@ Usage:
 Check example.py for other usage examples.
 """
 
-from typing import Any, Dict, Optional, List, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, List, Union
 import logging
 
 
-from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
 from .v2 import FirecrawlClient as V2FirecrawlClient
-from .v2.client_async import AsyncFirecrawlClient
 from .v2.types import Document
 
+if TYPE_CHECKING:
+    # The v1 client (aiohttp) and the async v2 client (httpx) are imported on first use
+    from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
+    from .v2.client_async import AsyncFirecrawlClient
+
 logger = logging.getLogger("firecrawl")
 
 class V1Proxy:
     """Type-annotated proxy for v1 client methods."""
-    _client: Optional[V1FirecrawlApp]
+    _client: Optional["V1FirecrawlApp"]
     
-    def __init__(self, client_instance: Optional[V1FirecrawlApp]):
+    def __init__(self, client_instance: Optional["V1FirecrawlApp"]):
         self._client = client_instance
 
         if client_instance:
@@ -91,9 +94,9 @@ class V2Proxy:
 
 class AsyncV1Proxy:
     """Type-annotated proxy for v1 client methods."""
-    _client: Optional[AsyncV1FirecrawlApp]
+    _client: Optional["AsyncV1FirecrawlApp"]
     
-    def __init__(self, client_instance: Optional[AsyncV1FirecrawlApp]):
+    def __init__(self, client_instance: Optional["AsyncV1FirecrawlApp"]):
         self._client = client_instance
 
         if client_instance:
@@ -110,9 +113,9 @@ class AsyncV1Proxy:
 
 class AsyncV2Proxy:
     """Proxy class that forwards method calls to the appropriate version client."""
-    _client: Optional[AsyncFirecrawlClient] = None
+    _client: Optional["AsyncFirecrawlClient"] = None
 
-    def __init__(self, client_instance: Optional[AsyncFirecrawlClient] = None):
+    def __init__(self, client_instance: Optional["AsyncFirecrawlClient"] = None):
         self._client = client_instance
 
         if client_instance:
@@ -162,32 +165,83 @@ class Firecrawl:
     keeping a feature-frozen v1 available for incremental migration.
     """
     
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        auto_idempotency: bool = False,
+        idempotency_journal=None,
+        scheduler=None,
+        domain_dispatcher=None,
+        scrape_cache=None,
+        map_search_cache=None,
+        single_flight=None,
+        hooks=None,
+        tracing=True,
+        metrics=None,
+        credit_ledger=None,
+        profiling=None,
+    ):
         """Initialize the unified client.
 
         Args:
             api_key: Firecrawl API key (or set ``FIRECRAWL_API_KEY``)
             api_url: Base API URL (defaults to production)
+            auto_idempotency: Attach idempotency keys to job-creating requests
+            idempotency_journal: Optional ``IdempotencyJournal`` for replaying started jobs (v2)
+            scheduler: Optional ``RequestScheduler`` with priority classes for v2 calls
+            domain_dispatcher: Optional ``DomainDispatcher`` with per-domain caps for v2 scrapes
+            scrape_cache: Optional ``ScrapeCache`` serving repeated v2 scrapes locally
+            map_search_cache: Optional ``MapSearchCache`` for v2 map/search results
+            single_flight: Optional ``SingleFlight`` coalescing identical in-flight v2 calls
+            hooks: Optional ``Hooks`` receiving transport and parse events for v2 calls
+            tracing: OpenTelemetry spans for v2 calls (on when opentelemetry-api is installed)
+            metrics: Optional ``MetricsRegistry`` with Prometheus/snapshot export of v2 client metrics
+            credit_ledger: Optional ``CreditLedger`` with per-job/tag budgets that cancel runaway v2 jobs
+            profiling: CPU time per phase of v2 calls (True, a sample rate or a ``Profiler``; defaults to
+                ``FIRECRAWL_PROFILE``), summarized by ``client.profiler.format()``
         """
         self.api_key = api_key
         self.api_url = api_url
+        self._auto_idempotency = auto_idempotency
+        self._v1 = None
         
-        # Initialize version-specific clients
-        self._v1_client = V1FirecrawlApp(api_key=api_key, api_url=api_url) if V1FirecrawlApp else None
-        self._v2_client = V2FirecrawlClient(api_key=api_key, api_url=api_url) if V2FirecrawlClient else None
+        # Initialize version-specific clients (v1 is created on first ``.v1`` access)
+        self._v2_client = V2FirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            auto_idempotency=auto_idempotency,
+            idempotency_journal=idempotency_journal,
+            scheduler=scheduler,
+            domain_dispatcher=domain_dispatcher,
+            scrape_cache=scrape_cache,
+            map_search_cache=map_search_cache,
+            single_flight=single_flight,
+            hooks=hooks,
+            tracing=tracing,
+            metrics=metrics,
+            credit_ledger=credit_ledger,
+            profiling=profiling,
+        ) if V2FirecrawlClient else None
         
         # Create version-specific proxies
-        self.v1 = V1Proxy(self._v1_client) if self._v1_client else None
         self.v2 = V2Proxy(self._v2_client)
+        self.profiler = self._v2_client.profiler if self._v2_client else None
         
         self.scrape = self._v2_client.scrape
+        self.prepare_scrape = self._v2_client.prepare_scrape
+        self.scrape_prepared = self._v2_client.scrape_prepared
         self.search = self._v2_client.search
         self.map = self._v2_client.map
+        self.scrape_many = self._v2_client.scrape_many
+        self.search_many = self._v2_client.search_many
+        self.map_many = self._v2_client.map_many
 
         self.crawl = self._v2_client.crawl
         self.start_crawl = self._v2_client.start_crawl
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -195,6 +249,7 @@ class Firecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_scrape_documents = self._v2_client.iter_batch_scrape_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -209,27 +264,79 @@ class Firecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
         
         self.watcher = self._v2_client.watcher
+
+    @property
+    def v1(self) -> V1Proxy:
+        """Legacy v1 client; its module is imported on first access."""
+        if self._v1 is None:
+            from .v1 import V1FirecrawlApp
+            client = V1FirecrawlApp(api_key=self.api_key, api_url=self.api_url, auto_idempotency=self._auto_idempotency)
+            self._v1 = V1Proxy(client)
+        return self._v1
+
+    @property
+    def _v1_client(self) -> "V1FirecrawlApp":
+        return self.v1._client
         
 class AsyncFirecrawl:
     """Async unified Firecrawl client (v2 by default, v1 under ``.v1``)."""
 
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        auto_idempotency: bool = False,
+        idempotency_journal=None,
+        scheduler=None,
+        domain_dispatcher=None,
+        scrape_cache=None,
+        map_search_cache=None,
+        single_flight=None,
+        hooks=None,
+        tracing=True,
+        metrics=None,
+        credit_ledger=None,
+        profiling=None,
+    ):
+        from .v2.client_async import AsyncFirecrawlClient
+
         self.api_key = api_key
         self.api_url = api_url
+        self._auto_idempotency = auto_idempotency
+        self._v1 = None
         
-        # Initialize version-specific clients
-        self._v1_client = AsyncV1FirecrawlApp(api_key=api_key, api_url=api_url) if AsyncV1FirecrawlApp else None
-        self._v2_client = AsyncFirecrawlClient(api_key=api_key, api_url=api_url) if AsyncFirecrawlClient else None
+        # Initialize version-specific clients (v1 is created on first ``.v1`` access)
+        self._v2_client = AsyncFirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            auto_idempotency=auto_idempotency,
+            idempotency_journal=idempotency_journal,
+            scheduler=scheduler,
+            domain_dispatcher=domain_dispatcher,
+            scrape_cache=scrape_cache,
+            map_search_cache=map_search_cache,
+            single_flight=single_flight,
+            hooks=hooks,
+            tracing=tracing,
+            metrics=metrics,
+            credit_ledger=credit_ledger,
+            profiling=profiling,
+        )
         
         # Create version-specific proxies
-        self.v1 = AsyncV1Proxy(self._v1_client) if self._v1_client else None
         self.v2 = AsyncV2Proxy(self._v2_client)
+        self.profiler = self._v2_client.profiler
 
         # Expose v2 async surface directly on the top-level client for ergonomic access
         # Keep method names aligned with the sync client
         self.scrape = self._v2_client.scrape
+        self.prepare_scrape = self._v2_client.prepare_scrape
+        self.scrape_prepared = self._v2_client.scrape_prepared
         self.search = self._v2_client.search
         self.map = self._v2_client.map
+        self.scrape_many = self._v2_client.scrape_many
+        self.search_many = self._v2_client.search_many
+        self.map_many = self._v2_client.map_many
 
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
@@ -256,6 +363,19 @@ class AsyncFirecrawl:
 
         self.watcher = self._v2_client.watcher
 
+    @property
+    def v1(self) -> AsyncV1Proxy:
+        """Legacy async v1 client; its module is imported on first access."""
+        if self._v1 is None:
+            from .v1 import AsyncV1FirecrawlApp
+            client = AsyncV1FirecrawlApp(api_key=self.api_key, api_url=self.api_url, auto_idempotency=self._auto_idempotency)
+            self._v1 = AsyncV1Proxy(client)
+        return self._v1
+
+    @property
+    def _v1_client(self) -> "AsyncV1FirecrawlApp":
+        return self.v1._client
+
 # Export Firecrawl as an alias for FirecrawlApp
 FirecrawlApp = Firecrawl
 AsyncFirecrawlApp = AsyncFirecrawl
\ No newline at end of file
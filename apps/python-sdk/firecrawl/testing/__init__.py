@@ -0,0 +1,19 @@
+"""
+Testing utilities: a local fake of the Firecrawl v2 API.
+
+Run it in-process (``with FakeFirecrawlServer() as url: ...``) or standalone
+with ``python -m firecrawl.testing``; see ``firecrawl.testing.server``. The
+memory-regression harness built on it lives in ``firecrawl.testing.memory``.
+"""
+
+from .documents import DocumentGenerator, fixture_documents, html_documents, lorem_documents
+from .server import FakeFirecrawlServer, FakeServerConfig
+
+__all__ = [
+    "FakeFirecrawlServer",
+    "FakeServerConfig",
+    "DocumentGenerator",
+    "lorem_documents",
+    "html_documents",
+    "fixture_documents",
+]
@@ -0,0 +1,60 @@
+"""
+Run the fake Firecrawl API until interrupted:
+
+    python -m firecrawl.testing --port 3002 --latency 0.05 --job-seconds 10 --rate-limit 20
+"""
+
+import argparse
+import threading
+
+from .documents import html_documents, lorem_documents
+from .server import FakeFirecrawlServer, FakeServerConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m firecrawl.testing", description="Fake Firecrawl v2 API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3002)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every HTTP response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of HTTP responses that fail")
+    parser.add_argument("--error-status", type=int, default=502)
+    parser.add_argument("--rate-limit", type=float, help="requests per second per API key before 429s")
+    parser.add_argument("--rate-limit-burst", type=int, default=10)
+    parser.add_argument("--payload-bytes", type=int, default=2048, help="markdown bytes per document")
+    parser.add_argument("--html", action="store_true", help="serve markdown, html and links formats")
+    parser.add_argument("--page-size", type=int, default=100, help="documents per status page")
+    parser.add_argument("--crawl-documents", type=int, default=200, help="documents per crawl")
+    parser.add_argument("--job-seconds", type=float, default=5.0, help="time jobs stay scraping")
+    parser.add_argument("--max-concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    generate = html_documents if args.html else lorem_documents
+    config = FakeServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limit=args.rate_limit,
+        rate_limit_burst=args.rate_limit_burst,
+        payload_bytes=args.payload_bytes,
+        documents=generate(args.payload_bytes),
+        page_size=args.page_size,
+        crawl_documents=args.crawl_documents,
+        job_seconds=args.job_seconds,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    )
+    server = FakeFirecrawlServer(config, host=args.host, port=args.port)
+    print(f"Fake Firecrawl API listening on {server.start()} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Document generators for the fake Firecrawl server.
+
+A generator is a callable ``(url, index) -> dict`` returning a document in the
+API's JSON shape (camelCase keys, as the real service sends them).
+"""
+
+import copy
+from typing import Any, Callable, Dict, Iterable, List
+
+DocumentGenerator = Callable[[str, int], Dict[str, Any]]
+
+
+def _metadata(url: str, index: int, credits_used: int) -> Dict[str, Any]:
+    return {
+        "sourceURL": url,
+        "url": url,
+        "title": f"Page {index}",
+        "statusCode": 200,
+        "contentType": "text/html",
+        "creditsUsed": credits_used,
+    }
+
+
+def lorem_documents(payload_bytes: int = 2048, *, credits_used: int = 1) -> DocumentGenerator:
+    """Markdown documents with ``payload_bytes`` of filler text each."""
+    filler = ("lorem ipsum dolor sit amet " * (payload_bytes // 27 + 1))[:payload_bytes]
+
+    def generate(url: str, index: int) -> Dict[str, Any]:
+        return {"markdown": f"# Page {index}\n\n{filler}", "metadata": _metadata(url, index, credits_used)}
+
+    return generate
+
+
+def html_documents(payload_bytes: int = 2048, *, links: int = 10, credits_used: int = 1) -> DocumentGenerator:
+    """Documents carrying markdown, html and links formats, for heavier parse paths."""
+    text = lorem_documents(payload_bytes)
+
+    def generate(url: str, index: int) -> Dict[str, Any]:
+        body = text(url, index)["markdown"]
+        base = url.rstrip("/")
+        return {
+            "markdown": body,
+            "html": f"<html><body><h1>Page {index}</h1><p>{body}</p></body></html>",
+            "links": [f"{base}/link/{i}" for i in range(links)],
+            "metadata": _metadata(url, index, credits_used),
+        }
+
+    return generate
+
+
+def fixture_documents(documents: Iterable[Dict[str, Any]]) -> DocumentGenerator:
+    """Cycle through recorded documents, overriding their source URL."""
+    recorded: List[Dict[str, Any]] = list(documents)
+    if not recorded:
+        raise ValueError("fixture_documents needs at least one document")
+
+    def generate(url: str, index: int) -> Dict[str, Any]:
+        document = copy.deepcopy(recorded[index % len(recorded)])
+        metadata = document.setdefault("metadata", {})
+        metadata["sourceURL"] = metadata["url"] = url
+        return document
+
+    return generate
@@ -0,0 +1,285 @@
+"""
+Memory-regression harness for large job results.
+
+Runs the SDK's result paths (crawl and batch pagination, streaming iterators,
+the WebSocket watcher and Parquet export) against a ``FakeFirecrawlServer``
+under ``tracemalloc`` and checks each against a ``MemoryBudget``:
+
+    report = run_memory_suite(documents=100_000)
+    print(report.format())
+    assert not report.violations()
+
+Peaks are expressed in *documents*: the traced size of the path's peak divided
+by the size of one parsed ``Document``, so budgets hold for any payload size.
+A path that keeps the whole job (``get_crawl_status``) is budgeted per
+document; a streaming path (``iter_crawl_documents``) per page only, so a
+quadratic copy or a second accumulation shows up as a budget violation rather
+than as a slow leak in production.
+
+The server runs in-process, so its per-request work is part of each peak. That
+is one page for the HTTP paths; the watcher's catchup message of an already
+finished job carries every document and is covered by its per-document budget.
+"""
+
+import gc
+import importlib.util
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..v2.client import FirecrawlClient
+from ..v2.types import Document
+from ..v2.utils.normalize import normalize_document_input
+from .documents import lorem_documents
+from .server import FakeFirecrawlServer, FakeServerConfig
+
+SEED_URL = "https://memory.firecrawl.test"
+
+
+@dataclass(frozen=True)
+class MemoryBudget:
+    """Limits of one path; the peak limit is ``per_document * N + per_page * page_size`` documents."""
+
+    per_document: float = 0.0
+    per_page: float = 6.0
+    retained_bytes: int = 1024 * 1024  # still allocated once the result is dropped
+
+    def peak_limit(self, documents: int, page_size: int) -> float:
+        return self.per_document * documents + self.per_page * page_size
+
+
+@dataclass
+class MemoryProfile:
+    """Measurements of one path run."""
+
+    path: str
+    documents: int
+    page_size: int
+    document_bytes: int
+    peak_bytes: int
+    result_bytes: int
+    retained_bytes: int
+    rss_delta_bytes: Optional[int]
+    seconds: float
+
+    @property
+    def peak_documents(self) -> float:
+        return self.peak_bytes / self.document_bytes
+
+    def violations(self, budget: MemoryBudget) -> List[str]:
+        problems = []
+        limit = budget.peak_limit(self.documents, self.page_size)
+        if self.peak_documents > limit:
+            problems.append(f"{self.path}: peak of {self.peak_documents:.0f} documents exceeds budget of {limit:.0f}")
+        if self.retained_bytes > budget.retained_bytes:
+            problems.append(
+                f"{self.path}: {self.retained_bytes} bytes retained after the result was dropped "
+                f"(budget {budget.retained_bytes})"
+            )
+        return problems
+
+
+@dataclass
+class MemoryReport:
+    """Profiles of a suite run, with the budgets they were checked against."""
+
+    documents: int
+    page_size: int
+    payload_bytes: int
+    profiles: List[MemoryProfile] = field(default_factory=list)
+    budgets: Dict[str, MemoryBudget] = field(default_factory=dict)
+
+    def violations(self) -> List[str]:
+        problems: List[str] = []
+        for profile in self.profiles:
+            problems.extend(profile.violations(self.budgets[profile.path]))
+        return problems
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stable, rounded values so that reports of two runs diff cleanly."""
+        paths = {}
+        for profile in self.profiles:
+            budget = self.budgets[profile.path]
+            paths[profile.path] = {
+                "peak_kib": profile.peak_bytes // 1024,
+                "peak_documents": round(profile.peak_documents),
+                "budget_documents": round(budget.peak_limit(profile.documents, profile.page_size)),
+                "result_kib": profile.result_bytes // 1024,
+                "retained_kib": profile.retained_bytes // 1024,
+                "rss_delta_kib": None if profile.rss_delta_bytes is None else profile.rss_delta_bytes // 1024,
+            }
+        return {
+            "documents": self.documents,
+            "page_size": self.page_size,
+            "payload_bytes": self.payload_bytes,
+            "document_bytes": self.profiles[0].document_bytes if self.profiles else None,
+            "paths": paths,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+
+    def format(self) -> str:
+        header = f"{'path':<16} {'peak MiB':>9} {'peak docs':>10} {'budget':>10} {'result MiB':>11} {'retained KiB':>13} {'RSS MiB':>8}"
+        lines = [header, "-" * len(header)]
+        for name, row in self.to_dict()["paths"].items():
+            rss = "-" if row["rss_delta_kib"] is None else f"{row['rss_delta_kib'] / 1024:.1f}"
+            lines.append(
+                f"{name:<16} {row['peak_kib'] / 1024:>9.1f} {row['peak_documents']:>10} {row['budget_documents']:>10} "
+                f"{row['result_kib'] / 1024:>11.1f} {row['retained_kib']:>13} {rss:>8}"
+            )
+        return "\n".join(lines)
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def document_bytes(payload_bytes: int) -> int:
+    """Traced size of one parsed ``Document`` of the default fake payload."""
+    generate = lorem_documents(payload_bytes)
+    raw = json.loads(json.dumps([generate(f"{SEED_URL}/page/{i}", i) for i in range(100)]))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        documents = [Document(**normalize_document_input(doc)) for doc in raw]
+        del raw
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del documents
+    return max(1, size // 100)
+
+
+def profile_memory(path: str, run: Callable[[], Any], *, documents: int, page_size: int, unit_bytes: int) -> MemoryProfile:
+    """
+    Trace ``run()``: its peak, the size of what it returns, and what stays
+    allocated after that result is dropped.
+    """
+    gc.collect()
+    rss_before = _rss_bytes()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        result = run()
+        seconds = time.perf_counter() - started
+        current, peak = tracemalloc.get_traced_memory()
+        rss_after = _rss_bytes()
+        del result
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    return MemoryProfile(
+        path=path,
+        documents=documents,
+        page_size=page_size,
+        document_bytes=unit_bytes,
+        peak_bytes=peak - baseline,
+        result_bytes=max(0, current - baseline),
+        retained_bytes=max(0, retained),
+        rss_delta_bytes=None if rss_before is None or rss_after is None else rss_after - rss_before,
+        seconds=seconds,
+    )
+
+
+# Paths: (prepare(client, documents) -> job id, run(client, job id) -> result, budget)
+
+
+def _start_crawl(client: FirecrawlClient, documents: int) -> str:
+    return client.start_crawl(SEED_URL, limit=documents).id
+
+
+def _start_batch(client: FirecrawlClient, documents: int) -> str:
+    return client.start_batch_scrape([f"{SEED_URL}/page/{i}" for i in range(documents)]).id
+
+
+def _drain(documents: Iterable[Document]) -> int:
+    count = 0
+    for _ in documents:
+        count += 1
+    return count
+
+
+def _watch(client: FirecrawlClient, job_id: str, kind: str) -> Any:
+    watcher = client.watcher(job_id, kind=kind, poll_interval=1, timeout=600)
+    done: List[Dict[str, Any]] = []
+    watcher.add_event_listener("done", done.append)
+    watcher.start()
+    watcher._thread.join()
+    if not done:
+        raise RuntimeError(f"watcher for {job_id} ended without a done event (status {watcher.status})")
+    return watcher
+
+
+def _start_export(client: FirecrawlClient, documents: int) -> str:
+    # pyarrow's import-time allocations are not part of the path
+    import pyarrow.parquet  # noqa: F401
+
+    return _start_crawl(client, documents)
+
+
+def _export(client: FirecrawlClient, job_id: str) -> int:
+    from ..v2.utils.export import write_parquet
+
+    with tempfile.TemporaryDirectory() as tmp:
+        return write_parquet(client.iter_crawl_documents(job_id), os.path.join(tmp, "crawl.parquet"))
+
+
+MemoryPath = Tuple[Callable[[FirecrawlClient, int], str], Callable[[FirecrawlClient, str], Any], MemoryBudget]
+
+MEMORY_PATHS: Dict[str, MemoryPath] = {
+    # Whole job held as Documents; pages are decoded one at a time
+    "crawl_status": (_start_crawl, lambda client, job_id: client.get_crawl_status(job_id), MemoryBudget(per_document=1.5)),
+    "batch_status": (_start_batch, lambda client, job_id: client.get_batch_scrape_status(job_id), MemoryBudget(per_document=1.5)),
+    # Streaming: bounded by a page, whatever the job size
+    "crawl_iter": (_start_crawl, lambda client, job_id: _drain(client.iter_crawl_documents(job_id)), MemoryBudget()),
+    "batch_iter": (_start_batch, lambda client, job_id: _drain(client.iter_batch_scrape_documents(job_id)), MemoryBudget()),
+    "export_parquet": (_start_export, _export, MemoryBudget(per_page=20.0)),
+    # Raw dicts streamed into ``watcher.data`` plus the final Document snapshot
+    "crawl_watcher": (_start_crawl, lambda client, job_id: _watch(client, job_id, "crawl"), MemoryBudget(per_document=2.5)),
+}
+
+
+def run_memory_suite(
+    *,
+    documents: int = 100_000,
+    page_size: int = 100,
+    payload_bytes: int = 512,
+    paths: Optional[Iterable[str]] = None,
+) -> MemoryReport:
+    """
+    Profile ``paths`` (default: all of ``MEMORY_PATHS``; ``export_parquet``
+    only when pyarrow is installed) over synthetic jobs of ``documents``
+    documents served by an in-process fake server.
+    """
+    if paths is None:
+        paths = [name for name in MEMORY_PATHS if name != "export_parquet" or _has_pyarrow()]
+    unit = document_bytes(payload_bytes)
+    report = MemoryReport(documents=documents, page_size=page_size, payload_bytes=payload_bytes)
+    config = FakeServerConfig(payload_bytes=payload_bytes, page_size=page_size, crawl_documents=documents)
+    with FakeFirecrawlServer(config) as url:
+        client = FirecrawlClient(api_key="fc-memory", api_url=url, tracing=False)
+        for name in paths:
+            prepare, run, budget = MEMORY_PATHS[name]
+            job_id = prepare(client, documents)
+            report.profiles.append(
+                profile_memory(name, lambda: run(client, job_id), documents=documents, page_size=page_size, unit_bytes=unit)
+            )
+            report.budgets[name] = budget
+    return report
+
+
+def _has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
@@ -0,0 +1,371 @@
+"""
+Fake Firecrawl v2 API server for offline integration and load testing.
+
+Serves scrape, crawl and batch scrape jobs (``scraping`` → ``completed``
+over ``job_seconds``, with ``next`` pagination cursors), the crawl/batch
+WebSocket watch endpoints (``catchup``, ``document`` and ``done`` messages),
+map, search, extract and the team usage endpoints from an aiohttp app on a
+background thread. Latency, error injection and 429 + ``Retry-After`` rate
+limiting are configurable:
+
+    from firecrawl import Firecrawl
+    from firecrawl.testing import FakeFirecrawlServer, FakeServerConfig
+
+    with FakeFirecrawlServer(FakeServerConfig(latency=0.02, rate_limit=50)) as url:
+        client = Firecrawl(api_key="fc-test", api_url=url)
+        client.crawl("https://example.com")
+
+It also runs standalone: ``python -m firecrawl.testing --port 3002``.
+"""
+
+import asyncio
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from .documents import DocumentGenerator, lorem_documents
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the fake API."""
+
+    latency: float = 0.0  # seconds added to every HTTP response
+    jitter: float = 0.0  # uniform extra latency in [0, jitter]
+    error_rate: float = 0.0  # fraction of HTTP responses replaced by ``error_status``
+    error_status: int = 502
+    rate_limit: Optional[float] = None  # requests per second per API key (429 beyond)
+    rate_limit_burst: int = 10
+    payload_bytes: int = 2048  # markdown size of the default documents
+    documents: Optional[DocumentGenerator] = None  # (url, index) -> document; lorem text by default
+    page_size: int = 100  # documents per status page before a ``next`` cursor
+    crawl_documents: int = 200  # documents per crawl (capped by the request's ``limit``)
+    job_seconds: float = 0.0  # time a crawl/batch job stays "scraping"
+    ws_interval: float = 0.01  # seconds between WebSocket progress checks
+    map_links: int = 500
+    search_results: int = 10
+    max_concurrency: int = 50
+    plan_credits: int = 100_000
+    seed: Optional[int] = None
+
+
+class _Job:
+    def __init__(self, kind: str, urls: List[str], total: int, duration: float):
+        self.id = str(uuid.uuid4())
+        self.kind = kind
+        self.urls = urls
+        self.total = total
+        self.duration = duration
+        self.created = time.monotonic()
+        self.cancelled_at: Optional[int] = None
+
+    def completed(self) -> int:
+        if self.cancelled_at is not None:
+            return self.cancelled_at
+        if self.duration <= 0:
+            return self.total
+        elapsed = time.monotonic() - self.created
+        return min(self.total, int(self.total * elapsed / self.duration))
+
+    def status(self) -> str:
+        if self.cancelled_at is not None:
+            return "cancelled"
+        return "completed" if self.completed() >= self.total else "scraping"
+
+    def url(self, index: int) -> str:
+        if self.urls:
+            return self.urls[index % len(self.urls)]
+        return f"https://fake.firecrawl.test/page/{index}"
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consume a token; returns 0, or the seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class FakeFirecrawlServer:
+    """aiohttp app on a background thread; ``start()`` returns its base URL."""
+
+    def __init__(self, config: Optional[FakeServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeServerConfig()
+        self.host = host
+        self.port = port
+        self.url: Optional[str] = None
+        # Requests served per "METHOD /route" and 429s returned
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+        self._documents = self.config.documents or lorem_documents(self.config.payload_bytes)
+        self._jobs: Dict[str, _Job] = {}
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._scraped = 0
+        self._random = random.Random(self.config.seed)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # Lifecycle
+
+    def start(self) -> str:
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self._startup())
+            except BaseException as exc:  # surfaced to the caller of start()
+                errors.append(exc)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="firecrawl-fake-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self.url
+
+    async def _startup(self) -> None:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        self.url = f"http://{self.host}:{self.port}"
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop = self._thread = None
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # App
+
+    def app(self) -> web.Application:
+        """The aiohttp application (e.g. to mount under an existing aiohttp test server)."""
+        app = web.Application(middlewares=[self._middleware], client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/v2/scrape", self._scrape)
+        app.router.add_post("/v2/crawl", self._start_crawl)
+        app.router.add_get("/v2/crawl/{id}", self._job_status)
+        app.router.add_delete("/v2/crawl/{id}", self._cancel)
+        app.router.add_get("/v2/crawl/{id}/errors", self._errors)
+        app.router.add_post("/v2/batch/scrape", self._start_batch)
+        app.router.add_get("/v2/batch/scrape/{id}", self._job_status)
+        app.router.add_delete("/v2/batch/scrape/{id}", self._cancel)
+        app.router.add_get("/v2/batch/scrape/{id}/errors", self._errors)
+        app.router.add_post("/v2/map", self._map)
+        app.router.add_post("/v2/search", self._search)
+        app.router.add_post("/v2/extract", self._start_extract)
+        app.router.add_get("/v2/extract/{id}", self._extract_status)
+        app.router.add_get("/v2/concurrency-check", self._concurrency)
+        app.router.add_get("/v2/team/credit-usage", self._credit_usage)
+        app.router.add_get("/v2/team/queue-status", self._queue_status)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        resource = request.match_info.route.resource
+        self.requests[f"{request.method} {resource.canonical if resource is not None else request.path}"] += 1
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await handler(request)
+        config = self.config
+        if config.rate_limit:
+            key = request.headers.get("Authorization", "")
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _TokenBucket(config.rate_limit, config.rate_limit_burst)
+            wait = bucket.take()
+            if wait:
+                self.rate_limited += 1
+                return web.json_response(
+                    {"success": False, "error": f"Rate limit exceeded. Retry after {math.ceil(wait)}s."},
+                    status=429,
+                    headers={"Retry-After": str(max(1, math.ceil(wait)))},
+                )
+        delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if config.error_rate and self._random.random() < config.error_rate:
+            return web.json_response({"success": False, "error": "injected failure"}, status=config.error_status)
+        return await handler(request)
+
+    def _job_documents(self, job: _Job, start: int, stop: int) -> List[Dict[str, Any]]:
+        return [self._documents(job.url(i), i) for i in range(start, stop)]
+
+    def _job(self, request: web.Request) -> Optional[_Job]:
+        return self._jobs.get(request.match_info["id"])
+
+    @staticmethod
+    def _not_found() -> web.Response:
+        return web.json_response({"success": False, "error": "Job not found"}, status=404)
+
+    # Handlers
+
+    async def _scrape(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self._scraped += 1
+        return web.json_response({"success": True, "data": self._documents(body.get("url", ""), 0)})
+
+    async def _start_crawl(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        total = self.config.crawl_documents
+        if body.get("limit"):
+            total = min(total, int(body["limit"]))
+        job = _Job("crawl", [], total, self.config.job_seconds)
+        self._jobs[job.id] = job
+        return web.json_response({"success": True, "id": job.id, "url": f"{self.url}/v2/crawl/{job.id}"})
+
+    async def _start_batch(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        urls = body.get("urls") or []
+        job = _Job("batch", urls, len(urls), self.config.job_seconds)
+        self._jobs[job.id] = job
+        return web.json_response({"success": True, "id": job.id, "url": f"{self.url}/v2/batch/scrape/{job.id}"})
+
+    def _status_body(self, job: _Job, skip: int) -> Dict[str, Any]:
+        completed = job.completed()
+        end = min(completed, skip + self.config.page_size)
+        body: Dict[str, Any] = {
+            "success": True,
+            "status": job.status(),
+            "completed": completed,
+            "total": job.total,
+            "creditsUsed": completed,
+            "expiresAt": "2099-01-01T00:00:00Z",
+            "data": self._job_documents(job, skip, end),
+        }
+        if end < completed:
+            path = "crawl" if job.kind == "crawl" else "batch/scrape"
+            body["next"] = f"{self.url}/v2/{path}/{job.id}?skip={end}"
+        return body
+
+    async def _job_status(self, request: web.Request) -> web.StreamResponse:
+        job = self._job(request)
+        if job is None:
+            return self._not_found()
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await self._watch(request, job)
+        return web.json_response(self._status_body(job, int(request.query.get("skip", 0))))
+
+    async def _watch(self, request: web.Request, job: _Job) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        sent = job.completed()
+        await ws.send_json({"type": "catchup", "data": {"status": job.status(), "data": self._job_documents(job, 0, sent)}})
+        while not ws.closed:
+            completed = job.completed()
+            for index in range(sent, completed):
+                await ws.send_json({"type": "document", "data": self._documents(job.url(index), index)})
+            sent = completed
+            status = job.status()
+            if status != "scraping":
+                payload = {"status": status, "completed": completed, "total": job.total, "creditsUsed": completed}
+                if status == "completed":
+                    await ws.send_json({"type": "done", "data": payload})
+                else:
+                    await ws.send_json({"type": "error", "error": f"Job {status}", "data": payload})
+                break
+            await asyncio.sleep(self.config.ws_interval)
+        await ws.close()
+        return ws
+
+    async def _cancel(self, request: web.Request) -> web.Response:
+        job = self._job(request)
+        if job is None:
+            return self._not_found()
+        if job.cancelled_at is None:
+            job.cancelled_at = job.completed()
+        return web.json_response({"success": True, "status": "cancelled"})
+
+    async def _errors(self, request: web.Request) -> web.Response:
+        if self._job(request) is None:
+            return self._not_found()
+        return web.json_response({"success": True, "errors": [], "robotsBlocked": []})
+
+    async def _map(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        base = body.get("url", "https://fake.firecrawl.test").rstrip("/")
+        limit = min(self.config.map_links, int(body.get("limit") or self.config.map_links))
+        links = [{"url": f"{base}/page/{i}", "title": f"Page {i}"} for i in range(limit)]
+        return web.json_response({"success": True, "links": links})
+
+    async def _search(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        query = body.get("query", "")
+        limit = min(self.config.search_results, int(body.get("limit") or self.config.search_results))
+        results = [
+            {"url": f"https://fake.firecrawl.test/{query}/{i}", "title": f"{query} {i}", "description": f"Result {i} for {query}"}
+            for i in range(limit)
+        ]
+        return web.json_response({"success": True, "data": {"web": results}})
+
+    async def _start_extract(self, request: web.Request) -> web.Response:
+        job = _Job("extract", [], 1, self.config.job_seconds)
+        self._jobs[job.id] = job
+        return web.json_response({"success": True, "id": job.id})
+
+    async def _extract_status(self, request: web.Request) -> web.Response:
+        job = self._job(request)
+        if job is None:
+            return self._not_found()
+        status = job.status()
+        if status == "scraping":
+            status = "processing"
+        data = {"summary": f"Extracted from job {job.id}"} if status == "completed" else None
+        return web.json_response({"success": True, "id": job.id, "status": status, "data": data})
+
+    def _active_jobs(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status() == "scraping")
+
+    async def _concurrency(self, request: web.Request) -> web.Response:
+        active = min(self._active_jobs(), self.config.max_concurrency)
+        return web.json_response({"success": True, "concurrency": active, "maxConcurrency": self.config.max_concurrency})
+
+    async def _credit_usage(self, request: web.Request) -> web.Response:
+        used = self._scraped + sum(job.completed() for job in self._jobs.values() if job.kind != "extract")
+        return web.json_response({
+            "success": True,
+            "data": {"remainingCredits": max(0, self.config.plan_credits - used), "planCredits": self.config.plan_credits},
+        })
+
+    async def _queue_status(self, request: web.Request) -> web.Response:
+        active = self._active_jobs()
+        running = min(active, self.config.max_concurrency)
+        return web.json_response({
+            "success": True,
+            "jobsInQueue": active,
+            "activeJobsInQueue": running,
+            "waitingJobsInQueue": active - running,
+            "maxConcurrency": self.config.max_concurrency,
+        })
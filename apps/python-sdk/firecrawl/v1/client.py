@@ -14,6 +14,7 @@ Classes:
 import logging
 import os
 import time
+import uuid
 from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic
 import json
 from datetime import datetime
@@ -26,6 +27,12 @@ import asyncio
 
 logger : logging.Logger = logging.getLogger("firecrawl")
 
+# Endpoints that start a server-side job and therefore benefit from idempotency keys
+_JOB_CREATING_PATHS = frozenset({'/v1/crawl', '/v1/batch/scrape', '/v1/extract', '/v1/deep-research', '/v1/llmstxt'})
+
+# Job-creating endpoints where the API rejects a reused idempotency key
+_DEDUPLICATED_PATHS = frozenset({'/v1/crawl', '/v1/batch/scrape'})
+
 def get_version():
   try:
       from pathlib import Path
@@ -499,16 +506,18 @@ class V1FirecrawlApp:
     This is used by the unified client to provide version-specific access
     through app.v1.method_name() patterns.
     """
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None, auto_idempotency: bool = False) -> None:
         """
         Initialize the V1FirecrawlApp instance with API key, API URL.
 
         Args:
             api_key (Optional[str]): API key for authenticating with the Firecrawl API.
             api_url (Optional[str]): Base URL for the Firecrawl API.
+            auto_idempotency (bool): Attach an idempotency key to job-creating requests so retries cannot start them twice.
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
+        self.auto_idempotency = auto_idempotency
         
         # Only require API key when using cloud service
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
@@ -2326,6 +2335,31 @@ class V1FirecrawlApp:
             'Authorization': f'Bearer {self.api_key}',
         }
 
+    def _with_idempotency_key(
+            self,
+            url: str,
+            data: Dict[str, Any],
+            headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Add a fresh idempotency key to the headers of a job-creating request.
+
+        Args:
+            url (str): The request URL.
+            data (Dict[str, Any]): The JSON body of the request.
+            headers (Dict[str, str]): The prepared headers.
+
+        Returns:
+            Dict[str, str]: The headers, with ``x-idempotency-key`` set when auto idempotency is enabled.
+        """
+        if not self.auto_idempotency or 'x-idempotency-key' in headers:
+            return headers
+        path = url[len(self.api_url):] if url.startswith(self.api_url) else url
+        if path not in _JOB_CREATING_PATHS:
+            return headers
+        # A new key per call: the API keeps keys forever, so reusing one for an
+        # identical later request would be rejected with 409
+        return {**headers, 'x-idempotency-key': str(uuid.uuid4())}
+
     def _post_request(
             self,
             url: str,
@@ -2349,8 +2383,18 @@ class V1FirecrawlApp:
         Raises:
             requests.RequestException: If the request fails after the specified retries.
         """
+        headers = self._with_idempotency_key(url, data, headers)
+        # Connection errors are only safe to retry when the server can deduplicate the request
+        path = url[len(self.api_url):] if url.startswith(self.api_url) else url
+        idempotent = 'x-idempotency-key' in headers and path in _DEDUPLICATED_PATHS
         for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] / 1000.0 + 5) if "timeout" in data and data["timeout"] is not None else None))
+            try:
+                response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] / 1000.0 + 5) if "timeout" in data and data["timeout"] is not None else None))
+            except requests.RequestException:
+                if not idempotent or attempt == retries - 1:
+                    raise
+                time.sleep(backoff_factor * (2 ** attempt))
+                continue
             if response.status_code == 502:
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
@@ -2905,9 +2949,9 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
     Provides non-blocking alternatives to all V1FirecrawlApp operations.
     """
 
-    def __init__(self, api_key: str, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(self, api_key: str, api_url: str = "https://api.firecrawl.dev", auto_idempotency: bool = False):
         # Reuse V1 helpers (_prepare_headers, _validate_kwargs, _ensure_schema_dict, _get_error_message)
-        super().__init__(api_key=api_key, api_url=api_url)
+        super().__init__(api_key=api_key, api_url=api_url, auto_idempotency=auto_idempotency)
 
     async def _async_request(
             self,
@@ -2975,6 +3019,7 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
             aiohttp.ClientError: If the request fails after all retries.
             Exception: If max retries are exceeded or other errors occur.
         """
+        headers = self._with_idempotency_key(url, data, headers)
         return await self._async_request("POST", url, headers, data, retries, backoff_factor)
 
     async def _async_get_request(
@@ -5,7 +5,8 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, Callable, Union, Literal, Iterator, Iterable
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -17,6 +18,7 @@ from .types import (
     CrawlRequest,
     CrawlResponse,
     CrawlJob,
+    BatchScrapeJob,
     CrawlParamsRequest,
     PDFParser,
     CrawlParamsData,
@@ -41,6 +43,20 @@ from .types import (
 )
 from .utils.http_client import HttpClient
 from .utils.error_handler import FirecrawlError
+from .utils.url_dedup import UrlDeduplicator
+from .utils.idempotency import IdempotencyJournal
+from .utils.batch_split import DEFAULT_MAX_PARALLEL_JOBS
+from .utils.scheduler import RequestScheduler
+from .utils.domain_dispatch import NULL_LEASE, DomainDispatcher
+from .utils.cache import MapSearchCache, ScrapeCache
+from .utils.single_flight import SingleFlight, request_key
+from .utils.hooks import Hooks
+from .utils.tracing import Tracing, resolve_tracing, span
+from .utils.metrics import MetricsRegistry
+from .utils.profiling import Profiler, resolve_profiling
+from .utils.credits import CreditLedger
+from .utils.prepared import PreparedScrape
+from .utils.fan_out import DEFAULT_CONCURRENCY, ItemResult, iter_bounded
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
 from .methods import batch as batch_module
@@ -64,7 +80,19 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        auto_idempotency: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        domain_dispatcher: Optional[DomainDispatcher] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+        map_search_cache: Optional[MapSearchCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        hooks: Optional[Hooks] = None,
+        tracing: Union[bool, Tracing] = True,
+        metrics: Optional[MetricsRegistry] = None,
+        credit_ledger: Optional[CreditLedger] = None,
+        profiling: Union[bool, float, Profiler, None] = None,
     ):
         """
         Initialize the Firecrawl client.
@@ -75,6 +103,20 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            auto_idempotency: Derive idempotency keys from the payload of every job-creating request
+            idempotency_journal: Journal mapping idempotency keys to started jobs (in-memory by default)
+            scheduler: Optional RequestScheduler gating scrape calls and job submissions by priority class
+            domain_dispatcher: Optional DomainDispatcher applying per-domain caps to scrape calls
+            scrape_cache: Optional local ScrapeCache serving repeated scrapes within ``max_age``
+            map_search_cache: Optional local MapSearchCache for map/search results
+            single_flight: Optional SingleFlight coalescing concurrent identical scrape/status calls
+            hooks: Optional Hooks receiving request/response/retry/page/parse events
+            tracing: OpenTelemetry spans and ``traceparent`` propagation (True enables them when
+                opentelemetry-api is installed; a Tracing instance selects the tracer provider)
+            metrics: Optional MetricsRegistry collecting latency, retry, throughput and watcher metrics
+            credit_ledger: Optional CreditLedger tracking credits per job/tag and cancelling jobs over budget
+            profiling: CPU time per operation and phase (True, a sample rate in (0, 1] or a Profiler;
+                None defers to the FIRECRAWL_PROFILE environment variable), reported by ``self.profiler``
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -90,10 +132,56 @@ class FirecrawlClient:
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
-            backoff_factor=backoff_factor
+            backoff_factor=backoff_factor,
+            auto_idempotency=auto_idempotency,
         )
         
-        self.http_client = HttpClient(api_key, api_url)
+        self.tracing = resolve_tracing(tracing)
+        if self.tracing is not None:
+            hooks = self.tracing.install(hooks if hooks is not None else Hooks())
+        self.metrics = metrics
+        if metrics is not None:
+            hooks = metrics.install(hooks if hooks is not None else Hooks())
+        self.profiler = resolve_profiling(profiling, label=api_url)
+
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            auto_idempotency=auto_idempotency,
+            idempotency_journal=idempotency_journal,
+            hooks=hooks,
+            credit_ledger=credit_ledger,
+            profiler=self.profiler,
+        )
+        self.hooks = hooks
+        self.credit_ledger = credit_ledger
+
+        self.scheduler = scheduler
+        if scheduler is not None and scheduler.max_concurrency is None and scheduler.concurrency_source is None:
+            scheduler.concurrency_source = self.get_concurrency
+        self.domain_dispatcher = domain_dispatcher
+        self.scrape_cache = scrape_cache
+        self.map_search_cache = map_search_cache
+        self.single_flight = single_flight
+
+    def _slot(self, priority: Optional[str]):
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(priority)
+
+    def _domain_slot(self, url: str):
+        if self.domain_dispatcher is None:
+            return nullcontext(NULL_LEASE)
+        return self.domain_dispatcher.slot(url)
+
+    def _coalesce(self, method: str, job_id: str, pagination_config: Optional[PaginationConfig], fetch):
+        if self.single_flight is None:
+            return fetch()
+        payload = {
+            "id": job_id,
+            "pagination": pagination_config.model_dump() if pagination_config is not None else None,
+        }
+        return self.single_flight.do(request_key(method, payload), fetch)
     
     def scrape(
         self,
@@ -119,6 +207,7 @@ class FirecrawlClient:
         max_age: Optional[int] = None,
         store_in_cache: Optional[bool] = None,
         integration: Optional[str] = None,
+        priority: Optional[str] = None,
     ) -> Document:
         """
         Scrape a single URL and return the document.
@@ -143,6 +232,7 @@ class FirecrawlClient:
             proxy: Proxy to use
             max_age: Maximum age of the cache
             store_in_cache: Whether to store the result in the cache
+            priority: Scheduler priority class (when a scheduler is configured)
         Returns:
             Document
         """
@@ -170,7 +260,108 @@ class FirecrawlClient:
                 integration=integration,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache, integration]) else None
-        return scrape_module.scrape(self.http_client, url, options)
+        return self._run_scrape(
+            url,
+            priority,
+            lambda: scrape_module._prepare_scrape_request(url, options),
+            lambda: scrape_module.scrape(self.http_client, url, options),
+        )
+
+    def prepare_scrape(self, options: Optional[ScrapeOptions] = None, **kwargs) -> PreparedScrape:
+        """
+        Validate and encode scrape options once for use with ``scrape_prepared``.
+
+        Args:
+            options: ScrapeOptions to prepare
+            **kwargs: ScrapeOptions fields (snake_case), used when ``options`` is None
+
+        Returns:
+            PreparedScrape reusable across URLs
+        """
+        if options is None and kwargs:
+            options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None})
+        return PreparedScrape(options)
+
+    def scrape_prepared(self, prepared: PreparedScrape, url: str, *, priority: Optional[str] = None) -> Document:
+        """
+        Scrape a URL with options prepared by ``prepare_scrape``.
+
+        Args:
+            prepared: Pre-validated, pre-encoded scrape options
+            url: URL to scrape
+            priority: Scheduler priority class (when a scheduler is configured)
+
+        Returns:
+            Document
+        """
+        return self._run_scrape(
+            url,
+            priority,
+            lambda: prepared.payload(url),
+            lambda: scrape_module.scrape_prepared(self.http_client, prepared, url),
+        )
+
+    def _run_scrape(self, url: str, priority: Optional[str], make_payload, send) -> Document:
+        payload = None
+        if self.scrape_cache is not None or self.single_flight is not None:
+            payload = make_payload()
+        if self.scrape_cache is not None:
+            # Cache hits skip the dispatcher and scheduler entirely
+            cached = self.scrape_cache.lookup(payload)
+            if cached is not None:
+                return cached
+
+        def fetch() -> Document:
+            if self.credit_ledger is not None:
+                self.credit_ledger.check()
+            # Domain slot first so a capped host does not hold a scheduler slot while waiting;
+            # only send() is timed, not the wait for the scheduler slot
+            with self._domain_slot(url) as lease, self._slot(priority), lease.measure():
+                document = send()
+            if self.credit_ledger is not None and document.metadata is not None:
+                self.credit_ledger.record_credits(document.metadata.credits_used)
+            if self.scrape_cache is not None:
+                self.scrape_cache.store(payload, document)
+            return document
+
+        if self.single_flight is None:
+            return fetch()
+        return self.single_flight.do(request_key("scrape", payload), fetch)
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        options: Optional[ScrapeOptions] = None,
+        priority: Optional[str] = None,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> Iterator[ItemResult]:
+        """
+        Scrape many URLs on a thread pool with at most ``concurrency`` requests in flight.
+
+        Args:
+            urls: URLs to scrape (consumed lazily)
+            concurrency: Maximum number of scrapes in flight
+            options: ScrapeOptions applied to every URL
+            priority: Scheduler priority class (when a scheduler is configured)
+            rate_limit_retries: Retries per URL after a 429, honoring Retry-After
+            **kwargs: ScrapeOptions fields (snake_case), used when ``options`` is None
+
+        Returns:
+            Iterator of ItemResult in completion order; ``index`` is the URL's input position
+            and a failed URL carries its exception in ``error``
+        """
+        # Options are validated and encoded once, before any request is sent
+        prepared = self.prepare_scrape(options, **kwargs)
+        self.http_client.reserve_connections(concurrency)
+        return iter_bounded(
+            lambda url: self.scrape_prepared(prepared, url, priority=priority),
+            urls,
+            concurrency,
+            rate_limit_retries=rate_limit_retries,
+        )
 
     def search(
         self,
@@ -213,7 +404,40 @@ class FirecrawlClient:
             integration=integration,
         )
 
-        return search_module.search(self.http_client, request)
+        if self.map_search_cache is None:
+            return search_module.search(self.http_client, request)
+        payload = search_module._prepare_search_request(request)
+        cached = self.map_search_cache.get_search(payload)
+        if cached is not None:
+            return cached
+        data = search_module.search(self.http_client, request)
+        self.map_search_cache.put_search(payload, data)
+        return data
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> Iterator[ItemResult]:
+        """
+        Run many searches on a thread pool with at most ``concurrency`` requests in flight.
+
+        Args:
+            queries: Search queries (consumed lazily)
+            concurrency: Maximum number of searches in flight
+            rate_limit_retries: Retries per query after a 429, honoring Retry-After
+            **kwargs: ``search`` arguments applied to every query
+
+        Returns:
+            Iterator of ItemResult (SearchData values) in completion order
+        """
+        self.http_client.reserve_connections(concurrency)
+        return iter_bounded(
+            lambda query: self.search(query, **kwargs), queries, concurrency, rate_limit_retries=rate_limit_retries
+        )
     
     def crawl(
         self,
@@ -237,6 +461,8 @@ class FirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -260,6 +486,8 @@ class FirecrawlClient:
             zero_data_retention: Whether to delete data after 24 hours
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None for no timeout)
+            idempotency_key: Header used to deduplicate starts
+            priority: Scheduler priority class for the submission (polling holds no slot)
             
         Returns:
             CrawlJob when job completes
@@ -289,12 +517,11 @@ class FirecrawlClient:
             integration=integration,
         )
         
-        return crawl_module.crawl(
-            self.http_client, 
-            request, 
-            poll_interval=poll_interval, 
-            timeout=timeout
-        )
+        with span(self.tracing, "firecrawl.crawl", **{"firecrawl.url": url}):
+            # Only the submission takes a slot; a running crawl must not block interactive calls
+            with self._slot(priority):
+                started = crawl_module.start_crawl(self.http_client, request, idempotency_key=idempotency_key)
+            return crawl_module.wait_for_crawl_completion(self.http_client, started.id, poll_interval, timeout)
     
     def start_crawl(
         self,
@@ -316,6 +543,8 @@ class FirecrawlClient:
         scrape_options: Optional[ScrapeOptions] = None,
         zero_data_retention: bool = False,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ) -> CrawlResponse:
         """
         Start an asynchronous crawl job.
@@ -337,6 +566,9 @@ class FirecrawlClient:
             webhook: Webhook configuration for notifications
             scrape_options: Page scraping configuration
             zero_data_retention: Whether to delete data after 24 hours
+            idempotency_key: Header used to deduplicate starts
+            priority: Scheduler priority class; orders the submission only, the
+                started job does not hold a slot
             
         Returns:
             CrawlResponse with job information
@@ -365,7 +597,8 @@ class FirecrawlClient:
             integration=integration,
         )
         
-        return crawl_module.start_crawl(self.http_client, request)
+        with self._slot(priority):
+            return crawl_module.start_crawl(self.http_client, request, idempotency_key=idempotency_key)
     
     def get_crawl_status(
         self, 
@@ -385,12 +618,36 @@ class FirecrawlClient:
         Raises:
             Exception: If the status check fails
         """
-        return crawl_module.get_crawl_status(
-            self.http_client, 
+        def fetch() -> CrawlJob:
+            return crawl_module.get_crawl_status(
+                self.http_client, 
+                job_id,
+                pagination_config=pagination_config
+            )
+
+        return self._coalesce("crawl_status", job_id, pagination_config, fetch)
+    
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None
+    ) -> Iterator[Document]:
+        """
+        Stream the documents of a crawl job page by page.
+
+        Args:
+            job_id: ID of the crawl job
+            pagination_config: Optional configuration for pagination limits
+
+        Returns:
+            Iterator of Document objects (pages are fetched lazily)
+        """
+        return crawl_module.iter_crawl_documents(
+            self.http_client,
             job_id,
             pagination_config=pagination_config
         )
-    
+
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
         """
         Retrieve error details and robots.txt blocks for a given crawl job.
@@ -456,7 +713,40 @@ class FirecrawlClient:
             location=location
         ) if any(v is not None for v in [search, include_subdomains, limit, sitemap, timeout, integration, location]) else None
 
-        return map_module.map(self.http_client, url, options)
+        if self.map_search_cache is None:
+            return map_module.map(self.http_client, url, options)
+        payload = map_module._prepare_map_request(url, options)
+        cached = self.map_search_cache.get_map(payload)
+        if cached is not None:
+            return cached
+        data = map_module.map(self.http_client, url, options)
+        self.map_search_cache.put_map(payload, data)
+        return data
+
+    def map_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> Iterator[ItemResult]:
+        """
+        Map many URLs on a thread pool with at most ``concurrency`` requests in flight.
+
+        Args:
+            urls: Root URLs to map (consumed lazily)
+            concurrency: Maximum number of map calls in flight
+            rate_limit_retries: Retries per URL after a 429, honoring Retry-After
+            **kwargs: ``map`` arguments applied to every URL
+
+        Returns:
+            Iterator of ItemResult (MapData values) in completion order
+        """
+        self.http_client.reserve_connections(concurrency)
+        return iter_bounded(
+            lambda url: self.map(url, **kwargs), urls, concurrency, rate_limit_retries=rate_limit_retries
+        )
     
     def cancel_crawl(self, crawl_id: str) -> bool:
         """
@@ -497,6 +787,8 @@ class FirecrawlClient:
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ):
         """Start an extract job (non-blocking).
 
@@ -512,23 +804,28 @@ class FirecrawlClient:
             ignore_invalid_urls: Skip invalid URLs instead of failing
             integration: Integration tag/name
             agent: Agent configuration
+            idempotency_key: Header used to deduplicate starts
+            priority: Scheduler priority class; orders the submission only, the
+                started job does not hold a slot
         Returns:
             Response payload with job id/status (poll with get_extract_status)
         """
-        return extract_module.start_extract(
-            self.http_client,
-            urls,
-            prompt=prompt,
-            schema=schema,
-            system_prompt=system_prompt,
-            allow_external_links=allow_external_links,
-            enable_web_search=enable_web_search,
-            show_sources=show_sources,
-            scrape_options=scrape_options,
-            ignore_invalid_urls=ignore_invalid_urls,
-            integration=integration,
-            agent=agent,
-        )
+        with self._slot(priority):
+            return extract_module.start_extract(
+                self.http_client,
+                urls,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt,
+                allow_external_links=allow_external_links,
+                enable_web_search=enable_web_search,
+                show_sources=show_sources,
+                scrape_options=scrape_options,
+                ignore_invalid_urls=ignore_invalid_urls,
+                integration=integration,
+                agent=agent,
+                idempotency_key=idempotency_key,
+            )
 
     def extract(
         self,
@@ -546,6 +843,8 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ):
         """Extract structured data and wait until completion.
 
@@ -563,29 +862,36 @@ class FirecrawlClient:
             timeout: Maximum seconds to wait (None for no timeout)
             integration: Integration tag/name
             agent: Agent configuration
+            idempotency_key: Header used to deduplicate starts
+            priority: Scheduler priority class for the submission (polling holds no slot)
         Returns:
             Final extract response when completed
         """
-        return extract_module.extract(
-            self.http_client,
-            urls,
-            prompt=prompt,
-            schema=schema,
-            system_prompt=system_prompt,
-            allow_external_links=allow_external_links,
-            enable_web_search=enable_web_search,
-            show_sources=show_sources,
-            scrape_options=scrape_options,
-            ignore_invalid_urls=ignore_invalid_urls,
-            poll_interval=poll_interval,
-            timeout=timeout,
-            integration=integration,
-            agent=agent,
-        )
+        with span(self.tracing, "firecrawl.extract", **{"firecrawl.urls": len(urls) if urls else 0}):
+            with self._slot(priority):
+                started = extract_module.start_extract(
+                    self.http_client,
+                    urls,
+                    prompt=prompt,
+                    schema=schema,
+                    system_prompt=system_prompt,
+                    allow_external_links=allow_external_links,
+                    enable_web_search=enable_web_search,
+                    show_sources=show_sources,
+                    scrape_options=scrape_options,
+                    ignore_invalid_urls=ignore_invalid_urls,
+                    integration=integration,
+                    agent=agent,
+                    idempotency_key=idempotency_key,
+                )
+            job_id = getattr(started, "id", None)
+            if not job_id:
+                return started
+            return extract_module.wait_extract(self.http_client, job_id, poll_interval=poll_interval, timeout=timeout)
 
     def start_batch_scrape(
         self,
-        urls: List[str],
+        urls: Iterable[str],
         *,
         formats: Optional[List['FormatOption']] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -613,11 +919,16 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        deduplicator: Optional[UrlDeduplicator] = None,
+        max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+        interleave_domains: bool = False,
+        priority: Optional[str] = None,
     ):
         """Start a batch scrape job over multiple URLs (non-blocking).
 
         Args:
-            urls: List of URLs to scrape
+            urls: URLs to scrape; lists or iterators beyond the per-request limit
+                are split into sub-jobs behind one merged job id
             formats: Output formats to collect per URL
             headers: HTTP headers
             include_tags: HTML tags to include
@@ -644,6 +955,11 @@ class FirecrawlClient:
             zero_data_retention: Delete data after 24 hours
             integration: Integration tag/name
             idempotency_key: Header used to deduplicate starts
+            deduplicator: Seen-set that skips URLs already submitted (compared in canonical form)
+            max_parallel_jobs: Maximum concurrent sub-job submissions when splitting
+            interleave_domains: Reorder URLs round-robin by registrable domain before submission
+            priority: Scheduler priority class; orders the submission only, the
+                started job does not hold a slot
 
         Returns:
             Response payload with job id (poll with get_batch_scrape_status)
@@ -672,18 +988,22 @@ class FirecrawlClient:
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache]) else None
 
-        return batch_module.start_batch_scrape(
-            self.http_client,
-            urls,
-            options=options,
-            webhook=webhook,
-            append_to_id=append_to_id,
-            ignore_invalid_urls=ignore_invalid_urls,
-            max_concurrency=max_concurrency,
-            zero_data_retention=zero_data_retention,
-            integration=integration,
-            idempotency_key=idempotency_key,
-        )
+        with self._slot(priority):
+            return batch_module.start_batch_scrape(
+                self.http_client,
+                urls,
+                options=options,
+                webhook=webhook,
+                append_to_id=append_to_id,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                idempotency_key=idempotency_key,
+                deduplicator=deduplicator,
+                max_parallel_jobs=max_parallel_jobs,
+                interleave_domains=interleave_domains,
+            )
 
     def get_batch_scrape_status(
         self, 
@@ -699,8 +1019,31 @@ class FirecrawlClient:
         Returns:
             Status payload including counts and partial data
         """
-        return batch_module.get_batch_scrape_status(
-            self.http_client, 
+        def fetch() -> BatchScrapeJob:
+            return batch_module.get_batch_scrape_status(
+                self.http_client, 
+                job_id,
+                pagination_config=pagination_config
+            )
+
+        return self._coalesce("batch_scrape_status", job_id, pagination_config, fetch)
+
+    def iter_batch_scrape_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None
+    ) -> Iterator[Document]:
+        """Stream the documents of a batch job page by page.
+
+        Args:
+            job_id: Batch job ID
+            pagination_config: Optional configuration for pagination limits
+
+        Returns:
+            Iterator of Document objects (pages are fetched lazily)
+        """
+        return batch_module.iter_batch_scrape_documents(
+            self.http_client,
             job_id,
             pagination_config=pagination_config
         )
@@ -785,7 +1128,7 @@ class FirecrawlClient:
 
     def batch_scrape(
         self,
-        urls: List[str],
+        urls: Iterable[str],
         *,
         formats: Optional[List['FormatOption']] = None,
         headers: Optional[Dict[str, str]] = None,
@@ -813,11 +1156,21 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        deduplicator: Optional[UrlDeduplicator] = None,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+        interleave_domains: bool = False,
+        priority: Optional[str] = None,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        URL lists (or iterators) beyond the per-request limit are split into
+        sub-jobs, run ``max_parallel_jobs`` at a time, and merged into one job.
+        ``interleave_domains`` reorders URLs round-robin by domain first. With a
+        scheduler, each sub-job submission takes a ``priority`` slot; polling
+        holds none.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -843,18 +1196,23 @@ class FirecrawlClient:
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache]) else None
 
-        return batch_module.batch_scrape(
-            self.http_client,
-            urls,
-            options=options,
-            webhook=webhook,
-            append_to_id=append_to_id,
-            ignore_invalid_urls=ignore_invalid_urls,
-            max_concurrency=max_concurrency,
-            zero_data_retention=zero_data_retention,
-            integration=integration,
-            idempotency_key=idempotency_key,
-            poll_interval=poll_interval,
-            timeout=wait_timeout,
-        )
+        with span(self.tracing, "firecrawl.batch_scrape"):
+            return batch_module.batch_scrape(
+                self.http_client,
+                urls,
+                options=options,
+                webhook=webhook,
+                append_to_id=append_to_id,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                idempotency_key=idempotency_key,
+                deduplicator=deduplicator,
+                poll_interval=poll_interval,
+                timeout=wait_timeout,
+                max_parallel_jobs=max_parallel_jobs,
+                interleave_domains=interleave_domains,
+                submit_slot=lambda: self._slot(priority),
+            )
     
\ No newline at end of file
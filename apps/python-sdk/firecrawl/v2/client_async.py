@@ -4,9 +4,11 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 
 import os
 import asyncio
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Union, Callable, Literal, Iterable, AsyncIterator
 from .types import (
     ScrapeOptions,
+    Document,
     CrawlRequest,
     WebhookConfig,
     SearchRequest,
@@ -33,8 +35,19 @@ from .types import (
     Location,
     PaginationConfig,
 )
-from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.idempotency import IdempotencyJournal
+from .utils.scheduler import RequestScheduler
+from .utils.domain_dispatch import NULL_LEASE, DomainDispatcher
+from .utils.cache import MapSearchCache, ScrapeCache
+from .utils.single_flight import SingleFlight, request_key
+from .utils.hooks import Hooks
+from .utils.tracing import Tracing, resolve_tracing, span
+from .utils.metrics import MetricsRegistry
+from .utils.profiling import Profiler, resolve_profiling
+from .utils.credits import CreditLedger
+from .utils.prepared import PreparedScrape
+from .utils.fan_out import DEFAULT_CONCURRENCY, ItemResult, aiter_bounded
 
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
@@ -46,23 +59,161 @@ from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
 
 from .watcher_async import AsyncWatcher
 
+@asynccontextmanager
+async def _null_slot(value=None):
+    yield value
+
+
 class AsyncFirecrawlClient:
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        auto_idempotency: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        domain_dispatcher: Optional[DomainDispatcher] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+        map_search_cache: Optional[MapSearchCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        hooks: Optional[Hooks] = None,
+        tracing: Union[bool, Tracing] = True,
+        metrics: Optional[MetricsRegistry] = None,
+        credit_ledger: Optional[CreditLedger] = None,
+        profiling: Union[bool, float, Profiler, None] = None,
+    ):
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if not api_key:
             raise ValueError("API key is required. Set FIRECRAWL_API_KEY or pass api_key.")
-        self.http_client = HttpClient(api_key, api_url)
-        self.async_http_client = AsyncHttpClient(api_key, api_url)
+        if idempotency_journal is None and auto_idempotency:
+            idempotency_journal = IdempotencyJournal()
+        # OpenTelemetry spans via transport hooks, when opentelemetry-api is installed
+        self.tracing = resolve_tracing(tracing)
+        if self.tracing is not None:
+            hooks = self.tracing.install(hooks if hooks is not None else Hooks())
+        # Optional in-process metrics fed by the same hooks
+        self.metrics = metrics
+        if metrics is not None:
+            hooks = metrics.install(hooks if hooks is not None else Hooks())
+        # Optional CPU profile per operation and phase (FIRECRAWL_PROFILE when not given)
+        self.profiler = resolve_profiling(profiling, label=api_url)
+        # The only transport: every call, wait loop and watcher poll stays on the event loop
+        self.async_http_client = AsyncHttpClient(
+            api_key,
+            api_url,
+            auto_idempotency=auto_idempotency,
+            idempotency_journal=idempotency_journal,
+            hooks=hooks,
+            credit_ledger=credit_ledger,
+            profiler=self.profiler,
+        )
+        # Optional lifecycle hooks shared by both transports and the response parsers
+        self.hooks = hooks
+        # Optional priority scheduler for scrape calls and job submissions (budget from get_concurrency by default)
+        self.scheduler = scheduler
+        if scheduler is not None and scheduler.max_concurrency is None and scheduler.concurrency_source is None:
+            scheduler.concurrency_source = self.get_concurrency
+        # Optional per-domain caps for scrape fan-outs (e.g. asyncio.gather over many URLs)
+        self.domain_dispatcher = domain_dispatcher
+        # Optional local cache for scrape results (TTL from max_age)
+        self.scrape_cache = scrape_cache
+        self.map_search_cache = map_search_cache
+        # Optional coalescing of concurrent identical scrape/status calls
+        self.single_flight = single_flight
+        # Optional credit accounting with budgets that cancel runaway jobs
+        self.credit_ledger = credit_ledger
+
+    def _slot(self, priority: Optional[str]):
+        if self.scheduler is None:
+            return _null_slot()
+        return self.scheduler.slot_async(priority)
+
+    def _domain_slot(self, url: str):
+        if self.domain_dispatcher is None:
+            return _null_slot(NULL_LEASE)
+        return self.domain_dispatcher.slot_async(url)
+
+    async def _coalesce(self, method: str, job_id: str, pagination_config: Optional[PaginationConfig], fetch):
+        if self.single_flight is None:
+            return await fetch()
+        payload = {
+            "id": job_id,
+            "pagination": pagination_config.model_dump() if pagination_config is not None else None,
+        }
+        return await self.single_flight.do_async(request_key(method, payload), fetch)
 
     # Scrape
     async def scrape(
         self,
         url: str,
+        *,
+        priority: Optional[str] = None,
         **kwargs,
     ):
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
-        return await async_scrape.scrape(self.async_http_client, url, options)
+        payload = None
+        if self.scrape_cache is not None or self.single_flight is not None:
+            payload = await async_scrape._prepare_scrape_request(url, options)
+        return await self._run_scrape(
+            url, priority, payload, lambda: async_scrape.scrape(self.async_http_client, url, options)
+        )
+
+    def prepare_scrape(self, options: Optional[ScrapeOptions] = None, **kwargs) -> PreparedScrape:
+        # Validate and encode options once; pass the result to scrape_prepared for each URL
+        if options is None and kwargs:
+            options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None})
+        return PreparedScrape(options)
+
+    async def scrape_prepared(self, prepared: PreparedScrape, url: str, *, priority: Optional[str] = None) -> Document:
+        payload = None
+        if self.scrape_cache is not None or self.single_flight is not None:
+            payload = prepared.payload(url)
+        return await self._run_scrape(
+            url, priority, payload, lambda: async_scrape.scrape_prepared(self.async_http_client, prepared, url)
+        )
+
+    async def _run_scrape(self, url: str, priority: Optional[str], payload, send) -> Document:
+        if self.scrape_cache is not None:
+            cached = self.scrape_cache.lookup(payload)
+            if cached is not None:
+                return cached
+
+        async def fetch():
+            if self.credit_ledger is not None:
+                self.credit_ledger.check()
+            # only send() is timed, not the wait for the scheduler slot
+            async with self._domain_slot(url) as lease, self._slot(priority):
+                with lease.measure():
+                    document = await send()
+            if self.credit_ledger is not None and document.metadata is not None:
+                self.credit_ledger.record_credits(document.metadata.credits_used)
+            if self.scrape_cache is not None:
+                self.scrape_cache.store(payload, document)
+            return document
+
+        if self.single_flight is None:
+            return await fetch()
+        return await self.single_flight.do_async(request_key("scrape", payload), fetch)
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        options: Optional[ScrapeOptions] = None,
+        priority: Optional[str] = None,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> AsyncIterator[ItemResult]:
+        # async for result in client.scrape_many(urls): results in completion order, errors per item
+        prepared = self.prepare_scrape(options, **kwargs)
+        return aiter_bounded(
+            lambda url: self.scrape_prepared(prepared, url, priority=priority),
+            urls,
+            concurrency,
+            rate_limit_retries=rate_limit_retries,
+        )
 
     # Search
     async def search(
@@ -71,40 +222,72 @@ class AsyncFirecrawlClient:
         **kwargs,
     ) -> SearchData:
         request = SearchRequest(query=query, **{k: v for k, v in kwargs.items() if v is not None})
-        return await async_search.search(self.async_http_client, request)
+        if self.map_search_cache is None:
+            return await async_search.search(self.async_http_client, request)
+        payload = async_search._prepare_search_request(request)
+        cached = self.map_search_cache.get_search(payload)
+        if cached is not None:
+            return cached
+        data = await async_search.search(self.async_http_client, request)
+        self.map_search_cache.put_search(payload, data)
+        return data
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> AsyncIterator[ItemResult]:
+        return aiter_bounded(
+            lambda query: self.search(query, **kwargs), queries, concurrency, rate_limit_retries=rate_limit_retries
+        )
 
-    async def start_crawl(self, url: str, **kwargs) -> CrawlResponse:
+    async def start_crawl(
+        self,
+        url: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
+        **kwargs,
+    ) -> CrawlResponse:
         request = CrawlRequest(url=url, **kwargs)
-        return await async_crawl.start_crawl(self.async_http_client, request)
+        async with self._slot(priority):
+            return await async_crawl.start_crawl(self.async_http_client, request, idempotency_key=idempotency_key)
 
     async def wait_crawl(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> CrawlJob:
-        # simple polling loop using blocking get (ok for test-level async)
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         while True:
             status = await async_crawl.get_crawl_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed"]:
+            if status.status in ["completed", "failed", "cancelled"]:
                 return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
+            if timeout and (loop.time() - start) > timeout:
                 raise TimeoutError("Crawl wait timed out")
             await asyncio.sleep(poll_interval)
 
-    async def crawl(self, **kwargs) -> CrawlJob:
-        # wrapper combining start and wait
-        resp = await self.start_crawl(**{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
-        poll_interval = kwargs.get("poll_interval", 2)
-        timeout = kwargs.get("timeout")
-        return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout)
+    async def crawl(self, *, priority: Optional[str] = None, **kwargs) -> CrawlJob:
+        # wrapper combining start and wait; only the submission takes a scheduler slot
+        with span(self.tracing, "firecrawl.crawl", **{"firecrawl.url": kwargs.get("url")}):
+            poll_interval = kwargs.pop("poll_interval", 2)
+            timeout = kwargs.pop("timeout", None)
+            resp = await self.start_crawl(priority=priority, **kwargs)
+            return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout)
 
     async def get_crawl_status(
         self, 
         job_id: str,
         pagination_config: Optional[PaginationConfig] = None
     ) -> CrawlJob:
-        return await async_crawl.get_crawl_status(
-            self.async_http_client, 
-            job_id,
-            pagination_config=pagination_config
-        )
+        def fetch():
+            return async_crawl.get_crawl_status(
+                self.async_http_client, 
+                job_id,
+                pagination_config=pagination_config
+            )
+
+        return await self._coalesce("crawl_status", job_id, pagination_config, fetch)
 
     async def cancel_crawl(self, job_id: str) -> bool:
         return await async_crawl.cancel_crawl(self.async_http_client, job_id)
@@ -142,39 +325,64 @@ class AsyncFirecrawlClient:
             timeout=timeout,
             integration=integration,
         ) if any(v is not None for v in [search, include_subdomains, limit, sitemap, integration, timeout]) else None
-        return await async_map.map(self.async_http_client, url, options)
+        if self.map_search_cache is None:
+            return await async_map.map(self.async_http_client, url, options)
+        payload = async_map._prepare_map_request(url, options)
+        cached = self.map_search_cache.get_map(payload)
+        if cached is not None:
+            return cached
+        data = await async_map.map(self.async_http_client, url, options)
+        self.map_search_cache.put_map(payload, data)
+        return data
+
+    def map_many(
+        self,
+        urls: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limit_retries: int = 2,
+        **kwargs,
+    ) -> AsyncIterator[ItemResult]:
+        return aiter_bounded(
+            lambda url: self.map(url, **kwargs), urls, concurrency, rate_limit_retries=rate_limit_retries
+        )
 
-    async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
-        return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
+    async def start_batch_scrape(self, urls: Iterable[str], *, priority: Optional[str] = None, **kwargs) -> Any:
+        async with self._slot(priority):
+            return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
     async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
         while True:
             status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
             if status.status in ["completed", "failed", "cancelled"]:
                 return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
+            if timeout and (loop.time() - start) > timeout:
                 raise TimeoutError("Batch wait timed out")
             await asyncio.sleep(poll_interval)
 
-    async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
-        # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
-        job_id = start.id
-        poll_interval = kwargs.get("poll_interval", 2)
-        timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+    async def batch_scrape(self, urls: Iterable[str], *, priority: Optional[str] = None, **kwargs) -> Any:
+        # Oversized inputs are split into sub-jobs bounded by max_parallel_jobs and merged;
+        # each sub-job submission takes a scheduler slot, polling holds none
+        with span(self.tracing, "firecrawl.batch_scrape"):
+            return await async_batch.batch_scrape(
+                self.async_http_client, urls, submit_slot=lambda: self._slot(priority), **kwargs
+            )
 
     async def get_batch_scrape_status(
         self, 
         job_id: str,
         pagination_config: Optional[PaginationConfig] = None
     ):
-        return await async_batch.get_batch_scrape_status(
-            self.async_http_client, 
-            job_id,
-            pagination_config=pagination_config
-        )
+        def fetch():
+            return async_batch.get_batch_scrape_status(
+                self.async_http_client, 
+                job_id,
+                pagination_config=pagination_config
+            )
+
+        return await self._coalesce("batch_scrape_status", job_id, pagination_config, fetch)
 
     async def cancel_batch_scrape(self, job_id: str) -> bool:
         return await async_batch.cancel_batch_scrape(self.async_http_client, job_id)
@@ -199,22 +407,30 @@ class AsyncFirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ):
-        return await async_extract.extract(
-            self.async_http_client,
-            urls,
-            prompt=prompt,
-            schema=schema,
-            system_prompt=system_prompt,
-            allow_external_links=allow_external_links,
-            enable_web_search=enable_web_search,
-            show_sources=show_sources,
-            scrape_options=scrape_options,
-            ignore_invalid_urls=ignore_invalid_urls,
-            poll_interval=poll_interval,
-            timeout=timeout,
-            integration=integration,
-        )
+        with span(self.tracing, "firecrawl.extract", **{"firecrawl.urls": len(urls) if urls else 0}):
+            started = await self.start_extract(
+                urls,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt,
+                allow_external_links=allow_external_links,
+                enable_web_search=enable_web_search,
+                show_sources=show_sources,
+                scrape_options=scrape_options,
+                ignore_invalid_urls=ignore_invalid_urls,
+                integration=integration,
+                idempotency_key=idempotency_key,
+                priority=priority,
+            )
+            job_id = getattr(started, "id", None)
+            if not job_id:
+                return started
+            return await async_extract.wait_extract(
+                self.async_http_client, job_id, poll_interval=poll_interval, timeout=timeout
+            )
 
     async def get_extract_status(self, job_id: str):
         return await async_extract.get_extract_status(self.async_http_client, job_id)
@@ -232,20 +448,24 @@ class AsyncFirecrawlClient:
         scrape_options: Optional['ScrapeOptions'] = None,
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        priority: Optional[str] = None,
     ):
-        return await async_extract.start_extract(
-            self.async_http_client,
-            urls,
-            prompt=prompt,
-            schema=schema,
-            system_prompt=system_prompt,
-            allow_external_links=allow_external_links,
-            enable_web_search=enable_web_search,
-            show_sources=show_sources,
-            scrape_options=scrape_options,
-            ignore_invalid_urls=ignore_invalid_urls,
-            integration=integration,
-        )
+        async with self._slot(priority):
+            return await async_extract.start_extract(
+                self.async_http_client,
+                urls,
+                prompt=prompt,
+                schema=schema,
+                system_prompt=system_prompt,
+                allow_external_links=allow_external_links,
+                enable_web_search=enable_web_search,
+                show_sources=show_sources,
+                scrape_options=scrape_options,
+                ignore_invalid_urls=ignore_invalid_urls,
+                integration=integration,
+                idempotency_key=idempotency_key,
+            )
 
     # Usage endpoints
     async def get_concurrency(self):
@@ -272,7 +492,7 @@ class AsyncFirecrawlClient:
         from .methods.aio import usage as async_usage  # type: ignore[attr-defined]
         return await async_usage.get_queue_status(self.async_http_client)
 
-    # Watcher (sync object usable from async contexts)
+    # Watcher (polls through the async transport)
     def watcher(
         self,
         job_id: str,
@@ -1,9 +1,27 @@
-from typing import Optional, List, Dict, Any
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncContextManager, Callable, Iterable
 from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
 from ...utils.normalize import normalize_document_input
+from ...utils.credits import check_budget, settle_job_async, track_job
+from ...utils.hooks import NULL_TIMER, phase_timer
+from ...utils.idempotency import resolve_idempotency_key, replay_job, record_job
+from ...utils.domain_dispatch import interleave_by_domain
+from ...utils.batch_split import (
+    DEFAULT_MAX_PARALLEL_JOBS,
+    split_oversized,
+    unique_chunks,
+    split_job_id,
+    chunk_idempotency_key,
+    run_bounded_async,
+    SubJobGuard,
+    merge_batch_responses,
+    merge_batch_jobs,
+    merge_raw_batch_errors,
+)
 import time
 
 
@@ -11,6 +29,10 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
     if not urls:
         raise ValueError("URLs list cannot be empty")
     payload: Dict[str, Any] = {"urls": [u.strip() for u in urls]}
+    if (dedup := kwargs.get("deduplicator")) is not None:
+        payload["urls"] = dedup.filter(payload["urls"])
+        if not payload["urls"]:
+            raise ValueError("All URLs were already submitted (deduplicated)")
     if options:
         opts = prepare_scrape_options(options)
         if opts:
@@ -32,15 +54,155 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
     return payload
 
 
-async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
+async def _run_split(chunks, run_chunk, kwargs: Dict[str, Any], guard: SubJobGuard) -> List[Any]:
+    dedup = kwargs.pop("deduplicator", None)
+    key = kwargs.pop("idempotency_key", None)
+    max_parallel_jobs = kwargs.pop("max_parallel_jobs", DEFAULT_MAX_PARALLEL_JOBS)
+
+    async def start_chunk(indexed):
+        index, chunk = indexed
+        if guard.aborted:
+            return None
+        try:
+            result = await run_chunk(chunk, idempotency_key=chunk_idempotency_key(key, index), **kwargs)
+        except BaseException:
+            # Cancelling the running siblings also ends their waits, so the error surfaces promptly
+            await guard.abort_async()
+            raise
+        if dedup is not None:
+            dedup.mark_seen(chunk)
+        return result
+
+    try:
+        results = await run_bounded_async(start_chunk, enumerate(unique_chunks(chunks, dedup)), max_parallel_jobs)
+    except BaseException:
+        # Sub-jobs started before the failure would otherwise run on unreachable
+        await guard.abort_async()
+        raise
+    if not results:
+        raise ValueError("All URLs were already submitted (deduplicated)")
+    return results
+
+
+async def start_batch_scrape(client: AsyncHttpClient, urls: Iterable[str], **kwargs) -> BatchScrapeResponse:
+    """
+    Start a batch scrape; inputs beyond the per-request limit are split into
+    sub-jobs (``max_parallel_jobs`` submissions at a time) behind a merged job id.
+    ``interleave_domains=True`` reorders URLs round-robin by domain first.
+    """
+    if kwargs.pop("interleave_domains", False):
+        urls = interleave_by_domain(urls)
+    chunks = split_oversized(urls)
+    if chunks is None:
+        return await _start_batch_scrape_job(client, urls, **kwargs)
+
+    dedup = kwargs.get("deduplicator")
+    hits_before = dedup.hits if dedup is not None else 0
+    guard = SubJobGuard(lambda job_id: cancel_batch_scrape(client, job_id))
+
+    async def run_chunk(chunk, **chunk_kwargs):
+        started = await _start_batch_scrape_job(client, chunk, **chunk_kwargs)
+        if not guard.started(started.id):
+            await guard.abort_async()
+            return None
+        return started
+
+    merged = merge_batch_responses(await _run_split(chunks, run_chunk, dict(kwargs), guard))
+    track_job(client, "batch_scrape", merged.id)
+    if dedup is not None:
+        merged.dedup_hits = dedup.hits - hits_before
+    return merged
+
+
+@asynccontextmanager
+async def _no_slot():
+    yield
+
+
+async def batch_scrape(
+    client: AsyncHttpClient,
+    urls: Iterable[str],
+    *,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    submit_slot: Callable[[], AsyncContextManager] = _no_slot,
+    **kwargs,
+) -> BatchScrapeJob:
+    """
+    Start a batch scrape and wait for completion. Split inputs run at most
+    ``max_parallel_jobs`` sub-jobs at a time and are merged into one job.
+    ``submit_slot`` is entered around each submission only, not the polling.
+    """
+    if kwargs.pop("interleave_domains", False):
+        urls = interleave_by_domain(urls)
+    chunks = split_oversized(urls)
+    if chunks is None:
+        async with submit_slot():
+            start = await _start_batch_scrape_job(client, urls, **kwargs)
+        return await wait_for_batch_completion(client, start.id, poll_interval, timeout)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout else None
+
+    guard = SubJobGuard(lambda job_id: cancel_batch_scrape(client, job_id))
+
+    async def run_chunk(chunk, **chunk_kwargs):
+        async with submit_slot():
+            start = await _start_batch_scrape_job(client, chunk, **chunk_kwargs)
+        if not guard.started(start.id):
+            await guard.abort_async()
+            return None
+        remaining = None
+        if deadline is not None:
+            # A zero timeout would mean "wait forever" to the poller
+            remaining = max(0.001, deadline - loop.time())
+        job = await wait_for_batch_completion(client, start.id, poll_interval, remaining)
+        guard.finished(start.id)
+        return job
+
+    return merge_batch_jobs(await _run_split(chunks, run_chunk, dict(kwargs), guard))
+
+
+async def wait_for_batch_completion(
+    client: AsyncHttpClient,
+    job_id: str,
+    poll_interval: int = 2,
+    timeout: Optional[float] = None,
+) -> BatchScrapeJob:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    while True:
+        status = await get_batch_scrape_status(client, job_id)
+        if status.status in ["completed", "failed", "cancelled"]:
+            return status
+        if timeout and (loop.time() - start) > timeout:
+            raise TimeoutError("Batch wait timed out")
+        await asyncio.sleep(poll_interval)
+
+
+async def _start_batch_scrape_job(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
     payload = _prepare(urls, **kwargs)
-    response = await client.post("/v2/batch/scrape", payload)
+    key = resolve_idempotency_key(client, "/v2/batch/scrape", payload, kwargs.get("idempotency_key"))
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return BatchScrapeResponse(**replayed)
+    # Sub-job feeders stop here once the credit budget is exhausted
+    check_budget(client)
+    headers = {"x-idempotency-key": key} if key else None
+    response = await client.post("/v2/batch/scrape", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "start batch scrape")
     body = response.json()
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    return BatchScrapeResponse(id=body.get("id"), url=body.get("url"), invalid_urls=body.get("invalidURLs"))
+    dedup_hits = None
+    if (dedup := kwargs.get("deduplicator")) is not None:
+        dedup.mark_seen(payload["urls"])
+        dedup_hits = len(urls) - len(payload["urls"])
+    job_data = {"id": body.get("id"), "url": body.get("url"), "invalid_urls": body.get("invalidURLs")}
+    record_job(client, key, job_data)
+    track_job(client, "batch_scrape", job_data["id"])
+    return BatchScrapeResponse(**job_data, dedup_hits=dedup_hits)
 
 
 async def get_batch_scrape_status(
@@ -62,17 +224,33 @@ async def get_batch_scrape_status(
     Raises:
         Exception: If the status check fails
     """
-    response = await client.get(f"/v2/batch/scrape/{job_id}")
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        jobs = await run_bounded_async(
+            lambda sub_id: get_batch_scrape_status(client, sub_id, pagination_config),
+            sub_job_ids,
+            DEFAULT_MAX_PARALLEL_JOBS,
+        )
+        return merge_batch_jobs(jobs, pagination_config.max_results if pagination_config else None)
+
+    endpoint = f"/v2/batch/scrape/{job_id}"
+    timer = phase_timer(client, "batch_scrape_status", endpoint)
+    response = await client.get(endpoint)
+    timer.mark("network")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
     body = response.json()
+    timer.mark("decode")
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     docs: List[Document] = []
     for doc in body.get("data", []) or []:
         if isinstance(doc, dict):
             normalized = normalize_document_input(doc)
+            timer.mark("normalize")
             docs.append(Document(**normalized))
+            timer.mark("model")
+    timer.page(endpoint, response, len(docs))
     
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -81,10 +259,11 @@ async def get_batch_scrape_status(
             client, 
             body.get("next"), 
             docs, 
-            pagination_config
+            pagination_config,
+            timer
         )
     
-    return BatchScrapeJob(
+    job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
@@ -93,13 +272,18 @@ async def get_batch_scrape_status(
         next=body.get("next") if not auto_paginate else None,
         data=docs,
     )
+    timer.mark("model")
+    timer.finish(response, len(docs))
+    await settle_job_async(client, "batch_scrape", job_id, job, cancel_batch_scrape)
+    return job
 
 
 async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    timer=NULL_TIMER
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results asynchronously.
@@ -109,6 +293,7 @@ async def _fetch_all_batch_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        timer: Phase timer of the enclosing status call
         
     Returns:
         List of all documents from all pages
@@ -134,6 +319,7 @@ async def _fetch_all_batch_pages_async(
         
         # Fetch next page
         response = await client.get(current_url)
+        timer.mark("network")
         
         if response.status_code >= 400:
             # Log error but continue with what we have
@@ -143,18 +329,23 @@ async def _fetch_all_batch_pages_async(
             break
         
         page_data = response.json()
+        timer.mark("decode")
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
+        page_start = len(documents)
         for doc in page_data.get("data", []) or []:
             if isinstance(doc, dict):
                 # Check max_results limit
                 if (max_results is not None) and (len(documents) >= max_results):
                     break
                 normalized = normalize_document_input(doc)
+                timer.mark("normalize")
                 documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(current_url, response, len(documents) - page_start)
         
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
@@ -168,6 +359,12 @@ async def _fetch_all_batch_pages_async(
 
 
 async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        results = await run_bounded_async(
+            lambda sub_id: cancel_batch_scrape(client, sub_id), sub_job_ids, DEFAULT_MAX_PARALLEL_JOBS
+        )
+        return all(results)
     response = await client.delete(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "cancel batch scrape")
@@ -176,6 +373,9 @@ async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
 
 
 async def get_batch_scrape_errors(client: AsyncHttpClient, job_id: str) -> Dict[str, Any]:
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        return merge_raw_batch_errors([await get_batch_scrape_errors(client, sub_id) for sub_id in sub_job_ids])
     response = await client.get(f"/v2/batch/scrape/{job_id}/errors")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape errors")
@@ -16,6 +16,9 @@ from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.normalize import normalize_document_input
+from ...utils.credits import check_budget, settle_job_async, track_job
+from ...utils.hooks import NULL_TIMER, phase_timer
+from ...utils.idempotency import discard_key, recover_conflict, resolve_idempotency_key, replay_job, record_job
 import time
 
 
@@ -61,13 +64,18 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlResponse:
+async def start_crawl(
+    client: AsyncHttpClient,
+    request: CrawlRequest,
+    idempotency_key: Optional[str] = None,
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: Async HTTP client instance
         request: CrawlRequest containing URL and options
+        idempotency_key: Optional key to deduplicate starts
         
     Returns:
         CrawlResponse with job information
@@ -77,12 +85,28 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
         Exception: If the crawl operation fails to start
     """
     payload = _prepare_crawl_request(request)
-    response = await client.post("/v2/crawl", payload)
+    key = resolve_idempotency_key(client, "/v2/crawl", payload, idempotency_key)
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return CrawlResponse(**replayed)
+    check_budget(client)
+    if key:
+        response = await client.post("/v2/crawl", payload, headers={"x-idempotency-key": key})
+    else:
+        response = await client.post("/v2/crawl", payload)
     if response.status_code >= 400:
+        if key and response.status_code == 409:
+            # An earlier attempt with this key already started the crawl
+            return CrawlResponse(**recover_conflict(client, key))
+        if key and response.status_code < 500:
+            discard_key(client, key)
         handle_response_error(response, "start crawl")
     body = response.json()
     if body.get("success"):
-        return CrawlResponse(id=body.get("id"), url=body.get("url"))
+        job_data = {"id": body.get("id"), "url": body.get("url")}
+        record_job(client, key, job_data)
+        track_job(client, "crawl", job_data["id"])
+        return CrawlResponse(**job_data)
     raise Exception(body.get("error", "Unknown error occurred"))
 
 
@@ -105,16 +129,23 @@ async def get_crawl_status(
     Raises:
         Exception: If the status check fails
     """
-    response = await client.get(f"/v2/crawl/{job_id}")
+    endpoint = f"/v2/crawl/{job_id}"
+    timer = phase_timer(client, "crawl_status", endpoint)
+    response = await client.get(endpoint)
+    timer.mark("network")
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
     body = response.json()
+    timer.mark("decode")
     if body.get("success"):
         documents = []
         for doc_data in body.get("data", []):
             if isinstance(doc_data, dict):
                 normalized = normalize_document_input(doc_data)
+                timer.mark("normalize")
                 documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(endpoint, response, len(documents))
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -123,10 +154,11 @@ async def get_crawl_status(
                 client, 
                 body.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                timer
             )
         
-        return CrawlJob(
+        job = CrawlJob(
             status=body.get("status"),
             completed=body.get("completed", 0),
             total=body.get("total", 0),
@@ -135,6 +167,10 @@ async def get_crawl_status(
             next=body.get("next") if not auto_paginate else None,
             data=documents,
         )
+        timer.mark("model")
+        timer.finish(response, len(documents))
+        await settle_job_async(client, "crawl", job_id, job, cancel_crawl)
+        return job
     raise Exception(body.get("error", "Unknown error occurred"))
 
 
@@ -142,7 +178,8 @@ async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    timer=NULL_TIMER
 ) -> List[Document]:
     """
     Fetch all pages of crawl results asynchronously.
@@ -152,6 +189,7 @@ async def _fetch_all_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        timer: Phase timer of the enclosing status call
         
     Returns:
         List of all documents from all pages
@@ -177,6 +215,7 @@ async def _fetch_all_pages_async(
         
         # Fetch next page
         response = await client.get(current_url)
+        timer.mark("network")
         
         if response.status_code >= 400:
             # Log error but continue with what we have
@@ -186,18 +225,23 @@ async def _fetch_all_pages_async(
             break
         
         page_data = response.json()
+        timer.mark("decode")
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
+        page_start = len(documents)
         for doc_data in page_data.get("data", []):
             if isinstance(doc_data, dict):
                 # Check max_results limit
                 if (max_results is not None) and (len(documents) >= max_results):
                     break
                 normalized = normalize_document_input(doc_data)
+                timer.mark("normalize")
                 documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(current_url, response, len(documents) - page_start)
         
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
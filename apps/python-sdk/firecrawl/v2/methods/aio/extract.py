@@ -3,7 +3,8 @@ import asyncio
 
 from ...types import ExtractResponse, ScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
-from ...utils.validation import prepare_scrape_options
+from ...utils.validation import prepare_scrape_options, _normalize_schema
+from ...utils.idempotency import resolve_idempotency_key, replay_job, record_job
 
 
 def _prepare_extract_request(
@@ -25,7 +26,9 @@ def _prepare_extract_request(
     if prompt is not None:
         body["prompt"] = prompt
     if schema is not None:
-        body["schema"] = schema
+        # Accept Pydantic models as well as dicts; model schemas are memoized
+        normalized_schema = _normalize_schema(schema)
+        body["schema"] = normalized_schema if normalized_schema is not None else schema
     if system_prompt is not None:
         body["systemPrompt"] = system_prompt
     if allow_external_links is not None:
@@ -58,6 +61,7 @@ async def start_extract(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -71,8 +75,18 @@ async def start_extract(
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
     )
-    resp = await client.post("/v2/extract", body)
-    return ExtractResponse(**resp.json())
+    key = resolve_idempotency_key(client, "/v2/extract", body, idempotency_key)
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return ExtractResponse(**replayed)
+    if key:
+        resp = await client.post("/v2/extract", body, headers={"x-idempotency-key": key})
+    else:
+        resp = await client.post("/v2/extract", body)
+    started = ExtractResponse(**resp.json())
+    if started.id:
+        record_job(client, key, {"success": started.success, "id": started.id})
+    return started
 
 
 async def get_extract_status(client: AsyncHttpClient, job_id: str) -> ExtractResponse:
@@ -87,12 +101,13 @@ async def wait_extract(
     poll_interval: int = 2,
     timeout: Optional[int] = None,
 ) -> ExtractResponse:
-    start_ts = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    start_ts = loop.time()
     while True:
         status = await get_extract_status(client, job_id)
         if status.status in ("completed", "failed", "cancelled"):
             return status
-        if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
+        if timeout is not None and (loop.time() - start_ts) > timeout:
             return status
         await asyncio.sleep(max(1, poll_interval))
 
@@ -112,6 +127,7 @@ async def extract(
     poll_interval: int = 2,
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     started = await start_extract(
         client,
@@ -125,6 +141,7 @@ async def extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
+        idempotency_key=idempotency_key,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
@@ -4,6 +4,8 @@ from ...utils.normalize import normalize_document_input
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options, validate_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
+from ...utils.hooks import NULL_TIMER, phase_timer
+from ...utils.prepared import PreparedScrape
 
 
 async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -20,14 +22,34 @@ async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = N
 
 
 async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+    timer = phase_timer(client, "scrape", "/v2/scrape")
     payload = await _prepare_scrape_request(url, options)
+    timer.mark("payload")
     response = await client.post("/v2/scrape", payload)
+    timer.mark("network")
+    return _parse_scrape_response(response, timer)
+
+
+async def scrape_prepared(client: AsyncHttpClient, prepared: PreparedScrape, url: str) -> Document:
+    timer = phase_timer(client, "scrape", "/v2/scrape")
+    body = prepared.body(url)
+    timer.mark("payload")
+    response = await client.post_encoded("/v2/scrape", body)
+    timer.mark("network")
+    return _parse_scrape_response(response, timer)
+
+
+def _parse_scrape_response(response, timer=NULL_TIMER) -> Document:
     if response.status_code >= 400:
         handle_response_error(response, "scrape")
     body = response.json()
+    timer.mark("decode")
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     document_data = body.get("data", {})
     normalized = normalize_document_input(document_data)
-    return Document(**normalized)
-
+    timer.mark("normalize")
+    document = Document(**normalized)
+    timer.mark("model")
+    timer.finish(response, 1)
+    return document
@@ -3,7 +3,9 @@ Batch scraping functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from contextlib import nullcontext
+from itertools import chain, islice
+from typing import Optional, List, Callable, ContextManager, Dict, Any, Union, Iterator, Iterable
 from ..types import (
     BatchScrapeRequest,
     BatchScrapeResponse,
@@ -15,12 +17,30 @@ from ..types import (
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 from ..utils.normalize import normalize_document_input
+from ..utils.url_dedup import UrlDeduplicator
+from ..utils.idempotency import resolve_idempotency_key, replay_job, record_job
+from ..utils.pagination import iter_paginated_documents
+from ..utils.credits import check_budget, settle_job, track_job
+from ..utils.hooks import NULL_TIMER, phase_timer
+from ..utils.domain_dispatch import interleave_by_domain
+from ..utils.batch_split import (
+    DEFAULT_MAX_PARALLEL_JOBS,
+    split_oversized,
+    unique_chunks,
+    split_job_id,
+    chunk_idempotency_key,
+    run_bounded,
+    SubJobGuard,
+    merge_batch_responses,
+    merge_batch_jobs,
+    merge_batch_errors,
+)
 from ..types import CrawlErrorsResponse
 
 
 def start_batch_scrape(
     client: HttpClient,
-    urls: List[str],
+    urls: Iterable[str],
     *,
     options: Optional[ScrapeOptions] = None,
     webhook: Optional[Union[str, WebhookConfig]] = None,
@@ -30,14 +50,27 @@ def start_batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    deduplicator: Optional[UrlDeduplicator] = None,
+    max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+    interleave_domains: bool = False,
 ) -> BatchScrapeResponse:
     """
     Start a batch scrape job for multiple URLs.
+
+    Lists (or iterators) larger than the API limit are split into sub-jobs
+    of up to MAX_BATCH_URLS URLs; the returned handle then has a merged ID
+    that the batch status, cancel and errors functions aggregate over. If a
+    sub-job fails to start, the ones already started are cancelled before
+    the error is raised.
     
     Args:
         client: HTTP client instance
-        urls: List of URLs to scrape
+        urls: URLs to scrape (any iterable)
         options: Scraping options
+        deduplicator: Optional seen-set; URLs already submitted through it are skipped
+        max_parallel_jobs: Maximum concurrent sub-job submissions when splitting
+        interleave_domains: Reorder URLs round-robin by domain so no single host
+            dominates the job (materializes the input)
         
     Returns:
         BatchScrapeResponse containing job information
@@ -45,6 +78,70 @@ def start_batch_scrape(
     Raises:
         FirecrawlError: If the batch scrape operation fails to start
     """
+    job_kwargs = dict(
+        options=options,
+        webhook=webhook,
+        append_to_id=append_to_id,
+        ignore_invalid_urls=ignore_invalid_urls,
+        max_concurrency=max_concurrency,
+        zero_data_retention=zero_data_retention,
+        integration=integration,
+    )
+    if interleave_domains:
+        urls = interleave_by_domain(urls)
+    chunks = split_oversized(urls)
+    if chunks is None:
+        return _start_batch_scrape_job(
+            client, urls, idempotency_key=idempotency_key, deduplicator=deduplicator, **job_kwargs
+        )
+
+    hits_before = deduplicator.hits if deduplicator is not None else 0
+    guard = SubJobGuard(lambda job_id: cancel_batch_scrape(client, job_id))
+
+    def start_chunk(indexed):
+        index, chunk = indexed
+        if guard.aborted:
+            return None
+        started = _start_batch_scrape_job(
+            client, chunk, idempotency_key=chunk_idempotency_key(idempotency_key, index), **job_kwargs
+        )
+        if not guard.started(started.id):
+            guard.abort()
+            return None
+        if deduplicator is not None:
+            deduplicator.mark_seen(chunk)
+        return started
+
+    try:
+        responses = run_bounded(start_chunk, enumerate(unique_chunks(chunks, deduplicator)), max_parallel_jobs)
+    except BaseException:
+        # Sub-jobs started before the failure would otherwise run on unreachable
+        guard.abort()
+        raise
+    if not responses:
+        raise ValueError("All URLs were already submitted (deduplicated)")
+    merged = merge_batch_responses(responses)
+    track_job(client, "batch_scrape", merged.id)
+    if deduplicator is not None:
+        merged.dedup_hits = deduplicator.hits - hits_before
+    return merged
+
+
+def _start_batch_scrape_job(
+    client: HttpClient,
+    urls: List[str],
+    *,
+    options: Optional[ScrapeOptions] = None,
+    webhook: Optional[Union[str, WebhookConfig]] = None,
+    append_to_id: Optional[str] = None,
+    ignore_invalid_urls: Optional[bool] = None,
+    max_concurrency: Optional[int] = None,
+    zero_data_retention: Optional[bool] = None,
+    integration: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    deduplicator: Optional[UrlDeduplicator] = None,
+) -> BatchScrapeResponse:
+    """Submit a single /v2/batch/scrape request (at most MAX_BATCH_URLS URLs)."""
     # Prepare request data
     request_data = prepare_batch_scrape_request(
         urls,
@@ -55,10 +152,18 @@ def start_batch_scrape(
         max_concurrency=max_concurrency,
         zero_data_retention=zero_data_retention,
         integration=integration,
+        deduplicator=deduplicator,
     )
     
+    key = resolve_idempotency_key(client, "/v2/batch/scrape", request_data, idempotency_key)
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return BatchScrapeResponse(**replayed)
+    # Sub-job feeders stop here once the credit budget is exhausted
+    check_budget(client)
+
     # Make the API request
-    headers = client._prepare_headers(idempotency_key)  # type: ignore[attr-defined]
+    headers = client._prepare_headers(key)  # type: ignore[attr-defined]
     response = client.post("/v2/batch/scrape", request_data, headers=headers)
     
     # Handle errors
@@ -69,11 +174,20 @@ def start_batch_scrape(
     body = response.json()
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    return BatchScrapeResponse(
-        id=body.get("id"),
-        url=body.get("url"),
-        invalid_urls=body.get("invalidURLs") or None,
-    )
+
+    dedup_hits = None
+    if deduplicator is not None:
+        deduplicator.mark_seen(request_data["urls"])
+        dedup_hits = len(urls) - len(request_data["urls"])
+
+    job_data = {
+        "id": body.get("id"),
+        "url": body.get("url"),
+        "invalid_urls": body.get("invalidURLs") or None,
+    }
+    record_job(client, key, job_data)
+    track_job(client, "batch_scrape", job_data["id"])
+    return BatchScrapeResponse(**job_data, dedup_hits=dedup_hits)
 
 
 def get_batch_scrape_status(
@@ -95,8 +209,20 @@ def get_batch_scrape_status(
     Raises:
         FirecrawlError: If the status check fails
     """
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        jobs = run_bounded(
+            lambda sub_id: get_batch_scrape_status(client, sub_id, pagination_config),
+            sub_job_ids,
+            DEFAULT_MAX_PARALLEL_JOBS,
+        )
+        return merge_batch_jobs(jobs, pagination_config.max_results if pagination_config else None)
+
     # Make the API request
-    response = client.get(f"/v2/batch/scrape/{job_id}")
+    endpoint = f"/v2/batch/scrape/{job_id}"
+    timer = phase_timer(client, "batch_scrape_status", endpoint)
+    response = client.get(endpoint)
+    timer.mark("network")
     
     # Handle errors
     if not response.ok:
@@ -104,6 +230,7 @@ def get_batch_scrape_status(
     
     # Parse response
     body = response.json()
+    timer.mark("decode")
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -112,7 +239,10 @@ def get_batch_scrape_status(
     for doc in body.get("data", []) or []:
         if isinstance(doc, dict):
             normalized = normalize_document_input(doc)
+            timer.mark("normalize")
             documents.append(Document(**normalized))
+            timer.mark("model")
+    timer.page(endpoint, response, len(documents))
 
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -121,10 +251,11 @@ def get_batch_scrape_status(
             client, 
             body.get("next"), 
             documents, 
-            pagination_config
+            pagination_config,
+            timer
         )
 
-    return BatchScrapeJob(
+    job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
@@ -133,13 +264,45 @@ def get_batch_scrape_status(
         next=body.get("next") if not auto_paginate else None,
         data=documents,
     )
+    timer.mark("model")
+    timer.finish(response, len(documents))
+    settle_job(client, "batch_scrape", job_id, job, cancel_batch_scrape)
+    return job
+
+
+def iter_batch_scrape_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None
+) -> Iterator[Document]:
+    """
+    Stream the documents of a batch scrape job page by page.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        pagination_config: Optional configuration for pagination limits
+
+    Yields:
+        Document objects, without accumulating previous pages
+    """
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        documents = chain.from_iterable(
+            iter_paginated_documents(client, f"/v2/batch/scrape/{sub_id}", "get batch scrape status", pagination_config)
+            for sub_id in sub_job_ids
+        )
+        max_results = pagination_config.max_results if pagination_config else None
+        return islice(documents, max_results) if max_results is not None else documents
+    return iter_paginated_documents(client, f"/v2/batch/scrape/{job_id}", "get batch scrape status", pagination_config)
 
 
 def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    timer=NULL_TIMER
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results.
@@ -149,6 +312,7 @@ def _fetch_all_batch_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        timer: Phase timer of the enclosing status call
         
     Returns:
         List of all documents from all pages
@@ -174,6 +338,7 @@ def _fetch_all_batch_pages(
         
         # Fetch next page
         response = client.get(current_url)
+        timer.mark("network")
         
         if not response.ok:
             # Log error but continue with what we have
@@ -183,18 +348,23 @@ def _fetch_all_batch_pages(
             break
         
         page_data = response.json()
+        timer.mark("decode")
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
+        page_start = len(documents)
         for doc in page_data.get("data", []) or []:
             if isinstance(doc, dict):
                 # Check max_results limit
                 if max_results is not None and len(documents) >= max_results:
                     break
                 normalized = normalize_document_input(doc)
+                timer.mark("normalize")
                 documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(current_url, response, len(documents) - page_start)
         
         # Check if we hit max_results limit after adding all docs from this page
         if max_results is not None and len(documents) >= max_results:
@@ -224,6 +394,10 @@ def cancel_batch_scrape(
     Raises:
         FirecrawlError: If the cancellation fails
     """
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        return all(run_bounded(lambda sub_id: cancel_batch_scrape(client, sub_id), sub_job_ids, DEFAULT_MAX_PARALLEL_JOBS))
+
     # Make the API request
     response = client.delete(f"/v2/batch/scrape/{job_id}")
     
@@ -277,7 +451,7 @@ def wait_for_batch_completion(
 
 def batch_scrape(
     client: HttpClient,
-    urls: List[str],
+    urls: Iterable[str],
     *,
     options: Optional[ScrapeOptions] = None,
     webhook: Optional[Union[str, WebhookConfig]] = None,
@@ -287,18 +461,30 @@ def batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    deduplicator: Optional[UrlDeduplicator] = None,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+    interleave_domains: bool = False,
+    submit_slot: Callable[[], ContextManager] = nullcontext,
 ) -> BatchScrapeJob:
     """
     Start a batch scrape job and wait for it to complete.
+
+    Oversized inputs are split into sub-jobs; at most ``max_parallel_jobs``
+    sub-jobs run at a time and their results are merged into one job. When
+    one sub-job fails to start or times out, the running ones are cancelled.
     
     Args:
         client: HTTP client instance
-        urls: List of URLs to scrape
+        urls: URLs to scrape (any iterable)
         options: Scraping options
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        max_parallel_jobs: Maximum sub-jobs in flight when splitting
+        interleave_domains: Reorder URLs round-robin by domain before submission
+        submit_slot: Context manager factory entered around each job submission
+            (e.g. a scheduler slot); polling runs outside it
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -307,10 +493,7 @@ def batch_scrape(
         FirecrawlError: If the batch scrape fails to start or complete
         TimeoutError: If timeout is reached
     """
-    # Start the batch scrape
-    start = start_batch_scrape(
-        client,
-        urls,
+    job_kwargs = dict(
         options=options,
         webhook=webhook,
         append_to_id=append_to_id,
@@ -318,15 +501,56 @@ def batch_scrape(
         max_concurrency=max_concurrency,
         zero_data_retention=zero_data_retention,
         integration=integration,
-        idempotency_key=idempotency_key,
-    )
-
-    job_id = start.id
-
-    # Wait for completion
-    return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
     )
+    if interleave_domains:
+        urls = interleave_by_domain(urls)
+    chunks = split_oversized(urls)
+    if chunks is None:
+        # Start the batch scrape
+        with submit_slot():
+            start = _start_batch_scrape_job(
+                client, urls, idempotency_key=idempotency_key, deduplicator=deduplicator, **job_kwargs
+            )
+        # Wait for completion
+        return wait_for_batch_completion(client, start.id, poll_interval, timeout)
+
+    deadline = time.monotonic() + timeout if timeout else None
+    guard = SubJobGuard(lambda job_id: cancel_batch_scrape(client, job_id))
+
+    def run_chunk(indexed):
+        index, chunk = indexed
+        if guard.aborted:
+            return None
+        try:
+            with submit_slot():
+                start = _start_batch_scrape_job(
+                    client, chunk, idempotency_key=chunk_idempotency_key(idempotency_key, index), **job_kwargs
+                )
+            if not guard.started(start.id):
+                guard.abort()
+                return None
+            if deduplicator is not None:
+                deduplicator.mark_seen(chunk)
+            remaining = None
+            if deadline is not None:
+                # A zero timeout would mean "wait forever" to the poller
+                remaining = max(0.001, deadline - time.monotonic())
+            job = wait_for_batch_completion(client, start.id, poll_interval, remaining)
+            guard.finished(start.id)
+            return job
+        except BaseException:
+            # Cancelling the running siblings also ends their waits, so the error surfaces promptly
+            guard.abort()
+            raise
+
+    try:
+        jobs = run_bounded(run_chunk, enumerate(unique_chunks(chunks, deduplicator)), max_parallel_jobs)
+    except BaseException:
+        guard.abort()
+        raise
+    if not jobs:
+        raise ValueError("All URLs were already submitted (deduplicated)")
+    return merge_batch_jobs(jobs)
 
 
 def validate_batch_urls(urls: List[str]) -> List[str]:
@@ -372,6 +596,7 @@ def prepare_batch_scrape_request(
     max_concurrency: Optional[int] = None,
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
+    deduplicator: Optional[UrlDeduplicator] = None,
 ) -> dict:
     """
     Prepare a batch scrape request payload.
@@ -379,11 +604,19 @@ def prepare_batch_scrape_request(
     Args:
         urls: List of URLs to scrape
         options: Scraping options
+        deduplicator: Optional seen-set used to drop repeated URLs
         
     Returns:
         Request payload dictionary
+
+    Raises:
+        ValueError: If URLs are invalid or all of them were already submitted
     """
     validated_urls = validate_batch_urls(urls)
+    if deduplicator is not None:
+        validated_urls = deduplicator.filter(validated_urls)
+        if not validated_urls:
+            raise ValueError("All URLs were already submitted (deduplicated)")
     request_data: Dict[str, Any] = {"urls": validated_urls}
 
     # Flatten scrape options at the top level (v2 behavior)
@@ -435,7 +668,8 @@ def process_large_batch(
     options: Optional[ScrapeOptions] = None,
     chunk_size: int = 100,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    deduplicator: Optional[UrlDeduplicator] = None,
 ) -> List[Document]:
     """
     Process a large batch of URLs by splitting into smaller chunks.
@@ -447,6 +681,7 @@ def process_large_batch(
         chunk_size: Size of each batch chunk
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait per chunk
+        deduplicator: Optional seen-set; chunks are filtered before submission
         
     Returns:
         List of all scraped documents
@@ -454,6 +689,8 @@ def process_large_batch(
     Raises:
         FirecrawlError: If any chunk fails
     """
+    if deduplicator is not None:
+        urls = deduplicator.filter(urls)
     url_chunks = chunk_urls(urls, chunk_size)
     all_documents = []
     completed_chunks = 0
@@ -466,6 +703,7 @@ def process_large_batch(
             options=options,
             poll_interval=poll_interval,
             timeout=timeout,
+            deduplicator=deduplicator,
         )
 
         # Add documents from this chunk
@@ -488,6 +726,10 @@ def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsRespo
     Returns:
         CrawlErrorsResponse with errors and robots-blocked URLs
     """
+    sub_job_ids = split_job_id(job_id)
+    if sub_job_ids:
+        return merge_batch_errors([get_batch_scrape_errors(client, sub_id) for sub_id in sub_job_ids])
+
     response = client.get(f"/v2/batch/scrape/{job_id}/errors")
 
     if not response.ok:
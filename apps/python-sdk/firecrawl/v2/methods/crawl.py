@@ -3,7 +3,7 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 from ..types import (
     CrawlRequest,
     CrawlJob,
@@ -12,6 +12,10 @@ from ..types import (
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
 from ..utils.normalize import normalize_document_input
+from ..utils.idempotency import discard_key, recover_conflict, resolve_idempotency_key, replay_job, record_job
+from ..utils.pagination import iter_paginated_documents
+from ..utils.credits import check_budget, settle_job, track_job
+from ..utils.hooks import NULL_TIMER, phase_timer
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -106,13 +110,19 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
+def start_crawl(
+    client: HttpClient,
+    request: CrawlRequest,
+    idempotency_key: Optional[str] = None,
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: HTTP client instance
         request: CrawlRequest containing URL and options
+        idempotency_key: Optional key to deduplicate starts (derived automatically
+            when the client has auto_idempotency enabled)
         
     Returns:
         CrawlResponse with job information
@@ -122,10 +132,24 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
         Exception: If the crawl operation fails to start
     """
     request_data = _prepare_crawl_request(request)
-    
-    response = client.post("/v2/crawl", request_data)
+
+    key = resolve_idempotency_key(client, "/v2/crawl", request_data, idempotency_key)
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return CrawlResponse(**replayed)
+    check_budget(client)
+
+    if key:
+        response = client.post("/v2/crawl", request_data, headers=client._prepare_headers(key))
+    else:
+        response = client.post("/v2/crawl", request_data)
     
     if not response.ok:
+        if key and response.status_code == 409:
+            # An earlier attempt with this key already started the crawl
+            return CrawlResponse(**recover_conflict(client, key))
+        if key and response.status_code < 500:
+            discard_key(client, key)
         handle_response_error(response, "start crawl")
     
     response_data = response.json()
@@ -135,6 +159,8 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
             "id": response_data.get("id"),
             "url": response_data.get("url")
         }
+        record_job(client, key, job_data)
+        track_job(client, "crawl", job_data["id"])
 
         return CrawlResponse(**job_data)
     else:
@@ -161,7 +187,10 @@ def get_crawl_status(
         Exception: If the status check fails
     """
     # Make the API request
-    response = client.get(f"/v2/crawl/{job_id}")
+    endpoint = f"/v2/crawl/{job_id}"
+    timer = phase_timer(client, "crawl_status", endpoint)
+    response = client.get(endpoint)
+    timer.mark("network")
     
     # Handle errors
     if not response.ok:
@@ -169,6 +198,7 @@ def get_crawl_status(
     
     # Parse response
     response_data = response.json()
+    timer.mark("decode")
     
     if response_data.get("success"):
         # The API returns status fields at the top level, not in a data field
@@ -182,7 +212,11 @@ def get_crawl_status(
                 # but we'll handle it gracefully
                 continue
             else:
-                documents.append(Document(**normalize_document_input(doc_data)))
+                normalized = normalize_document_input(doc_data)
+                timer.mark("normalize")
+                documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(endpoint, response, len(documents))
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -191,11 +225,12 @@ def get_crawl_status(
                 client, 
                 response_data.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                timer
             )
         
         # Create CrawlJob with current status and data
-        return CrawlJob(
+        job = CrawlJob(
             status=response_data.get("status"),
             completed=response_data.get("completed", 0),
             total=response_data.get("total", 0),
@@ -204,15 +239,39 @@ def get_crawl_status(
             next=response_data.get("next", None) if not auto_paginate else None,
             data=documents
         )
+        timer.mark("model")
+        timer.finish(response, len(documents))
+        settle_job(client, "crawl", job_id, job, cancel_crawl)
+        return job
     else:
         raise Exception(response_data.get("error", "Unknown error occurred"))
 
 
+def iter_crawl_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None
+) -> Iterator[Document]:
+    """
+    Stream the documents of a crawl job page by page.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        pagination_config: Optional configuration for pagination limits
+
+    Yields:
+        Document objects, without accumulating previous pages
+    """
+    return iter_paginated_documents(client, f"/v2/crawl/{job_id}", "get crawl status", pagination_config)
+
+
 def _fetch_all_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    timer=NULL_TIMER
 ) -> List[Document]:
     """
     Fetch all pages of crawl results.
@@ -222,6 +281,7 @@ def _fetch_all_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        timer: Phase timer of the enclosing status call
         
     Returns:
         List of all documents from all pages
@@ -247,6 +307,7 @@ def _fetch_all_pages(
         
         # Fetch next page
         response = client.get(current_url)
+        timer.mark("network")
         
         if not response.ok:
             # Log error but continue with what we have
@@ -256,11 +317,13 @@ def _fetch_all_pages(
             break
         
         page_data = response.json()
+        timer.mark("decode")
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
+        page_start = len(documents)
         data_list = page_data.get("data", [])
         for doc_data in data_list:
             if isinstance(doc_data, str):
@@ -269,7 +332,11 @@ def _fetch_all_pages(
                 # Check max_results limit BEFORE adding each document
                 if max_results is not None and len(documents) >= max_results:
                     break
-                documents.append(Document(**normalize_document_input(doc_data)))
+                normalized = normalize_document_input(doc_data)
+                timer.mark("normalize")
+                documents.append(Document(**normalized))
+                timer.mark("model")
+        timer.page(current_url, response, len(documents) - page_start)
         
         # Check if we hit max_results limit
         if max_results is not None and len(documents) >= max_results:
@@ -333,7 +400,7 @@ def wait_for_crawl_completion(
         crawl_job = get_crawl_status(client, job_id)
         
         # Check if job is complete
-        if crawl_job.status in ["completed", "failed"]:
+        if crawl_job.status in ["completed", "failed", "cancelled"]:
             return crawl_job
         
         # Check timeout
@@ -348,7 +415,8 @@ def crawl(
     client: HttpClient,
     request: CrawlRequest,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    idempotency_key: Optional[str] = None,
 ) -> CrawlJob:
     """
     Start a crawl job and wait for it to complete.
@@ -358,6 +426,7 @@ def crawl(
         request: CrawlRequest containing URL and options
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        idempotency_key: Optional key to deduplicate starts
         
     Returns:
         CrawlJob when job completes
@@ -368,7 +437,7 @@ def crawl(
         TimeoutError: If timeout is reached
     """
     # Start the crawl
-    crawl_job = start_crawl(client, request)
+    crawl_job = start_crawl(client, request, idempotency_key=idempotency_key)
     job_id = crawl_job.id
     
     # Wait for completion
@@ -4,8 +4,9 @@ import time
 from ..types import ExtractResponse, ScrapeOptions
 from ..types import AgentOptions
 from ..utils.http_client import HttpClient
-from ..utils.validation import prepare_scrape_options
+from ..utils.validation import prepare_scrape_options, _normalize_schema
 from ..utils.error_handler import handle_response_error
+from ..utils.idempotency import resolve_idempotency_key, replay_job, record_job
 
 
 def _prepare_extract_request(
@@ -28,7 +29,9 @@ def _prepare_extract_request(
     if prompt is not None:
         body["prompt"] = prompt
     if schema is not None:
-        body["schema"] = schema
+        # Accept Pydantic models as well as dicts; model schemas are memoized
+        normalized_schema = _normalize_schema(schema)
+        body["schema"] = normalized_schema if normalized_schema is not None else schema
     if system_prompt is not None:
         body["systemPrompt"] = system_prompt
     if allow_external_links is not None:
@@ -67,6 +70,7 @@ def start_extract(
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -81,10 +85,20 @@ def start_extract(
         integration=integration,
         agent=agent,
     )
-    resp = client.post("/v2/extract", body)
+    key = resolve_idempotency_key(client, "/v2/extract", body, idempotency_key)
+    replayed = replay_job(client, key)
+    if replayed is not None:
+        return ExtractResponse(**replayed)
+    if key:
+        resp = client.post("/v2/extract", body, headers=client._prepare_headers(key))
+    else:
+        resp = client.post("/v2/extract", body)
     if not resp.ok:
         handle_response_error(resp, "extract")
-    return ExtractResponse(**resp.json())
+    started = ExtractResponse(**resp.json())
+    if started.id:
+        record_job(client, key, {"success": started.success, "id": started.id})
+    return started
 
 
 def get_extract_status(client: HttpClient, job_id: str) -> ExtractResponse:
@@ -127,6 +141,7 @@ def extract(
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    idempotency_key: Optional[str] = None,
 ) -> ExtractResponse:
     started = start_extract(
         client,
@@ -141,6 +156,7 @@ def extract(
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
         agent=agent,
+        idempotency_key=idempotency_key,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
@@ -6,6 +6,8 @@ from typing import Optional, Dict, Any
 from ..types import ScrapeOptions, Document
 from ..utils.normalize import normalize_document_input
 from ..utils import HttpClient, handle_response_error, prepare_scrape_options, validate_scrape_options
+from ..utils.hooks import NULL_TIMER, phase_timer
+from ..utils.prepared import PreparedScrape
 
 
 def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -48,17 +50,48 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
     Returns:
         Document
     """
+    timer = phase_timer(client, "scrape", "/v2/scrape")
     payload = _prepare_scrape_request(url, options)
+    timer.mark("payload")
 
     response = client.post("/v2/scrape", payload)
+    timer.mark("network")
+    return _parse_scrape_response(response, timer)
 
+
+def scrape_prepared(client: HttpClient, prepared: PreparedScrape, url: str) -> Document:
+    """
+    Scrape a URL with a PreparedScrape, sending its pre-encoded request body.
+
+    Args:
+        client: HTTP client instance
+        prepared: Options validated and encoded once for many URLs
+        url: URL to scrape
+
+    Returns:
+        Document
+    """
+    timer = phase_timer(client, "scrape", "/v2/scrape")
+    body = prepared.body(url)
+    timer.mark("payload")
+    response = client.post_encoded("/v2/scrape", body)
+    timer.mark("network")
+    return _parse_scrape_response(response, timer)
+
+
+def _parse_scrape_response(response, timer=NULL_TIMER) -> Document:
     if not response.ok:
         handle_response_error(response, "scrape")
 
     body = response.json()
+    timer.mark("decode")
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
     document_data = body.get("data", {})
     normalized = normalize_document_input(document_data)
-    return Document(**normalized)
\ No newline at end of file
+    timer.mark("normalize")
+    document = Document(**normalized)
+    timer.mark("model")
+    timer.finish(response, 1)
+    return document
@@ -7,6 +7,7 @@ from typing import Dict, Any, Union, List, TypeVar, Type
 from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages
 from ..utils.normalize import normalize_document_input
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
+from ..utils.hooks import phase_timer
 
 T = TypeVar("T")
 
@@ -27,12 +28,16 @@ def search(
     Raises:
         FirecrawlError: If the search operation fails
     """
+    timer = phase_timer(client, "search", "/v2/search")
     request_data = _prepare_search_request(request)
+    timer.mark("payload")
     try:
         response = client.post("/v2/search", request_data)
+        timer.mark("network")
         if response.status_code != 200:
             handle_response_error(response, "search")
         response_data = response.json()
+        timer.mark("decode")
         if not response_data.get("success"):
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
@@ -43,6 +48,9 @@ def search(
             out.news = _transform_array(data["news"], SearchResultNews)
         if "images" in data:
             out.images = _transform_array(data["images"], SearchResultImages)
+        # Normalization of document results happens inline and is counted as model time
+        timer.mark("model")
+        timer.finish(response, sum(len(items or []) for items in (out.web, out.news, out.images)))
         return out
     except Exception as err:
         # If the error is an HTTP error from requests, handle it
@@ -348,7 +348,7 @@ class CrawlResponse(BaseModel):
 
 class CrawlJob(BaseModel):
     """Crawl job status and progress data."""
-    status: Literal["scraping", "completed", "failed"]
+    status: Literal["scraping", "completed", "failed", "cancelled"]
     total: int = 0
     completed: int = 0
     credits_used: int = 0
@@ -443,6 +443,8 @@ class BatchScrapeResponse(BaseModel):
     id: str
     url: str
     invalid_urls: Optional[List[str]] = None
+    dedup_hits: Optional[int] = None
+    sub_job_ids: Optional[List[str]] = None
 
 class BatchScrapeJob(BaseModel):
     """Batch scrape job status and results."""
@@ -520,6 +522,87 @@ class ConcurrencyCheck(BaseModel):
     concurrency: int
     max_concurrency: int
 
+class SchedulerClassStats(BaseModel):
+    """Queue metrics for one priority class of the client-side scheduler."""
+    weight: float
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    avg_wait_seconds: float = 0.0
+
+class SchedulerStats(BaseModel):
+    """Snapshot of the client-side scheduler (budget, occupancy and per-class queues)."""
+    max_concurrency: Optional[int] = None
+    in_flight: int = 0
+    queued: int = 0
+    classes: Dict[str, SchedulerClassStats] = {}
+
+class DomainStats(BaseModel):
+    """Per-domain state of the domain dispatcher (adaptive cap, occupancy, health)."""
+    cap: int
+    in_flight: int = 0
+    queued: int = 0
+    completed: int = 0
+    errors: int = 0
+    error_rate: float = 0.0
+    latency_seconds: Optional[float] = None
+
+class CacheStats(BaseModel):
+    """Hit/miss/eviction counters of a client-side response cache."""
+    hits: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    evictions: int = 0
+    writes: int = 0
+    hit_rate: float = 0.0
+    memory_entries: int = 0
+    disk_entries: Optional[int] = None
+
+class SingleFlightStats(BaseModel):
+    """Counters of the single-flight request coalescer."""
+    calls: int = 0
+    executions: int = 0
+    deduplicated: int = 0
+    in_flight: int = 0
+
+class CreditLedgerStats(BaseModel):
+    """Credits recorded by a client-side credit ledger."""
+    total: float = 0.0
+    budget: Optional[float] = None
+    remaining: Optional[float] = None
+    by_job: Dict[str, float] = Field(default_factory=dict)
+    by_tag: Dict[str, float] = Field(default_factory=dict)
+    breaches: int = 0
+    cancelled_jobs: List[str] = Field(default_factory=list)
+
+class PhaseProfile(BaseModel):
+    """Sampled CPU time and call count of one phase of one operation."""
+    operation: str
+    phase: str
+    calls: int = 0
+    cpu_seconds: float = 0.0
+
+class ProfileStats(BaseModel):
+    """Snapshot of a client profiler (sampled totals; divide by sample_rate to extrapolate)."""
+    sample_rate: float = 1.0
+    operations: Dict[str, int] = Field(default_factory=dict)
+    cpu_seconds: float = 0.0
+    phases: List[PhaseProfile] = Field(default_factory=list)
+
+class Chunk(BaseModel):
+    """A token-bounded slice of a document's markdown, with its source for RAG ingestion."""
+    text: str
+    token_count: int
+    chunk_index: int
+    document_index: int = 0
+    source_url: Optional[str] = None
+    headings: List[str] = Field(default_factory=list)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
 class CreditUsage(BaseModel):
     """Remaining credits for the team/API key."""
     remaining_credits: int
@@ -767,6 +850,7 @@ class ClientConfig(BaseModel):
     timeout: Optional[float] = None
     max_retries: int = 3
     backoff_factor: float = 0.5
+    auto_idempotency: bool = False
 
 class PaginationConfig(BaseModel):
     """Configuration for pagination behavior."""
@@ -5,5 +5,19 @@ Utility modules for v2 API client.
 from .http_client import HttpClient
 from .error_handler import FirecrawlError, handle_response_error
 from .validation import validate_scrape_options, prepare_scrape_options
+from .url_dedup import UrlDeduplicator, canonicalize_url
+from .idempotency import IdempotencyJournal, derive_idempotency_key
+from .scheduler import RequestScheduler
+from .domain_dispatch import DomainDispatcher, interleave_by_domain, registrable_domain
+from .cache import ScrapeCache, MapSearchCache, TieredCache
+from .single_flight import SingleFlight
+from .hooks import Hooks, RequestEvent, ResponseEvent, RetryEvent, PageEvent, ParseEvent
+from .metrics import MetricsRegistry
+from .credits import CreditLedger, CreditBudgetExceeded
+from .profiling import Profiler
+from .fan_out import ItemResult
+from .postprocess import PostProcessor
+from .chunking import MarkdownChunker, chunk_documents
+from .export import ParquetDocumentWriter, write_parquet, iter_record_batches
 
-__all__ = ['HttpClient', 'FirecrawlError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options']
\ No newline at end of file
+__all__ = ['HttpClient', 'FirecrawlError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options', 'UrlDeduplicator', 'canonicalize_url', 'IdempotencyJournal', 'derive_idempotency_key', 'ParquetDocumentWriter', 'write_parquet', 'iter_record_batches', 'RequestScheduler', 'DomainDispatcher', 'interleave_by_domain', 'registrable_domain', 'ScrapeCache', 'MapSearchCache', 'TieredCache', 'SingleFlight', 'Hooks', 'RequestEvent', 'ResponseEvent', 'RetryEvent', 'PageEvent', 'ParseEvent', 'MetricsRegistry', 'CreditLedger', 'CreditBudgetExceeded', 'Profiler', 'ItemResult', 'PostProcessor', 'MarkdownChunker', 'chunk_documents']
\ No newline at end of file
@@ -0,0 +1,252 @@
+"""
+Helpers for transparently splitting oversized batch scrapes into sub-jobs.
+
+A batch that exceeds the API limit is submitted as several sub-jobs and
+represented by a single merged job ID (``merged:<id1>,<id2>,...``). The
+batch status, cancel, errors and watcher paths recognise merged IDs and
+aggregate across the sub-jobs.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from ..types import BatchScrapeJob, BatchScrapeResponse, CrawlErrorsResponse
+from .url_dedup import UrlDeduplicator
+
+logger = logging.getLogger("firecrawl")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of URLs accepted by a single /v2/batch/scrape request
+MAX_BATCH_URLS = 1000
+
+# Number of sub-jobs run (or polled) at the same time by default
+DEFAULT_MAX_PARALLEL_JOBS = 4
+
+MERGED_JOB_PREFIX = "merged:"
+
+_TERMINAL_PRIORITY = ("scraping", "failed", "cancelled", "completed")
+
+
+def iter_url_chunks(urls: Iterable[str], chunk_size: int = MAX_BATCH_URLS) -> Iterator[List[str]]:
+    """Lazily split any iterable of URLs into lists of at most ``chunk_size``."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    it = iter(urls)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def split_oversized(urls: Iterable[str]) -> Optional[Iterator[List[str]]]:
+    """
+    Return URL chunks when ``urls`` may exceed one request, else None.
+
+    Sequences within the limit return None and are submitted unchanged. For
+    other iterables only the first two chunks are read up front.
+    """
+    if isinstance(urls, (list, tuple)) and len(urls) <= MAX_BATCH_URLS:
+        return None
+    chunks = iter_url_chunks(urls)
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if second is None:
+        return iter([first or []])
+    return chain([first, second], chunks)
+
+
+def unique_chunks(
+    chunks: Iterator[List[str]],
+    deduplicator: Optional[UrlDeduplicator],
+) -> Iterator[List[str]]:
+    """Drop already-seen URLs, re-chunking so sub-jobs stay full and cross-chunk repeats are caught."""
+    if deduplicator is None:
+        return chunks
+    return iter_url_chunks(deduplicator.iter_unique(chain.from_iterable(chunks)))
+
+
+def merge_job_ids(job_ids: List[str]) -> str:
+    return MERGED_JOB_PREFIX + ",".join(job_ids)
+
+
+def split_job_id(job_id: str) -> Optional[List[str]]:
+    """Return the sub-job IDs of a merged job ID, or None for a regular job ID."""
+    if not isinstance(job_id, str) or not job_id.startswith(MERGED_JOB_PREFIX):
+        return None
+    return [part for part in job_id[len(MERGED_JOB_PREFIX):].split(",") if part]
+
+
+def chunk_idempotency_key(key: Optional[str], index: int) -> Optional[str]:
+    """Derive a distinct, stable UUID key per sub-job from a caller-supplied key."""
+    if not key:
+        return None
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"firecrawl-batch-chunk:{key}:{index}"))
+
+
+def run_bounded(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+    """
+    Apply ``fn`` to ``items`` on a thread pool with at most ``max_workers``
+    calls in flight, without materializing ``items`` up front.
+
+    Results are returned in input order. The first exception is re-raised
+    after in-flight calls finish.
+    """
+    max_workers = max(1, max_workers)
+    results: Dict[int, R] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {}
+        for index, item in enumerate(items):
+            # Each call runs in a copy of the caller's context (e.g. its active trace span)
+            pending[pool.submit(contextvars.copy_context().run, fn, item)] = index
+            if len(pending) >= max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+        for future, index in pending.items():
+            results[index] = future.result()
+    return [results[i] for i in range(len(results))]
+
+
+async def run_bounded_async(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int,
+) -> List[R]:
+    """Async counterpart of ``run_bounded``: at most ``max_concurrency`` awaitables in flight."""
+    max_concurrency = max(1, max_concurrency)
+    results: Dict[int, R] = {}
+    pending: Dict["asyncio.Task[R]", int] = {}
+    try:
+        for index, item in enumerate(items):
+            pending[asyncio.ensure_future(fn(item))] = index
+            if len(pending) >= max_concurrency:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[pending.pop(task)] = task.result()
+        if pending:
+            await asyncio.wait(pending)
+            for task, index in pending.items():
+                results[index] = task.result()
+            pending.clear()
+    finally:
+        for task in pending:
+            task.cancel()
+    return [results[i] for i in range(len(results))]
+
+
+class SubJobGuard:
+    """
+    Sub-jobs started for one split batch.
+
+    When a chunk fails (start error, budget breach, wait timeout) ``abort``
+    cancels every sub-job still running, so no orphaned sub-jobs keep
+    scraping and billing without a merged ID to cancel them by. Chunks that
+    start after an abort cancel their own job.
+    """
+
+    def __init__(self, cancel: Callable[[str], Any]):
+        self.cancel = cancel
+        self.aborted = False
+        self._running: List[str] = []
+        self._lock = threading.Lock()
+
+    def started(self, job_id: str) -> bool:
+        """Track a started sub-job; False if the batch was aborted meanwhile (call ``abort`` again)."""
+        with self._lock:
+            self._running.append(job_id)
+            return not self.aborted
+
+    def finished(self, job_id: str) -> None:
+        with self._lock:
+            if job_id in self._running:
+                self._running.remove(job_id)
+
+    def _take(self) -> List[str]:
+        with self._lock:
+            self.aborted = True
+            job_ids, self._running = self._running, []
+            return job_ids
+
+    def abort(self) -> None:
+        for job_id in self._take():
+            try:
+                self.cancel(job_id)
+            except Exception as exc:
+                logger.warning("Failed to cancel batch sub-job %s: %s", job_id, exc)
+
+    async def abort_async(self) -> None:
+        job_ids = self._take()
+        results = await asyncio.gather(*(self.cancel(job_id) for job_id in job_ids), return_exceptions=True)
+        for job_id, result in zip(job_ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to cancel batch sub-job %s: %s", job_id, result)
+
+
+def merge_batch_responses(responses: List[BatchScrapeResponse]) -> BatchScrapeResponse:
+    """
+    Combine sub-job start responses into one merged handle.
+
+    Sub-jobs that share an ID (e.g. all appended via ``append_to_id``) collapse
+    into a regular, non-merged handle.
+    """
+    invalid: List[str] = []
+    for resp in responses:
+        invalid.extend(resp.invalid_urls or [])
+    job_ids = list(dict.fromkeys(resp.id for resp in responses))
+    return BatchScrapeResponse(
+        id=job_ids[0] if len(job_ids) == 1 else merge_job_ids(job_ids),
+        url=responses[0].url,
+        invalid_urls=invalid or None,
+        sub_job_ids=job_ids if len(job_ids) > 1 else None,
+    )
+
+
+def merge_batch_jobs(jobs: List[BatchScrapeJob], max_results: Optional[int] = None) -> BatchScrapeJob:
+    """
+    Aggregate sub-job snapshots: counts and credits are summed, documents are
+    concatenated in sub-job order, and the status is ``scraping`` while any
+    sub-job is running, then ``failed``/``cancelled`` if any sub-job ended so.
+    """
+    statuses = {job.status for job in jobs}
+    status = next((s for s in _TERMINAL_PRIORITY if s in statuses), "completed")
+    credits = [job.credits_used for job in jobs if job.credits_used is not None]
+    expiries = [job.expires_at for job in jobs if job.expires_at is not None]
+    data = [doc for job in jobs for doc in job.data]
+    if max_results is not None:
+        data = data[:max_results]
+    return BatchScrapeJob(
+        status=status,
+        completed=sum(job.completed for job in jobs),
+        total=sum(job.total for job in jobs),
+        credits_used=sum(credits) if credits else None,
+        expires_at=min(expiries) if expiries else None,
+        next=None,
+        data=data,
+    )
+
+
+def merge_batch_errors(responses: List[CrawlErrorsResponse]) -> CrawlErrorsResponse:
+    return CrawlErrorsResponse(
+        errors=[err for resp in responses for err in resp.errors],
+        robots_blocked=[url for resp in responses for url in resp.robots_blocked],
+    )
+
+
+def merge_raw_batch_errors(bodies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge raw errors payloads as returned by the async client."""
+    errors: List[Any] = []
+    robots: List[Any] = []
+    for body in bodies:
+        payload = body.get("data", body)
+        errors.extend(payload.get("errors", []) or [])
+        robots.extend(payload.get("robotsBlocked", payload.get("robots_blocked", [])) or [])
+    return {"success": True, "errors": errors, "robotsBlocked": robots}
@@ -0,0 +1,430 @@
+"""
+Client-side response caches.
+
+``TieredCache`` keeps decoded values in an in-memory LRU and, optionally,
+encoded values in a SQLite file shared across processes. Entries record when
+they were stored; a lookup passes the oldest age it accepts, so the same
+entry can serve callers with different freshness requirements.
+
+``ScrapeCache`` builds on it for ``scrape()`` results, keyed on the URL plus
+the prepared request options, with freshness taken from ``max_age``:
+
+    cache = ScrapeCache(path="~/.cache/firecrawl/scrape.sqlite")
+    client = FirecrawlClient(scrape_cache=cache)
+    client.scrape(url, max_age=3_600_000)  # network
+    client.scrape(url, max_age=3_600_000)  # served locally
+    print(cache.stats())
+
+``MapSearchCache`` stores ``map()`` and ``search()`` results for a fixed TTL
+in a compact zlib-compressed encoding, and can be invalidated by domain
+(map) or query prefix (search).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..types import (
+    CacheStats,
+    Document,
+    LinkResult,
+    MapData,
+    SearchData,
+    SearchResultImages,
+    SearchResultNews,
+    SearchResultWeb,
+)
+from .domain_dispatch import registrable_domain
+
+logger = logging.getLogger("firecrawl")
+
+T = TypeVar("T")
+
+# Server default for ScrapeOptions.max_age (milliseconds), see prepare_scrape_options
+DEFAULT_MAX_AGE_MS = 14_400_000
+
+# Option keys that control freshness/storage rather than the scraped content
+_UNKEYED_OPTIONS = ("maxAge", "storeInCache")
+
+
+def cache_key(payload: Dict[str, Any]) -> str:
+    """Stable digest of a prepared (camelCase) request payload."""
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _SQLiteTier:
+    """Disk tier: one row per entry, values stored as encoded bytes."""
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, tag TEXT NOT NULL,"
+            " stored_at REAL NOT NULL, value BLOB NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_tag ON entries (namespace, tag)")
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[float, str, bytes]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, tag, value FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        return (row[0], row[1], bytes(row[2])) if row else None
+
+    def set(self, namespace: str, key: str, tag: str, stored_at: float, value: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, tag, stored_at, value) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, tag, stored_at, sqlite3.Binary(value)),
+            )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def delete_tagged(self, namespace: str, tag_prefix: str) -> int:
+        escaped = tag_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND tag LIKE ? ESCAPE '\\'",
+                (namespace, escaped + "%"),
+            )
+        return cursor.rowcount
+
+    def prune(self, namespace: str, older_than: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND stored_at < ?", (namespace, older_than)
+            )
+        return cursor.rowcount
+
+    def count(self, namespace: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """
+    In-memory LRU in front of an optional SQLite tier.
+
+    Values are kept decoded in memory and encoded (``encode``/``decode``
+    supplied by the caller) on disk. Each entry carries a ``tag`` used for
+    bulk invalidation by prefix.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        *,
+        namespace: str = "default",
+        max_entry_age: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_entries: Capacity of the in-memory tier
+            path: SQLite file for the disk tier (memory only when None)
+            namespace: Partition within the SQLite file, so caches can share one file
+            max_entry_age: Seconds after which disk entries are pruned on open
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.namespace = namespace
+        self._memory: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._disk = _SQLiteTier(path) if path else None
+        self._lock = threading.Lock()
+        self._counts = dict(memory_hits=0, disk_hits=0, misses=0, stale=0, evictions=0, writes=0)
+        if self._disk is not None and max_entry_age is not None:
+            self._disk.prune(namespace, time.time() - max_entry_age)
+
+    def _remember_locked(self, key: str, entry: Tuple[float, str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counts["evictions"] += 1
+
+    def get(self, key: str, max_age: Optional[float], decode: Callable[[bytes], T]) -> Optional[T]:
+        """
+        Return the value for ``key`` if it was stored at most ``max_age``
+        seconds ago (any age when None), else None.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if max_age is None or now - entry[0] <= max_age:
+                    self._memory.move_to_end(key)
+                    self._counts["memory_hits"] += 1
+                    return entry[2]
+                self._counts["stale"] += 1
+                self._counts["misses"] += 1
+                return None
+        if self._disk is not None:
+            try:
+                row = self._disk.get(self.namespace, key)
+            except sqlite3.Error as exc:
+                logger.debug("Cache disk read failed: %s", exc)
+                row = None
+            if row is not None:
+                stored_at, tag, blob = row
+                if max_age is None or now - stored_at <= max_age:
+                    try:
+                        value = decode(blob)
+                    except Exception as exc:
+                        logger.debug("Dropping undecodable cache entry: %s", exc)
+                        self._disk.delete(self.namespace, key)
+                    else:
+                        with self._lock:
+                            self._remember_locked(key, (stored_at, tag, value))
+                            self._counts["disk_hits"] += 1
+                        return value
+                else:
+                    with self._lock:
+                        self._counts["stale"] += 1
+        with self._lock:
+            self._counts["misses"] += 1
+        return None
+
+    def set(self, key: str, value: T, encode: Callable[[T], bytes], tag: str = "") -> None:
+        stored_at = time.time()
+        with self._lock:
+            self._remember_locked(key, (stored_at, tag, value))
+            self._counts["writes"] += 1
+        if self._disk is not None:
+            try:
+                self._disk.set(self.namespace, key, tag, stored_at, encode(value))
+            except sqlite3.Error as exc:
+                logger.debug("Cache disk write failed: %s", exc)
+
+    def invalidate(self, tag_prefix: str = "") -> int:
+        """Drop every entry whose tag starts with ``tag_prefix`` (all entries for ""). Returns the count."""
+        with self._lock:
+            doomed = [k for k, (_, tag, _) in self._memory.items() if tag.startswith(tag_prefix)]
+            for key in doomed:
+                del self._memory[key]
+        removed = len(doomed)
+        if self._disk is not None:
+            # Disk rows include the ones mirrored in memory
+            removed = max(removed, self._disk.delete_tagged(self.namespace, tag_prefix))
+        return removed
+
+    def clear(self) -> None:
+        self.invalidate("")
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            counts = dict(self._counts)
+            memory_entries = len(self._memory)
+        lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+        return CacheStats(
+            hits=counts["memory_hits"] + counts["disk_hits"],
+            memory_hits=counts["memory_hits"],
+            disk_hits=counts["disk_hits"],
+            misses=counts["misses"],
+            stale=counts["stale"],
+            evictions=counts["evictions"],
+            writes=counts["writes"],
+            hit_rate=(counts["memory_hits"] + counts["disk_hits"]) / lookups if lookups else 0.0,
+            memory_entries=memory_entries,
+            disk_entries=self._disk.count(self.namespace) if self._disk is not None else None,
+        )
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+
+def _domain_tag(url: str) -> str:
+    # Trailing separator keeps prefix invalidation exact ("a.com/" does not match "a.com.au/")
+    return registrable_domain(url) + "/"
+
+
+def _encode_document(document: Document) -> bytes:
+    return document.model_dump_json(exclude_none=True).encode("utf-8")
+
+
+def _decode_document(blob: bytes) -> Document:
+    return Document.model_validate_json(blob)
+
+
+class ScrapeCache(TieredCache):
+    """
+    Cache of ``scrape()`` results keyed on the URL and prepared scrape options.
+
+    ``max_age`` (milliseconds, as on ScrapeOptions) bounds how old a cached
+    document may be; ``max_age=0`` bypasses the cache and
+    ``store_in_cache=False`` skips storing. Requests with browser actions are
+    never cached. Returned documents are shared and should not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None, *, namespace: str = "scrape", **kwargs):
+        super().__init__(max_entries, path, namespace=namespace, **kwargs)
+
+    @staticmethod
+    def _split(payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[float], bool]:
+        if payload.get("actions"):
+            return None, None, False
+        max_age_ms = payload.get("maxAge", DEFAULT_MAX_AGE_MS)
+        store = payload.get("storeInCache", True) is not False
+        if max_age_ms is not None and max_age_ms <= 0:
+            return None, None, store
+        keyed = {k: v for k, v in payload.items() if k not in _UNKEYED_OPTIONS}
+        max_age = max_age_ms / 1000.0 if max_age_ms is not None else None
+        return cache_key(keyed), max_age, store
+
+    def lookup(self, payload: Dict[str, Any]) -> Optional[Document]:
+        """Return a fresh cached document for a prepared scrape payload, or None."""
+        key, max_age, _ = self._split(payload)
+        if key is None:
+            return None
+        return self.get(key, max_age, _decode_document)
+
+    def store(self, payload: Dict[str, Any], document: Document) -> None:
+        key, _, store = self._split(payload)
+        if key is None or not store:
+            return
+        self.set(key, document, _encode_document, tag=_domain_tag(payload.get("url", "")))
+
+    def invalidate_domain(self, domain: str) -> int:
+        """Drop cached documents for a registrable domain (e.g. ``example.com``)."""
+        return self.invalidate(_domain_tag(f"http://{domain}"))
+
+
+
+# Search result groups and the model used for non-document items in each
+_SEARCH_GROUPS = (("web", SearchResultWeb), ("news", SearchResultNews), ("images", SearchResultImages))
+
+
+def _pack(obj: Any) -> bytes:
+    return zlib.compress(json.dumps(obj, separators=(",", ":")).encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _encode_map(data: MapData) -> bytes:
+    # Links as positional rows with trailing Nones dropped: [url, title?, description?]
+    rows: List[List[Any]] = []
+    for link in data.links:
+        row = [link.url, link.title, link.description]
+        while len(row) > 1 and row[-1] is None:
+            row.pop()
+        rows.append(row)
+    return _pack(rows)
+
+
+def _decode_map(blob: bytes) -> MapData:
+    links = []
+    for row in _unpack(blob):
+        row = list(row) + [None] * (3 - len(row))
+        links.append(LinkResult(url=row[0], title=row[1], description=row[2]))
+    return MapData(links=links)
+
+
+def _encode_search(data: SearchData) -> bytes:
+    # Items are tagged "d" (Document) or "r" (plain result) so decoding restores the same types
+    packed: Dict[str, Any] = {}
+    for group, _ in _SEARCH_GROUPS:
+        items = getattr(data, group)
+        if items is None:
+            continue
+        packed[group] = [
+            ["d" if isinstance(item, Document) else "r", item.model_dump(mode="json", exclude_none=True)]
+            for item in items
+        ]
+    return _pack(packed)
+
+
+def _decode_search(blob: bytes) -> SearchData:
+    packed = _unpack(blob)
+    out = SearchData()
+    for group, result_type in _SEARCH_GROUPS:
+        if group in packed:
+            setattr(out, group, [
+                Document(**item) if kind == "d" else result_type(**item)
+                for kind, item in packed[group]
+            ])
+    return out
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join(str(query).lower().split())
+
+
+class MapSearchCache(TieredCache):
+    """
+    TTL cache of ``map()`` and ``search()`` results keyed on the prepared
+    request payloads. Returned results are shared and should not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        path: Optional[str] = None,
+        *,
+        ttl: float = 3600.0,
+        map_ttl: Optional[float] = None,
+        search_ttl: Optional[float] = None,
+        namespace: str = "map_search",
+    ):
+        """
+        Args:
+            max_entries: Capacity of the in-memory tier
+            path: SQLite file for the disk tier (memory only when None)
+            ttl: Seconds a cached result stays valid
+            map_ttl: Override of ``ttl`` for map results
+            search_ttl: Override of ``ttl`` for search results
+            namespace: Partition within the SQLite file
+        """
+        self.map_ttl = map_ttl if map_ttl is not None else ttl
+        self.search_ttl = search_ttl if search_ttl is not None else ttl
+        super().__init__(
+            max_entries, path, namespace=namespace, max_entry_age=max(self.map_ttl, self.search_ttl)
+        )
+
+    def get_map(self, payload: Dict[str, Any]) -> Optional[MapData]:
+        return self.get(cache_key({"endpoint": "map", **payload}), self.map_ttl, _decode_map)
+
+    def put_map(self, payload: Dict[str, Any], data: MapData) -> None:
+        tag = "map:" + _domain_tag(payload.get("url", ""))
+        self.set(cache_key({"endpoint": "map", **payload}), data, _encode_map, tag=tag)
+
+    def get_search(self, payload: Dict[str, Any]) -> Optional[SearchData]:
+        return self.get(cache_key({"endpoint": "search", **payload}), self.search_ttl, _decode_search)
+
+    def put_search(self, payload: Dict[str, Any], data: SearchData) -> None:
+        tag = "search:" + _normalize_query(payload.get("query", ""))
+        self.set(cache_key({"endpoint": "search", **payload}), data, _encode_search, tag=tag)
+
+    def invalidate_domain(self, domain: str) -> int:
+        """Drop cached map results for a registrable domain (e.g. ``example.com``)."""
+        return self.invalidate("map:" + _domain_tag(f"http://{domain}"))
+
+    def invalidate_query_prefix(self, prefix: str) -> int:
+        """Drop cached search results whose (normalized) query starts with ``prefix``."""
+        return self.invalidate("search:" + _normalize_query(prefix))
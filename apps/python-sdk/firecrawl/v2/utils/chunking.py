@@ -0,0 +1,238 @@
+"""
+Token-aware chunking of scraped markdown for RAG ingestion.
+
+``MarkdownChunker`` splits ``Document.markdown`` along its structure:
+headings start new chunks, paragraphs, lists and fenced code blocks are kept
+whole where they fit, and only blocks larger than the budget are split further
+(by sentence, then by word). Each ``Chunk`` carries its token count, heading
+path, source URL and the document's metadata.
+
+Usage:
+    chunker = MarkdownChunker(max_tokens=512, overlap_tokens=64)
+    for chunk in chunker.iter_chunks(client.iter_crawl_documents(job_id)):
+        index.add(chunk.text, url=chunk.source_url, headings=chunk.headings)
+
+    # Exact counts for a model's tokenizer (``pip install tiktoken``)
+    chunker = MarkdownChunker(max_tokens=512, tokenizer=tiktoken_tokenizer("cl100k_base"))
+
+Token counts default to a ~4 characters per token estimate. Any callable
+``str -> int`` can be passed as the tokenizer. Every block is tokenized
+once, so chunking is linear in the markdown size. ``iter_chunks`` holds one
+document at a time, so memory stays bounded over crawls of any size.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..types import Chunk, Document, DocumentMetadata
+from .normalize import normalize_document_input
+
+DocumentLike = Union[Document, Dict[str, Any]]
+Tokenizer = Callable[[str], int]
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def approximate_token_count(text: str) -> int:
+    """Rough token count for English-like text (~4 characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def tiktoken_tokenizer(encoding: str = "cl100k_base") -> Tokenizer:
+    """Token counter backed by ``tiktoken`` (optional dependency)."""
+    try:
+        import tiktoken
+    except ImportError as exc:
+        raise ImportError(
+            "tiktoken is required for exact token counts. Install it with `pip install tiktoken`."
+        ) from exc
+    enc = tiktoken.get_encoding(encoding)
+    return lambda text: len(enc.encode(text, disallowed_special=()))
+
+
+def _blocks(markdown: str) -> Iterator[Tuple[str, Optional[Tuple[int, str]]]]:
+    """Yield ``(text, heading)`` per block; ``heading`` is ``(level, title)`` for heading lines."""
+    lines: List[str] = []
+    fence: Optional[str] = None
+    for line in markdown.splitlines():
+        if fence is not None:
+            lines.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+        match = _FENCE.match(line)
+        if match:
+            # Code blocks are never split on the blank lines inside them
+            fence = match.group(1)
+            lines.append(line)
+            continue
+        if not line.strip():
+            if lines:
+                yield "\n".join(lines), None
+                lines = []
+            continue
+        heading = _HEADING.match(line)
+        if heading:
+            if lines:
+                yield "\n".join(lines), None
+                lines = []
+            yield line.strip(), (len(heading.group(1)), heading.group(2))
+            continue
+        lines.append(line)
+    if lines:
+        yield "\n".join(lines), None
+
+
+class MarkdownChunker:
+    """Split markdown into token-bounded chunks along headings and paragraphs."""
+
+    def __init__(
+        self,
+        max_tokens: int = 512,
+        *,
+        overlap_tokens: int = 0,
+        min_tokens: Optional[int] = None,
+        tokenizer: Tokenizer = approximate_token_count,
+    ):
+        """
+        Args:
+            max_tokens: Token budget per chunk
+            overlap_tokens: Trailing blocks of up to this many tokens repeated at the
+                start of the next chunk of the same section
+            min_tokens: Chunks smaller than this absorb the next section instead of
+                ending at its heading (default ``max_tokens // 4``)
+            tokenizer: ``str -> int`` token counter
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be in [0, max_tokens)")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.min_tokens = max_tokens // 4 if min_tokens is None else min_tokens
+        self.tokenizer = tokenizer
+        self._separator_tokens = tokenizer("\n\n")
+
+    def split(self, markdown: str) -> Iterator[Tuple[str, List[str], int]]:
+        """Yield ``(text, heading path, token count)`` per chunk of ``markdown``."""
+        path: List[Tuple[int, str]] = []
+        current: List[Tuple[str, int]] = []
+        tokens = 0
+        headings: List[str] = []
+
+        def emit() -> Tuple[str, List[str], int]:
+            return "\n\n".join(text for text, _ in current), headings, tokens
+
+        def carry_overlap() -> List[Tuple[str, int]]:
+            carried: List[Tuple[str, int]] = []
+            budget = self.overlap_tokens
+            for text, count in reversed(current):
+                if count + self._separator_tokens > budget:
+                    break
+                carried.insert(0, (text, count))
+                budget -= count + self._separator_tokens
+            return carried
+
+        for block, heading in _blocks(markdown):
+            if heading is not None:
+                level, title = heading
+                if current and tokens >= self.min_tokens:
+                    yield emit()
+                    current, tokens = [], 0
+                while path and path[-1][0] >= level:
+                    path.pop()
+                path.append((level, title))
+            # An oversized block first tops up the current chunk, so a heading is not left on its own
+            room = self.max_tokens - tokens - self._separator_tokens if current else self.max_tokens
+            for text, count in self._fit(block, max(1, room)):
+                added = count + (self._separator_tokens if current else 0)
+                if current and tokens + added > self.max_tokens:
+                    yield emit()
+                    current = carry_overlap()
+                    tokens = sum(c for _, c in current) + self._separator_tokens * max(0, len(current) - 1)
+                    added = count + (self._separator_tokens if current else 0)
+                    if tokens + added > self.max_tokens:
+                        # No room for the overlap next to this block
+                        current, tokens, added = [], 0, count
+                if not current:
+                    headings = [title for _, title in path]
+                current.append((text, count))
+                tokens += added
+        if current:
+            yield emit()
+
+    def _fit(self, block: str, first_budget: int) -> List[Tuple[str, int]]:
+        """The block with its token count, or pieces of it that each fit the budget."""
+        count = self.tokenizer(block)
+        if count <= self.max_tokens:
+            return [(block, count)]
+        pieces: List[Tuple[str, int]] = []
+        for sentence in _SENTENCE_END.split(block):
+            sentence_count = self.tokenizer(sentence)
+            if sentence_count <= self.max_tokens:
+                pieces.append((sentence, sentence_count))
+            else:
+                pieces.extend(self._pack_words(sentence))
+        return self._merge(pieces, " ", first_budget)
+
+    def _pack_words(self, text: str) -> List[Tuple[str, int]]:
+        # Last resort for run-on text (e.g. minified content); a single overlong word is cut
+        pieces: List[Tuple[str, int]] = []
+        for word in text.split():
+            count = self.tokenizer(word)
+            while count > self.max_tokens:
+                cut = max(1, len(word) * self.max_tokens // count)
+                pieces.append((word[:cut], self.tokenizer(word[:cut])))
+                word = word[cut:]
+                count = self.tokenizer(word)
+            pieces.append((word, count))
+        return self._merge(pieces, " ", self.max_tokens)
+
+    def _merge(self, pieces: List[Tuple[str, int]], separator: str, first_budget: int) -> List[Tuple[str, int]]:
+        separator_tokens = self.tokenizer(separator)
+        merged: List[Tuple[str, int]] = []
+        texts: List[str] = []
+        tokens = 0
+        budget = first_budget
+        for text, count in pieces:
+            if texts and tokens + separator_tokens + count > budget:
+                merged.append((separator.join(texts), tokens))
+                texts, tokens, budget = [], 0, self.max_tokens
+            tokens += count + (separator_tokens if texts else 0)
+            texts.append(text)
+        if texts:
+            merged.append((separator.join(texts), tokens))
+        return merged
+
+    def chunk_document(self, document: DocumentLike, document_index: int = 0) -> List[Chunk]:
+        """Chunks of one document (``Document`` or raw API dict, e.g. from a watcher event)."""
+        if isinstance(document, dict):
+            document = Document(**normalize_document_input(dict(document)))
+        metadata = document.metadata
+        metadata_dict = metadata.model_dump(exclude_none=True) if isinstance(metadata, DocumentMetadata) else {}
+        source_url = metadata_dict.get("source_url") or metadata_dict.get("url")
+        return [
+            # Fields are already well-typed; skipping validation also shares metadata_dict across chunks
+            Chunk.model_construct(
+                text=text,
+                token_count=tokens,
+                chunk_index=index,
+                document_index=document_index,
+                source_url=source_url,
+                headings=headings,
+                metadata=metadata_dict,
+            )
+            for index, (text, headings, tokens) in enumerate(self.split(document.markdown or ""))
+        ]
+
+    def iter_chunks(self, documents: Iterable[DocumentLike]) -> Iterator[Chunk]:
+        """Stream chunks over documents (e.g. ``client.iter_crawl_documents``), one document at a time."""
+        for document_index, document in enumerate(documents):
+            yield from self.chunk_document(document, document_index)
+
+
+def chunk_documents(documents: Iterable[DocumentLike], max_tokens: int = 512, **kwargs: Any) -> Iterator[Chunk]:
+    """Shorthand for ``MarkdownChunker(max_tokens, **kwargs).iter_chunks(documents)``."""
+    return MarkdownChunker(max_tokens, **kwargs).iter_chunks(documents)
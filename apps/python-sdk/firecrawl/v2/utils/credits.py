@@ -0,0 +1,357 @@
+"""
+Client-side credit ledger with budget guards.
+
+The ledger aggregates the ``creditsUsed`` reported by job status snapshots
+(polls, pagination and watcher messages) and by scraped documents, per job,
+per tag and for the client as a whole. Budgets can be set at each level:
+
+* a job whose own spend exceeds its budget is cancelled at its next snapshot;
+* once a tag or the client budget is exceeded, every running job under it is
+  cancelled at its next snapshot;
+* once a tag or the client budget is exhausted, ``check()`` refuses new work,
+  so crawl/batch starts, batch sub-job feeders and scrapes stop submitting.
+
+Status calls that detect a breach raise ``CreditBudgetExceeded`` once per job
+(carrying the snapshot); watchers cancel the job and keep streaming until its
+terminal snapshot.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from ..types import CreditLedgerStats
+from .batch_split import split_job_id
+from .error_handler import FirecrawlError
+
+logger = logging.getLogger("firecrawl")
+
+DEFAULT_TAG = "default"
+
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Tag attributed to jobs and scrapes started in the current thread or task
+_current_tag: ContextVar[Optional[str]] = ContextVar("firecrawl_credit_tag", default=None)
+
+
+class CreditBudgetExceeded(FirecrawlError):
+    """Raised when a job, tag or client credit budget is exceeded."""
+
+    def __init__(
+        self,
+        scope: str,
+        key: str,
+        spent: float,
+        budget: float,
+        job_id: Optional[str] = None,
+    ):
+        target = f"{scope} {key!r}" if scope != "client" else "client"
+        super().__init__(f"Credit budget exceeded for {target}: {spent:g} of {budget:g} credits used")
+        self.scope = scope
+        self.key = key
+        self.spent = spent
+        self.budget = budget
+        self.job_id = job_id
+        # Snapshot that crossed the budget and whether the job was cancelled
+        self.job: Any = None
+        self.cancelled = False
+
+
+class _Job:
+    __slots__ = ("kind", "tag", "budget", "group", "spent", "breached", "cancelled")
+
+    def __init__(self, kind: str, tag: str, budget: Optional[float]):
+        self.kind = kind
+        self.tag = tag
+        self.budget = budget
+        self.group: Optional[str] = None
+        self.spent = 0.0
+        self.breached = False
+        self.cancelled = False
+
+
+class CreditLedger:
+    """
+    Thread-safe credit accounting per job, per tag and per client.
+
+    Args:
+        budget: Credits the client may spend in total (None for no limit)
+        job_budget: Default budget of every tracked job
+        tag_budgets: Budgets per tag (see ``tagged``)
+        cancel: Cancel jobs that breach a budget (otherwise only report it)
+        on_exceeded: Callback receiving each ``CreditBudgetExceeded`` breach
+    """
+
+    def __init__(
+        self,
+        budget: Optional[float] = None,
+        *,
+        job_budget: Optional[float] = None,
+        tag_budgets: Optional[Dict[str, float]] = None,
+        cancel: bool = True,
+        on_exceeded: Optional[Callable[[CreditBudgetExceeded], None]] = None,
+    ):
+        self.budget = budget
+        self.job_budget = job_budget
+        self.tag_budgets: Dict[str, float] = dict(tag_budgets or {})
+        self.cancel = cancel
+        self.on_exceeded = on_exceeded
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, _Job] = {}
+        # Merged batch IDs -> budget shared by their sub-jobs
+        self._groups: Dict[str, Optional[float]] = {}
+        self._tags: Dict[str, float] = {}
+        self._total = 0.0
+        self._breaches = 0
+
+    @contextmanager
+    def tagged(self, tag: str) -> Iterator[None]:
+        """Attribute jobs and scrapes started inside the block to ``tag``."""
+        token = _current_tag.set(tag)
+        try:
+            yield
+        finally:
+            _current_tag.reset(token)
+
+    def set_budget(self, budget: Optional[float], *, tag: Optional[str] = None) -> None:
+        """Set (or clear with None) the client budget, or the budget of ``tag``."""
+        with self._lock:
+            if tag is None:
+                self.budget = budget
+            elif budget is None:
+                self.tag_budgets.pop(tag, None)
+            else:
+                self.tag_budgets[tag] = budget
+
+    def track(self, job_id: str, kind: str = "crawl", *, tag: Optional[str] = None, budget: Optional[float] = None) -> None:
+        """
+        Register a job before its first snapshot, optionally with its own budget.
+
+        Jobs are tracked automatically when started through the client; call
+        this to give one job a budget. A merged batch ID tracks its sub-jobs,
+        which then share the budget.
+        """
+        with self._lock:
+            sub_job_ids = split_job_id(job_id)
+            if sub_job_ids:
+                self._groups[job_id] = budget if budget is not None else self._groups.get(job_id, self.job_budget)
+                for sub_id in sub_job_ids:
+                    self._job(sub_id, kind, tag).group = job_id
+                return
+            job = self._job(job_id, kind, tag)
+            if budget is not None:
+                job.budget = budget
+
+    def _job(self, job_id: str, kind: str, tag: Optional[str] = None) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self._jobs[job_id] = _Job(kind, tag or _current_tag.get() or DEFAULT_TAG, self.job_budget)
+        elif tag is not None and tag != job.tag:
+            # Move spend already recorded under the old tag
+            self._tags[job.tag] = self._tags.get(job.tag, 0.0) - job.spent
+            self._tags[tag] = self._tags.get(tag, 0.0) + job.spent
+            job.tag = tag
+        return job
+
+    def record_job(self, kind: str, job_id: str, credits_used: Optional[float]) -> Optional[CreditBudgetExceeded]:
+        """
+        Record a job snapshot's cumulative ``credits_used``.
+
+        Returns the breach when the snapshot puts the job, its tag or the
+        client over budget, once per job; None otherwise.
+        """
+        with self._lock:
+            job = self._job(job_id, kind)
+            # Snapshots report cumulative spend; watcher messages may omit it
+            delta = max(0.0, float(credits_used or 0) - job.spent)
+            if delta:
+                job.spent += delta
+                self._tags[job.tag] = self._tags.get(job.tag, 0.0) + delta
+                self._total += delta
+            if job.breached:
+                return None
+            breach = self._breach(job_id, job)
+            if breach is not None:
+                # A merged batch breaches once, whichever sub-job reported it
+                members = [j for j in self._jobs.values() if j.group == job.group] if job.group else [job]
+                for member in members:
+                    member.breached = True
+                self._breaches += 1
+            return breach
+
+    def record_credits(self, credits: Optional[float], *, tag: Optional[str] = None) -> None:
+        """Record credits not tied to a job (e.g. a scraped document's ``credits_used``)."""
+        if not credits:
+            return
+        tag = tag or _current_tag.get() or DEFAULT_TAG
+        with self._lock:
+            self._tags[tag] = self._tags.get(tag, 0.0) + credits
+            self._total += credits
+
+    def _breach(self, job_id: str, job: _Job) -> Optional[CreditBudgetExceeded]:
+        if job.group is not None:
+            budget = self._groups.get(job.group)
+            spent = sum(j.spent for j in self._jobs.values() if j.group == job.group)
+            key = job.group
+        else:
+            budget, spent, key = job.budget, job.spent, job_id
+        if budget is not None and spent > budget:
+            return CreditBudgetExceeded("job", key, spent, budget, job_id=job_id)
+        tag_budget = self.tag_budgets.get(job.tag)
+        if tag_budget is not None and self._tags.get(job.tag, 0.0) > tag_budget:
+            return CreditBudgetExceeded("tag", job.tag, self._tags[job.tag], tag_budget, job_id=job_id)
+        if self.budget is not None and self._total > self.budget:
+            return CreditBudgetExceeded("client", "client", self._total, self.budget, job_id=job_id)
+        return None
+
+    def check(self, tag: Optional[str] = None) -> None:
+        """Raise ``CreditBudgetExceeded`` when the client or tag budget is exhausted."""
+        tag = tag or _current_tag.get() or DEFAULT_TAG
+        with self._lock:
+            tag_budget = self.tag_budgets.get(tag)
+            tag_spent = self._tags.get(tag, 0.0)
+            if self.budget is not None and self._total >= self.budget:
+                raise CreditBudgetExceeded("client", "client", self._total, self.budget)
+            if tag_budget is not None and tag_spent >= tag_budget:
+                raise CreditBudgetExceeded("tag", tag, tag_spent, tag_budget)
+
+    def enforce(
+        self,
+        kind: str,
+        job_id: str,
+        job: Any,
+        cancel: Callable[[str], Any],
+    ) -> Optional[CreditBudgetExceeded]:
+        """
+        Record a snapshot and cancel the job through ``cancel(job_id)`` on a breach;
+        a sub-job of a merged batch cancels the whole batch by its merged ID.
+        """
+        breach = self.record_job(kind, job_id, job.credits_used)
+        if breach is None:
+            return None
+        if self.cancel and job.status not in _TERMINAL_STATUSES:
+            target = self._cancel_target(job_id)
+            try:
+                cancel(target)
+                self._cancelled(target, breach)
+            except Exception as exc:
+                logger.warning("Failed to cancel %s %s over credit budget: %s", kind, target, exc)
+        return self._report(breach, job)
+
+    async def enforce_async(
+        self,
+        kind: str,
+        job_id: str,
+        job: Any,
+        cancel: Callable[[str], Awaitable[Any]],
+    ) -> Optional[CreditBudgetExceeded]:
+        """Async counterpart of ``enforce``."""
+        breach = self.record_job(kind, job_id, job.credits_used)
+        if breach is None:
+            return None
+        if self.cancel and job.status not in _TERMINAL_STATUSES:
+            target = self._cancel_target(job_id)
+            try:
+                await cancel(target)
+                self._cancelled(target, breach)
+            except Exception as exc:
+                logger.warning("Failed to cancel %s %s over credit budget: %s", kind, target, exc)
+        return self._report(breach, job)
+
+    def _cancel_target(self, job_id: str) -> str:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.group if job is not None and job.group is not None else job_id
+
+    def _cancelled(self, job_id: str, breach: CreditBudgetExceeded) -> None:
+        with self._lock:
+            for sub_id in split_job_id(job_id) or [job_id]:
+                if sub_id in self._jobs:
+                    self._jobs[sub_id].cancelled = True
+        breach.cancelled = True
+
+    def _report(self, breach: CreditBudgetExceeded, job: Any) -> CreditBudgetExceeded:
+        breach.job = job
+        logger.warning("%s", breach)
+        if self.on_exceeded is not None:
+            try:
+                self.on_exceeded(breach)
+            except Exception:
+                logger.exception("credit budget callback failed")
+        return breach
+
+    def spent(self, *, job_id: Optional[str] = None, tag: Optional[str] = None) -> float:
+        """Credits recorded for a job (merged IDs sum their sub-jobs), a tag, or in total."""
+        with self._lock:
+            if job_id is not None:
+                sub_job_ids = split_job_id(job_id) or [job_id]
+                return sum(self._jobs[i].spent for i in sub_job_ids if i in self._jobs)
+            if tag is not None:
+                return self._tags.get(tag, 0.0)
+            return self._total
+
+    def remaining(self, tag: Optional[str] = None) -> Optional[float]:
+        """Credits left in the client budget (or the budget of ``tag``); None when unlimited."""
+        with self._lock:
+            if tag is not None:
+                budget = self.tag_budgets.get(tag)
+                return None if budget is None else max(0.0, budget - self._tags.get(tag, 0.0))
+            return None if self.budget is None else max(0.0, self.budget - self._total)
+
+    def stats(self) -> CreditLedgerStats:
+        with self._lock:
+            cancelled: List[str] = [job_id for job_id, job in self._jobs.items() if job.cancelled]
+            return CreditLedgerStats(
+                total=self._total,
+                budget=self.budget,
+                remaining=None if self.budget is None else max(0.0, self.budget - self._total),
+                by_job={job_id: job.spent for job_id, job in self._jobs.items()},
+                by_tag=dict(self._tags),
+                breaches=self._breaches,
+                cancelled_jobs=cancelled,
+            )
+
+
+def ledger_of(client: Any) -> Optional[CreditLedger]:
+    ledger = getattr(client, "credit_ledger", None)
+    return ledger if isinstance(ledger, CreditLedger) else None
+
+
+def check_budget(client: Any) -> None:
+    """``ledger.check()`` for the client's ledger, if any."""
+    ledger = ledger_of(client)
+    if ledger is not None:
+        ledger.check()
+
+
+def track_job(client: Any, kind: str, job_id: Optional[str]) -> None:
+    ledger = ledger_of(client)
+    if ledger is not None and job_id:
+        ledger.track(job_id, kind)
+
+
+def settle_job(client: Any, kind: str, job_id: str, job: Any, cancel: Callable[[Any, str], Any]) -> None:
+    """Record a status snapshot; on a breach cancel via ``cancel(client, job_id)`` and raise."""
+    ledger = ledger_of(client)
+    if ledger is None:
+        return
+    breach = ledger.enforce(kind, job_id, job, lambda i: cancel(client, i))
+    if breach is not None:
+        raise breach
+
+
+async def settle_job_async(
+    client: Any,
+    kind: str,
+    job_id: str,
+    job: Any,
+    cancel: Callable[[Any, str], Awaitable[Any]],
+) -> None:
+    ledger = ledger_of(client)
+    if ledger is None:
+        return
+    breach = await ledger.enforce_async(kind, job_id, job, lambda i: cancel(client, i))
+    if breach is not None:
+        raise breach
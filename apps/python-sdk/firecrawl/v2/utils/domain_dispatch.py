@@ -0,0 +1,394 @@
+"""
+Per-domain politeness and fairness for fan-out scraping.
+
+``DomainDispatcher`` hands out request slots per registrable domain: waiting
+requests are served round-robin across domains, each domain has an in-flight
+cap, and caps adapt (AIMD) to the domain's observed latency and error rate.
+A slow or failing origin therefore shrinks to a few slots instead of holding
+most of the client's concurrency.
+
+Usage:
+    dispatcher = DomainDispatcher(max_concurrency=20)
+    client = AsyncFirecrawlClient(domain_dispatcher=dispatcher)
+    await asyncio.gather(*(client.scrape(u) for u in urls))
+    print(dispatcher.stats())
+
+For server-side batches, ``interleave_by_domain`` reorders URLs so that no
+host dominates a contiguous run of the job.
+"""
+
+import asyncio
+import ipaddress
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from ..types import DomainStats
+from .error_handler import FirecrawlError
+
+T = TypeVar("T")
+
+# Common second-level public suffixes; enough to group hosts without a PSL dependency
+_MULTI_PART_SUFFIXES = frozenset({
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "me.uk", "ltd.uk", "plc.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "co.nz", "org.nz", "co.jp", "ne.jp", "or.jp", "ac.jp",
+    "com.br", "com.cn", "com.mx", "com.ar", "com.tr", "com.sg", "com.hk", "com.tw",
+    "co.in", "co.za", "co.kr", "co.il", "com.my", "com.ph", "com.vn",
+    "github.io", "gitlab.io", "herokuapp.com", "vercel.app", "netlify.app", "pages.dev",
+    "blogspot.com", "cloudfront.net", "appspot.com", "azurewebsites.net",
+})
+
+
+def registrable_domain(url: str) -> str:
+    """
+    Best-effort registrable domain (eTLD+1) of a URL, e.g. ``docs.example.co.uk``
+    -> ``example.co.uk``. IP addresses and single-label hosts are returned as-is.
+    """
+    try:
+        host = (urlsplit(url.strip()).hostname or "").lower().rstrip(".")
+    except ValueError:
+        return ""
+    if not host:
+        return ""
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+    labels = host.split(".")
+    if len(labels) <= 2:
+        return host
+    if ".".join(labels[-2:]) in _MULTI_PART_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def interleave_by_domain(urls: Iterable[str]) -> List[str]:
+    """Reorder URLs round-robin across registrable domains, keeping per-domain order."""
+    groups: "OrderedDict[str, Deque[str]]" = OrderedDict()
+    for url in urls:
+        groups.setdefault(registrable_domain(url), deque()).append(url)
+    ordered: List[str] = []
+    queues = list(groups.values())
+    while queues:
+        remaining = []
+        for queue in queues:
+            ordered.append(queue.popleft())
+            if queue:
+                remaining.append(queue)
+        queues = remaining
+    return ordered
+
+
+class _Domain:
+    __slots__ = ("cap", "in_flight", "waiters", "completed", "errors", "latency", "error_rate")
+
+    def __init__(self, cap: float):
+        self.cap = cap
+        self.in_flight = 0
+        self.waiters: Deque[Callable[[], None]] = deque()
+        self.completed = 0
+        self.errors = 0
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+
+
+def is_origin_error(exc: BaseException) -> bool:
+    """
+    Whether ``exc`` says the origin is struggling: a scrape that failed with a
+    5xx or timed out (408). Cancellations, local timeouts, credit-budget stops
+    and Firecrawl's own refusals (402, 429, ...) say nothing about the origin.
+    """
+    if not isinstance(exc, FirecrawlError) or exc.status_code is None:
+        return False
+    return exc.status_code == 408 or exc.status_code >= 500
+
+
+class DomainLease:
+    """
+    Handle yielded by a domain slot. ``measure()`` marks the request whose
+    latency is sampled; without it the whole slot body is timed.
+    """
+
+    __slots__ = ("_started", "latency")
+
+    def __init__(self):
+        self._started = time.monotonic()
+        self.latency: Optional[float] = None
+
+    @contextmanager
+    def measure(self):
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.latency = time.monotonic() - started
+
+    def elapsed(self) -> float:
+        return self.latency if self.latency is not None else time.monotonic() - self._started
+
+
+class _NullLease:
+    __slots__ = ()
+
+    def measure(self):
+        return nullcontext()
+
+
+NULL_LEASE = _NullLease()
+
+
+class DomainDispatcher:
+    """
+    Round-robin, per-domain capped slot dispatcher with adaptive caps.
+
+    Caps grow additively (+1/cap per healthy completion) and shrink
+    multiplicatively on origin errors (x0.5) or when a domain's latency EWMA exceeds
+    ``slow_factor`` times the EWMA across all domains (x0.75).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        *,
+        initial_cap: int = 4,
+        min_cap: int = 1,
+        max_cap: int = 16,
+        slow_factor: float = 2.0,
+        smoothing: float = 0.2,
+        min_samples: int = 3,
+    ):
+        """
+        Args:
+            max_concurrency: Global in-flight limit across all domains (None for no limit)
+            initial_cap: Starting in-flight cap for a newly seen domain
+            min_cap: Lower bound for any domain's cap
+            max_cap: Upper bound for any domain's cap
+            slow_factor: Latency ratio (domain vs. overall) treated as congestion
+            smoothing: EWMA weight of the newest latency/error sample
+            min_samples: Completions required before latency adjusts a cap
+        """
+        if not 1 <= min_cap <= initial_cap <= max_cap:
+            raise ValueError("caps must satisfy 1 <= min_cap <= initial_cap <= max_cap")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self.max_concurrency = max_concurrency
+        self.initial_cap = initial_cap
+        self.min_cap = min_cap
+        self.max_cap = max_cap
+        self.slow_factor = slow_factor
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+
+        self._domains: "OrderedDict[str, _Domain]" = OrderedDict()
+        self._rr: Deque[str] = deque()
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._lock = threading.Lock()
+
+    # Dispatch
+
+    def _domain_locked(self, key: str) -> _Domain:
+        domain = self._domains.get(key)
+        if domain is None:
+            domain = self._domains[key] = _Domain(float(self.initial_cap))
+        return domain
+
+    def _has_capacity_locked(self, domain: _Domain) -> bool:
+        if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+            return False
+        return domain.in_flight < int(domain.cap)
+
+    def _grant_locked(self, domain: _Domain, notify: Callable[[], None]) -> None:
+        domain.in_flight += 1
+        self._in_flight += 1
+        notify()
+
+    def _dispatch_locked(self) -> None:
+        # Visit domains with waiters in round-robin order until no grant is possible
+        progressed = True
+        while progressed and self._rr:
+            progressed = False
+            for _ in range(len(self._rr)):
+                key = self._rr[0]
+                self._rr.rotate(-1)
+                domain = self._domains[key]
+                if not domain.waiters:
+                    # Emptied by a withdrawn waiter; keep scanning the other domains
+                    self._rr.remove(key)
+                    progressed = True
+                    break
+                if self._has_capacity_locked(domain):
+                    self._grant_locked(domain, domain.waiters.popleft())
+                    if not domain.waiters:
+                        self._rr.remove(key)
+                    progressed = True
+                    break
+
+    def _submit(self, key: str, notify: Callable[[], None]) -> Callable[[], None]:
+        with self._lock:
+            domain = self._domain_locked(key)
+            if not domain.waiters and self._has_capacity_locked(domain):
+                self._grant_locked(domain, notify)
+            else:
+                domain.waiters.append(notify)
+                if key not in self._rr:
+                    self._rr.append(key)
+        return notify
+
+    def _withdraw(self, key: str, notify: Callable[[], None]) -> bool:
+        """Remove a pending waiter. Returns False if it had already been granted."""
+        with self._lock:
+            domain = self._domains[key]
+            try:
+                domain.waiters.remove(notify)
+            except ValueError:
+                return False
+            if not domain.waiters and key in self._rr:
+                self._rr.remove(key)
+            return True
+
+    def release(self, url: str, latency: Optional[float] = None, error: bool = False, record: bool = True) -> None:
+        """
+        Return a slot for ``url`` and feed the outcome into the domain's cap;
+        with ``record=False`` the slot is returned without an outcome.
+        """
+        key = registrable_domain(url)
+        with self._lock:
+            domain = self._domains[key]
+            domain.in_flight -= 1
+            self._in_flight -= 1
+            if record:
+                self._record_locked(domain, latency, error)
+            self._dispatch_locked()
+
+    def _record_locked(self, domain: _Domain, latency: Optional[float], error: bool) -> None:
+        a = self.smoothing
+        domain.completed += 1
+        domain.error_rate = (1 - a) * domain.error_rate + a * (1.0 if error else 0.0)
+        if error:
+            domain.errors += 1
+            domain.cap = max(float(self.min_cap), domain.cap * 0.5)
+            return
+        if latency is not None:
+            domain.latency = latency if domain.latency is None else (1 - a) * domain.latency + a * latency
+            self._latency = latency if self._latency is None else (1 - a) * self._latency + a * latency
+        slow = (
+            domain.completed >= self.min_samples
+            and domain.latency is not None
+            and self._latency
+            and domain.latency > self.slow_factor * self._latency
+        )
+        if slow:
+            domain.cap = max(float(self.min_cap), domain.cap * 0.75)
+        else:
+            domain.cap = min(float(self.max_cap), domain.cap + 1.0 / domain.cap)
+
+    def acquire(self, url: str, timeout: Optional[float] = None) -> None:
+        """Block until a slot for ``url``'s domain is granted; pair with ``release``."""
+        key = registrable_domain(url)
+        event = threading.Event()
+        notify = self._submit(key, event.set)
+        if not event.wait(timeout):
+            # Also returns the slot if it was granted right as the wait timed out
+            if not self._withdraw(key, notify):
+                self.release(url, record=False)
+            raise TimeoutError(f"Timed out waiting for a slot for {key or url}")
+
+    async def acquire_async(self, url: str) -> None:
+        key = registrable_domain(url)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        self._submit(key, notify)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not self._withdraw(key, notify):
+                self.release(url, record=False)
+            raise
+
+    def _settle(self, url: str, lease: DomainLease, exc: Optional[BaseException] = None) -> None:
+        if exc is None:
+            self.release(url, lease.elapsed())
+        elif is_origin_error(exc):
+            self.release(url, error=True)
+        else:
+            self.release(url, record=False)
+
+    @contextmanager
+    def slot(self, url: str, timeout: Optional[float] = None):
+        """
+        Hold a slot for ``url``, yielding a ``DomainLease``. The request latency
+        and origin errors (see ``is_origin_error``) adjust the domain cap.
+        """
+        self.acquire(url, timeout)
+        lease = DomainLease()
+        try:
+            yield lease
+        except BaseException as exc:
+            self._settle(url, lease, exc)
+            raise
+        self._settle(url, lease)
+
+    @asynccontextmanager
+    async def slot_async(self, url: str):
+        await self.acquire_async(url)
+        lease = DomainLease()
+        try:
+            yield lease
+        except BaseException as exc:
+            self._settle(url, lease, exc)
+            raise
+        self._settle(url, lease)
+
+    # Fan-out helpers
+
+    def map(self, fn: Callable[[str], T], urls: Iterable[str], max_workers: int = 16) -> List[T]:
+        """Run ``fn(url)`` for every URL on a thread pool under the dispatcher; results in input order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(url: str) -> T:
+            with self.slot(url):
+                return fn(url)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            return list(pool.map(run, urls))
+
+    async def map_async(
+        self,
+        fn: Callable[[str], Awaitable[T]],
+        urls: Iterable[str],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Await ``fn(url)`` for every URL under the dispatcher; results in input order."""
+
+        async def run(url: str) -> T:
+            async with self.slot_async(url):
+                return await fn(url)
+
+        return await asyncio.gather(*(run(url) for url in urls), return_exceptions=return_exceptions)
+
+    # Metrics
+
+    def stats(self) -> Dict[str, DomainStats]:
+        with self._lock:
+            return {
+                key: DomainStats(
+                    cap=int(domain.cap),
+                    in_flight=domain.in_flight,
+                    queued=len(domain.waiters),
+                    completed=domain.completed,
+                    errors=domain.errors,
+                    error_rate=domain.error_rate,
+                    latency_seconds=domain.latency,
+                )
+                for key, domain in self._domains.items()
+            }
@@ -41,6 +41,24 @@ class RequestTimeoutError(FirecrawlError):
     pass
 
 
+class ConflictError(FirecrawlError):
+    """Raised when an idempotency key was already used (409)."""
+    pass
+
+
+class IdempotencyConflictError(ConflictError):
+    """Raised when our idempotency key was already used and its job is not known locally (409)."""
+
+    def __init__(self, idempotency_key: str, response: Optional[requests.Response] = None):
+        super().__init__(
+            f"Idempotency key {idempotency_key} was already used and the job it started is not recorded "
+            "locally. Look it up with get_active_crawls() instead of submitting again.",
+            status_code=409,
+            response=response,
+        )
+        self.idempotency_key = idempotency_key
+
+
 class RateLimitError(FirecrawlError):
     """Raised when the rate limit is exceeded (429)."""
     pass
@@ -96,6 +114,9 @@ def handle_response_error(response: requests.Response, action: str) -> None:
     elif response.status_code == 408:
         message = f"Request Timeout: Failed to {action} as the request timed out. {error_message} - {error_details}"
         raise RequestTimeoutError(message, response.status_code, response)
+    elif response.status_code == 409:
+        message = f"Conflict: Failed to {action}. {error_message} - {error_details}"
+        raise ConflictError(message, response.status_code, response)
     elif response.status_code == 429:
         message = f"Rate Limit Exceeded: Failed to {action}. {error_message} - {error_details}"
         raise RateLimitError(message, response.status_code, response)
@@ -0,0 +1,281 @@
+"""
+Columnar export of scraped documents to Arrow record batches and Parquet.
+
+Documents are consumed from any iterable (e.g. ``client.iter_crawl_documents``)
+or pushed one at a time (e.g. from a watcher's ``document`` events), and are
+buffered only up to one record batch / row group. Metadata is flattened into
+``metadata_<field>`` columns following ``DocumentMetadata``.
+
+Requires the optional ``pyarrow`` dependency (``pip install pyarrow``).
+
+Usage:
+    rows = write_parquet(client.iter_crawl_documents(job_id), "crawl.parquet")
+
+    with ParquetDocumentWriter("batch.parquet") as writer:
+        watcher.add_event_listener("document", lambda e: writer.write(e["data"]))
+        watcher.start()
+        ...
+"""
+
+import json
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, get_args, get_origin
+
+from ..types import Document, DocumentMetadata
+from .normalize import normalize_document_input
+
+DocumentLike = Union[Document, Dict[str, Any]]
+
+# Potentially large text bodies use 64-bit offsets so a row group can exceed 2 GiB
+LARGE_TEXT_COLUMNS = ("markdown", "html", "raw_html")
+TEXT_COLUMNS = ("summary", "screenshot", "warning")
+LIST_COLUMNS = ("links", "images")
+JSON_COLUMNS = ("json", "actions", "change_tracking")
+
+METADATA_PREFIX = "metadata_"
+
+
+def _metadata_kind(annotation: Any) -> str:
+    args = get_args(annotation) or (annotation,)
+    if int in args:
+        return "int"
+    if str not in args and any(get_origin(arg) in (list, List) for arg in args):
+        return "list"
+    return "str"
+
+
+# (field name, kind) for every DocumentMetadata field, in declaration order
+METADATA_FIELDS: Tuple[Tuple[str, str], ...] = tuple(
+    (name, _metadata_kind(field.annotation)) for name, field in DocumentMetadata.model_fields.items()
+)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet export. Install it with `pip install pyarrow`."
+        ) from exc
+    return pyarrow
+
+
+def document_schema():
+    """Return the Arrow schema used for exported documents."""
+    pa = _require_pyarrow()
+    fields = [pa.field(name, pa.large_string()) for name in LARGE_TEXT_COLUMNS]
+    fields += [pa.field(name, pa.string()) for name in TEXT_COLUMNS]
+    fields += [pa.field(name, pa.list_(pa.string())) for name in LIST_COLUMNS]
+    fields += [pa.field(name, pa.string()) for name in JSON_COLUMNS]
+    metadata_types = {"int": pa.int64(), "list": pa.list_(pa.string()), "str": pa.string()}
+    fields += [pa.field(METADATA_PREFIX + name, metadata_types[kind]) for name, kind in METADATA_FIELDS]
+    return pa.schema(fields)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return json.dumps(value, default=str)
+
+
+def _to_str(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return ", ".join(str(item) for item in value)
+    return str(value)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_list(value: Any) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+_CONVERTERS = {"int": _to_int, "list": _to_list, "str": _to_str}
+
+
+class _ColumnBuffer:
+    """Column-wise buffer holding references to document values until the next flush."""
+
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.columns = {name: [] for name in self._names()}
+
+    @staticmethod
+    def _names() -> Iterator[str]:
+        yield from LARGE_TEXT_COLUMNS
+        yield from TEXT_COLUMNS
+        yield from LIST_COLUMNS
+        yield from JSON_COLUMNS
+        for name, _ in METADATA_FIELDS:
+            yield METADATA_PREFIX + name
+
+    def __len__(self) -> int:
+        return len(self.columns[LARGE_TEXT_COLUMNS[0]])
+
+    def append(self, document: DocumentLike) -> None:
+        if isinstance(document, Document):
+            get = document.__dict__.get
+        elif isinstance(document, dict):
+            get = normalize_document_input(document).get
+        else:
+            raise TypeError(f"Expected Document or dict, got {type(document).__name__}")
+
+        cols = self.columns
+        # Text bodies are appended by reference; Arrow copies them once when the batch is built
+        for name in LARGE_TEXT_COLUMNS:
+            cols[name].append(get(name))
+        for name in TEXT_COLUMNS:
+            cols[name].append(_to_str(get(name)))
+        for name in LIST_COLUMNS:
+            cols[name].append(_to_list(get(name)))
+        for name in JSON_COLUMNS:
+            cols[name].append(_to_json(get(name)))
+
+        metadata = get("metadata")
+        if isinstance(metadata, DocumentMetadata):
+            md_get = metadata.__dict__.get
+        elif isinstance(metadata, dict):
+            md_get = metadata.get
+        else:
+            md_get = None
+        for name, kind in METADATA_FIELDS:
+            value = md_get(name) if md_get is not None else None
+            cols[METADATA_PREFIX + name].append(_CONVERTERS[kind](value))
+
+    def to_record_batch(self, schema):
+        pa = _require_pyarrow()
+        arrays = [pa.array(self.columns[field.name], type=field.type) for field in schema]
+        batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+        self.reset()
+        return batch
+
+
+def iter_record_batches(documents: Iterable[DocumentLike], batch_size: int = 1000) -> Iterator[Any]:
+    """
+    Convert documents into Arrow record batches of at most ``batch_size`` rows.
+
+    Args:
+        documents: Iterable of Document objects or raw API document dicts
+        batch_size: Maximum rows per record batch
+
+    Yields:
+        pyarrow.RecordBatch objects using ``document_schema()``
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    schema = document_schema()
+    buffer = _ColumnBuffer()
+    for document in documents:
+        buffer.append(document)
+        if len(buffer) >= batch_size:
+            yield buffer.to_record_batch(schema)
+    if len(buffer):
+        yield buffer.to_record_batch(schema)
+
+
+def documents_to_table(documents: Iterable[DocumentLike], batch_size: int = 1000):
+    """Build a pyarrow.Table from documents (e.g. for ``duckdb.arrow(table)``)."""
+    pa = _require_pyarrow()
+    return pa.Table.from_batches(list(iter_record_batches(documents, batch_size)), schema=document_schema())
+
+
+class ParquetDocumentWriter:
+    """
+    Incremental Parquet writer; each buffered batch becomes one row group.
+
+    Thread-safe, so ``write`` can be used directly as a watcher event listener.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 1000, compression: str = "zstd"):
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._schema = document_schema()
+        self._buffer = _ColumnBuffer()
+        self._lock = threading.Lock()
+        self._writer: Optional[Any] = pq.ParquetWriter(path, self._schema, compression=compression)
+        self._pa = pa
+
+    def write(self, document: DocumentLike) -> None:
+        with self._lock:
+            if self._writer is None:
+                raise ValueError("ParquetDocumentWriter is closed")
+            self._buffer.append(document)
+            if len(self._buffer) >= self.row_group_size:
+                self._flush_locked()
+
+    def write_many(self, documents: Iterable[DocumentLike]) -> None:
+        for document in documents:
+            self.write(document)
+
+    def _flush_locked(self) -> None:
+        rows = len(self._buffer)
+        if not rows:
+            return
+        batch = self._buffer.to_record_batch(self._schema)
+        self._writer.write_table(self._pa.Table.from_batches([batch]), row_group_size=rows)
+        self.rows_written += rows
+
+    def flush(self) -> None:
+        """Write buffered documents as a (possibly short) row group."""
+        with self._lock:
+            if self._writer is not None:
+                self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                return
+            self._flush_locked()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ParquetDocumentWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def write_parquet(
+    documents: Iterable[DocumentLike],
+    path: str,
+    row_group_size: int = 1000,
+    compression: str = "zstd",
+) -> int:
+    """
+    Stream documents into a Parquet file.
+
+    Args:
+        documents: Iterable of Document objects or raw API document dicts
+        path: Destination file
+        row_group_size: Rows buffered per row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    with ParquetDocumentWriter(path, row_group_size=row_group_size, compression=compression) as writer:
+        writer.write_many(documents)
+    return writer.rows_written
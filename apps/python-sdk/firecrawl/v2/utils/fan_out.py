@@ -0,0 +1,160 @@
+"""
+Bounded-concurrency fan-out behind the clients' ``scrape_many``, ``map_many``
+and ``search_many``.
+
+    for result in client.scrape_many(urls, concurrency=16, formats=["markdown"]):
+        if result.ok:
+            store(result.index, result.value)
+        else:
+            log.warning("%s failed: %s", result.item, result.error)
+
+    async for result in async_client.scrape_many(urls, concurrency=64):
+        ...
+
+Results are yielded as calls complete, each carrying the input's position
+(``index``) so callers can restore input order. A failing item does not stop
+the others; its exception is kept on the result. Inputs are consumed lazily,
+so a generator of a million URLs never has more than ``concurrency`` calls in
+flight.
+
+Every call goes through the client's regular path (cache, single-flight,
+scheduler and domain dispatcher slots, transport retries). A 429 is retried
+per item after the server's ``Retry-After`` or, without one, an exponential
+backoff. Closing the iterator early stops submitting new calls.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from .error_handler import RateLimitError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 10
+
+
+@dataclass
+class ItemResult(Generic[T, R]):
+    """Outcome of one input of a ``*_many`` call."""
+
+    index: int
+    item: T
+    value: Optional[R] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> R:
+        """The value, or the item's exception re-raised."""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+def rate_limit_delay(error: RateLimitError, attempt: int, backoff: float) -> float:
+    """Seconds to wait before retrying a 429: ``Retry-After`` when numeric, else ``backoff * 2**attempt``."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        retry_after = float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        retry_after = -1.0
+    return retry_after if retry_after >= 0 else backoff * (2 ** attempt)
+
+
+def _call(fn: Callable[[T], R], item: T, retries: int, backoff: float) -> R:
+    attempt = 0
+    while True:
+        try:
+            return fn(item)
+        except RateLimitError as e:
+            if attempt >= retries:
+                raise
+            time.sleep(rate_limit_delay(e, attempt, backoff))
+            attempt += 1
+
+
+async def _call_async(fn: Callable[[T], Awaitable[R]], item: T, retries: int, backoff: float) -> R:
+    attempt = 0
+    while True:
+        try:
+            return await fn(item)
+        except RateLimitError as e:
+            if attempt >= retries:
+                raise
+            await asyncio.sleep(rate_limit_delay(e, attempt, backoff))
+            attempt += 1
+
+
+def iter_bounded(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    *,
+    rate_limit_retries: int = 2,
+    rate_limit_backoff: float = 1.0,
+) -> Iterator[ItemResult]:
+    """
+    Apply ``fn`` to ``items`` on a thread pool with at most ``concurrency``
+    calls in flight, yielding an ``ItemResult`` per item as it completes.
+    """
+    concurrency = max(1, concurrency)
+    source = enumerate(items)
+    pending: Dict[Future, Tuple[int, Any]] = {}
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="firecrawl-many")
+    try:
+        while True:
+            for index, item in itertools.islice(source, concurrency - len(pending)):
+                # Each call runs in a copy of the caller's context (e.g. its active trace span)
+                future = pool.submit(
+                    contextvars.copy_context().run, _call, fn, item, rate_limit_retries, rate_limit_backoff
+                )
+                pending[future] = (index, item)
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: pending[f][0]):
+                index, item = pending.pop(future)
+                error = future.exception()
+                yield ItemResult(index, item, None if error is not None else future.result(), error)
+    finally:
+        for future in pending:
+            future.cancel()
+        # In-flight calls of an abandoned iterator finish in the background
+        pool.shutdown(wait=False)
+
+
+async def aiter_bounded(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    *,
+    rate_limit_retries: int = 2,
+    rate_limit_backoff: float = 1.0,
+) -> AsyncIterator[ItemResult]:
+    """Async counterpart of ``iter_bounded``: tasks on the running loop instead of threads."""
+    concurrency = max(1, concurrency)
+    source = enumerate(items)
+    pending: Dict["asyncio.Task[Any]", Tuple[int, Any]] = {}
+    try:
+        while True:
+            for index, item in itertools.islice(source, concurrency - len(pending)):
+                task = asyncio.ensure_future(_call_async(fn, item, rate_limit_retries, rate_limit_backoff))
+                pending[task] = (index, item)
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: pending[t][0]):
+                index, item = pending.pop(task)
+                error = task.exception()
+                yield ItemResult(index, item, None if error is not None else task.result(), error)
+    finally:
+        for task in pending:
+            task.cancel()
@@ -1,8 +1,16 @@
-import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=None)
 def get_version():
+    # ``__version__`` is assigned before any submodule import in firecrawl/__init__.py,
+    # so it is available even while the package is still initializing
+    try:
+        from ... import __version__
+        return __version__
+    except ImportError:
+        pass
     try:
         package_path = Path(__file__).parents[2]
         version_file = (package_path / "__init__.py").read_text()
@@ -12,4 +20,4 @@ def get_version():
         return "3.x.x"
     except Exception as e:
         print(f"Failed to get version from __init__.py: {e}")
-        return "3.x.x"
\ No newline at end of file
+        return "3.x.x"
@@ -0,0 +1,311 @@
+"""
+Lifecycle hooks for the v2 transports and response parsing.
+
+Register callbacks on a ``Hooks`` instance and pass it to the client:
+
+    hooks = Hooks()
+    hooks.on_response(lambda e: print(e.method, e.endpoint, e.status_code, e.network_seconds))
+    hooks.on_parse(lambda e: print(e.operation, e.timings))
+    client = Firecrawl(api_key="...", hooks=hooks)
+
+Events:
+    on_request   RequestEvent   before each HTTP attempt (``headers`` may be modified)
+    on_response  ResponseEvent  after each attempt, with the response or the error
+    on_retry     RetryEvent     before sleeping between attempts
+    on_page      PageEvent      after each page of a job status has been parsed
+    on_parse     ParseEvent     after a call has produced its SDK models
+
+Parse timings are split into phases: ``payload`` (request building),
+``network`` (transport call including retries), ``decode`` (JSON),
+``normalize`` (API → SDK field mapping) and ``model`` (Pydantic construction).
+
+When no callback is registered for an event, it is neither built nor timed,
+and parsers get a no-op timer unless the client's profiler (``profiling.py``)
+samples the call; the same marks then also accumulate CPU time per phase.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .profiling import Profiler, profiler_of
+
+logger = logging.getLogger("firecrawl")
+
+PHASES = ("payload", "network", "decode", "normalize", "model")
+
+
+@dataclass
+class RequestEvent:
+    method: str
+    endpoint: str
+    url: str
+    attempt: int
+    headers: Dict[str, str]
+    bytes_out: Optional[int] = None
+
+
+@dataclass
+class ResponseEvent:
+    method: str
+    endpoint: str
+    url: str
+    attempt: int
+    status_code: Optional[int]
+    bytes_in: Optional[int]
+    bytes_out: Optional[int]
+    network_seconds: float
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class RetryEvent:
+    method: str
+    endpoint: str
+    attempt: int
+    delay: float
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class PageEvent:
+    operation: str
+    endpoint: str
+    page: int
+    status_code: Optional[int]
+    bytes_in: Optional[int]
+    documents: int
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ParseEvent:
+    operation: str
+    endpoint: str
+    status_code: Optional[int]
+    bytes_in: Optional[int]
+    documents: int
+    pages: int
+    timings: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+
+def body_size(body: Any) -> Optional[int]:
+    """Length of an encoded body, or None when it is not available as bytes/str."""
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return None
+
+
+def _response_size(response: Any) -> Optional[int]:
+    try:
+        return body_size(response.content)
+    except Exception:
+        return None
+
+
+class Hooks:
+    """Callback registry shared by a client's transport and parsers."""
+
+    def __init__(self):
+        self.request: List[Callable[[RequestEvent], None]] = []
+        self.response: List[Callable[[ResponseEvent], None]] = []
+        self.retry: List[Callable[[RetryEvent], None]] = []
+        self.page: List[Callable[[PageEvent], None]] = []
+        self.parse: List[Callable[[ParseEvent], None]] = []
+
+    # Registration (each returns the callback, so they also work as decorators)
+
+    def on_request(self, callback: Callable[[RequestEvent], None]) -> Callable[[RequestEvent], None]:
+        self.request.append(callback)
+        return callback
+
+    def on_response(self, callback: Callable[[ResponseEvent], None]) -> Callable[[ResponseEvent], None]:
+        self.response.append(callback)
+        return callback
+
+    def on_retry(self, callback: Callable[[RetryEvent], None]) -> Callable[[RetryEvent], None]:
+        self.retry.append(callback)
+        return callback
+
+    def on_page(self, callback: Callable[[PageEvent], None]) -> Callable[[PageEvent], None]:
+        self.page.append(callback)
+        return callback
+
+    def on_parse(self, callback: Callable[[ParseEvent], None]) -> Callable[[ParseEvent], None]:
+        self.parse.append(callback)
+        return callback
+
+    @property
+    def transport_active(self) -> bool:
+        return bool(self.request or self.response or self.retry)
+
+    @property
+    def parse_active(self) -> bool:
+        return bool(self.page or self.parse)
+
+    def emit(self, callbacks: List[Callable[[Any], None]], event: Any) -> None:
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                # A failing hook must never break the request it observes
+                logger.exception("Firecrawl hook %r failed", callback)
+
+    def response_event(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        attempt: int,
+        started: float,
+        response: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if not self.response:
+            return
+        elapsed = time.perf_counter() - started
+        status_code = bytes_in = bytes_out = None
+        if response is not None:
+            status_code = getattr(response, "status_code", None)
+            bytes_in = _response_size(response)
+            request = getattr(response, "request", None)
+            # requests exposes the sent body as ``body``, httpx as ``content``
+            bytes_out = body_size(getattr(request, "body", None))
+            if bytes_out is None:
+                try:
+                    bytes_out = body_size(getattr(request, "content", None))
+                except Exception:
+                    bytes_out = None
+        self.emit(
+            self.response,
+            ResponseEvent(method, endpoint, url, attempt, status_code, bytes_in, bytes_out, elapsed, error),
+        )
+
+
+class PhaseTimer:
+    """
+    Accumulates per-phase timings for one parse operation and emits page/parse
+    events to ``hooks`` and/or per-phase CPU time to ``profiler``.
+    """
+
+    __slots__ = (
+        "hooks", "operation", "endpoint", "timings", "pages", "bytes_in", "_start", "_last", "_page_start",
+        "profiler", "cpu", "calls", "_cpu_last",
+    )
+
+    def __init__(self, hooks: Optional[Hooks], operation: str, endpoint: str = "", profiler: Optional[Profiler] = None):
+        self.hooks = hooks
+        self.operation = operation
+        self.endpoint = endpoint
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.pages = 0
+        self.bytes_in: Optional[int] = None
+        self._start = self._last = time.perf_counter()
+        self._page_start = dict(self.timings)
+        self.profiler = profiler
+        self.cpu: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._cpu_last = profiler.clock() if profiler is not None else 0.0
+
+    def mark(self, phase: str) -> None:
+        """Attribute the time since the previous mark to ``phase``."""
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + (now - self._last)
+        self._last = now
+        if self.profiler is not None:
+            cpu_now = self.profiler.clock()
+            self.cpu[phase] = self.cpu.get(phase, 0.0) + (cpu_now - self._cpu_last)
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+            self._cpu_last = cpu_now
+
+    def skip(self) -> None:
+        """Exclude the time since the previous mark (e.g. spent in the caller of a generator)."""
+        self._last = time.perf_counter()
+        if self.profiler is not None:
+            self._cpu_last = self.profiler.clock()
+
+    def _flush_profile(self, finished: bool) -> None:
+        if self.profiler is not None:
+            self.profiler.record(self.operation, self.cpu, self.calls, finished)
+            self.cpu, self.calls = {}, {}
+
+    def page(self, endpoint: str, response: Any, documents: int) -> None:
+        """Close out one page of a paginated result."""
+        self.pages += 1
+        size = _response_size(response)
+        if size is not None:
+            self.bytes_in = (self.bytes_in or 0) + size
+        if self.hooks is not None and self.hooks.page:
+            delta = {k: v - self._page_start.get(k, 0.0) for k, v in self.timings.items()}
+            self.hooks.emit(
+                self.hooks.page,
+                PageEvent(
+                    self.operation,
+                    endpoint,
+                    self.pages,
+                    getattr(response, "status_code", None),
+                    size,
+                    documents,
+                    delta,
+                ),
+            )
+        self._page_start = dict(self.timings)
+        self._flush_profile(finished=False)
+
+    def finish(self, response: Any, documents: int) -> None:
+        """Emit the parse event; ``response`` is the first (or only) response of the call."""
+        self._flush_profile(finished=True)
+        if self.hooks is not None and self.hooks.parse:
+            self.hooks.emit(
+                self.hooks.parse,
+                ParseEvent(
+                    self.operation,
+                    self.endpoint,
+                    getattr(response, "status_code", None),
+                    self.bytes_in if self.pages else _response_size(response),
+                    documents,
+                    self.pages,
+                    dict(self.timings),
+                    time.perf_counter() - self._start,
+                ),
+            )
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def skip(self) -> None:
+        pass
+
+    def page(self, endpoint: str, response: Any, documents: int) -> None:
+        pass
+
+    def finish(self, response: Any, documents: int) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+def phase_timer(client: Any, operation: str, endpoint: str = ""):
+    """
+    Timer for a parse operation on ``client``; a shared no-op unless parse hooks
+    are registered or the client's profiler samples this call.
+    """
+    hooks = getattr(client, "hooks", None)
+    if not (isinstance(hooks, Hooks) and hooks.parse_active):
+        hooks = None
+    profiler = profiler_of(client)
+    if profiler is not None and not profiler.sampled():
+        profiler = None
+    if hooks is None and profiler is None:
+        return NULL_TIMER
+    return PhaseTimer(hooks, operation, endpoint, profiler)
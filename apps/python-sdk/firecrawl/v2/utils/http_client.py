@@ -2,20 +2,71 @@
 HTTP client utilities for v2 API.
 """
 
+import threading
 import time
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from .get_version import get_version
+from .hooks import Hooks, RequestEvent, RetryEvent, body_size
+from .idempotency import JOB_CREATING_ENDPOINTS, IdempotencyJournal, is_retryable_post
+
+if TYPE_CHECKING:
+    from .credits import CreditLedger
+    from .profiling import Profiler
 
 version = get_version()
 
+# Matches requests' own default; fan-out calls grow it to their concurrency
+DEFAULT_POOL_MAXSIZE = 10
+
 class HttpClient:
-    """HTTP client with retry logic and error handling."""
+    """HTTP client with retry logic and error handling, sending over a pooled session."""
     
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        auto_idempotency: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        hooks: Optional[Hooks] = None,
+        credit_ledger: Optional["CreditLedger"] = None,
+        profiler: Optional["Profiler"] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
         self.api_key = api_key
         self.api_url = api_url
+        # Derive idempotency keys for job-creating POSTs and remember the jobs they started
+        self.auto_idempotency = auto_idempotency
+        if idempotency_journal is None and auto_idempotency:
+            idempotency_journal = IdempotencyJournal()
+        self.idempotency_journal = idempotency_journal
+        self.hooks = hooks
+        # Optional credit ledger that status parsers record job snapshots into
+        self.credit_ledger = credit_ledger
+        # Optional profiler that response parsers report per-phase CPU time to
+        self.profiler = profiler
+        # Keep-alive connections are reused across calls instead of one handshake per request
+        self.session = requests.Session()
+        self.pool_maxsize = 0
+        self._pool_lock = threading.Lock()
+        self.reserve_connections(pool_maxsize)
+
+    def reserve_connections(self, count: int) -> None:
+        """Grow the connection pool to keep at least ``count`` connections per host alive."""
+        with self._pool_lock:
+            if count <= self.pool_maxsize:
+                return
+            # Requests already in flight finish on the previous adapter's connections
+            adapter = HTTPAdapter(pool_maxsize=count)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.pool_maxsize = count
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -65,35 +116,36 @@ class HttpClient:
             headers = self._prepare_headers()
 
         data['origin'] = f'python-sdk@{version}'
-            
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=data,
-                    timeout=timeout
-                )
 
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in POST request")
+        return self._post(endpoint, headers, timeout, retries, backoff_factor, json=data)
+
+    def post_encoded(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5
+    ) -> requests.Response:
+        """Make a POST request with an already JSON-encoded body (including ``origin``)."""
+        if headers is None:
+            headers = self._prepare_headers()
+        return self._post(endpoint, headers, timeout, retries, backoff_factor, data=body)
+
+    def _post(
+        self,
+        endpoint: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        retries: int,
+        backoff_factor: float,
+        **body: Any
+    ) -> requests.Response:
+        if endpoint in JOB_CREATING_ENDPOINTS and not is_retryable_post(endpoint, headers):
+            # A retry could start a second job that the API does not deduplicate
+            retries = 1
+        return self._send("POST", self.session.post, endpoint, headers, timeout, retries, backoff_factor, **body)
     
     def get(
         self,
@@ -106,34 +158,7 @@ class HttpClient:
         """Make a GET request with retry logic."""
         if headers is None:
             headers = self._prepare_headers()
-
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in GET request")
+        return self._send("GET", self.session.get, endpoint, headers, timeout, retries, backoff_factor)
     
     def delete(
         self,
@@ -146,31 +171,67 @@ class HttpClient:
         """Make a DELETE request with retry logic."""
         if headers is None:
             headers = self._prepare_headers()
-            
+        return self._send("DELETE", self.session.delete, endpoint, headers, timeout, retries, backoff_factor)
+
+    def _send(
+        self,
+        method: str,
+        send: Callable[..., requests.Response],
+        endpoint: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        retries: int,
+        backoff_factor: float,
+        **body: Any
+    ) -> requests.Response:
         url = self._build_url(endpoint)
+        hooks = self.hooks if self.hooks is not None and self.hooks.transport_active else None
         
         last_exception = None
         
         for attempt in range(retries):
+            if hooks is not None:
+                if hooks.request:
+                    hooks.emit(hooks.request, RequestEvent(
+                        method, endpoint, url, attempt, headers, body_size(body.get("data"))
+                    ))
+                started = time.perf_counter()
             try:
-                response = requests.delete(
+                response = send(
                     url,
                     headers=headers,
-                    timeout=timeout
+                    timeout=timeout,
+                    **body
                 )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
             except requests.RequestException as e:
                 last_exception = e
+                if hooks is not None:
+                    hooks.response_event(method, endpoint, url, attempt, started, error=e)
                 if attempt == retries - 1:
                     raise e
-                time.sleep(backoff_factor * (2 ** attempt))
+                delay = backoff_factor * (2 ** attempt)
+                if hooks is not None and hooks.retry:
+                    hooks.emit(hooks.retry, RetryEvent(method, endpoint, attempt, delay, error=e))
+                time.sleep(delay)
+                continue
+            except BaseException as e:
+                # e.g. KeyboardInterrupt; still close the attempt for in-flight gauges and spans
+                if hooks is not None:
+                    hooks.response_event(method, endpoint, url, attempt, started, error=e)
+                raise
+
+            if hooks is not None:
+                hooks.response_event(method, endpoint, url, attempt, started, response)
+
+            if response.status_code == 502:
+                if attempt < retries - 1:
+                    delay = backoff_factor * (2 ** attempt)
+                    if hooks is not None and hooks.retry:
+                        hooks.emit(hooks.retry, RetryEvent(method, endpoint, attempt, delay, status_code=502))
+                    time.sleep(delay)
+                    continue
+            
+            return response
         
         # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
+        raise last_exception or Exception(f"Unexpected error in {method} request")
@@ -1,14 +1,40 @@
+import asyncio
+import time
 import httpx
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from .get_version import get_version
+from .hooks import Hooks, RequestEvent, RetryEvent, body_size
+from .idempotency import IdempotencyJournal, is_retryable_post
+
+if TYPE_CHECKING:
+    from .credits import CreditLedger
+    from .profiling import Profiler
 
 version = get_version()
 
 
 class AsyncHttpClient:
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        auto_idempotency: bool = False,
+        idempotency_journal: Optional[IdempotencyJournal] = None,
+        hooks: Optional[Hooks] = None,
+        credit_ledger: Optional["CreditLedger"] = None,
+        profiler: Optional["Profiler"] = None,
+    ):
         self.api_key = api_key
         self.api_url = api_url
+        self.auto_idempotency = auto_idempotency
+        if idempotency_journal is None and auto_idempotency:
+            idempotency_journal = IdempotencyJournal()
+        self.idempotency_journal = idempotency_journal
+        self.hooks = hooks
+        # Optional credit ledger that status parsers record job snapshots into
+        self.credit_ledger = credit_ledger
+        # Optional profiler that response parsers report per-phase CPU time to
+        self.profiler = profiler
         self._client = httpx.AsyncClient(
             base_url=api_url,
             headers={
@@ -33,15 +59,68 @@ class AsyncHttpClient:
         data: Dict[str, Any],
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
     ) -> httpx.Response:
         payload = dict(data)
         payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
-            endpoint,
-            json=payload,
-            headers={**self._headers(), **(headers or {})},
-            timeout=timeout,
-        )
+        return await self._post(endpoint, headers, timeout, retries, backoff_factor, json=payload)
+
+    async def post_encoded(
+        self,
+        endpoint: str,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+    ) -> httpx.Response:
+        """POST an already JSON-encoded body (including ``origin``)."""
+        return await self._post(endpoint, headers, timeout, retries, backoff_factor, content=body)
+
+    async def _post(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        retries: int,
+        backoff_factor: float,
+        **body: Any,
+    ) -> httpx.Response:
+        merged_headers = {**self._headers(), **(headers or {})}
+        # Only keyed POSTs the API deduplicates are safe to replay after a
+        # transport failure or 502; anything else is sent exactly once.
+        attempts = retries if is_retryable_post(endpoint, merged_headers) else 1
+        hooks = self.hooks if self.hooks is not None and self.hooks.transport_active else None
+        for attempt in range(attempts):
+            try:
+                if hooks is None:
+                    response = await self._client.post(
+                        endpoint,
+                        headers=merged_headers,
+                        timeout=timeout,
+                        **body,
+                    )
+                else:
+                    response = await self._observed(
+                        hooks, "POST", self._client.post, endpoint, merged_headers, timeout, attempt, **body
+                    )
+            except httpx.TransportError as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = backoff_factor * (2 ** attempt)
+                if hooks is not None and hooks.retry:
+                    hooks.emit(hooks.retry, RetryEvent("POST", endpoint, attempt, delay, error=e))
+                await asyncio.sleep(delay)
+                continue
+            if response.status_code == 502 and attempt < attempts - 1:
+                delay = backoff_factor * (2 ** attempt)
+                if hooks is not None and hooks.retry:
+                    hooks.emit(hooks.retry, RetryEvent("POST", endpoint, attempt, delay, status_code=502))
+                await asyncio.sleep(delay)
+                continue
+            return response
+        raise RuntimeError("Unexpected error in POST request")
 
     async def get(
         self,
@@ -49,9 +128,10 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        merged_headers = {**self._headers(), **(headers or {})}
+        if self.hooks is not None and self.hooks.transport_active:
+            return await self._observed(self.hooks, "GET", self._client.get, endpoint, merged_headers, timeout, 0)
+        return await self._client.get(endpoint, headers=merged_headers, timeout=timeout)
 
     async def delete(
         self,
@@ -59,7 +139,33 @@ class AsyncHttpClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
-        )
+        merged_headers = {**self._headers(), **(headers or {})}
+        if self.hooks is not None and self.hooks.transport_active:
+            return await self._observed(self.hooks, "DELETE", self._client.delete, endpoint, merged_headers, timeout, 0)
+        return await self._client.delete(endpoint, headers=merged_headers, timeout=timeout)
+
+    async def _observed(
+        self,
+        hooks: Hooks,
+        method: str,
+        send,
+        endpoint: str,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        attempt: int,
+        **body: Any,
+    ) -> httpx.Response:
+        """Perform one request attempt, emitting request/response hook events around it."""
+        url = str(self._client.base_url.join(endpoint))
+        if hooks.request:
+            hooks.emit(hooks.request, RequestEvent(method, endpoint, url, attempt, headers, body_size(body.get("content"))))
+        started = time.perf_counter()
+        try:
+            response = await send(endpoint, headers=headers, timeout=timeout, **body)
+        except BaseException as e:
+            # Includes cancellation, so in-flight gauges and spans are always closed
+            hooks.response_event(method, endpoint, url, attempt, started, error=e)
+            raise
+        hooks.response_event(method, endpoint, url, attempt, started, response)
+        return response
 
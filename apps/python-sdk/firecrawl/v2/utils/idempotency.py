@@ -0,0 +1,225 @@
+"""
+Idempotency keys and a local job journal for job-creating requests.
+
+When enabled on a client, every job-creating POST (crawl, batch scrape,
+extract) carries an ``x-idempotency-key``. The journal assigns one key per
+normalized request payload (identified by ``derive_idempotency_key``) and maps
+keys to the job returned by the API; re-submitting an identical payload within
+the journal's TTL returns the recorded job instead of posting again.
+
+Only ``POST /v2/crawl`` is deduplicated by the API, so only that request is
+retried by the transports after a connection error or 502. Batch scrape and
+extract are sent once: a retry there could start a second billed job. A 409
+for a key the SDK sent means the job was started by an earlier attempt; it is
+recovered from the journal or reported as ``IdempotencyConflictError``.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from .error_handler import IdempotencyConflictError
+
+# Fixed namespace so keys are stable across processes and SDK versions
+IDEMPOTENCY_NAMESPACE = uuid.UUID("6f1c1f0e-3d2a-5b8e-9a47-2f7c0d5e8b13")
+
+# Fields added by the transport that must not influence the key
+_VOLATILE_FIELDS = ("origin",)
+
+# Job-creating endpoints that receive idempotency keys
+JOB_CREATING_ENDPOINTS = frozenset({"/v2/crawl", "/v2/batch/scrape", "/v2/extract"})
+
+# Endpoints where the API rejects a reused key, making a keyed POST safe to retry
+SERVER_DEDUPLICATED_ENDPOINTS = frozenset({"/v2/crawl"})
+
+# How long journal entries replay a job (and keep their key) by default
+DEFAULT_JOURNAL_TTL = 24 * 60 * 60
+
+
+def is_retryable_post(endpoint: str, headers: Dict[str, str]) -> bool:
+    """Whether a failed POST may be re-sent without risking a second job."""
+    return "x-idempotency-key" in headers and endpoint in SERVER_DEDUPLICATED_ENDPOINTS
+
+
+def derive_idempotency_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    Derive a deterministic UUID idempotency key for a request.
+
+    Args:
+        endpoint: API endpoint path (e.g. "/v2/crawl")
+        payload: Prepared request body
+
+    Returns:
+        UUID string (the API only accepts UUID-shaped keys)
+    """
+    body = {k: v for k, v in payload.items() if k not in _VOLATILE_FIELDS}
+    canonical = json.dumps(
+        {"endpoint": endpoint, "payload": body},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return str(uuid.uuid5(IDEMPOTENCY_NAMESPACE, canonical))
+
+
+class IdempotencyJournal:
+    """
+    Map of idempotency keys to the jobs they created.
+
+    Kept in memory, and optionally appended to a JSON-lines file so that a
+    restarted process does not re-launch jobs it already started. Entries
+    expire after ``ttl`` seconds (``None`` keeps them forever); after that an
+    identical payload starts a new job under a fresh key.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = DEFAULT_JOURNAL_TTL):
+        self.path = path
+        self.ttl = ttl
+        # key -> {"job": ..., "recorded_at": ...}; "job" is None until the POST succeeds
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # derived key -> key currently sent for that payload
+        self._keys: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Ignore a torn trailing line from an interrupted write
+                        continue
+                    if isinstance(entry, dict) and entry.get("key"):
+                        self._load(entry)
+
+    def _load(self, entry: Dict[str, Any]) -> None:
+        recorded_at = entry.get("recorded_at")
+        if not isinstance(recorded_at, (int, float)):
+            # Written without a timestamp; its age is unknown
+            if self.ttl is not None:
+                return
+            recorded_at = 0.0
+        if self._expired(recorded_at):
+            return
+        key = entry["key"]
+        if entry.get("discarded"):
+            self._entries.pop(key, None)
+            return
+        if entry.get("derived"):
+            self._keys[entry["derived"]] = key
+        previous = self._entries.get(key)
+        job = entry.get("job")
+        if job is None and previous is not None:
+            job = previous["job"]
+        self._entries[key] = {"job": job, "recorded_at": recorded_at}
+
+    def _expired(self, recorded_at: float) -> bool:
+        return self.ttl is not None and time.time() - recorded_at > self.ttl
+
+    def _append(self, line: Dict[str, Any]) -> None:
+        if self.path:
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(line, default=str) + "\n")
+
+    def key_for(self, derived_key: str) -> str:
+        """
+        The key to send for a payload whose derived key is ``derived_key``.
+
+        The API stores keys permanently, so each payload gets a random key
+        that is reused until it expires or is discarded, then replaced.
+        """
+        with self._lock:
+            key = self._keys.get(derived_key)
+            entry = self._entries.get(key) if key else None
+            if entry is not None and not self._expired(entry["recorded_at"]):
+                return key
+            key = str(uuid.uuid4())
+            recorded_at = time.time()
+            self._keys[derived_key] = key
+            self._entries[key] = {"job": None, "recorded_at": recorded_at}
+            self._append({"key": key, "derived": derived_key, "recorded_at": recorded_at})
+            return key
+
+    def discard(self, key: str) -> None:
+        """Forget a key whose request was rejected, so the next attempt gets a fresh one."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._append({"key": key, "discarded": True, "recorded_at": time.time()})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["job"] is None or self._expired(entry["recorded_at"]):
+                return None
+            return dict(entry["job"])
+
+    def record(self, key: str, job: Dict[str, Any]) -> None:
+        with self._lock:
+            recorded_at = time.time()
+            self._entries[key] = {"job": dict(job), "recorded_at": recorded_at}
+            self._append({"key": key, "job": job, "recorded_at": recorded_at})
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(
+                1 for entry in self._entries.values()
+                if entry["job"] is not None and not self._expired(entry["recorded_at"])
+            )
+
+
+def resolve_idempotency_key(
+    client: Any,
+    endpoint: str,
+    payload: Dict[str, Any],
+    idempotency_key: Optional[str] = None,
+) -> Optional[str]:
+    """Return the explicit key, a derived key when the client opts in, or None."""
+    if idempotency_key:
+        return idempotency_key
+    if getattr(client, "auto_idempotency", False) is True:
+        key = derive_idempotency_key(endpoint, payload)
+        journal = getattr(client, "idempotency_journal", None)
+        if isinstance(journal, IdempotencyJournal):
+            return journal.key_for(key)
+        return key
+    return None
+
+
+def replay_job(client: Any, idempotency_key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Look up a job previously started with this key in the client's journal."""
+    journal = getattr(client, "idempotency_journal", None)
+    if not idempotency_key or not isinstance(journal, IdempotencyJournal):
+        return None
+    return journal.get(idempotency_key)
+
+
+def record_job(client: Any, idempotency_key: Optional[str], job: Dict[str, Any]) -> None:
+    """Record the job created for this key in the client's journal."""
+    journal = getattr(client, "idempotency_journal", None)
+    if idempotency_key and isinstance(journal, IdempotencyJournal):
+        journal.record(idempotency_key, job)
+
+
+def discard_key(client: Any, idempotency_key: Optional[str]) -> None:
+    """Drop a key the API rejected the request for; no job was started with it."""
+    journal = getattr(client, "idempotency_journal", None)
+    if idempotency_key and isinstance(journal, IdempotencyJournal):
+        journal.discard(idempotency_key)
+
+
+def recover_conflict(client: Any, idempotency_key: str) -> Dict[str, Any]:
+    """
+    Resolve a 409 for a key the SDK sent: the job recorded for it, if any.
+
+    Raises:
+        IdempotencyConflictError: If the job started under this key is unknown locally
+    """
+    job = replay_job(client, idempotency_key)
+    if job is not None:
+        return job
+    raise IdempotencyConflictError(idempotency_key)
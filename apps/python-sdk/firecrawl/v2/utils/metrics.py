@@ -0,0 +1,328 @@
+"""
+In-process metrics for the v2 clients, with Prometheus text exposition.
+
+    metrics = MetricsRegistry()
+    client = Firecrawl(api_key="...", metrics=metrics)
+    ...
+    metrics.snapshot()      # plain dict for logging / custom exporters
+    metrics.prometheus()    # text format 0.0.4, e.g. served on /metrics
+
+Collected from the transport and parse hooks (see ``hooks.py``) and the watchers:
+
+    firecrawl_request_duration_seconds   histogram  method, endpoint, status
+    firecrawl_requests_in_flight         gauge      method
+    firecrawl_retries_total              counter    method, endpoint
+    firecrawl_rate_limited_total         counter    method, endpoint (HTTP 429)
+    firecrawl_request_errors_total       counter    method, endpoint (transport errors)
+    firecrawl_bytes_sent_total           counter    endpoint
+    firecrawl_bytes_received_total       counter    endpoint
+    firecrawl_documents_parsed_total     counter    operation
+    firecrawl_parse_seconds              histogram  operation, phase
+    firecrawl_watcher_messages_total     counter    kind, type
+
+The snapshot also reports documents parsed and watcher messages per second
+over a sliding window. Endpoints are reduced to templates (job IDs become
+``{id}``, query strings are dropped) to keep label cardinality bounded.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from .hooks import Hooks, PageEvent, ParseEvent, RequestEvent, ResponseEvent, RetryEvent
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+PARSE_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_ID_SEGMENT = re.compile(r"^(merged:.*|[0-9a-fA-F-]{16,}|.*\d.*\d.*\d.*)$")
+
+LabelValues = Tuple[str, ...]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """``/v2/crawl/<job id>?skip=10`` → ``/v2/crawl/{id}``."""
+    path = urlparse(endpoint).path or endpoint
+    segments = path.split("/")
+    return "/".join("{id}" if segment and _ID_SEGMENT.match(segment) else segment for segment in segments)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], lock: threading.Lock):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, *args: Any):
+        super().__init__(*args)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[Dict[str, Any]]:
+        return [{"labels": dict(zip(self.labelnames, k)), "value": v} for k, v in self._values.items()]
+
+    def _exposition(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], lock: threading.Lock, buckets: Sequence[float]):
+        super().__init__(name, help, labelnames, lock)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            else:
+                state[len(self.buckets)] += 1
+            state[-1] += value
+
+    def _samples(self) -> List[Dict[str, Any]]:
+        samples = []
+        for key, state in self._values.items():
+            cumulative, buckets = 0.0, {}
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                buckets[_format_value(bound)] = cumulative
+            samples.append({"labels": dict(zip(self.labelnames, key)), "count": cumulative, "sum": state[-1], "buckets": buckets})
+        return samples
+
+    def _exposition(self) -> Iterable[str]:
+        for sample in self._samples():
+            key = tuple(sample["labels"][name] for name in self.labelnames)
+            for le, cumulative in sample["buckets"].items():
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', le))} {_format_value(cumulative)}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(sample['sum'])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(sample['count'])}"
+
+
+class RateMeter:
+    """Events per second over a sliding window, in one-second buckets."""
+
+    def __init__(self, window: float = 60.0):
+        self.window = window
+        self._started = time.monotonic()
+        self._buckets: Deque[List[float]] = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+
+    def mark(self, amount: float = 1.0) -> None:
+        now = time.monotonic()
+        second = float(int(now))
+        with self._lock:
+            if self._buckets and self._buckets[-1][0] == second:
+                self._buckets[-1][1] += amount
+            else:
+                self._buckets.append([second, amount])
+            self._prune(now)
+
+    def per_second(self) -> float:
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            total = sum(amount for _, amount in self._buckets)
+        elapsed = min(self.window, max(now - self._started, 1.0))
+        return total / elapsed
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters, gauges and histograms fed by client hooks."""
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS, rate_window: float = 60.0):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self.request_duration = self.histogram(
+            "firecrawl_request_duration_seconds", "HTTP request latency per attempt.", ("method", "endpoint", "status"), buckets
+        )
+        self.in_flight = self.gauge("firecrawl_requests_in_flight", "HTTP requests currently in flight.", ("method",))
+        self.retries = self.counter("firecrawl_retries_total", "Retried HTTP attempts.", ("method", "endpoint"))
+        self.rate_limited = self.counter("firecrawl_rate_limited_total", "Responses with HTTP 429.", ("method", "endpoint"))
+        self.request_errors = self.counter(
+            "firecrawl_request_errors_total", "HTTP attempts that failed without a response.", ("method", "endpoint")
+        )
+        self.bytes_sent = self.counter("firecrawl_bytes_sent_total", "Request body bytes sent.", ("endpoint",))
+        self.bytes_received = self.counter("firecrawl_bytes_received_total", "Response body bytes received.", ("endpoint",))
+        self.documents = self.counter("firecrawl_documents_parsed_total", "Documents parsed into SDK models.", ("operation",))
+        self.parse_seconds = self.histogram(
+            "firecrawl_parse_seconds", "Client-side time per parse phase.", ("operation", "phase"), PARSE_BUCKETS
+        )
+        self.watcher_messages = self.counter(
+            "firecrawl_watcher_messages_total", "WebSocket messages received by watchers.", ("kind", "type")
+        )
+        self.documents_rate = RateMeter(rate_window)
+        self.watcher_rate = RateMeter(rate_window)
+
+    # Registration
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered with a different type or labels")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames, self._lock))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames, self._lock))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, self._lock, buckets))
+
+    # Collection
+
+    def install(self, hooks: Hooks) -> Hooks:
+        """Register the callbacks that feed the built-in metrics on ``hooks``."""
+        hooks.on_request(self._on_request)
+        hooks.on_response(self._on_response)
+        hooks.on_retry(self._on_retry)
+        hooks.on_page(self._on_page)
+        hooks.on_parse(self._on_parse)
+        return hooks
+
+    def _on_request(self, event: RequestEvent) -> None:
+        self.in_flight.inc(method=event.method)
+
+    def _on_response(self, event: ResponseEvent) -> None:
+        endpoint = endpoint_template(event.endpoint)
+        self.in_flight.dec(method=event.method)
+        status = str(event.status_code) if event.status_code is not None else "error"
+        self.request_duration.observe(event.network_seconds, method=event.method, endpoint=endpoint, status=status)
+        if event.error is not None:
+            self.request_errors.inc(method=event.method, endpoint=endpoint)
+        if event.status_code == 429:
+            self.rate_limited.inc(method=event.method, endpoint=endpoint)
+        if event.bytes_out:
+            self.bytes_sent.inc(event.bytes_out, endpoint=endpoint)
+        if event.bytes_in:
+            self.bytes_received.inc(event.bytes_in, endpoint=endpoint)
+
+    def _on_retry(self, event: RetryEvent) -> None:
+        self.retries.inc(method=event.method, endpoint=endpoint_template(event.endpoint))
+
+    def _count_documents(self, operation: str, documents: int) -> None:
+        if documents:
+            self.documents.inc(documents, operation=operation)
+            self.documents_rate.mark(documents)
+
+    def _on_page(self, event: PageEvent) -> None:
+        self._count_documents(event.operation, event.documents)
+
+    def _on_parse(self, event: ParseEvent) -> None:
+        # Paginated results were already counted page by page
+        if not event.pages:
+            self._count_documents(event.operation, event.documents)
+        for phase, seconds in event.timings.items():
+            if seconds:
+                self.parse_seconds.observe(seconds, operation=event.operation, phase=phase)
+
+    def watcher_message(self, kind: str, message_type: Optional[str]) -> None:
+        self.watcher_messages.inc(kind=kind, type=message_type or "unknown")
+        self.watcher_rate.mark()
+
+    # Export
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as ``{name: {"type", "help", "samples"}}`` plus current rates under ``"rates"``."""
+        with self._lock:
+            metrics = {
+                name: {"type": metric.kind, "help": metric.help, "samples": metric._samples()}
+                for name, metric in self._metrics.items()
+            }
+        metrics["rates"] = {
+            "documents_per_second": self.documents_rate.per_second(),
+            "watcher_messages_per_second": self.watcher_rate.per_second(),
+        }
+        return metrics
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition (format 0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            for name, metric in self._metrics.items():
+                lines.append(f"# HELP {name} {metric.help}")
+                lines.append(f"# TYPE {name} {metric.kind}")
+                lines.extend(metric._exposition())
+        for name, value in (
+            ("firecrawl_documents_per_second", self.documents_rate.per_second()),
+            ("firecrawl_watcher_messages_per_second", self.watcher_rate.per_second()),
+        ):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def metrics_of(client: Any) -> Optional[MetricsRegistry]:
+    metrics = getattr(client, "metrics", None)
+    return metrics if isinstance(metrics, MetricsRegistry) else None
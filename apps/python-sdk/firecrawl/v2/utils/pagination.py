@@ -0,0 +1,95 @@
+"""
+Streaming iteration over paginated job results (crawl and batch scrape).
+"""
+
+import logging
+import time
+from typing import Iterator, Optional
+
+from ..types import Document, PaginationConfig
+from .error_handler import handle_response_error
+from .hooks import phase_timer
+from .normalize import normalize_document_input
+
+logger = logging.getLogger("firecrawl")
+
+
+def iter_paginated_documents(
+    client,
+    status_url: str,
+    action: str,
+    pagination_config: Optional[PaginationConfig] = None,
+) -> Iterator[Document]:
+    """
+    Yield documents of a job page by page, following ``next`` links.
+
+    Unlike the status getters, no page is retained after its documents have
+    been yielded, so memory stays bounded by a single page.
+
+    Args:
+        client: HTTP client instance
+        status_url: Status endpoint of the job (first page)
+        action: Description used in error messages
+        pagination_config: Optional limits (max_pages, max_results, max_wait_time);
+            auto_paginate=False stops after the first page
+
+    Yields:
+        Document objects in API order
+    """
+    timer = phase_timer(client, "iter_documents", status_url)
+    response = client.get(status_url)
+    timer.mark("network")
+    if not response.ok:
+        handle_response_error(response, action)
+    page_data = response.json()
+    timer.mark("decode")
+    if not page_data.get("success"):
+        raise Exception(page_data.get("error", "Unknown error occurred"))
+
+    auto_paginate = pagination_config.auto_paginate if pagination_config else True
+    max_pages = pagination_config.max_pages if pagination_config else None
+    max_results = pagination_config.max_results if pagination_config else None
+    max_wait_time = pagination_config.max_wait_time if pagination_config else None
+
+    start_time = time.monotonic()
+    yielded = 0
+    page_count = 0
+
+    page_url = status_url
+    while True:
+        page_start = yielded
+        for doc_data in page_data.get("data", []):
+            if isinstance(doc_data, str):
+                continue
+            normalized = normalize_document_input(doc_data)
+            timer.mark("normalize")
+            document = Document(**normalized)
+            timer.mark("model")
+            yield document
+            timer.skip()
+            yielded += 1
+            if max_results is not None and yielded >= max_results:
+                timer.page(page_url, response, yielded - page_start)
+                return
+        timer.page(page_url, response, yielded - page_start)
+
+        next_url = page_data.get("next")
+        if not auto_paginate or not next_url:
+            return
+        # Treat 0 as a valid limit (first page only)
+        if max_pages is not None and page_count >= max_pages:
+            return
+        if max_wait_time is not None and (time.monotonic() - start_time) > max_wait_time:
+            return
+
+        page_url = next_url
+        response = client.get(next_url)
+        timer.mark("network")
+        if not response.ok:
+            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+            return
+        page_data = response.json()
+        timer.mark("decode")
+        if not page_data.get("success"):
+            return
+        page_count += 1
@@ -0,0 +1,281 @@
+"""
+Process-pool post-processing of scraped documents.
+
+CPU-heavy per-document work (markdown cleanup, chunking, hashing, metadata
+extraction) would otherwise run on the thread that consumes crawl pages and
+use a single core. ``PostProcessor`` fans documents out to a
+``ProcessPoolExecutor`` in chunks. Documents are sent as plain dicts with
+``None`` fields dropped, not as pickled Pydantic models. Only a bounded
+number of chunks are in flight, so fetching of further pages waits for the
+workers.
+
+Usage:
+    def clean(doc: dict) -> dict:          # top level, so workers can import it
+        return {"url": doc["metadata"]["source_url"], "text": tidy(doc.get("markdown") or "")}
+
+    with PostProcessor(clean, max_workers=8) as post:
+        for row in post.map(client.iter_crawl_documents(job_id)):
+            store(row)
+
+    # Push style, e.g. from a watcher's ``document`` events
+    with PostProcessor(clean, on_result=store) as post:
+        watcher.add_event_listener("document", lambda e: post.submit(e["data"]))
+        watcher.start()
+        ...
+
+``fn`` and its results cross process boundaries, so both must be picklable;
+pass ``as_document=True`` to have workers rebuild a ``Document`` before
+calling ``fn``. Results come back in input order unless ``ordered=False``.
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..types import Document, DocumentMetadata
+from .normalize import normalize_document_input
+
+DocumentLike = Union[Document, Dict[str, Any]]
+
+
+def document_payload(document: DocumentLike) -> Dict[str, Any]:
+    """Compact, picklable form of a document: snake_case fields, ``None`` values dropped."""
+    if isinstance(document, Document):
+        return document.model_dump(exclude_none=True)
+    normalized = normalize_document_input(dict(document))
+    metadata = normalized.get("metadata")
+    if isinstance(metadata, DocumentMetadata):
+        normalized["metadata"] = metadata.model_dump(exclude_none=True)
+    return {key: value for key, value in normalized.items() if value is not None}
+
+
+def _process_chunk(fn: Callable[[Any], Any], payloads: List[Dict[str, Any]], as_document: bool) -> List[Any]:
+    # Runs in the worker process
+    if as_document:
+        return [fn(Document.model_validate(payload)) for payload in payloads]
+    return [fn(payload) for payload in payloads]
+
+
+class PostProcessor:
+    """Apply a picklable ``fn`` to documents on a process pool, with bounded in-flight work."""
+
+    def __init__(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 32,
+        max_pending: Optional[int] = None,
+        ordered: bool = True,
+        as_document: bool = False,
+        on_result: Optional[Callable[[Any], None]] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            fn: Function applied to each document payload (or ``Document`` with ``as_document``)
+            max_workers: Worker processes (defaults to the CPU count); ignored with ``executor``
+            chunk_size: Documents per task, amortizing inter-process overhead
+            max_pending: Chunks in flight before input is no longer pulled (default ``2 * max_workers``)
+            ordered: Yield results in input order rather than completion order
+            as_document: Rebuild a ``Document`` in the worker before calling ``fn``
+            on_result: Receives each result of ``submit``-ed documents
+            executor: Existing executor to use instead of a private process pool
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.fn = fn
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max(1, max_pending or 2 * self.max_workers)
+        self.ordered = ordered
+        self.as_document = as_document
+        self.on_result = on_result
+        self._executor = executor
+        self._owns_executor = executor is None
+        # Push-style state (submit/flush)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._buffer: List[Dict[str, Any]] = []
+        self._inflight: Deque[Future] = deque()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _dispatch(self, payloads: List[Dict[str, Any]]) -> Future:
+        return self.executor.submit(_process_chunk, self.fn, payloads, self.as_document)
+
+    def _chunks(self, documents: Iterable[DocumentLike]) -> Iterator[List[Dict[str, Any]]]:
+        chunk: List[Dict[str, Any]] = []
+        for document in documents:
+            chunk.append(document_payload(document))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    # Pull style
+
+    def map(self, documents: Iterable[DocumentLike]) -> Iterator[Any]:
+        """
+        Yield ``fn``'s result per document.
+
+        ``documents`` is consumed lazily and only while fewer than
+        ``max_pending`` chunks are in flight, so a paginated iterator fetches
+        its next page only when the workers have room. A worker exception is
+        re-raised here.
+        """
+        pending: List[Future] = []
+        try:
+            for chunk in self._chunks(documents):
+                pending.append(self._dispatch(chunk))
+                if len(pending) >= self.max_pending:
+                    yield from self._collect(pending)
+            while pending:
+                yield from self._collect(pending)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _collect(self, pending: List[Future]) -> Iterator[Any]:
+        if self.ordered:
+            yield from pending.pop(0).result()
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield from future.result()
+
+    async def amap(self, documents: Union[Iterable[DocumentLike], AsyncIterable[DocumentLike]]) -> AsyncIterator[Any]:
+        """Async counterpart of ``map``; accepts sync or async iterables of documents."""
+        pending: List["asyncio.Future[List[Any]]"] = []
+        try:
+            async for chunk in self._achunks(documents):
+                pending.append(asyncio.wrap_future(self._dispatch(chunk)))
+                if len(pending) >= self.max_pending:
+                    for result in await self._acollect(pending):
+                        yield result
+            while pending:
+                for result in await self._acollect(pending):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _achunks(self, documents) -> AsyncIterator[List[Dict[str, Any]]]:
+        if not hasattr(documents, "__aiter__"):
+            for chunk in self._chunks(documents):
+                yield chunk
+            return
+        chunk: List[Dict[str, Any]] = []
+        async for document in documents:
+            chunk.append(document_payload(document))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def _acollect(self, pending: List["asyncio.Future[List[Any]]"]) -> List[Any]:
+        if self.ordered:
+            return await pending.pop(0)
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        results: List[Any] = []
+        for future in done:
+            pending.remove(future)
+            results.extend(future.result())
+        return results
+
+    # Push style
+
+    def submit(self, document: DocumentLike) -> None:
+        """
+        Queue one document; results go to ``on_result``.
+
+        Blocks while ``max_pending`` chunks are in flight, which holds back
+        the caller (e.g. a watcher's receive loop). Raises the first worker
+        exception seen so far.
+        """
+        self._raise_error()
+        with self._lock:
+            self._buffer.append(document_payload(document))
+            if len(self._buffer) < self.chunk_size:
+                return
+            chunk, self._buffer = self._buffer, []
+        self._submit_chunk(chunk)
+
+    def flush(self) -> None:
+        """Dispatch the partial chunk and wait until every submitted document has been handled."""
+        with self._lock:
+            chunk, self._buffer = self._buffer, []
+        if chunk:
+            self._submit_chunk(chunk)
+        for _ in range(self.max_pending):
+            self._slots.acquire()
+        for _ in range(self.max_pending):
+            self._slots.release()
+        self._raise_error()
+
+    def _submit_chunk(self, chunk: List[Dict[str, Any]]) -> None:
+        self._slots.acquire()
+        try:
+            future = self._dispatch(chunk)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._inflight.append(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            if self.ordered:
+                # Deliver completed chunks only once everything before them is done
+                ready = []
+                while self._inflight and self._inflight[0].done():
+                    ready.append(self._inflight.popleft())
+            else:
+                self._inflight.remove(future)
+                ready = [future]
+            for done in ready:
+                try:
+                    if done.cancelled():
+                        continue
+                    error = done.exception()
+                    if error is not None:
+                        self._error = self._error or error
+                    elif self.on_result is not None:
+                        for result in done.result():
+                            self.on_result(result)
+                except Exception as e:
+                    self._error = self._error or e
+                finally:
+                    self._slots.release()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Flush pending ``submit`` work and shut down the private process pool."""
+        try:
+            self.flush()
+        finally:
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self) -> "PostProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,58 @@
+"""
+Pre-validated, pre-encoded scrape requests for loops over many URLs.
+
+``PreparedScrape`` validates and converts ScrapeOptions once, then encodes
+the JSON request body once around a URL slot. Each call only JSON-escapes
+the URL and joins three byte strings.
+
+Usage:
+    prepared = client.prepare_scrape(formats=["markdown"], only_main_content=True)
+    for url in urls:
+        doc = client.scrape_prepared(prepared, url)
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from ..types import ScrapeOptions
+from .get_version import get_version
+from .validation import prepare_scrape_options, validate_scrape_options
+
+# Placeholder for the URL while encoding the template
+_URL_SLOT = "\u0000firecrawl-url-slot\u0000"
+
+
+class PreparedScrape:
+    """Reusable ``/v2/scrape`` request with options validated and encoded once."""
+
+    __slots__ = ("options", "_fields", "_prefix", "_suffix")
+
+    def __init__(self, options: Optional[ScrapeOptions] = None):
+        fields: Dict[str, Any] = {}
+        if options is not None:
+            validated = validate_scrape_options(options)
+            if validated is not None:
+                fields = prepare_scrape_options(validated) or {}
+        self.options = options
+        self._fields = fields
+
+        body = {"url": _URL_SLOT, **fields, "origin": f"python-sdk@{get_version()}"}
+        encoded = json.dumps(body, separators=(",", ":"))
+        slot = json.dumps(_URL_SLOT)
+        prefix, suffix = encoded.split(slot, 1)
+        self._prefix = prefix.encode("utf-8")
+        self._suffix = suffix.encode("utf-8")
+
+    @staticmethod
+    def _clean(url: str) -> str:
+        if not url or not url.strip():
+            raise ValueError("URL cannot be empty")
+        return url.strip()
+
+    def payload(self, url: str) -> Dict[str, Any]:
+        """Request payload for ``url`` as a dict (same shape as the regular scrape payload)."""
+        return {"url": self._clean(url), **self._fields}
+
+    def body(self, url: str) -> bytes:
+        """Encoded JSON request body for ``url``."""
+        return b"".join((self._prefix, json.dumps(self._clean(url)).encode("utf-8"), self._suffix))
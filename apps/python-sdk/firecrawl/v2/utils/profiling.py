@@ -0,0 +1,164 @@
+"""
+Opt-in CPU profiling of the v2 clients, broken down by operation and phase.
+
+    client = Firecrawl(api_key="...", profiling=True)      # or a sample rate, e.g. 0.05
+    ...
+    print(client.profiler.format())
+    client.profiler.stats()                                 # ProfileStats model
+
+or, without code changes, ``FIRECRAWL_PROFILE=1`` (``=0.05`` to sample 5% of
+calls); clients profiled through the environment print their table to stderr
+at interpreter exit.
+
+Phases follow the parse hooks (see ``hooks.py``): ``payload`` (request
+building, including ``prepare_scrape_options``), ``network``, ``decode``
+(JSON), ``normalize`` (``normalize_document_input``) and ``model`` (Pydantic
+validation). Watchers add ``decode``/``model`` for WebSocket messages and
+``model_dump`` for the event payloads they build.
+
+Times are CPU seconds of the calling thread (``time.thread_time``), so waiting
+on the network costs nothing; with the async client, ``network`` also includes
+whatever other tasks run while the call is awaiting. With sampling, only the
+sampled calls are timed and the table extrapolates their totals by
+``1 / sample_rate``; unsampled calls pay for a single ``random()`` draw.
+"""
+
+import atexit
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+from ..types import PhaseProfile, ProfileStats
+
+ENV_VAR = "FIRECRAWL_PROFILE"
+
+
+class Profiler:
+    """Thread-safe accumulator of CPU time and call counts per (operation, phase)."""
+
+    def __init__(self, sample_rate: float = 1.0, clock: Callable[[], float] = time.thread_time):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.sample_rate = sample_rate
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._phases: Dict[Tuple[str, str], list] = {}
+        self._operations: Dict[str, int] = {}
+
+    def sampled(self) -> bool:
+        """Whether the next call should be timed."""
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def record(self, operation: str, cpu: Dict[str, float], calls: Dict[str, int], finished: bool = False) -> None:
+        """Add one call's (or page's) per-phase CPU seconds and call counts."""
+        with self._lock:
+            for phase, seconds in cpu.items():
+                entry = self._phases.setdefault((operation, phase), [0.0, 0])
+                entry[0] += seconds
+                entry[1] += calls.get(phase, 0)
+            if finished:
+                self._operations[operation] = self._operations.get(operation, 0) + 1
+
+    @contextmanager
+    def phase(self, operation: str, phase: str) -> Iterator[None]:
+        """Time a block as one call of ``phase`` (sampled like any other call)."""
+        if not self.sampled():
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(operation, {phase: self.clock() - start}, {phase: 1})
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases.clear()
+            self._operations.clear()
+
+    def stats(self) -> ProfileStats:
+        """Sampled totals per phase, sorted by CPU time."""
+        with self._lock:
+            phases = [
+                PhaseProfile(operation=operation, phase=phase, calls=calls, cpu_seconds=seconds)
+                for (operation, phase), (seconds, calls) in self._phases.items()
+            ]
+            operations = dict(self._operations)
+        phases.sort(key=lambda p: p.cpu_seconds, reverse=True)
+        return ProfileStats(
+            sample_rate=self.sample_rate,
+            operations=operations,
+            cpu_seconds=sum(p.cpu_seconds for p in phases),
+            phases=phases,
+        )
+
+    def format(self) -> str:
+        """Summary table; totals are extrapolated from the sampled calls."""
+        stats = self.stats()
+        scale = 1 / stats.sample_rate
+        header = f"{'operation':<22} {'phase':<11} {'calls':>10} {'cpu s':>10} {'us/call':>9} {'share':>7}"
+        lines = [header, "-" * len(header)]
+        for p in stats.phases:
+            per_call = p.cpu_seconds / p.calls * 1e6 if p.calls else 0.0
+            share = p.cpu_seconds / stats.cpu_seconds if stats.cpu_seconds else 0.0
+            lines.append(
+                f"{p.operation:<22} {p.phase:<11} {round(p.calls * scale):>10} {p.cpu_seconds * scale:>10.3f} "
+                f"{per_call:>9.1f} {share:>7.1%}"
+            )
+        sampled = "" if stats.sample_rate >= 1 else f", sampled at {stats.sample_rate:g}"
+        lines.append(f"total {stats.cpu_seconds * scale:.3f} CPU s{sampled}")
+        return "\n".join(lines)
+
+
+def _print_at_exit(profiler: Profiler, label: str) -> None:
+    if profiler.stats().phases:
+        print(f"Firecrawl client profile ({label})\n{profiler.format()}", file=sys.stderr)
+
+
+def profiler_from_env(label: str = "") -> Optional[Profiler]:
+    """Profiler configured by ``FIRECRAWL_PROFILE`` (``1``/``true`` or a sample rate), or None."""
+    value = os.getenv(ENV_VAR, "").strip().lower()
+    if value in ("", "0", "false", "no", "off"):
+        return None
+    try:
+        rate = 1.0 if value in ("1", "true", "yes", "on") else float(value)
+        profiler = Profiler(sample_rate=rate)
+    except ValueError:
+        raise ValueError(f"{ENV_VAR} must be 1/true or a sample rate in (0, 1], got {value!r}") from None
+    atexit.register(_print_at_exit, profiler, label)
+    return profiler
+
+
+def resolve_profiling(profiling: Union[bool, float, Profiler, None], label: str = "") -> Optional[Profiler]:
+    """
+    Client ``profiling`` argument to a Profiler.
+
+    ``True`` profiles every call, a float is a sample rate, a ``Profiler`` is
+    used as is, ``False`` disables profiling and ``None`` defers to the
+    ``FIRECRAWL_PROFILE`` environment variable.
+    """
+    if isinstance(profiling, Profiler):
+        return profiling
+    if profiling is None:
+        return profiler_from_env(label)
+    if profiling is True:
+        return Profiler()
+    if profiling is False:
+        return None
+    return Profiler(sample_rate=float(profiling))
+
+
+def profiler_of(client: Any) -> Optional[Profiler]:
+    profiler = getattr(client, "profiler", None)
+    return profiler if isinstance(profiler, Profiler) else None
+
+
+def profiled(profiler: Optional[Profiler], operation: str, phase: str):
+    """``profiler.phase(...)`` or a no-op context when profiling is off."""
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(operation, phase)
@@ -0,0 +1,309 @@
+"""
+Client-side request scheduler with priority classes and weighted fair queuing.
+
+The scheduler bounds how many requests a process has in flight against the
+team's concurrency budget, and decides which waiting request goes next:
+each priority class receives slots in proportion to its weight, so bulk
+traffic keeps flowing without starving latency-sensitive calls.
+
+Slots are held only for HTTP calls: a ``scrape``, or the submission of a
+crawl, batch scrape or extract (including the submit step of ``crawl``,
+``batch_scrape`` and ``extract``). Running jobs and status polling hold no
+slot, since a held slot cannot be preempted and hours-long jobs would starve
+interactive calls; the budget therefore orders submissions, not server-side
+job concurrency.
+
+Usage:
+    scheduler = RequestScheduler()  # budget derived from get_concurrency()
+    client = FirecrawlClient(scheduler=scheduler)
+    client.scrape(url, priority="interactive")
+    client.start_batch_scrape(urls, priority="bulk")
+    print(scheduler.stats())
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from ..types import ConcurrencyCheck, SchedulerClassStats, SchedulerStats
+
+logger = logging.getLogger("firecrawl")
+
+DEFAULT_PRIORITY = "default"
+
+# Relative share of slots per class when all classes are backlogged
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "interactive": 8.0,
+    "default": 4.0,
+    "bulk": 1.0,
+}
+
+# Budget used when the concurrency source is unavailable
+FALLBACK_CONCURRENCY = 2
+
+
+class _Waiter:
+    __slots__ = ("priority", "enqueued_at", "granted", "cancelled", "notify")
+
+    def __init__(self, priority: str, notify: Callable[[], None]):
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+        self.granted = False
+        self.cancelled = False
+        self.notify = notify
+
+
+class _ClassState:
+    __slots__ = ("weight", "finish_tag", "queued", "in_flight", "completed", "total_wait", "max_wait")
+
+    def __init__(self, weight: float):
+        self.weight = weight
+        self.finish_tag = 0.0
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class RequestScheduler:
+    """
+    Weighted fair queue of request slots shared by sync and async callers.
+
+    Each request is tagged with a virtual finish time ``max(V, F_c) + 1 / w_c``
+    (V: tag of the last dispatched request, F_c: last tag of its class, w_c:
+    class weight) and free slots go to the smallest tag.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        *,
+        weights: Optional[Dict[str, float]] = None,
+        budget_fraction: float = 1.0,
+        refresh_interval: float = 60.0,
+        concurrency_source: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Args:
+            max_concurrency: Fixed slot budget; when None it is derived from
+                ``concurrency_source`` (the client's ``get_concurrency``)
+            weights: Priority class weights (defaults to interactive/default/bulk)
+            budget_fraction: Share of the team's max concurrency this process may use
+            refresh_interval: Seconds between budget refreshes from the source
+            concurrency_source: Callable returning a ConcurrencyCheck (or an awaitable of one)
+        """
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if not 0 < budget_fraction <= 1:
+            raise ValueError("budget_fraction must be in (0, 1]")
+        weights = dict(weights or DEFAULT_WEIGHTS)
+        if not weights or any(w <= 0 for w in weights.values()):
+            raise ValueError("weights must be a non-empty mapping of positive numbers")
+
+        self.max_concurrency = max_concurrency
+        self.budget_fraction = budget_fraction
+        self.refresh_interval = refresh_interval
+        self.concurrency_source = concurrency_source
+
+        self._limit: Optional[int] = max_concurrency
+        self._refreshed_at: Optional[float] = None
+        self._classes = {name: _ClassState(w) for name, w in weights.items()}
+        self._heap: List[Any] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    # Budget
+
+    def _budget_due(self) -> bool:
+        if self.max_concurrency is not None or self.concurrency_source is None:
+            return False
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_interval
+
+    def _apply_budget(self, check: Optional[ConcurrencyCheck]) -> None:
+        with self._lock:
+            self._refreshed_at = time.monotonic()
+            if check is not None and getattr(check, "max_concurrency", None):
+                self._limit = max(1, int(check.max_concurrency * self.budget_fraction))
+            elif self._limit is None:
+                self._limit = FALLBACK_CONCURRENCY
+            self._dispatch_locked()
+
+    def refresh_budget(self) -> None:
+        """Re-read the team concurrency budget from the source."""
+        check = None
+        try:
+            result = self.concurrency_source() if self.concurrency_source else None
+            if inspect.iscoroutine(result):
+                # Sync callers cannot await an async source; keep the current budget
+                result.close()
+            elif not inspect.isawaitable(result):
+                check = result
+        except Exception as exc:
+            logger.debug("Failed to refresh scheduler budget: %s", exc)
+        self._apply_budget(check)
+
+    async def refresh_budget_async(self) -> None:
+        check = None
+        try:
+            source = self.concurrency_source
+            if inspect.iscoroutinefunction(source):
+                # The async client's get_concurrency: awaited on the loop, no worker thread
+                check = await source()
+            elif source is not None:
+                # Sync sources may block on HTTP
+                result = await asyncio.to_thread(source)
+                if inspect.isawaitable(result):
+                    result = await result
+                check = result
+        except Exception as exc:
+            logger.debug("Failed to refresh scheduler budget: %s", exc)
+        self._apply_budget(check)
+
+    @property
+    def limit(self) -> int:
+        return self._limit if self._limit is not None else FALLBACK_CONCURRENCY
+
+    # Queueing
+
+    def _class(self, priority: Optional[str]) -> _ClassState:
+        name = priority or DEFAULT_PRIORITY
+        state = self._classes.get(name)
+        if state is None:
+            raise ValueError(f"Unknown priority class '{name}'. Expected one of {sorted(self._classes)}")
+        return state
+
+    def _enqueue_locked(self, waiter: _Waiter) -> None:
+        state = self._classes[waiter.priority]
+        start = max(self._virtual_time, state.finish_tag)
+        state.finish_tag = start + 1.0 / state.weight
+        state.queued += 1
+        heapq.heappush(self._heap, (state.finish_tag, next(self._seq), waiter))
+
+    def _grant_locked(self, waiter: _Waiter, tag: float) -> None:
+        state = self._classes[waiter.priority]
+        state.queued -= 1
+        state.in_flight += 1
+        wait = time.monotonic() - waiter.enqueued_at
+        state.total_wait += wait
+        state.max_wait = max(state.max_wait, wait)
+        self._virtual_time = max(self._virtual_time, tag)
+        self._in_flight += 1
+        waiter.granted = True
+        waiter.notify()
+
+    def _dispatch_locked(self) -> None:
+        while self._heap and self._in_flight < self.limit:
+            tag, _, waiter = heapq.heappop(self._heap)
+            if waiter.cancelled:
+                continue
+            self._grant_locked(waiter, tag)
+
+    def _submit(self, priority: Optional[str], notify: Callable[[], None]) -> _Waiter:
+        self._class(priority)
+        waiter = _Waiter(priority or DEFAULT_PRIORITY, notify)
+        with self._lock:
+            self._enqueue_locked(waiter)
+            self._dispatch_locked()
+        return waiter
+
+    def _cancel(self, waiter: _Waiter) -> None:
+        with self._lock:
+            if waiter.granted:
+                self._release_locked(waiter.priority)
+            elif not waiter.cancelled:
+                waiter.cancelled = True
+                self._classes[waiter.priority].queued -= 1
+
+    def _release_locked(self, priority: str) -> None:
+        state = self._classes[priority]
+        state.in_flight -= 1
+        state.completed += 1
+        self._in_flight -= 1
+        self._dispatch_locked()
+
+    def release(self, priority: Optional[str] = None) -> None:
+        with self._lock:
+            self._release_locked(priority or DEFAULT_PRIORITY)
+
+    def acquire(self, priority: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        """Block until a slot is granted to ``priority``; pair with ``release``."""
+        if self._budget_due():
+            self.refresh_budget()
+        event = threading.Event()
+        waiter = self._submit(priority, event.set)
+        if not event.wait(timeout):
+            # Also returns the slot if it was granted right as the wait timed out
+            self._cancel(waiter)
+            raise TimeoutError(f"Timed out waiting for a '{waiter.priority}' scheduler slot")
+
+    async def acquire_async(self, priority: Optional[str] = None) -> None:
+        if self._budget_due():
+            await self.refresh_budget_async()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self._submit(priority, notify)
+        try:
+            await future
+        except asyncio.CancelledError:
+            self._cancel(waiter)
+            raise
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None, timeout: Optional[float] = None):
+        """Hold one slot for the duration of the block."""
+        self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    @asynccontextmanager
+    async def slot_async(self, priority: Optional[str] = None):
+        await self.acquire_async(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+    # Metrics
+
+    def queue_depth(self, priority: Optional[str] = None) -> int:
+        with self._lock:
+            if priority is not None:
+                return self._class(priority).queued
+            return sum(state.queued for state in self._classes.values())
+
+    def stats(self) -> SchedulerStats:
+        with self._lock:
+            classes = {
+                name: SchedulerClassStats(
+                    weight=state.weight,
+                    queued=state.queued,
+                    in_flight=state.in_flight,
+                    completed=state.completed,
+                    total_wait_seconds=state.total_wait,
+                    max_wait_seconds=state.max_wait,
+                    avg_wait_seconds=(state.total_wait / (state.completed + state.in_flight))
+                    if (state.completed + state.in_flight) else 0.0,
+                )
+                for name, state in self._classes.items()
+            }
+            return SchedulerStats(
+                max_concurrency=self._limit,
+                in_flight=self._in_flight,
+                queued=sum(state.queued for state in self._classes.values()),
+                classes=classes,
+            )
@@ -0,0 +1,89 @@
+"""
+Memoized JSON schemas for Pydantic model classes.
+
+Generating ``model_json_schema()`` for large nested models is costly and the
+payload builders (scrape formats, crawl/batch scrape options, extract) would
+otherwise do it on every request. Schemas are cached per model class, with a
+bounded LRU that holds classes weakly so dynamically created models can still
+be garbage collected.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+DEFAULT_MAXSIZE = 256
+
+
+def _generate(model: type) -> Dict[str, Any]:
+    generate = getattr(model, "model_json_schema", None)  # Pydantic v2
+    if not callable(generate):
+        generate = getattr(model, "schema", None)  # Pydantic v1
+    return generate()
+
+
+class SchemaCache:
+    """
+    Bounded, weakref-keyed cache of ``model class -> JSON schema``.
+
+    Cached schema dicts are shared by every request built from the same model
+    and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[weakref.ref, Dict[str, Any]]" = OrderedDict()
+        # Re-entrant: the weakref callback may fire during a GC triggered while the lock is held
+        self._lock = threading.RLock()
+
+    def _discard(self, ref: "weakref.ref") -> None:
+        with self._lock:
+            self._entries.pop(ref, None)
+
+    def _lookup(self, model: type) -> Optional[Dict[str, Any]]:
+        # weakref.ref(model) compares equal to the stored ref while the class is alive
+        ref = weakref.ref(model)
+        with self._lock:
+            entry = self._entries.get(ref)
+            if entry is not None:
+                self._entries.move_to_end(ref)
+                self.hits += 1
+            return entry
+
+    def _store(self, model: type, entry: Dict[str, Any]) -> None:
+        ref = weakref.ref(model, self._discard)
+        with self._lock:
+            self._entries[ref] = entry
+            self._entries.move_to_end(ref)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, model: type) -> Dict[str, Any]:
+        """JSON schema dict for a Pydantic model class."""
+        schema = self._lookup(model)
+        if schema is not None:
+            return schema
+        with self._lock:
+            self.misses += 1
+        schema = _generate(model)
+        self._store(model, schema)
+        return schema
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared by all payload builders in the SDK
+schema_cache = SchemaCache()
+
@@ -0,0 +1,113 @@
+"""
+Single-flight coalescing of concurrent identical calls.
+
+While a call for a key is in flight, further calls for the same key wait for
+it and receive its result (or exception) instead of issuing their own
+request. Keys are built from the method name and the prepared request
+payload, so only truly identical calls are merged.
+
+Usage:
+    flights = SingleFlight()
+    client = AsyncFirecrawlClient(single_flight=flights)
+    await asyncio.gather(*(client.scrape(url) for _ in range(50)))  # one request
+    print(flights.stats().deduplicated)  # 49
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from ..types import SingleFlightStats
+from .cache import cache_key
+
+T = TypeVar("T")
+
+
+def request_key(method: str, payload: Dict[str, Any]) -> str:
+    """Coalescing key for ``method`` called with a prepared payload."""
+    return f"{method}:{cache_key(payload)}"
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Shares one execution among concurrent callers of the same key.
+
+    Threads use ``do``; coroutines use ``do_async`` (coalesced per event loop).
+    Results are shared between callers and should not be mutated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executions = 0
+        self._deduplicated = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call for ``key`` is already in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+            else:
+                self._deduplicated += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()`` unless a call for ``key`` is already in flight on this
+        loop. The shared call runs as its own task, so cancelling one caller
+        does not cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._tasks.setdefault(loop, {})
+            task = tasks.get(key)
+            if task is None:
+                task = loop.create_task(fn())
+                tasks[key] = task
+                task.add_done_callback(lambda _t: tasks.pop(key, None))
+                self._executions += 1
+            else:
+                self._deduplicated += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            in_flight = len(self._calls) + sum(len(tasks) for tasks in self._tasks.values())
+            return SingleFlightStats(
+                calls=self._executions + self._deduplicated,
+                executions=self._executions,
+                deduplicated=self._deduplicated,
+                in_flight=in_flight,
+            )
@@ -0,0 +1,166 @@
+"""
+Optional OpenTelemetry tracing for v2 calls.
+
+Active only when ``opentelemetry-api`` is installed (``pip install firecrawl-py[otel]``);
+spans are exported by whatever tracer provider the application configures.
+
+Span layout:
+    firecrawl.crawl / firecrawl.batch_scrape / firecrawl.extract   one per waiting call
+        firecrawl.submit   job-creating POST
+        firecrawl.poll     status GET
+        firecrawl.page     GET of a ``next`` pagination link
+        firecrawl.watcher  WebSocket watcher session
+    Every HTTP attempt gets its own span (``firecrawl.attempt`` > 0 for retries),
+    and retries are also recorded as ``firecrawl.retry`` events on the parent.
+
+The W3C ``traceparent`` (and any other configured propagator fields) of each
+HTTP span is injected into the outgoing request headers.
+"""
+
+import contextvars
+import importlib.util
+from contextlib import contextmanager, nullcontext
+from typing import Any, Optional, Union
+
+from .get_version import get_version
+from .hooks import Hooks, RequestEvent, ResponseEvent, RetryEvent
+
+# HTTP span of the attempt in progress; request and response hooks of one attempt
+# always run in the same thread or task
+_http_span: contextvars.ContextVar = contextvars.ContextVar("firecrawl_http_span", default=None)
+
+
+def otel_available() -> bool:
+    """Whether ``opentelemetry-api`` is importable (checked without importing it)."""
+    try:
+        return importlib.util.find_spec("opentelemetry.trace") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def _operation(method: str, endpoint: str) -> str:
+    if method == "POST":
+        return "submit"
+    if method == "DELETE":
+        return "cancel"
+    # Pagination links returned by the API carry a ``skip`` cursor
+    return "page" if "skip=" in endpoint else "poll"
+
+
+def _attributes(**values: Any) -> dict:
+    return {k: v for k, v in values.items() if v is not None}
+
+
+class Tracing:
+    """Creates Firecrawl spans and propagates their context into request headers."""
+
+    def __init__(self, tracer_provider: Any = None, propagate: bool = True):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = trace.get_tracer("firecrawl", get_version(), tracer_provider=tracer_provider)
+        self.propagate = propagate
+
+    def install(self, hooks: Hooks) -> Hooks:
+        """Register the transport callbacks that create HTTP spans on ``hooks``."""
+        hooks.on_request(self._on_request)
+        hooks.on_response(self._on_response)
+        hooks.on_retry(self._on_retry)
+        return hooks
+
+    @contextmanager
+    def span(self, name: str, context: Any = None, **attributes: Any):
+        """Current span wrapping a block (e.g. one ``crawl`` call)."""
+        with self.tracer.start_as_current_span(name, context=context, attributes=_attributes(**attributes)) as span:
+            yield span
+
+    def start_span(self, name: str, context: Any = None, **attributes: Any):
+        """Span that is not made current; the caller must ``end()`` it."""
+        return self.tracer.start_span(name, context=context, attributes=_attributes(**attributes))
+
+    @staticmethod
+    def current_context() -> Any:
+        from opentelemetry import context
+
+        return context.get_current()
+
+    def _on_request(self, event: RequestEvent) -> None:
+        span = self.tracer.start_span(
+            f"firecrawl.{_operation(event.method, event.endpoint)}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=_attributes(
+                **{
+                    "http.request.method": event.method,
+                    "url.full": event.url,
+                    "firecrawl.endpoint": event.endpoint,
+                    "firecrawl.attempt": event.attempt,
+                    "firecrawl.bytes_out": event.bytes_out,
+                }
+            ),
+        )
+        _http_span.set(span)
+        if self.propagate:
+            from opentelemetry import propagate
+
+            propagate.inject(event.headers, context=self._trace.set_span_in_context(span))
+
+    def _on_response(self, event: ResponseEvent) -> None:
+        span = _http_span.get()
+        if span is None:
+            return
+        _http_span.set(None)
+        for key, value in _attributes(
+            **{
+                "http.response.status_code": event.status_code,
+                "firecrawl.bytes_in": event.bytes_in,
+                "firecrawl.bytes_out": event.bytes_out,
+            }
+        ).items():
+            span.set_attribute(key, value)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(event.error)))
+        elif event.status_code is not None and event.status_code >= 400:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def _on_retry(self, event: RetryEvent) -> None:
+        self._trace.get_current_span().add_event(
+            "firecrawl.retry",
+            _attributes(
+                **{
+                    "http.request.method": event.method,
+                    "firecrawl.endpoint": event.endpoint,
+                    "firecrawl.attempt": event.attempt,
+                    "firecrawl.delay": event.delay,
+                    "http.response.status_code": event.status_code,
+                    "exception.message": str(event.error) if event.error is not None else None,
+                }
+            ),
+        )
+
+
+def resolve_tracing(tracing: Union[bool, Tracing, None]) -> Optional[Tracing]:
+    """
+    Client ``tracing`` argument to a Tracing instance.
+
+    ``True`` enables tracing when OpenTelemetry is installed, ``False``/``None``
+    disables it, and a ``Tracing`` instance is used as is.
+    """
+    if isinstance(tracing, Tracing):
+        return tracing
+    if tracing and otel_available():
+        return Tracing()
+    return None
+
+
+def tracing_of(client: Any) -> Optional[Tracing]:
+    tracing = getattr(client, "tracing", None)
+    return tracing if isinstance(tracing, Tracing) else None
+
+
+def span(tracing: Optional[Tracing], name: str, context: Any = None, **attributes: Any):
+    """``tracing.span(...)`` or a no-op context when tracing is off."""
+    if tracing is None:
+        return nullcontext()
+    return tracing.span(name, context=context, **attributes)
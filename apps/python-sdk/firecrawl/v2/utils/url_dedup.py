@@ -0,0 +1,232 @@
+"""
+URL canonicalization and persistent de-duplication for batch submissions.
+
+Usage:
+    dedup = UrlDeduplicator(capacity=50_000_000, path="seen-urls.bloom")
+    client.batch_scrape(urls, deduplicator=dedup)
+    print(dedup.hits)
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only carry attribution data and never change page content
+TRACKING_PARAMS = frozenset({
+    "fbclid",
+    "gclid",
+    "dclid",
+    "gbraid",
+    "wbraid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "igshid",
+    "yclid",
+    "_ga",
+    "_gl",
+    "_hsenc",
+    "_hsmi",
+    "ref_src",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a URL so that trivially different spellings compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the remaining query parameters and removes trailing
+    slashes from non-root paths.
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string (the stripped input if it cannot be parsed)
+    """
+    stripped = url.strip()
+    try:
+        parts = urlsplit(stripped)
+        port = parts.port
+    except ValueError:
+        return stripped
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host
+    if port is not None and _DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username if parts.password is None else f"{parts.username}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    query_pairs = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query = urlencode(sorted(query_pairs))
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings, optionally backed by an on-disk bitmap.
+
+    Memory use is bounded by ``capacity`` and ``error_rate`` (about 1.8 MB per
+    million items at 0.1%), independent of how many items are actually added.
+    """
+
+    _MAGIC = b"FCBF"
+    _HEADER = struct.Struct(">4sQI")
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001, path: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.path = path
+        self._file = None
+        self._offset = 0
+        num_bytes = (self.num_bits + 7) // 8
+
+        if path is None:
+            self._bits = bytearray(num_bytes)
+            return
+
+        self._offset = self._HEADER.size
+        header = self._HEADER.pack(self._MAGIC, self.num_bits, self.num_hashes)
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+        if exists:
+            found = self._file.read(self._HEADER.size)
+            if found != header:
+                self._file.close()
+                raise ValueError(
+                    f"Bloom filter file {path} was created with different capacity/error_rate settings"
+                )
+        else:
+            self._file.write(header)
+            self._file.truncate(self._offset + num_bytes)
+            self._file.flush()
+        self._bits = mmap.mmap(self._file.fileno(), self._offset + num_bytes)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, item: str) -> bool:
+        bits, offset = self._bits, self._offset
+        return all(bits[offset + (pos >> 3)] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """Add an item. Returns True if it was (probably) already present."""
+        bits, offset = self._bits, self._offset
+        present = True
+        for pos in self._positions(item):
+            index = offset + (pos >> 3)
+            mask = 1 << (pos & 7)
+            if not bits[index] & mask:
+                present = False
+                bits[index] |= mask
+        return present
+
+    def flush(self) -> None:
+        if isinstance(self._bits, mmap.mmap):
+            self._bits.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._bits.flush()
+            self._bits.close()
+            self._file.close()
+            self._file = None
+
+
+class UrlDeduplicator:
+    """
+    Seen-set of canonical URLs used to skip re-submitting URLs across batches.
+
+    The canonical form is only the membership key: URLs that pass are handed
+    back exactly as the caller spelled them, so signed or order-sensitive
+    query strings reach the API untouched. URLs are only recorded as seen once their batch has been accepted by the
+    API (see ``mark_seen``), so a failed submission can be retried as-is.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        path: Optional[str] = None,
+        canonicalize: bool = True,
+    ):
+        """
+        Args:
+            capacity: Expected number of distinct URLs over the filter's lifetime
+            error_rate: Acceptable false-positive rate (URL wrongly treated as seen)
+            path: Optional file for a persistent bitmap shared across runs
+            canonicalize: Whether to canonicalize URLs before comparing them
+        """
+        self._filter = BloomFilter(capacity=capacity, error_rate=error_rate, path=path)
+        self._canonicalize = canonicalize
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.checked = 0
+
+    def normalize(self, url: str) -> str:
+        return canonicalize_url(url) if self._canonicalize else url.strip()
+
+    def iter_unique(self, urls: Iterable[str]) -> Iterator[str]:
+        """Yield the URLs not seen before (nor earlier in ``urls``) unchanged, without recording them."""
+        batch_seen = set()
+        for url in urls:
+            key = self.normalize(url)
+            with self._lock:
+                self.checked += 1
+                if key in batch_seen or key in self._filter:
+                    self.hits += 1
+                    continue
+            batch_seen.add(key)
+            yield url
+
+    def filter(self, urls: Iterable[str]) -> List[str]:
+        """Return the URLs from ``urls`` that have not been seen yet, as given."""
+        return list(self.iter_unique(urls))
+
+    def mark_seen(self, urls: Iterable[str]) -> None:
+        """Record URLs as submitted (by their normalized key)."""
+        keys = [self.normalize(url) for url in urls]
+        with self._lock:
+            for key in keys:
+                self._filter.add(key)
+
+    def __contains__(self, url: str) -> bool:
+        return self.normalize(url) in self._filter
+
+    def flush(self) -> None:
+        self._filter.flush()
+
+    def close(self) -> None:
+        self._filter.close()
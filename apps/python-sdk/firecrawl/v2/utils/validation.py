@@ -4,6 +4,7 @@ Shared validation functions for Firecrawl v2 API.
 
 from typing import Optional, Dict, Any, List
 from ..types import ScrapeOptions, ScrapeFormats
+from .schema_cache import schema_cache
 
 
 def _convert_format_string(format_str: str) -> str:
@@ -28,28 +29,33 @@ def _normalize_schema(schema: Any) -> Optional[Dict[str, Any]]:
     """
     Normalize a schema object which may be a dict, Pydantic BaseModel subclass,
     or a Pydantic model instance into a plain dict.
+
+    Schemas generated from model classes are memoized per class (see
+    ``schema_cache``) and shared between requests; treat them as read-only.
     """
     try:
         # Pydantic v2 BaseModel subclass: has "model_json_schema"
         if hasattr(schema, "model_json_schema") and callable(schema.model_json_schema):
-            return schema.model_json_schema()
+            return schema_cache.get(schema if isinstance(schema, type) else schema.__class__)
         # Pydantic v2 BaseModel instance: has "model_dump" or "model_json_schema"
         if hasattr(schema, "model_dump") and callable(schema.model_dump):
             # Try to get JSON schema if available on the class
             mjs = getattr(schema.__class__, "model_json_schema", None)
             if callable(mjs):
-                return schema.__class__.model_json_schema()
+                return schema_cache.get(schema.__class__)
             # Fallback to data shape (not ideal, but better than dropping)
             return schema.model_dump()
         # Pydantic v1 BaseModel subclass: has "schema"
         if hasattr(schema, "schema") and callable(schema.schema):
+            if isinstance(schema, type):
+                return schema_cache.get(schema)
             return schema.schema()
         # Pydantic v1 BaseModel instance
         if hasattr(schema, "dict") and callable(schema.dict):
             # Prefer class-level schema if present
             sch = getattr(schema.__class__, "schema", None)
             if callable(sch):
-                return schema.__class__.schema()
+                return schema_cache.get(schema.__class__)
             return schema.dict()
     except Exception:
         pass
@@ -12,10 +12,13 @@ import json
 import threading
 from typing import Callable, List, Optional, Literal, Union, Dict, Any
 
-import websockets
-
 from .types import CrawlJob, BatchScrapeJob, Document
 from .utils.normalize import normalize_document_input
+from .utils.batch_split import split_job_id
+from .utils.tracing import span, tracing_of
+from .utils.metrics import metrics_of
+from .utils.credits import ledger_of
+from .utils.profiling import profiled, profiler_of
 
 
 JobKind = Literal["crawl", "batch"]
@@ -39,6 +42,12 @@ class Watcher:
         self._listeners: List[Callable[[JobType], None]] = []
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        # Trace context of the caller of start(), parent of the watcher session span
+        self._trace_context: Any = None
+        self._metrics = metrics_of(client)
+        self._ledger = ledger_of(client)
+        self._profiler = profiler_of(client)
+        self._profile_operation = f"{kind}_watcher"
 
         http_client = getattr(client, "http_client", None)
         self._api_url: Optional[str] = getattr(http_client, "api_url", None)
@@ -65,6 +74,16 @@ class Watcher:
             except Exception:
                 pass
 
+    async def _settle(self, job: JobType) -> None:
+        # WebSocket snapshots bypass the status call, so budgets are enforced here
+        if self._ledger is None:
+            return
+        if self._kind == "crawl":
+            kind, cancel = "crawl", self._client.cancel_crawl
+        else:
+            kind, cancel = "batch_scrape", self._client.cancel_batch_scrape
+        await asyncio.to_thread(self._ledger.enforce, kind, self._job_id, job, cancel)
+
     # v1-like events API
     def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
         if event_type in self._event_handlers:
@@ -87,12 +106,26 @@ class Watcher:
         return f"{ws_base}/v2/batch/scrape/{self._job_id}"
 
     async def _run_ws(self) -> None:
+        if split_job_id(self._job_id):
+            # Merged batch handles have no WebSocket endpoint; poll the aggregated status
+            deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
+            while not self._stop.is_set():
+                if await self._poll_status_once():
+                    return
+                if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+                    return
+                await asyncio.sleep(self._poll_interval or 2)
+            return
+
         uri = self._build_ws_url()
         headers_list = []
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
         try:
+            # Imported on first use so ``import firecrawl`` does not pay for websockets
+            import websockets
+
             async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
                 deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
                 while not self._stop.is_set():
@@ -123,12 +156,15 @@ class Watcher:
                         return
 
                     try:
-                        body = json.loads(msg)
+                        with profiled(self._profiler, self._profile_operation, "decode"):
+                            body = json.loads(msg)
                     except Exception:
                         continue
 
                     # v1-style typed event handling
                     msg_type = body.get("type")
+                    if self._metrics is not None:
+                        self._metrics.watcher_message(self._kind, msg_type)
                     if msg_type == "error":
                         self.status = "failed"
                         self.dispatch_event("error", {
@@ -171,10 +207,11 @@ class Watcher:
                         self._sent_done = True
                         # Emit a final completed snapshot for listeners and break immediately
                         docs: List[Document] = []
-                        for doc in self.data:
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        with profiled(self._profiler, self._profile_operation, "model"):
+                            for doc in self.data:
+                                if isinstance(doc, dict):
+                                    d = normalize_document_input(doc)
+                                    docs.append(Document(**d))
                         if self._kind == "crawl":
                             job = CrawlJob(
                                 status="completed",
@@ -195,6 +232,7 @@ class Watcher:
                                 next=raw_payload.get("next"),
                                 data=docs,
                             )
+                        await self._settle(job)
                         self._emit(job)
                         break
 
@@ -207,10 +245,11 @@ class Watcher:
 
                     if self._kind == "crawl":
                         docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        with profiled(self._profiler, self._profile_operation, "model"):
+                            for doc in payload.get("data", []):
+                                if isinstance(doc, dict):
+                                    d = normalize_document_input(doc)
+                                    docs.append(Document(**d))
                         job = CrawlJob(
                             status=status_str,
                             completed=payload.get("completed", 0),
@@ -220,6 +259,7 @@ class Watcher:
                             next=payload.get("next"),
                             data=docs,
                         )
+                        await self._settle(job)
                         self._emit(job)
                         if status_str in ("completed", "failed", "cancelled"):
                             # Ensure done/error dispatched even if server didn't send explicit event type
@@ -232,10 +272,11 @@ class Watcher:
                             break
                     else:
                         docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        with profiled(self._profiler, self._profile_operation, "model"):
+                            for doc in payload.get("data", []):
+                                if isinstance(doc, dict):
+                                    d = normalize_document_input(doc)
+                                    docs.append(Document(**d))
                         job = BatchScrapeJob(
                             status=status_str,
                             completed=payload.get("completed", 0),
@@ -245,6 +286,7 @@ class Watcher:
                             next=payload.get("next"),
                             data=docs,
                         )
+                        await self._settle(job)
                         self._emit(job)
                         if status_str in ("completed", "failed", "cancelled"):
                             if status_str == "completed" and not self._sent_done:
@@ -276,20 +318,28 @@ class Watcher:
         self._emit(job)
         if job.status in ("completed", "failed", "cancelled"):
             if job.status == "completed" and not self._sent_done:
-                self.dispatch_event("done", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                with profiled(self._profiler, self._profile_operation, "model_dump"):
+                    data = [d.model_dump() for d in job.data]
+                self.dispatch_event("done", {"status": job.status, "data": data, "id": self._job_id})
                 self._sent_done = True
             if job.status == "failed" and not self._sent_error:
-                self.dispatch_event("error", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                with profiled(self._profiler, self._profile_operation, "model_dump"):
+                    data = [d.model_dump() for d in job.data]
+                self.dispatch_event("error", {"status": job.status, "data": data, "id": self._job_id})
                 self._sent_error = True
             return True
         return False
 
     def _loop(self) -> None:
-        asyncio.run(self._run_ws())
+        attributes = {"firecrawl.job_id": self._job_id, "firecrawl.kind": self._kind}
+        with span(tracing_of(self._client), "firecrawl.watcher", context=self._trace_context, **attributes):
+            asyncio.run(self._run_ws())
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
+        tracing = tracing_of(self._client)
+        self._trace_context = tracing.current_context() if tracing is not None else None
         self._stop.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
@@ -12,11 +12,13 @@ import json
 import time
 from typing import AsyncIterator, Dict, List, Literal, Optional
 
-import websockets
-from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
-
 from .types import BatchScrapeJob, CrawlJob, Document
 from .utils.normalize import normalize_document_input
+from .utils.batch_split import split_job_id
+from .utils.tracing import Tracing, tracing_of
+from .utils.metrics import metrics_of
+from .utils.credits import ledger_of
+from .utils.profiling import profiled, profiler_of
 
 JobKind = Literal["crawl", "batch"]
 
@@ -28,15 +30,17 @@ class AsyncWatcher:
         job_id: str,
         *,
         kind: JobKind = "crawl",
+        poll_interval: float = 2.0,
         timeout: Optional[int] = None,
     ) -> None:
         self._client = client
         self._job_id = job_id
         self._kind = kind
         self._timeout = timeout
-        self._poll_interval: float = 2.0
+        self._poll_interval: float = poll_interval
 
-        http_client = getattr(client, "http_client", None)
+        # The async client only carries the async transport; older clients expose http_client
+        http_client = getattr(client, "async_http_client", None) or getattr(client, "http_client", None)
         if http_client is not None:
             self._api_url = getattr(http_client, "api_url", None)
             self._api_key = getattr(http_client, "api_key", None)
@@ -47,10 +51,32 @@ class AsyncWatcher:
 
         self._status: str = "scraping"
         self._data: List[Dict] = []
+        self._metrics = metrics_of(client)
+        self._ledger = ledger_of(client)
+        self._profiler = profiler_of(client)
+        self._profile_operation = f"{kind}_watcher"
 
     def __aiter__(self) -> AsyncIterator[object]:
+        tracing = tracing_of(self._client)
+        if tracing is not None:
+            return self._traced(tracing)
         return self._iterate()
 
+    async def _traced(self, tracing: Tracing) -> AsyncIterator[object]:
+        # Not made current: the context would otherwise leak across the generator's yields
+        session = tracing.start_span("firecrawl.watcher", **{"firecrawl.job_id": self._job_id, "firecrawl.kind": self._kind})
+        snapshots = 0
+        try:
+            async for snapshot in self._iterate():
+                snapshots += 1
+                yield snapshot
+        except Exception as e:
+            session.record_exception(e)
+            raise
+        finally:
+            session.set_attribute("firecrawl.snapshots", snapshots)
+            session.end()
+
     def _build_ws_url(self) -> str:
         if not self._api_url:
             raise ValueError("API URL is required for WebSocket watcher")
@@ -60,6 +86,18 @@ class AsyncWatcher:
         return f"{ws_base}/v2/batch/scrape/{self._job_id}"
 
     async def _iterate(self) -> AsyncIterator[object]:
+        if split_job_id(self._job_id):
+            # Merged batch handles have no WebSocket endpoint; poll the aggregated status
+            deadline = time.time() + self._timeout if self._timeout else None
+            while True:
+                job = await self._fetch_job_status()
+                yield job
+                if job.status in ("completed", "failed", "cancelled"):
+                    return
+                if deadline is not None and time.time() >= deadline:
+                    return
+                await asyncio.sleep(self._poll_interval)
+
         uri = self._build_ws_url()
         headers_list = []
         if self._api_key:
@@ -67,8 +105,12 @@ class AsyncWatcher:
 
         # Attempt to establish WS; on failure, fall back to HTTP polling immediately
         try:
+            # Imported on first use so ``import firecrawl`` does not pay for websockets
+            import websockets
+            from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
+
             async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
+                deadline = asyncio.get_running_loop().time() + self._timeout if self._timeout else None
                 # Pre-yield a snapshot if available to ensure progress is visible
                 try:
                     pre = await self._fetch_job_status()
@@ -81,7 +123,7 @@ class AsyncWatcher:
                 while True:
                     try:
                         if deadline is not None:
-                            remaining = max(0.0, deadline - asyncio.get_event_loop().time())
+                            remaining = max(0.0, deadline - asyncio.get_running_loop().time())
                             timeout = min(self._poll_interval, remaining) if remaining > 0 else 0.0
                         else:
                             timeout = self._poll_interval
@@ -93,7 +135,7 @@ class AsyncWatcher:
                             yield job
                             if job.status in ("completed", "failed", "cancelled"):
                                 return
-                        if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+                        if deadline is not None and asyncio.get_running_loop().time() >= deadline:
                             return
                         continue
                     except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
@@ -111,11 +153,14 @@ class AsyncWatcher:
                                 return
                             await asyncio.sleep(1)
                     try:
-                        body = json.loads(msg)
+                        with profiled(self._profiler, self._profile_operation, "decode"):
+                            body = json.loads(msg)
                     except Exception:
                         continue
 
                     msg_type = body.get("type")
+                    if self._metrics is not None:
+                        self._metrics.watcher_message(self._kind, msg_type)
                     if msg_type == "error":
                         self._status = "failed"
                         # Yield a terminal snapshot
@@ -144,13 +189,16 @@ class AsyncWatcher:
                                 if isinstance(doc, dict):
                                     self._data.append(doc)
                         # Emit final snapshot then end
-                        yield self._make_snapshot(status="completed", payload=raw_payload, docs_override=self._data)
+                        snapshot = self._make_snapshot(status="completed", payload=raw_payload, docs_override=self._data)
+                        await self._settle(snapshot)
+                        yield snapshot
                         return
 
                     # Generic snapshot emit for status messages and periodic progress
                     payload = body.get("data", body)
                     status_str = payload.get("status", body.get("status", self._status))
                     snapshot = self._make_snapshot(status=status_str, payload=payload)
+                    await self._settle(snapshot)
                     yield snapshot
                     if status_str in ("completed", "failed", "cancelled"):
                         return
@@ -175,37 +223,31 @@ class AsyncWatcher:
         return await self._call_status_method("get_batch_scrape_status")
 
     async def _call_status_method(self, method_name: str):
-        # Try on client directly
-        meth = getattr(self._client, method_name, None)
-        if meth is not None:
-            try:
-                result = meth(self._job_id)
-            except TypeError:
-                result = None
-            if result is not None:
-                if inspect.isawaitable(result):
-                    return await result
-                return result
-            # Fallback: if we couldn't call directly, try to_thread
-            return await asyncio.to_thread(meth, self._job_id)
-
-        # Try on client.v2
-        v2 = getattr(self._client, "v2", None)
-        if v2 is not None:
-            meth = getattr(v2, method_name, None)
-            if meth is not None:
-                try:
-                    result = meth(self._job_id)
-                except TypeError:
-                    result = None
-                if result is not None:
-                    if inspect.isawaitable(result):
-                        return await result
-                    return result
-                return await asyncio.to_thread(meth, self._job_id)
+        # Status calls run on the caller's loop; no worker threads, so one loop can watch thousands of jobs
+        for owner in (self._client, getattr(self._client, "v2", None)):
+            meth = getattr(owner, method_name, None) if owner is not None else None
+            if meth is None:
+                continue
+            result = meth(self._job_id)
+            if inspect.isawaitable(result):
+                return await result
+            return result
 
         raise RuntimeError(f"Client does not expose {method_name}")
 
+    async def _settle(self, snapshot) -> None:
+        # WebSocket snapshots bypass the status call, so budgets are enforced here
+        if self._ledger is None:
+            return
+        kind = "crawl" if self._kind == "crawl" else "batch_scrape"
+        method = getattr(self._client, "cancel_crawl" if kind == "crawl" else "cancel_batch_scrape")
+
+        async def cancel(job_id: str):
+            result = method(job_id)
+            return await result if inspect.isawaitable(result) else result
+
+        await self._ledger.enforce_async(kind, self._job_id, snapshot, cancel)
+
     async def _safe_fetch(self):
         try:
             return await self._fetch_job_status()
@@ -215,10 +257,11 @@ class AsyncWatcher:
     def _make_snapshot(self, *, status: str, payload: Dict, docs_override: Optional[List[Dict]] = None):
         docs = []
         source_docs = docs_override if docs_override is not None else payload.get("data", []) or []
-        for doc in source_docs:
-            if isinstance(doc, dict):
-                d = normalize_document_input(doc)
-                docs.append(Document(**d))
+        with profiled(self._profiler, self._profile_operation, "model"):
+            for doc in source_docs:
+                if isinstance(doc, dict):
+                    d = normalize_document_input(doc)
+                    docs.append(Document(**d))
 
         if self._kind == "crawl":
             return CrawlJob(
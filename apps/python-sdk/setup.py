@@ -36,6 +36,14 @@ setup(
         'pydantic>=2.0',
         'aiohttp'
     ],
+    extras_require={
+        'arrow': ['pyarrow'],
+        'otel': ['opentelemetry-api'],
+        'tokens': ['tiktoken'],
+    },
+    entry_points={
+        'console_scripts': ['firecrawl-bench=firecrawl.bench:main'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",